@@ -4,31 +4,45 @@ CourtSide Analytics Auto-Grader
 -------------------------------
 Runs continuously (or via cron) to:
 1. Grade pending picks for all models (NBA, NFL, etc.)
-2. Regenerate HTML outputs with latest results
+2. Regenerate HTML outputs whose inputs changed (see render_manifest.py)
 3. Push updates to GitHub (via auto_push.sh)
 
 Usage:
     python3 auto_grader.py          # Run once
     python3 auto_grader.py --loop   # Run in continuous loop
+    python3 auto_grader.py --schedule   # Loop, grading as games are expected to end
+    python3 auto_grader.py --serial     # Grade sports one after another in this process
+
+Sports are graded concurrently, one worker process per sport (see grading_pool.py).
 """
 
 import os
 import sys
 import time
 import json
-import importlib
-import importlib.util
 import argparse
 import subprocess
+import traceback
+from collections import defaultdict
 from datetime import datetime, timedelta
 import pytz
 
-# Add subdirectories to path to allow importing models
-sys.path.append(os.path.join(os.path.dirname(__file__), 'nba'))
-sys.path.append(os.path.join(os.path.dirname(__file__), 'nfl'))
-sys.path.append(os.path.join(os.path.dirname(__file__), 'soccer'))
-sys.path.append(os.path.join(os.path.dirname(__file__), 'wnba'))
-sys.path.append(os.path.join(os.path.dirname(__file__), 'ncaa'))
+from grading_pool import GradingPool, SportResult, format_sport_report, worker_loop
+from grading_scheduler import GradingScheduler
+from html_templates import template_version
+from model_registry import ModelRegistry
+from render_manifest import RenderManifest, date_bucket, fingerprint, tracking_fingerprint
+from site_assets import asset_version
+from tracking_archive import load_tracking, save_tracking, season_label
+
+# Models are imported once and hot-reloaded on file change (see model_registry.py)
+REGISTRY = ModelRegistry()
+
+# Input digests of the pages last written; unchanged pages aren't re-rendered (see render_manifest.py)
+MANIFEST = RenderManifest()
+
+# Set to "[nba] " etc. inside sport worker processes so interleaved output stays readable
+LOG_PREFIX = ""
 
 # ANSI Colors
 class Colors:
@@ -45,7 +59,21 @@ def log(msg, type="info"):
     if type == "success": color = Colors.GREEN
     if type == "warning": color = Colors.YELLOW
     if type == "error": color = Colors.RED
-    print(f"{Colors.BOLD}[{timestamp}]{Colors.END} {color}{msg}{Colors.END}")
+    print(f"{Colors.BOLD}[{timestamp}]{Colors.END} {color}{LOG_PREFIX}{msg}{Colors.END}")
+
+def page_digest(mod, output, *inputs, force=False):
+    """
+    Digest of a page's inputs, plus the ET date, the model's source version,
+    the shared templates and the shared asset bundles the page links.
+    Returns None when `output` was already rendered from exactly these inputs
+    (and `force` is off), in which case the caller skips the render.
+    """
+    digest = fingerprint(*inputs, date_bucket(), os.path.getmtime(mod.__file__), template_version(),
+                         asset_version())
+    if not force and MANIFEST.is_current(output, digest):
+        MANIFEST.mark_checked(output)
+        return None
+    return digest
 
 def backup_file(filepath):
     """Create a simple .backup copy of a file"""
@@ -103,7 +131,7 @@ def retrieve_active_plays(tracking_data, stat_type="PTS"):
             
             if should_show:
                 # Reconstruct play object
-                # Needed fields: prop, game_time, team, opponent, player, ai_score, odds
+                # Needed fields: prop, game_time, team, opponent, player, ai_score, hit_prob, odds
                 
                 # Construct prop string: e.g. "OVER 28.5 PTS"
                 line = p.get('prop_line', 0)
@@ -117,6 +145,7 @@ def retrieve_active_plays(tracking_data, stat_type="PTS"):
                     'team': p.get('team'),
                     'opponent': p.get('opponent'),
                     'ai_score': p.get('ai_score', 9.5), 
+                    'hit_prob': p.get('hit_prob'),
                     'odds': p.get('odds'),
                     'home_team': p.get('team') 
                 }
@@ -210,117 +239,335 @@ def retrieve_active_plays_nfl(tracking_data, stats_cache=None):
             
     return active_picks
 
+# NBA props markets graded together by grade_nba_props()
+# (module name, tracking file, box score column, actual_* field, display label)
+NBA_PROPS_MARKETS = [
+    ('nba_points_props_model', 'nba/nba_points_props_tracking.json', 'PTS', 'actual_pts', 'points'),
+    ('nba_assists_props_model', 'nba/nba_assists_props_tracking.json', 'AST', 'actual_ast', 'assists'),
+    ('nba_rebounds_props_model', 'nba/nba_rebounds_props_tracking.json', 'REB', 'actual_reb', 'rebounds'),
+    ('nba_3pt_props_model', 'nba/nba_3pt_props_tracking.json', 'FG3M', 'actual_3pm', '3-pointers'),
+]
+NBA_PROPS_STAT_COLUMNS = [m[2] for m in NBA_PROPS_MARKETS]
+# Settlement gating, as each model's own grader had it: points picks settle on a final
+# game or as soon as the live stat is past the line; the other markets wait for a
+# final game or 4h past tip
+NBA_PROPS_EARLY_DECISION = {'nba_points_props_model'}
+NBA_PROPS_SETTLE_HOURS = 4
+
+def fetch_nba_box_scores_for_date(date_str):
+    """
+    One LeagueDashPlayerStats call for an ET game date covering every props market.
+    Returns {player_name_lower: {'PTS': .., 'AST': .., 'REB': .., 'FG3M': ..}}.
+    """
+    from nba_api.stats.endpoints import leaguedashplayerstats
+
+    target_date = datetime.strptime(date_str, '%Y-%m-%d')
+    df = leaguedashplayerstats.LeagueDashPlayerStats(
+        season=season_label(target_date, 8),
+        date_from_nullable=target_date.strftime('%m/%d/%Y'),
+        date_to_nullable=target_date.strftime('%m/%d/%Y'),
+        measure_type_detailed_defense='Base',
+        per_mode_detailed='PerGame',
+        timeout=30
+    ).get_data_frames()[0]
+
+    if df.empty:
+        return {}
+    names = df['PLAYER_NAME'].fillna('').str.lower()
+    values = df[NBA_PROPS_STAT_COLUMNS].fillna(0).astype(int).to_dict('records')
+    return dict(zip(names, values))
+
+def fetch_nba_completed_teams_for_date(date_str):
+    """Team names with a game on this ET date (used for final/DNP checks)."""
+    from nba_api.stats.endpoints import leaguedashteamstats
+
+    df = leaguedashteamstats.LeagueDashTeamStats(
+        date_from_nullable=date_str,
+        date_to_nullable=date_str
+    ).get_data_frames()[0]
+    return set() if df.empty else set(df['TEAM_NAME'].unique())
+
+def _match_player_stats(player_name, box_scores, first_last_index):
+    """Exact lowercase name first, then first+last name (e.g. "Luka Doncic" vs "Luka Dončić")."""
+    key = (player_name or '').lower()
+    if key in box_scores:
+        return box_scores[key]
+    parts = key.split()
+    if len(parts) >= 2:
+        return first_last_index.get((parts[0], parts[-1]))
+    return None
+
+def grade_nba_props():
+    """
+    Grade every NBA props market in one pass.
+
+    1. Load each tracking file once.
+    2. Group pending picks from all markets by ET game date.
+    3. Fetch one box-score table (and one completed-teams set) per date and
+       grade PTS/AST/REB/FG3M picks against it.
+    4. Write each tracking file at most once.
+
+    nba_api calls scale with the number of dates, not dates x models.
+    Returns {module_name: graded_count}.
+    """
+    et_tz = pytz.timezone('US/Eastern')
+    now_utc = datetime.now(pytz.utc)
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # 1. Load every tracking file once
+    books = {}
+    picks_by_date = defaultdict(list)
+    for mod_name, rel_path, column, field, label in NBA_PROPS_MARKETS:
+        path = os.path.join(base_dir, rel_path)
+        if not os.path.exists(path):
+            continue
+        data = load_tracking(path)
+        books[mod_name] = {'path': path, 'data': data, 'graded': 0}
+
+        # 2. Pending picks whose game started at least an hour ago, keyed by ET date
+        for pick in data.get('picks', []):
+            if pick.get('status') != 'pending' or not pick.get('game_time'):
+                continue
+            try:
+                game_time_utc = datetime.fromisoformat(pick['game_time'].replace('Z', '+00:00'))
+            except ValueError:
+                continue
+            hours_since_game = (now_utc - game_time_utc).total_seconds() / 3600
+            if hours_since_game >= 1:
+                game_date = game_time_utc.astimezone(et_tz).strftime('%Y-%m-%d')
+                picks_by_date[game_date].append((mod_name, column, field, label, pick, hours_since_game))
+
+    if not picks_by_date:
+        log("NBA props: no pending picks ready for grading", "info")
+        return {m: 0 for m in books}
+
+    total_pending = sum(len(v) for v in picks_by_date.values())
+    log(f"NBA props: {total_pending} pending picks across {len(picks_by_date)} dates", "info")
+
+    # 3. One box score fetch per date, all markets graded against it
+    api_calls = 0
+    for date_str in sorted(picks_by_date):
+        try:
+            api_calls += 1
+            box_scores = fetch_nba_box_scores_for_date(date_str)
+            api_calls += 1
+            completed_teams = fetch_nba_completed_teams_for_date(date_str)
+        except Exception as e:
+            log(f"NBA props: box score fetch failed for {date_str}: {e}", "warning")
+            continue
+
+        if not box_scores:
+            log(f"NBA props: no stats found for {date_str} yet", "warning")
+            continue
+
+        first_last_index = {}
+        for name, row in box_scores.items():
+            parts = name.split()
+            if len(parts) >= 2:
+                first_last_index.setdefault((parts[0], parts[-1]), row)
+
+        for mod_name, column, field, label, pick, hours_since_game in picks_by_date[date_str]:
+            try:
+                player_name = pick.get('player')
+                is_game_final = pick.get('team') in completed_teams
+                row = _match_player_stats(player_name, box_scores, first_last_index)
+
+                if row is None:
+                    # Game is over and the player has no line -> DNP
+                    if is_game_final:
+                        print(f"{Colors.YELLOW}  ⚠️  Player {player_name} has no stats but game is final -> Marking as DNP/Void{Colors.END}")
+                        pick['status'] = 'void'
+                        pick['result'] = 'DNP'
+                        pick['profit_loss'] = 0
+                        books[mod_name]['graded'] += 1
+                    continue
+
+                actual = row[column]
+                prop_line = pick.get('prop_line')
+                bet_type = pick.get('bet_type')
+
+                # A live over past the line is already a win and a live under past
+                # the line already a loss (points only, see NBA_PROPS_EARLY_DECISION)
+                if mod_name in NBA_PROPS_EARLY_DECISION:
+                    is_determined = is_game_final or (bet_type in ('over', 'under') and actual > prop_line)
+                else:
+                    is_determined = is_game_final or hours_since_game >= NBA_PROPS_SETTLE_HOURS
+                if not is_determined:
+                    continue
+
+                if bet_type == 'over':
+                    is_win = actual > prop_line
+                else:  # under
+                    is_win = actual < prop_line
+
+                # USE OPENING ODDS (the odds the bet was actually placed at), stored in cents
+                odds = pick.get('opening_odds') or pick.get('odds', -110)
+                if is_win:
+                    profit_loss = int(odds) if odds > 0 else int((100.0 / abs(odds)) * 100)
+                    status, result, result_color = 'win', 'WIN', Colors.GREEN
+                else:
+                    profit_loss = -100
+                    status, result, result_color = 'loss', 'LOSS', Colors.RED
+
+                pick['status'] = status
+                pick['result'] = result
+                pick[field] = actual
+                pick['profit_loss'] = profit_loss
+                pick['updated_at'] = datetime.now(et_tz).isoformat()
+
+                print(f"    {result_color}{result}{Colors.END}: {player_name} had {actual} {label} (line: {prop_line}, bet: {bet_type.upper()}) | Profit: {profit_loss/100.0:.2f} units")
+                books[mod_name]['graded'] += 1
+            except Exception as e:
+                print(f"{Colors.RED}  Error grading pick {pick.get('player')}: {e}{Colors.END}")
+
+    # 4. Write each touched file once
+    for mod_name, book in books.items():
+        if book['graded'] > 0:
+            backup_file(book['path'])
+            save_tracking(book['path'], book['data'])
+            log(f"Graded {book['graded']} picks for {mod_name}", "success")
+
+    log(f"NBA props: {api_calls} nba_api calls for {len(picks_by_date)} dates", "info")
+    return {m: b['graded'] for m, b in books.items()}
+
+def render_tracking_page(mod_name, output, tracking_file, force=False):
+    """
+    Re-render a model's tracking dashboard (its registry `tracking` entry) when
+    the tracking data or the ET date changed.
+    Returns True when the page was written, False when it was already current.
+    """
+    mod = REGISTRY.load(mod_name)
+    digest = page_digest(mod, output, tracking_fingerprint(tracking_file), force=force)
+    if digest is None:
+        return False
+    with REGISTRY.timed(mod_name, 'render'):
+        REGISTRY.entry(mod_name, 'tracking')()
+    MANIFEST.record(output, digest)
+    return True
+
+def render_nba_props_page(mod_name, force=False):
+    """
+    Re-render an NBA props page from its tracking file, with the active plays
+    rebuilt from pending picks so the page doesn't go empty on regrade.
+    Returns True when the page was written, False when its inputs were
+    unchanged, None when the model has no page to render.
+    """
+    mod = REGISTRY.load(mod_name)
+    render = REGISTRY.entry(mod_name, 'render')
+    stats_fn = REGISTRY.entry(mod_name, 'stats')
+    if not (render and stats_fn and hasattr(mod, 'load_tracking_data')):
+        return None
+    with REGISTRY.timed(mod_name, 'render'):
+        # Load fresh data
+        t_data = mod.load_tracking_data(full_history=True)
+        stats = stats_fn(t_data)
+
+        # Determine stat type for display reconstruction
+        stat_label = "PTS"
+        if 'assists' in mod_name: stat_label = "AST"
+        elif 'rebounds' in mod_name: stat_label = "REB"
+        elif '3pt' in mod_name: stat_label = "3PM"
+
+        active_plays = retrieve_active_plays(t_data, stat_label)
+        over_plays = [p for p in active_plays if 'OVER' in p['prop']]
+        under_plays = [p for p in active_plays if 'UNDER' in p['prop']]
+
+        digest = page_digest(mod, mod.OUTPUT_HTML, active_plays, stats, t_data['picks'], force=force)
+        if digest is None:
+            return False
+
+        try:
+            html = render(over_plays, under_plays, stats, t_data, {}, {})
+        except TypeError:
+            # Some models don't take defense/player stats args
+            html = render(over_plays, under_plays, stats, t_data)
+        mod.save_html(html)
+        MANIFEST.record(mod.OUTPUT_HTML, digest)
+        log(f"Regenerated HTML for {mod_name} with {len(active_plays)} active plays", "success")
+        return True
+
+def render_nfl_props_page(mod_name, force=False):
+    """
+    Re-render an NFL props page (or the ATD page) from its tracking file and
+    player stats cache. Same return values as render_nba_props_page().
+    """
+    mod = REGISTRY.load(mod_name)
+    render = REGISTRY.entry(mod_name, 'render')
+    stats_fn = REGISTRY.entry(mod_name, 'stats')
+    if not (render and stats_fn and hasattr(mod, 'load_tracking_data')):
+        return None
+    with REGISTRY.timed(mod_name, 'render'):
+        t_data = mod.load_tracking_data(full_history=True)
+        # Load Stats Cache if available
+        stats_cache = {}
+        if hasattr(mod, 'PLAYER_STATS_CACHE') and os.path.exists(mod.PLAYER_STATS_CACHE):
+            try:
+                with open(mod.PLAYER_STATS_CACHE, 'r') as f:
+                    stats_cache = json.load(f)
+            except:
+                pass
+
+        # Restore Active Plays from tracking
+        active_plays = retrieve_active_plays_nfl(t_data, stats_cache)
+
+        ts = stats_fn(t_data)
+        digest = page_digest(mod, mod.OUTPUT_HTML, active_plays, ts, t_data['picks'], force=force)
+        if digest is None:
+            return False
+        render(active_plays, ts, t_data)
+        MANIFEST.record(mod.OUTPUT_HTML, digest)
+    return True
+
 def run_nba_grading(force=False):
     """
-    Grades NBA props by importing model modules dynamically.
+    Grades NBA props and the main model through the model registry.
     """
     log("Starting NBA Grading...", "info")
     
-    # List of NBA prop models to grade
-    # (Module Name, Script Filename)
-    nba_models = [
-        ('nba_points_props_model', 'nba_points_props_model.py'),
-        ('nba_assists_props_model', 'nba_assists_props_model.py'),
-        ('nba_rebounds_props_model', 'nba_rebounds_props_model.py'),
-        ('nba_3pt_props_model', 'nba_3pt_props_model.py'),
-        ('nba_model_IMPROVED', 'nba_model_IMPROVED.py'), # Main Model
-    ]
-    
     any_updates = False
+
+    # Props markets are graded together so each date's box score is fetched once
+    try:
+        with REGISTRY.timed('nba_props (shared)', 'grade'):
+            graded = grade_nba_props()
+        if any(graded.values()):
+            any_updates = True
+    except Exception as e:
+        log(f"Error grading NBA props: {e}", "error")
     
-    for mod_name, filename in nba_models:
+    for mod_name in REGISTRY.names('nba'):
         try:
             log(f"Checking {mod_name}...", "info")
-            
-            # Dynamic import
-            try:
-                mod = __import__(mod_name)
-            except ImportError:
-                spec = importlib.util.spec_from_file_location(mod_name, os.path.join("nba", filename))
-                mod = importlib.util.module_from_spec(spec)
-                sys.modules[mod_name] = mod
-                spec.loader.exec_module(mod)
-            
-            # FORCE RELOAD to ensure fresh code/logic (crucial for long-running process)
-            importlib.reload(mod)
+            mod = REGISTRY.load(mod_name)
 
-            # 1. Run Grading
-            updated = False
-            if hasattr(mod, 'grade_pending_picks'):
-                if hasattr(mod, 'TRACKING_FILE'):
-                    backup_file(mod.TRACKING_FILE)
-                
-                # We can capture if it actually updated anything if grade_pending_picks returned a count,
-                # but currently it might just print. 
-                # Let's assume we want to rebuild if forced OR if we suspect changes.
+            if mod_name == 'nba_model_IMPROVED':
+                # Main model grades with update_pick_results() and keeps its own tracking page
                 try:
-                    # Some models return count, some don't.
-                    # We'll just run it.
-                    res = mod.grade_pending_picks()
-                    if isinstance(res, int) and res > 0: updated = True
-                except:
-                    pass
-            
-            # 2. Regenerate HTML ALWAYS to refresh date-dependent stats (TODAY/YESTERDAY)
-            if True:  # Always regenerate to ensure TODAY stats are fresh
-                if mod_name == 'nba_model_IMPROVED':
-                     # Main Model use update_pick_results()
-                     if hasattr(mod, 'update_pick_results'):
-                         try:
-                             # It returns count of updated picks
-                             res = mod.update_pick_results()
-                             if isinstance(res, int) and res > 0:
-                                 log(f"Updated {res} picks for {mod_name}", "success")
-                                 any_updates = True
-                             
-                             # ALWAYS regenerate tracking HTML if available
-                             if hasattr(mod, 'generate_tracking_html'):
-                                 mod.generate_tracking_html()
-                                 log(f"Regenerated tracking HTML for {mod_name}", "success")
-                                 any_updates = True
-                         except Exception as e:
-                             log(f"Error updating main NBA model: {e}", "error")
-                elif hasattr(mod, 'generate_html_output') and hasattr(mod, 'load_tracking_data') and hasattr(mod, 'calculate_tracking_stats'):
-                    # Load fresh data
-                    t_data = mod.load_tracking_data()
-                    stats = mod.calculate_tracking_stats(t_data)
-                    
-                    # Generate HTML with EMPTY plays
-                    try:
-                        # Determine stat type for display reconstruction
-                        stat_label = "PTS"
-                        if 'assists' in mod_name: stat_label = "AST"
-                        elif 'rebounds' in mod_name: stat_label = "REB"
-                        elif '3pt' in mod_name: stat_label = "3PM"
-                        
-                        # Reconstruct active plays
-                        active_plays = retrieve_active_plays(t_data, stat_label)
-                        
-                        # Prop models usually generate_html_output(over_plays, under_plays, ...)
-                        # We will assume all are OVER plays for now if bet_type isn't checked strictly, 
-                        # but retrieve_active_plays handles prop string.
-                        # We need to split into over/under lists?
-                        # auto_grader usually just passes them.
-                        # user's models usually put everything in over_plays list for display if they are "top plays".
-                        # But wait, generate_html_output takes (over_plays, under_plays, ...)
-                        
-                        over_plays = [p for p in active_plays if 'OVER' in p['prop']]
-                        under_plays = [p for p in active_plays if 'UNDER' in p['prop']]
-                        
-                        html = mod.generate_html_output(over_plays, under_plays, stats, t_data, {}, {})
-                        mod.save_html(html)
-                        log(f"Regenerated HTML for {mod_name} with {len(active_plays)} active plays", "success")
+                    with REGISTRY.timed(mod_name, 'grade'):
+                        res = REGISTRY.entry(mod_name, 'grade')()
+                    if isinstance(res, int) and res > 0:
+                        log(f"Updated {res} picks for {mod_name}", "success")
                         any_updates = True
-                    except Exception as e:
-                        # Some might have diff signature
-                        try:
-                             # Some models might not take defense/player stats args
-                             html = mod.generate_html_output([], [], stats, t_data) 
-                             mod.save_html(html)
-                             any_updates = True
-                        except:
-                            log(f"HTML generation failed for {mod_name}: {e}", "warning")
-            
+
+                    # Regenerate tracking HTML when the tracking data or the ET date changed
+                    if REGISTRY.entry(mod_name, 'tracking'):
+                        if not render_tracking_page(mod_name, mod.TRACKING_HTML_FILE,
+                                                    mod.PICKS_TRACKING_FILE, force=force):
+                            log(f"Tracking HTML for {mod_name} is current, skipped", "info")
+                            continue
+                        log(f"Regenerated tracking HTML for {mod_name}", "success")
+                        any_updates = True
+                except Exception as e:
+                    log(f"Error updating main NBA model: {e}", "error")
+                continue
+
+            # Props picks were already settled by grade_nba_props() above
+            # Regenerate HTML when the shown plays, stats, history or ET date changed
+            updated = render_nba_props_page(mod_name, force=force)
+            if updated is False:
+                log(f"HTML for {mod_name} is current, skipped", "info")
+            any_updates = any_updates or bool(updated)
+
         except Exception as e:
             log(f"Error processing {mod_name}: {e}", "error")
 
@@ -332,95 +579,65 @@ def run_nfl_grading(force=False):
     """
     log("Starting NFL Grading...", "info")
     
-    nfl_models = [
-        ('nfl_passing_yards_props_model', 'nfl_passing_yards_props_model.py'),
-        ('nfl_rushing_yards_props_model', 'nfl_rushing_yards_props_model.py'),
-        ('nfl_receiving_yards_props_model', 'nfl_receiving_yards_props_model.py'),
-        ('nfl_receptions_props_model', 'nfl_receptions_props_model.py'),
-        ('atd_model', 'atd_model.py'),
-        ('nfl_model_IMPROVED', 'nfl_model_IMPROVED.py'),
-    ]
-    
     any_updates = False
+
+    # All five props markets in one pass: nflreadpy seasons load once, one index join
+    try:
+        from nfl.props_grader import NFL_PROPS_TRACKING_FILES, grade_all_props
+        for path in NFL_PROPS_TRACKING_FILES.values():
+            backup_file(str(path))
+        with REGISTRY.timed('nfl_props (shared)', 'grade'):
+            graded = grade_all_props()
+        for stat_kind, count in graded.items():
+            if count > 0:
+                log(f"Graded {count} {stat_kind} picks", "success")
+                any_updates = True
+    except Exception as e:
+        log(f"Error grading NFL props: {e}", "error")
     
-    for mod_name, filename in nfl_models:
+    for mod_name in REGISTRY.names('nfl'):
         try:
             log(f"Checking {mod_name}...", "info")
-            
-            try:
-                mod = __import__(mod_name)
-            except ImportError:
-                spec = importlib.util.spec_from_file_location(mod_name, os.path.join("nfl", filename))
-                mod = importlib.util.module_from_spec(spec)
-                sys.modules[mod_name] = mod
-                spec.loader.exec_module(mod)
-            
-            # FORCE RELOAD
-            importlib.reload(mod)
+            mod = REGISTRY.load(mod_name)
             
             updated = False
             # 1. Grading
             if mod_name == 'nfl_model_IMPROVED':
-                if hasattr(mod, 'grade_pending_picks'):
-                    try:
-                        res = mod.grade_pending_picks()
-                        if isinstance(res, int) and res > 0:
-                            log(f"Graded {res} picks for {mod_name}", "success")
-                            updated = True
-                        elif force:
-                            updated = True # Force HTML regen
-                    except Exception as e:
-                        log(f"Error grading NFL main model: {e}", "error")
-            elif hasattr(mod, 'grade_props_tracking_file') and hasattr(mod, 'TRACKING_FILE'):
-                stat_kind = None
-                if 'passing' in filename: stat_kind = 'passing_yards'
-                elif 'rushing' in filename: stat_kind = 'rushing_yards'
-                elif 'receiving' in filename: stat_kind = 'receiving_yards'
-                elif 'receptions' in filename: stat_kind = 'receptions'
-                elif 'atd' in filename: stat_kind = 'anytime_td'
-                
-                if stat_kind:
-                    backup_file(mod.TRACKING_FILE)
-                    from nfl.props_grader import grade_props_tracking_file
-                    updated_count = grade_props_tracking_file(mod.TRACKING_FILE, stat_kind=stat_kind)
-                    if updated_count > 0:
-                        log(f"Graded {updated_count} picks for {mod_name}", "success")
+                try:
+                    with REGISTRY.timed(mod_name, 'grade'):
+                        res = REGISTRY.entry(mod_name, 'grade')()
+                    if isinstance(res, int) and res > 0:
+                        log(f"Graded {res} picks for {mod_name}", "success")
                         updated = True
+                    elif force:
+                        updated = True # Force HTML regen
+                except Exception as e:
+                    log(f"Error grading NFL main model: {e}", "error")
+            # Props picks were already settled by grade_all_props() above
             
-            # 2. Regenerate HTML
-            if True: # Always regen to restore pending plays
-                 if mod_name == 'nfl_model_IMPROVED':
-                     try:
-                         # For NFL main model, we just run main() to refresh odds and HTML
-                         # but we might want to avoid re-analysis if just grading.
-                         # However, nfl_model_IMPROVED analysis is fast.
-                         if hasattr(mod, 'main'):
-                             mod.main()
-                             log(f"Regenerated HTML for {mod_name}", "success")
-                             any_updates = True
-                     except Exception as e:
-                         log(f"HTML gen failed for {mod_name}: {e}", "warning")
-                 elif hasattr(mod, 'generate_html_output') and hasattr(mod, 'load_tracking_data') and hasattr(mod, 'calculate_tracking_stats'):
-                    try:
-                        t_data = mod.load_tracking_data()
-                        # Load Stats Cache if available
-                        stats_cache = {}
-                        if hasattr(mod, 'PLAYER_STATS_CACHE') and os.path.exists(mod.PLAYER_STATS_CACHE):
-                            try:
-                                with open(mod.PLAYER_STATS_CACHE, 'r') as f:
-                                    stats_cache = json.load(f)
-                            except:
-                                pass
-                        
-                        # Restore Active Plays from tracking
-                        active_plays = retrieve_active_plays_nfl(t_data, stats_cache)
-                        
-                        ts = mod.calculate_tracking_stats(t_data)
-                        mod.generate_html_output(active_plays, ts, t_data)
+            # 2. Regenerate HTML (props pages only when their inputs changed)
+            render = REGISTRY.entry(mod_name, 'render')
+            if not render:
+                continue
+            if mod_name == 'nfl_model_IMPROVED':
+                try:
+                    # nfl_model_IMPROVED.main() refreshes odds and HTML; its analysis is fast
+                    with REGISTRY.timed(mod_name, 'render'):
+                        render()
+                    log(f"Regenerated HTML for {mod_name}", "success")
+                    any_updates = True
+                except Exception as e:
+                    log(f"HTML gen failed for {mod_name}: {e}", "warning")
+            else:
+                try:
+                    updated = render_nfl_props_page(mod_name, force=force)
+                    if updated is False:
+                        log(f"HTML for {mod_name} is current, skipped", "info")
+                    elif updated:
                         log(f"Regenerated HTML for {mod_name}", "success")
                         any_updates = True
-                    except Exception as e:
-                        log(f"HTML gen failed for {mod_name}: {e}", "warning")
+                except Exception as e:
+                    log(f"HTML gen failed for {mod_name}: {e}", "warning")
 
         except Exception as e:
             log(f"Error processing {mod_name}: {e}", "error")
@@ -455,19 +672,9 @@ def run_wnba_grading(force=False):
     # --- 1. Main Model ---
     try:
         mod_name = 'wnba_model'
-        filename = 'wnba_model.py'
         log(f"Checking {mod_name}...", "info")
         
-        try:
-            mod = __import__(mod_name)
-        except ImportError:
-            spec = importlib.util.spec_from_file_location(mod_name, os.path.join("wnba", filename))
-            mod = importlib.util.module_from_spec(spec)
-            sys.modules[mod_name] = mod
-            spec.loader.exec_module(mod)
-            
-        # FORCE RELOAD
-        importlib.reload(mod)
+        mod = REGISTRY.load(mod_name)
             
         # Verify functions exist
         if hasattr(mod, 'generate_html') and hasattr(mod, 'get_stats'):
@@ -486,9 +693,10 @@ def run_wnba_grading(force=False):
             if force:
                 # We can't easy invoke main() without running the whole script which tracks mock picks.
                 # Let's just generate HTML with *empty* results list but valid stats, to check headers/tracking.
-                stats = mod.get_stats()
-                # generate_html(results, stats_tuple)
-                mod.generate_html([], stats)
+                with REGISTRY.timed(mod_name, 'render'):
+                    stats = mod.get_stats()
+                    # generate_html(results, stats_tuple)
+                    mod.generate_html([], stats)
                 log(f"Regenerated HTML for {mod_name}", "success")
                 any_updates = True
                 
@@ -498,25 +706,16 @@ def run_wnba_grading(force=False):
     # --- 2. Props Model ---
     try:
         mod_name = 'wnba_props_model'
-        filename = 'wnba_props_model.py'
         log(f"Checking {mod_name}...", "info")
         
-        try:
-            mod = __import__(mod_name)
-        except ImportError:
-            spec = importlib.util.spec_from_file_location(mod_name, os.path.join("wnba", filename))
-            mod = importlib.util.module_from_spec(spec)
-            sys.modules[mod_name] = mod
-            spec.loader.exec_module(mod)
-            
-        # FORCE RELOAD
-        importlib.reload(mod)
+        mod = REGISTRY.load(mod_name)
             
         if hasattr(mod, 'generate_html') and hasattr(mod, 'get_stats'):
             if force:
                  # get_stats returns 5 values now
-                 s1, s10, s20, today, yesterday = mod.get_stats()
-                 mod.generate_html([], s1, s10, today, yesterday)
+                 with REGISTRY.timed(mod_name, 'render'):
+                     s1, s10, s20, today, yesterday = mod.get_stats()
+                     mod.generate_html([], s1, s10, today, yesterday)
                  log(f"Regenerated HTML for {mod_name}", "success")
                  any_updates = True
 
@@ -532,40 +731,34 @@ def run_ncaab_grading(force=False):
     log("Starting NCAAB Grading...", "info")
     
     mod_name = 'ncaab_model_2ndFINAL'
-    filename = 'ncaab_model_2ndFINAL.py'
     
     any_updates = False
     
     try:
         log(f"Checking {mod_name}...", "info")
         
-        try:
-            mod = __import__(mod_name)
-        except ImportError:
-            spec = importlib.util.spec_from_file_location(mod_name, os.path.join("ncaa", filename))
-            mod = importlib.util.module_from_spec(spec)
-            sys.modules[mod_name] = mod
-            spec.loader.exec_module(mod)
-            
-        # FORCE RELOAD
-        importlib.reload(mod)
+        mod = REGISTRY.load(mod_name)
             
         # Run grading
         if hasattr(mod, 'update_pick_results'):
             try:
-                res = mod.update_pick_results()
+                with REGISTRY.timed(mod_name, 'grade'):
+                    res = mod.update_pick_results()
                 if isinstance(res, int) and res > 0:
                     log(f"Updated {res} picks for {mod_name}", "success")
                     any_updates = True
             except Exception as e:
                 log(f"Error updating NCAAB model: {e}", "error")
         
-        # ALWAYS regenerate HTML to refresh date-dependent stats
-        if hasattr(mod, 'generate_tracking_html'):
+        # Regenerate HTML when the tracking data or the ET date changed
+        if REGISTRY.entry(mod_name, 'tracking'):
             try:
-                mod.generate_tracking_html()
-                log(f"Regenerated HTML for {mod_name}", "success")
-                any_updates = True
+                if not render_tracking_page(mod_name, mod.TRACKING_HTML_FILE,
+                                            mod.PICKS_TRACKING_FILE, force=force):
+                    log(f"Tracking HTML for {mod_name} is current, skipped", "info")
+                else:
+                    log(f"Regenerated HTML for {mod_name}", "success")
+                    any_updates = True
             except Exception as e:
                 log(f"HTML generation failed for {mod_name}: {e}", "warning")
                 
@@ -581,27 +774,18 @@ def run_soccer_grading(force=False):
     log("Starting Soccer Grading...", "info")
     
     mod_name = 'soccer_model_IMPROVED'
-    filename = 'soccer_model_IMPROVED.py'
     
     any_updates = False
     
     try:
         log(f"Checking {mod_name}...", "info")
         
-        try:
-            mod = __import__(mod_name)
-        except ImportError:
-            spec = importlib.util.spec_from_file_location(mod_name, os.path.join("soccer", filename))
-            mod = importlib.util.module_from_spec(spec)
-            sys.modules[mod_name] = mod
-            spec.loader.exec_module(mod)
-
-        # FORCE RELOAD
-        importlib.reload(mod)
+        mod = REGISTRY.load(mod_name)
         
         # Call update_pick_results (Soccer's grading function)
         if hasattr(mod, 'update_pick_results'):
-            graded = mod.update_pick_results()
+            with REGISTRY.timed(mod_name, 'grade'):
+                graded = mod.update_pick_results()
             if graded and graded > 0:
                 log(f"Graded {graded} soccer picks", "success")
                 any_updates = True
@@ -611,7 +795,8 @@ def run_soccer_grading(force=False):
         # Always run full model to get fresh games (Dec 20, 2024 fix)
         if hasattr(mod, 'main'):
             log("Running full soccer model for fresh games...", "info")
-            mod.main()
+            with REGISTRY.timed(mod_name, 'render'):
+                mod.main()
             any_updates = True
     
     except Exception as e:
@@ -621,37 +806,145 @@ def run_soccer_grading(force=False):
     
     return any_updates
 
+SPORT_RUNNERS = {
+    'nba': run_nba_grading,
+    'nfl': run_nfl_grading,
+    'wnba': run_wnba_grading,
+    'ncaab': run_ncaab_grading,
+    'soccer': run_soccer_grading,
+}
+
+# Created on first parallel cycle; workers persist across --loop / --schedule cycles
+POOL = None
+
+def run_sport(sport, force=False):
+    """Run one sport's grader, then write its page digests to the manifest."""
+    try:
+        return SPORT_RUNNERS[sport](force=force)
+    finally:
+        MANIFEST.save()
+
+def _sport_worker(sport, conn):
+    """Entry point of a sport's worker process (see grading_pool.py)."""
+    global LOG_PREFIX
+    LOG_PREFIX = f"[{sport}] "
+    # Child stdout is a pipe under cron/launchd; flush per line so logs interleave sanely
+    try:
+        sys.stdout.reconfigure(line_buffering=True)
+    except AttributeError:
+        pass
+    worker_loop(sport, conn, lambda force=False: run_sport(sport, force=force), REGISTRY)
+
+def grade_sports(sports, force=False, parallel=True):
+    """
+    Run the sport graders and return {sport: SportResult}.
+    Parallel mode runs each sport in its own worker with a timeout; serial mode
+    runs them in this process one after another (handy for debugging).
+    """
+    global POOL
+    if parallel:
+        if POOL is None:
+            POOL = GradingPool(_sport_worker)
+        results = POOL.run(sports, force=force)
+        for sport in sports:
+            r = results[sport]
+            # Fold worker timings into the combined per-model report
+            REGISTRY.timings.update(r.timings)
+            if r.status == 'timeout':
+                log(f"{sport} grading timed out: {r.error}", "error")
+            elif r.status != 'ok':
+                log(f"{sport} grading failed ({r.status}): {r.error}", "error")
+        return {sport: results[sport] for sport in sports}
+
+    results = {}
+    for sport in sports:
+        start = time.perf_counter()
+        try:
+            updated = bool(run_sport(sport, force=force))
+            results[sport] = SportResult(sport, 'ok', updated=updated)
+        except Exception:
+            error = traceback.format_exc()
+            log(f"{sport} grading failed: {error}", "error")
+            results[sport] = SportResult(sport, 'error', error=error)
+        results[sport].seconds = time.perf_counter() - start
+    return results
+
+def run_cycle(force=False, sports=None, parallel=True):
+    """
+    One grading pass, then best plays + git push if anything changed.
+    `sports` limits the pass to those graders (default: all).
+    """
+    REGISTRY.start_cycle()
+    cycle_start = time.perf_counter()
+
+    selected = [s for s in SPORT_RUNNERS if sports is None or s in sports]
+    results = grade_sports(selected, force=force, parallel=parallel)
+    sports_wall = time.perf_counter() - cycle_start
+    any_updates = any(r.updated for r in results.values())
+    
+    if any_updates:
+        # Regenerate Best Plays aggregator
+        try:
+            with REGISTRY.timed('best_plays_bot', 'render'):
+                REGISTRY.entry('best_plays_bot', 'render')()
+            log("Regenerated best_plays.html", "success")
+        except Exception as e:
+            log(f"Best plays generation failed: {e}", "warning")
+        
+        trigger_git_push()
+    else:
+        log("No updates found.", "info")
+
+    log("Cycle timings:", "info")
+    print(format_sport_report(results, sports_wall))
+    print(REGISTRY.report())
+
+def run_scheduled_loop(force=False, max_sleep=900, parallel=True):
+    """
+    Sleep until the next pending game is expected to be final, then grade only
+    the sports that have due picks. A full pass still runs at start-up and once
+    per ET day so date-dependent HTML (TODAY/YESTERDAY) stays fresh.
+    """
+    scheduler = GradingScheduler()
+    et_tz = pytz.timezone('US/Eastern')
+    last_full_date = None
+
+    while True:
+        today = datetime.now(et_tz).date()
+        scheduler.refresh()
+        due = scheduler.due_sports()
+
+        if last_full_date != today:
+            log("Scheduler: daily full pass", "info")
+            run_cycle(force=force, parallel=parallel)
+            scheduler.record_attempt(SPORT_RUNNERS.keys())
+            last_full_date = today
+            force = False
+        elif due:
+            log("Scheduler: due " + ", ".join(f"{s} ({n} picks)" for s, n in sorted(due.items())), "info")
+            run_cycle(sports=due, parallel=parallel)
+            scheduler.record_attempt(due)
+        
+        wait = scheduler.next_wake(max_sleep=max_sleep)
+        log(f"Next check in {wait / 60:.0f} min ({len(scheduler.pending)} pending picks tracked)", "info")
+        time.sleep(wait)
+
 def main():
     parser = argparse.ArgumentParser(description='Auto-Grader for Sports Models')
     parser.add_argument('--loop', action='store_true', help='Run in a loop every 15 minutes')
-    parser.add_argument('--interval', type=int, default=900, help='Interval in seconds (default: 900s = 15m)')
+    parser.add_argument('--interval', type=int, default=900, help='Interval in seconds (default: 900s = 15m); max sleep with --schedule')
+    parser.add_argument('--schedule', action='store_true', help='Loop, waking when pending games are expected to be final')
     parser.add_argument('--force', action='store_true', help='Force regeneration of all HTML files')
+    parser.add_argument('--serial', action='store_true', help='Grade sports one at a time in this process')
     args = parser.parse_args()
     
     log("Auto-Grader initialized", "info")
     
-    if args.loop:
+    if args.schedule:
+        run_scheduled_loop(force=args.force, max_sleep=args.interval, parallel=not args.serial)
+    elif args.loop:
         while True:
-            updates_nba = run_nba_grading(force=args.force)
-            updates_nfl = run_nfl_grading(force=args.force)
-            updates_wnba = run_wnba_grading(force=args.force)
-            updates_ncaab = run_ncaab_grading(force=args.force)
-            updates_soccer = run_soccer_grading(force=args.force)
-            
-            if updates_nba or updates_nfl or updates_wnba or updates_ncaab or updates_soccer:
-                # Regenerate Best Plays aggregator
-                try:
-                    import best_plays_bot
-                    import importlib
-                    importlib.reload(best_plays_bot)
-                    best_plays_bot.main()
-                    log("Regenerated best_plays.html", "success")
-                except Exception as e:
-                    log(f"Best plays generation failed: {e}", "warning")
-                
-                trigger_git_push()
-            else:
-                log("No updates found.", "info")
+            run_cycle(force=args.force, parallel=not args.serial)
                 
             log(f"Sleeping for {args.interval} seconds...", "info")
             time.sleep(args.interval)
@@ -659,26 +952,7 @@ def main():
             args.force = False 
     else:
         # Run once
-        updates_nba = run_nba_grading(force=args.force)
-        updates_nfl = run_nfl_grading(force=args.force)
-        updates_wnba = run_wnba_grading(force=args.force)
-        updates_ncaab = run_ncaab_grading(force=args.force)
-        updates_soccer = run_soccer_grading(force=args.force)
-        
-        if updates_nba or updates_nfl or updates_wnba or updates_ncaab or updates_soccer:
-            # Regenerate Best Plays aggregator
-            try:
-                import best_plays_bot
-                import importlib
-                importlib.reload(best_plays_bot)
-                best_plays_bot.main()
-                log("Regenerated best_plays.html", "success")
-            except Exception as e:
-                log(f"Best plays generation failed: {e}", "warning")
-            
-            trigger_git_push()
-        else:
-            log("No updates found.", "info")
+        run_cycle(force=args.force, parallel=not args.serial)
 
 if __name__ == "__main__":
     main()
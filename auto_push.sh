@@ -5,8 +5,12 @@
 
 cd "/Users/rico/sports-models"
 
-# Add all HTML, CSV, and JSON output files (including root dashboards)
-git add *.html *.json nba/*.html nba/*.csv ncaa/*.html ncaa/*.csv nfl/*.html nfl/*.json soccer/*.html soccer/*.json nba/*.json ncaa/*.json 2>/dev/null
+# Add all HTML, CSV, and JSON output files (including root dashboards) and the shared assets
+git add *.html *.json assets/* nba/*.html nba/*.csv ncaa/*.html ncaa/*.csv nfl/*.html nfl/*.json soccer/*.html soccer/*.json nba/*.json ncaa/*.json 2>/dev/null
+# Pick-history month shards for the tracking dashboards (separate: no shards yet is not an error)
+git add */history/*/*.json 2>/dev/null
+# Archived tracking partitions (<sport>/archive/<tracking file>/<season>/<YYYY-MM>.json)
+git add */archive/*/*/*.json 2>/dev/null
 
 # Check if there are changes to commit
 if git diff --staged --quiet; then
@@ -14,6 +18,13 @@ if git diff --staged --quiet; then
     exit 0
 fi
 
+# render_manifest.json only records when pages were last checked; don't push it on its own
+if [ -z "$(git diff --staged --name-only -- . ':!render_manifest.json')" ]; then
+    git reset -q -- render_manifest.json
+    echo "No page changes to commit"
+    exit 0
+fi
+
 # Create commit with timestamp
 TIMESTAMP=$(date "+%Y-%m-%d %H:%M:%S")
 git commit -m "Update model outputs - $TIMESTAMP"
@@ -2,6 +2,8 @@ import json
 import os
 from datetime import datetime
 
+from tracking_archive import ARCHIVED_TRACKING_FILES, load_tracking, save_tracking
+
 # Define the mapping of tracking files to their stats cache and key names
 CONFIG = [
     # NFL Props
@@ -60,8 +62,8 @@ def backfill():
         if not os.path.exists(tracking_path):
             continue
             
-        with open(tracking_path, 'r') as f:
-            tracking_data = json.load(f)
+        # Team records need the archived picks too
+        tracking_data = load_tracking(tracking_path, full_history=True)
             
         # Calculate Team Records from graded picks in this file (Fallback for Team Bets)
         team_records = {}
@@ -112,8 +114,7 @@ def backfill():
                     updated_in_file += 1
                     
         if updated_in_file > 0:
-            with open(tracking_path, 'w') as f:
-                json.dump(tracking_data, f, indent=2)
+            save_tracking(tracking_path, tracking_data)
             print(f"✅ Updated {updated_in_file} picks in {tracking_path}")
             total_updated += updated_in_file
             
@@ -127,8 +128,11 @@ def backfill():
     ]
     for path in MAINS:
         if not os.path.exists(path): continue
-        with open(path, 'r') as f:
-            data = json.load(f)
+        if path in ARCHIVED_TRACKING_FILES:
+            data = load_tracking(path, full_history=True)
+        else:
+            with open(path, 'r') as f:
+                data = json.load(f)
         
         team_records = {}
         picks = data.get('picks', []) if isinstance(data, dict) else data
@@ -152,8 +156,11 @@ def backfill():
                     updated += 1
         
         if updated > 0:
-            with open(path, 'w') as f:
-                json.dump(data if isinstance(data, dict) else {'picks': picks}, f, indent=2)
+            if path in ARCHIVED_TRACKING_FILES:
+                save_tracking(path, data)
+            else:
+                with open(path, 'w') as f:
+                    json.dump(data if isinstance(data, dict) else {'picks': picks}, f, indent=2)
             print(f"✅ Updated {updated} team records in {path}")
             total_updated += updated
 
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Threshold Sweep Backtester
+--------------------------
+Replays graded picks from the tracking files under a grid of filter settings
+(the `SPREAD_THRESHOLD` / `TOTAL_CALIBRATION` / `MIN_AI_SCORE` /
+`MIN_EDGE_OVER_LINE` / `PAUSE_UNDERS` style constants) and reports what each
+setting would have returned. Use it before retuning a constant off a few days
+of results.
+
+Each pick's stored inputs (edge, A.I. score, line, season/recent averages,
+odds) become one column. Every grid cell becomes a row of parameter values,
+and the filter rules are evaluated as one (cells x picks) boolean mask per
+chunk of the grid. Chunks are spread over CPU cores. Per cell you get the
+sample size, hit rate with a Wilson 95% interval, and ROI per unit staked
+with a normal-approximation 95% interval.
+
+Only picks that were tracked can be replayed, so a sweep can tighten the
+current filters but can't tell you what looser settings would have added.
+A `total_calibration` that would flip a total's side drops that pick. Older
+picks without an input (e.g. no `season_avg`) only count in cells where that
+filter is off (`-inf`, written `off` on the command line).
+
+Usage:
+    python3 backtest_sweep.py nba/nba_points_props_tracking.json
+    python3 backtest_sweep.py nba/nba_*_props_tracking.json --grid min_ai_score=7:10:0.25 pause_unders=0,1
+    python3 backtest_sweep.py ncaa/ncaab_picks_tracking.json --grid spread_threshold=4:12:0.5 --min-n 50 --csv sweep.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from tracking_archive import load_tracking
+
+DEFAULT_ODDS = -110
+Z_95 = 1.96
+
+# Parameters each kind of pick can be swept over, with the value that applies
+# no filter when a parameter is left out of the grid.
+PARAM_DEFAULTS = {
+    'prop': {
+        'min_ai_score': -np.inf,
+        'min_edge_over': -np.inf,     # season_avg - line, OVER picks
+        'min_edge_under': -np.inf,    # line - season_avg, UNDER picks
+        'min_recent_edge': -np.inf,   # recent_avg beyond the line in the pick's direction
+        'pause_unders': 0.0,
+    },
+    'game': {
+        'spread_threshold': 0.0,
+        'total_threshold': 0.0,
+        'total_calibration': 0.0,     # added to the model total before the threshold
+        'max_edge': np.inf,
+    },
+}
+
+# Grid used when --grid isn't given (a few thousand cells each)
+DEFAULT_GRIDS = {
+    'prop': {
+        'min_ai_score': np.arange(0.0, 10.01, 0.25),
+        'min_edge_over': np.r_[-np.inf, np.arange(0.0, 4.01, 0.5)],
+        'min_edge_under': np.r_[-np.inf, np.arange(0.0, 4.01, 0.5)],
+        'pause_unders': np.array([0.0, 1.0]),
+    },
+    'game': {
+        'spread_threshold': np.arange(0.0, 15.01, 0.5),
+        'total_threshold': np.arange(0.0, 20.01, 0.5),
+        'total_calibration': np.arange(-6.0, 6.01, 1.0),
+    },
+}
+
+_WIN = {'win', 'won'}
+_LOSS = {'loss', 'lost'}
+_PUSH = {'push'}
+
+
+@dataclass
+class PickSet:
+    kind: str                      # 'prop' | 'game'
+    cols: dict[str, np.ndarray]    # model inputs, one value per pick
+    profit: np.ndarray             # units won/lost on a 1-unit stake
+    win: np.ndarray
+    loss: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.profit)
+
+
+@dataclass
+class SweepResult:
+    names: list[str]
+    cells: np.ndarray              # (cells, params)
+    n: np.ndarray
+    wins: np.ndarray
+    losses: np.ndarray
+    profit: np.ndarray
+    roi: np.ndarray
+    roi_lo: np.ndarray
+    roi_hi: np.ndarray
+    hit_rate: np.ndarray
+    hit_lo: np.ndarray
+    hit_hi: np.ndarray
+    seconds: float = 0.0
+
+
+def _num(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _is_prop(pick: dict) -> bool:
+    return 'prop_line' in pick or 'bet_type' in pick
+
+
+def load_picks(paths: Iterable[str]) -> PickSet:
+    """Graded picks from one or more tracking files (archives included)."""
+    picks = []
+    for path in paths:
+        picks.extend(load_tracking(path, full_history=True).get('picks', []))
+    graded = [p for p in picks if str(p.get('status', '')).lower() in _WIN | _LOSS | _PUSH]
+    if not graded:
+        raise ValueError("no graded picks found")
+    kinds = {'prop' if _is_prop(p) else 'game' for p in graded}
+    if len(kinds) > 1:
+        raise ValueError("can't sweep player props and game picks together; pass one kind of tracking file")
+    kind = kinds.pop()
+
+    status = np.array([str(p['status']).lower() for p in graded])
+    win = np.isin(status, list(_WIN))
+    loss = np.isin(status, list(_LOSS))
+    odds = np.array([_num(p.get('odds', p.get('opening_odds'))) for p in graded])
+    odds = np.where(np.isfinite(odds) & (np.abs(odds) >= 100), odds, DEFAULT_ODDS)
+    payout = np.where(odds > 0, odds / 100.0, 100.0 / np.abs(odds))
+    profit = np.where(win, payout, np.where(loss, -1.0, 0.0))
+
+    if kind == 'prop':
+        line = np.array([_num(p.get('prop_line', p.get('line'))) for p in graded])
+        over = np.array([str(p.get('bet_type', '')).lower() == 'over' for p in graded])
+        season = np.array([_num(p.get('season_avg')) for p in graded])
+        recent = np.array([_num(p.get('recent_avg')) for p in graded])
+        direction = np.where(over, 1.0, -1.0)
+        cols = {
+            'over': over,
+            'ai_score': np.array([_num(p.get('ai_score')) for p in graded]),
+            'season_edge': direction * (season - line),
+            'recent_edge': direction * (recent - line),
+        }
+    else:
+        pick_type = np.array([str(p.get('pick_type', '')).lower() for p in graded])
+        edge = np.array([_num(p.get('edge')) for p in graded])
+        text = [str(p.get('pick') or p.get('pick_text') or '').upper() for p in graded]
+        side = np.array([1.0 if 'OVER' in t else -1.0 if 'UNDER' in t else np.nan for t in text])
+        cols = {
+            'is_spread': np.char.find(pick_type, 'spread') >= 0,
+            'is_total': np.char.find(pick_type, 'total') >= 0,
+            'edge': edge,
+            'total_side': np.where(np.isnan(side), np.sign(edge), side),
+        }
+    return PickSet(kind, cols, profit, win, loss)
+
+
+def _at_least(values: np.ndarray, threshold: np.ndarray) -> np.ndarray:
+    """values >= threshold; a missing (NaN) value only passes when the filter is off."""
+    return (values >= threshold) | (np.isnan(values) & (threshold == -np.inf))
+
+
+def selection_mask(kind: str, cols: dict[str, np.ndarray], params: dict[str, np.ndarray]) -> np.ndarray:
+    """(cells, picks) mask of picks each cell would have kept. Params are (cells, 1) columns."""
+    if kind == 'prop':
+        over = cols['over']
+        keep = _at_least(cols['ai_score'], params['min_ai_score'])
+        keep &= np.where(over, _at_least(cols['season_edge'], params['min_edge_over']),
+                         _at_least(cols['season_edge'], params['min_edge_under']))
+        keep &= _at_least(cols['recent_edge'], params['min_recent_edge'])
+        keep &= over | (params['pause_unders'] < 0.5)
+        return keep
+
+    edge = cols['edge']
+    spread_ok = (np.abs(edge) >= params['spread_threshold']) & (np.abs(edge) <= params['max_edge'])
+    total_edge = edge + params['total_calibration']
+    total_ok = ((np.sign(total_edge) == cols['total_side'])
+                & (np.abs(total_edge) >= params['total_threshold'])
+                & (np.abs(total_edge) <= params['max_edge']))
+    return (cols['is_spread'] & spread_ok) | (cols['is_total'] & total_ok)
+
+
+def parse_axis(spec: str) -> tuple[str, np.ndarray]:
+    """'name=start:stop:step' (stop inclusive) or 'name=a,b,c'; 'off' is -inf."""
+    name, _, values = spec.partition('=')
+    if ':' in values:
+        start, stop, step = (float(x) for x in values.split(':'))
+        return name, np.arange(start, stop + step / 2, step)
+    return name, np.array([-np.inf if x == 'off' else float(x) for x in values.split(',')])
+
+
+def build_cells(axes: dict[str, np.ndarray]) -> tuple[list[str], np.ndarray]:
+    names = list(axes)
+    cells = np.array(list(itertools.product(*axes.values())), dtype=float).reshape(-1, len(names))
+    return names, cells
+
+
+# Worker state, set once per process so chunks only carry grid rows
+_WORKER_PICKS: Optional[PickSet] = None
+
+
+def _init_worker(picks: PickSet):
+    global _WORKER_PICKS
+    _WORKER_PICKS = picks
+
+
+def _sweep_chunk(names: list[str], cells: np.ndarray, picks: Optional[PickSet] = None):
+    picks = picks or _WORKER_PICKS
+    params = dict(PARAM_DEFAULTS[picks.kind])
+    for i, name in enumerate(names):
+        params[name] = cells[:, i:i + 1]
+    params = {k: (v if isinstance(v, np.ndarray) else np.full((len(cells), 1), v)) for k, v in params.items()}
+    mask = selection_mask(picks.kind, picks.cols, params).astype(np.float64)
+    return (mask.sum(axis=1), mask @ picks.win, mask @ picks.loss,
+            mask @ picks.profit, mask @ (picks.profit ** 2))
+
+
+def sweep(picks: PickSet, axes: dict[str, np.ndarray], workers: Optional[int] = None,
+          chunk_size: int = 1024) -> SweepResult:
+    """Evaluate every cell of the grid. `workers=1` runs in-process."""
+    unknown = set(axes) - set(PARAM_DEFAULTS[picks.kind])
+    if unknown:
+        raise ValueError(f"unknown {picks.kind} parameter(s): {', '.join(sorted(unknown))} "
+                         f"(choose from {', '.join(PARAM_DEFAULTS[picks.kind])})")
+    names, cells = build_cells(axes)
+    chunks = [cells[i:i + chunk_size] for i in range(0, len(cells), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if workers == 1 or len(chunks) == 1:
+        parts = [_sweep_chunk(names, c, picks) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                 initializer=_init_worker, initargs=(picks,)) as pool:
+            parts = list(pool.map(_sweep_chunk, itertools.repeat(names), chunks))
+    n, wins, losses, profit, profit_sq = (np.concatenate(x) for x in zip(*parts))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi = profit / n
+        var = np.maximum(profit_sq / n - roi ** 2, 0.0) * n / np.maximum(n - 1, 1)
+        half = Z_95 * np.sqrt(var / n)
+        decided = wins + losses
+        p = wins / decided
+        z2 = Z_95 ** 2
+        centre = (p + z2 / (2 * decided)) / (1 + z2 / decided)
+        spread = Z_95 * np.sqrt(p * (1 - p) / decided + z2 / (4 * decided ** 2)) / (1 + z2 / decided)
+    return SweepResult(names, cells, n.astype(int), wins.astype(int), losses.astype(int), profit,
+                       roi, roi - half, roi + half, p, centre - spread, centre + spread,
+                       seconds=time.perf_counter() - start)
+
+
+def format_table(result: SweepResult, top: int = 20, min_n: int = 30) -> str:
+    order = np.argsort(-np.where(result.n >= min_n, result.roi, -np.inf), kind='stable')
+    order = [i for i in order[:top] if result.n[i] >= min_n]
+    head = ' '.join(f"{name:>18}" for name in result.names)
+    lines = [f"{head} {'n':>6} {'W-L':>9} {'hit%':>6} {'hit 95% CI':>13} {'ROI%':>7} {'ROI 95% CI':>15}"]
+    for i in order:
+        values = ' '.join(f"{v:>18g}" for v in result.cells[i])
+        lines.append(f"{values} {result.n[i]:>6} {f'{result.wins[i]}-{result.losses[i]}':>9} "
+                     f"{result.hit_rate[i] * 100:>6.1f} "
+                     f"{f'{result.hit_lo[i] * 100:.1f}-{result.hit_hi[i] * 100:.1f}':>13} "
+                     f"{result.roi[i] * 100:>+7.1f} "
+                     f"{f'{result.roi_lo[i] * 100:+.1f}..{result.roi_hi[i] * 100:+.1f}':>15}")
+    if not order:
+        lines.append(f"(no cell has at least {min_n} picks)")
+    return '\n'.join(lines)
+
+
+def write_csv(result: SweepResult, path: str):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(result.names + ['n', 'wins', 'losses', 'hit_rate', 'hit_lo', 'hit_hi',
+                                        'roi', 'roi_lo', 'roi_hi'])
+        for i in range(len(result.cells)):
+            writer.writerow(list(result.cells[i]) + [
+                result.n[i], result.wins[i], result.losses[i],
+                *(round(float(x), 4) for x in (result.hit_rate[i], result.hit_lo[i], result.hit_hi[i],
+                                               result.roi[i], result.roi_lo[i], result.roi_hi[i]))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtest filter thresholds over graded picks')
+    parser.add_argument('files', nargs='+', help='Tracking JSON files (one kind: props or games)')
+    parser.add_argument('--grid', nargs='*', default=None,
+                        help='Axes as name=start:stop:step or name=a,b,c (default: a built-in grid)')
+    parser.add_argument('--workers', type=int, default=None, help='Processes (default: all cores)')
+    parser.add_argument('--min-n', type=int, default=30, help='Smallest sample shown in the table')
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--csv', help='Write every cell to this CSV')
+    args = parser.parse_args()
+
+    picks = load_picks(args.files)
+    axes = dict(parse_axis(s) for s in args.grid) if args.grid else DEFAULT_GRIDS[picks.kind]
+    result = sweep(picks, axes, workers=args.workers)
+
+    base = _sweep_chunk([], np.zeros((1, 0)), picks)
+    base_roi = base[3][0] / base[0][0] * 100
+    print(f"{len(picks)} graded {picks.kind} picks, all tracked: "
+          f"{int(base[1][0])}-{int(base[2][0])}, ROI {base_roi:+.1f}%")
+    print(f"{len(result.cells):,} cells in {result.seconds:.2f}s\n")
+    print(format_table(result, top=args.top, min_n=args.min_n))
+    if args.csv:
+        write_csv(result, args.csv)
+        print(f"\nWrote {len(result.cells):,} cells to {args.csv}")
+
+
+if __name__ == '__main__':
+    main()
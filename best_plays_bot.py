@@ -15,6 +15,10 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 import pytz
 
+from pick_table import SOURCES, source_picks
+from site_assets import page_assets
+from tracking_archive import load_tracking
+
 # Configuration
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_HTML = os.path.join(SCRIPT_DIR, "best_plays.html")
@@ -32,32 +36,21 @@ def now_et():
 def today_str():
     return now_et().strftime('%Y-%m-%d')
 
-# All tracking files to scan
-TRACKING_SOURCES = [
-    # (Name, File Path, Sport, Bet Category)
-    ('NBA Points Props', 'nba/nba_points_props_tracking.json', 'NBA', 'Props'),
-    ('NBA Assists Props', 'nba/nba_assists_props_tracking.json', 'NBA', 'Props'),
-    ('NBA Rebounds Props', 'nba/nba_rebounds_props_tracking.json', 'NBA', 'Props'),
-    ('NBA 3PT Props', 'nba/nba_3pt_props_tracking.json', 'NBA', 'Props'),
-    ('NFL Passing Yards', 'nfl/nfl_passing_yards_props_tracking.json', 'NFL', 'Props'),
-    ('NFL Rushing Yards', 'nfl/nfl_rushing_yards_props_tracking.json', 'NFL', 'Props'),
-    ('NFL Receiving Yards', 'nfl/nfl_receiving_yards_props_tracking.json', 'NFL', 'Props'),
-    ('NFL Receptions', 'nfl/nfl_receptions_props_tracking.json', 'NFL', 'Props'),
-    ('NBA Main', 'nba/nba_picks_tracking.json', 'NBA', 'Spread/Total'),
-    ('NFL Main', 'nfl/nfl_picks_tracking.json', 'NFL', 'Spread/Total'),
-    ('NCAAB', 'ncaa/ncaab_picks_tracking.json', 'NCAAB', 'Spread/Total'),
-    ('Soccer', 'soccer/soccer_picks_tracking.json', 'Soccer', 'Total'),
-]
-
-
-def load_tracking_data(filepath):
-    """Load tracking data from JSON file"""
+# All tracking files to scan (the shared pick table's sources)
+# (Name, File Path, Sport, Bet Category)
+TRACKING_SOURCES = [(src.name, src.path, src.sport, src.category) for src in SOURCES]
+
+
+def load_tracking_data(filepath, full_history=True):
+    """Load picks from a tracking file (archived history included by default)"""
     full_path = os.path.join(SCRIPT_DIR, filepath)
     if not os.path.exists(full_path):
         return []
+    if full_history:
+        # Shared with the dashboards; re-read only when the file changes
+        return source_picks(filepath)
     try:
-        with open(full_path, 'r') as f:
-            data = json.load(f)
+        data = load_tracking(full_path, full_history=full_history)
         picks = data.get('picks', []) if isinstance(data, dict) else data
         # print(f"Loaded {len(picks)} picks from {filepath}")
         return picks
@@ -101,12 +94,12 @@ def calculate_bet_type_stats(picks, bet_type):
     return (wins / total * 100) if total > 0 else 50.0
 
 
-def get_record_breakdown():
+def get_record_breakdown(sources=None):
     """Aggregate records by sport and model"""
+    sources = sources or SourceIndex()
     breakdown = []
     for model_name, filepath, sport, category in TRACKING_SOURCES:
-        picks = load_tracking_data(filepath)
-        stats = calculate_model_stats(picks)
+        stats = sources.model_stats[model_name]
         if stats['total'] > 0:
             breakdown.append({
                 'name': model_name,
@@ -133,6 +126,100 @@ def parse_game_time(game_time_str):
         return None
 
 
+WIN_LOSS = {'win': 'win', 'won': 'win', 'loss': 'loss', 'lost': 'loss'}
+VOID_STATUSES = {'push', 'void', 'cancelled', 'refunded'}
+
+
+class SourceIndex:
+    """
+    Every TRACKING_SOURCES file loaded once per run, with the lookups the bot
+    makes per play:
+
+        picks / model_stats   per model name
+        bet_type_rate()       bet-type win rate per model (computed once per bet type)
+        find_result()         a tracked play's source pick, by pick_id and by
+                              normalized player, bet type and ET game date
+    """
+
+    def __init__(self, sources=TRACKING_SOURCES):
+        self.picks = {}
+        self.model_stats = {}
+        self._bet_type_rates = {}
+        self._by_id = defaultdict(list)      # pick_id -> [pick]
+        self._by_player = defaultdict(list)  # player -> [(BET TYPE, ET date, pick)], source order
+        for model_name, filepath, _, _ in sources:
+            picks = load_tracking_data(filepath)
+            self.picks[model_name] = picks
+            self.model_stats[model_name] = calculate_model_stats(picks)
+            self._bet_type_rates[model_name] = {}
+            for p in picks:
+                p_src = p.get('pick_id') or p.get('pickId')
+                if p_src:
+                    self._by_id[p_src].append(p)
+                try:
+                    player = (p.get('player') or p.get('team') or '').strip().lower()
+                    bet = (p.get('bet_type') or p.get('pick_type') or '').strip().upper()
+                    p_time = parse_game_time(p.get('game_time') or p.get('game_date'))
+                except Exception:
+                    continue
+                self._by_player[player].append((bet, p_time.date().isoformat() if p_time else None, p))
+
+    def bet_type_rate(self, model_name, bet_type):
+        """`calculate_bet_type_stats` for this model, memoized by bet type."""
+        rates = self._bet_type_rates[model_name]
+        key = bet_type.lower()
+        if key not in rates:
+            rates[key] = calculate_bet_type_stats(self.picks[model_name], bet_type)
+        return rates[key]
+
+    def find_result(self, tp):
+        """
+        Settled status ('win', 'loss' or 'void') of the source pick behind a
+        tracked play, or None while it is still pending. A graded pick with the
+        play's source_pick_id decides; otherwise the first source pick (in
+        TRACKING_SOURCES order) with the same player, bet type (either contains
+        the other) and game date.
+        """
+        tp_src = tp.get('source_pick_id')
+        if tp_src:
+            for p in self._by_id.get(tp_src, ()):
+                status = WIN_LOSS.get((p.get('status') or 'pending').lower())
+                if status:
+                    return status
+
+        try:
+            tp_player = (tp.get('player') or '').strip().lower()
+            tp_bet = (tp.get('bet_type') or '').strip().upper()
+            tp_time = parse_game_time(tp.get('game_time')) if isinstance(tp.get('game_time'), str) else tp.get('game_time')
+            tp_date = tp_time.date().isoformat() if tp_time else None
+        except Exception:
+            return None
+
+        for p_bet, p_date, p in self._by_player.get(tp_player, ()):
+            if not (p_bet in tp_bet or tp_bet in p_bet):
+                continue
+            if p_date and tp_date and p_date != tp_date:
+                continue
+            status = (p.get('status') or 'pending').lower()
+            status = WIN_LOSS.get(status) or ('void' if status in VOID_STATUSES else None)
+            if status:
+                return status
+        return None
+
+
+def resolve_pending(tracked_plays, sources):
+    """Settle tracked pending plays from their source picks (in place). Returns how many settled."""
+    settled = 0
+    for tp in tracked_plays:
+        if tp.get('status') != 'pending':
+            continue
+        status = sources.find_result(tp)
+        if status:
+            tp['status'] = status
+            settled += 1
+    return settled
+
+
 def calculate_confidence_score(play, model_stats, bet_type_rate):
     """
     Calculate composite confidence score (0-100)
@@ -173,18 +260,19 @@ def calculate_confidence_score(play, model_stats, bet_type_rate):
     return round(min(100, max(0, total)), 1)
 
 
-def get_pending_plays():
+def get_pending_plays(sources=None):
     """Gather all pending plays from all models with confidence scores"""
+    sources = sources or SourceIndex()
     all_plays = []
     now = now_et()
 
     for model_name, filepath, sport, category in TRACKING_SOURCES:
-        picks = load_tracking_data(filepath)
+        picks = sources.picks[model_name]
         if not picks:
             continue
         
-        # Calculate model stats
-        model_stats = calculate_model_stats(picks)
+        # Model stats (computed once when the sources were loaded)
+        model_stats = sources.model_stats[model_name]
         
         # Get pending plays
         pending = [p for p in picks if p.get('status', 'pending').lower() == 'pending']
@@ -202,7 +290,7 @@ def get_pending_plays():
             
             # Get bet type
             bet_type = p.get('bet_type', p.get('pick_type', 'unknown'))
-            bet_type_rate = calculate_bet_type_stats(picks, bet_type)
+            bet_type_rate = sources.bet_type_rate(model_name, bet_type)
             
             # Calculate confidence score
             confidence = calculate_confidence_score(p, model_stats, bet_type_rate)
@@ -325,16 +413,18 @@ def load_fire_tracking():
 
 
 def save_fire_tracking(data):
-    """Save Fire plays tracking data"""
-    with open(FIRE_TRACKING_FILE, 'w') as f:
+    """Save Fire plays tracking data (atomically, so a page build never reads half a file)"""
+    tmp = f"{FIRE_TRACKING_FILE}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
         json.dump(data, f, indent=2)
+    os.replace(tmp, FIRE_TRACKING_FILE)
 
 
-def update_fire_tracking(current_plays):
+def update_fire_tracking(current_plays, sources=None):
     """
     Update Fire plays tracking:
     1. Add new high-confidence plays
-    2. Check status of pending plays from source files
+    2. Check status of pending plays from source files (`sources`, loaded once per run)
     3. Calculate Fire record
     """
     tracking = load_fire_tracking()
@@ -381,94 +471,8 @@ def update_fire_tracking(current_plays):
                     existing_keys.add(key)
                 tracked_plays.append(new_play)
     
-    # 2. Check status of pending plays
-    # We need to reload source files to check for results
-    # This is efficiently done by creating a map of results from source files
-    results_map = {} # Key: player_bettype_date -> status
-    
-    for _, filepath, _, _ in TRACKING_SOURCES:
-        picks = load_tracking_data(filepath)
-        for p in picks:
-            status = p.get('status', 'pending').lower()
-            if status in ['win', 'won', 'loss', 'lost']:
-                pass # Logic handled below
-
-    # Step 2: Iterate through tracked pending plays and look for them in source files
-    for i, tp in enumerate(tracked_plays):
-        if tp.get('status') != 'pending':
-            continue
-
-        matched = False
-        # If we have a source_pick_id, match exactly
-        tp_src = tp.get('source_pick_id')
-
-        for _, filepath, _, _ in TRACKING_SOURCES:
-            picks = load_tracking_data(filepath)
-            for p in picks:
-                # If source id exists, prefer exact match
-                p_src = p.get('pick_id') or p.get('pickId')
-                if tp_src and p_src and tp_src == p_src:
-                    status = (p.get('status') or 'pending').lower()
-                    if status in ['win', 'won']:
-                        tracked_plays[i]['status'] = 'win'
-                        matched = True
-                    elif status in ['loss', 'lost']:
-                        tracked_plays[i]['status'] = 'loss'
-                        matched = True
-                    if matched: break
-
-                # Fallback matching: normalize player, bet type, date, and line
-                if not matched:
-                    try:
-                        p_player = (p.get('player') or p.get('team') or '').strip().lower()
-                        tp_player = (tp.get('player') or '').strip().lower()
-                        
-                        # Primary bet type (OVER/UNDER/SPREAD/TOTAL)
-                        p_bet = (p.get('bet_type') or p.get('pick_type') or '').strip().upper()
-                        tp_bet = (tp.get('bet_type') or '').strip().upper()
-
-                        # Compare game dates (YYYY-MM-DD) to avoid timezone mismatches
-                        p_time = parse_game_time(p.get('game_time') or p.get('game_date'))
-                        tp_time = None
-                        try:
-                            if isinstance(tp.get('game_time'), str):
-                                tp_time = parse_game_time(tp.get('game_time'))
-                            else:
-                                tp_time = tp.get('game_time')
-                        except:
-                            tp_time = None
-
-                        p_date = p_time.date().isoformat() if p_time else None
-                        tp_date = tp_time.date().isoformat() if tp_time else None
-
-                        # Match player
-                        if p_player == tp_player:
-                            # Match bet type (check for Over/Under/Spread inclusion)
-                            # This handles "UNDER" vs "under" vs "Player Under 244.5"
-                            bet_matched = (p_bet in tp_bet or tp_bet in p_bet)
-                            
-                            # Match date
-                            date_matched = (p_date == tp_date) if (p_date and tp_date) else True
-                            
-                            if bet_matched and date_matched:
-                                status = (p.get('status') or 'pending').lower()
-                                if status in ['win', 'won']:
-                                    tracked_plays[i]['status'] = 'win'
-                                    matched = True
-                                elif status in ['loss', 'lost']:
-                                    tracked_plays[i]['status'] = 'loss'
-                                    matched = True
-                                elif status in ['push', 'void', 'cancelled', 'refunded']:
-                                    tracked_plays[i]['status'] = 'void'
-                                    matched = True
-                                
-                                if matched:
-                                    break
-                    except:
-                        continue
-            if matched:
-                # stop searching other files for this tracked play
-                continue
+    # 2. Check status of pending plays against their source picks
+    resolve_pending(tracked_plays, sources or SourceIndex())
     
     # 3. Calculate Records
     fire_wins = 0
@@ -522,6 +526,8 @@ def generate_html(plays, fire_record=None, breakdown=None):
     # Show up to 50 plays (or all if less than 50)
     top_plays = plays[:50]
     timestamp = now_et().strftime('%Y-%m-%d %I:%M %p ET')
+    # Team logos come from the shared sprite when it has them (see site_assets.py)
+    assets = page_assets(OUTPUT_HTML)
     
     # Fire Record & Breakdown Display
     stats_header_html = ""
@@ -671,13 +677,18 @@ def generate_html(plays, fire_record=None, breakdown=None):
         
         # Team Logo
         logo_url = get_team_logo_url(play.get('team', 'UNK'), play.get('sport', 'NBA'))
+        sprite = assets.logo(logo_url)
+        if sprite:
+            logo_html = f'<svg role="img" aria-label="Team" style="width: 40px; height: 40px;"><use href="{sprite}"></use></svg>'
+        else:
+            logo_html = f'<img src="{logo_url}" alt="Team" style="width: 40px; height: 40px; object-fit: contain;">'
         
         play_cards += f'''
         <div class="play-card">
             <div class="play-content">
                 <div class="play-header">
                     <div class="header-left-group" style="display: flex; align-items: center; gap: 10px;">
-                        <img src="{logo_url}" alt="Team" style="width: 40px; height: 40px; object-fit: contain;">
+                        {logo_html}
                         <div>
                              <div class="play-player">{play['player']}</div>
                              <div class="play-matchup" style="font-size: 12px; color: var(--text-secondary);">{play['matchup']}</div>
@@ -1051,19 +1062,26 @@ def generate_html(plays, fire_record=None, breakdown=None):
     return html
 
 
-def main():
-    print("🎯 Best Plays Aggregator")
-    print("=" * 50)
-    
-    # Get all pending plays with scores
+def build_page(sources=None):
+    """
+    Everything the page shows: (pending plays, fire/solid record, breakdown).
+    Read-only: the record is the one last saved by update_fire_tracking, which
+    only the grading run (main) calls.
+    """
+    # Load every model's tracking once; scoring and the breakdown share it
     print("📊 Scanning all models...")
-    plays = get_pending_plays()
+    sources = sources or SourceIndex()
+    plays = get_pending_plays(sources)
     print(f"   Found {len(plays)} pending plays across all models")
-    
-    # Update Fire plays tracking
-    print("🔥 Updating Fire plays tracking...")
-    fire_record = update_fire_tracking(plays)
-    
+    fire_record = load_fire_tracking().get('record', {})
+
+    print("📋 Calculating breakdown stats...")
+    breakdown = get_record_breakdown(sources)
+    return plays, fire_record, breakdown
+
+
+def print_fire_record(fire_record):
+    """Console summary of the fire/solid record"""
     # Check for legacy format compatibility during transition
     if 'wins' in fire_record:
          # It's the old format
@@ -1074,10 +1092,19 @@ def main():
          sr = fire_record.get('solid', {})
          print(f"   Fire Record: {fr.get('wins',0)}-{fr.get('losses',0)} ({fr.get('win_rate',0):.1f}%)")
          print(f"   Solid Record: {sr.get('wins',0)}-{sr.get('losses',0)} ({sr.get('win_rate',0):.1f}%)")
-    
-    # 3. Calculate breakdown
-    print("📋 Calculating breakdown stats...")
-    breakdown = get_record_breakdown()
+
+
+def main():
+    print("🎯 Best Plays Aggregator")
+    print("=" * 50)
+
+    sources = SourceIndex()
+    plays, _, breakdown = build_page(sources)
+
+    # Track new plays and grade pending ones (the grading path; publish.py only reads the record)
+    print("🔥 Updating Fire plays tracking...")
+    fire_record = update_fire_tracking(plays, sources)
+    print_fire_record(fire_record)
 
     # 4. Generate HTML
     print("📄 Generating HTML...")
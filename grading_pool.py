@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Per-Sport Grading Pool
+----------------------
+Runs each sport's grader in its own long-lived worker process so a slow
+stats.nba.com response no longer holds up NFL or soccer results.
+
+- One worker per sport, kept alive between cycles so its model registry
+  (imported modules, see model_registry.py) survives like it does in-process.
+- Each sport has its own timeout. A worker that overruns is killed and
+  respawned on the next cycle; the other sports are unaffected.
+- Exceptions are caught inside the worker and reported per sport.
+- Each worker sends back its per-model timings so the parent can print one
+  combined report.
+
+Sports must not share tracking files (they don't: nba/, nfl/, wnba/, ncaa/,
+soccer/ each own theirs).
+
+    pool = GradingPool(worker_main, timeouts={'nba': 600})
+    results = pool.run(['nba', 'nfl', 'soccer'], force=False)
+    print(format_sport_report(results, wall_seconds))
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import time
+import traceback
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait
+from typing import Callable, Optional
+
+# Seconds a sport may run before its worker is killed
+DEFAULT_TIMEOUT = 420
+SPORT_TIMEOUTS = {
+    # stats.nba.com can hang for minutes before answering
+    'nba': 600,
+    'nfl': 600,
+    'soccer': 420,
+    'ncaab': 300,
+    'wnba': 180,
+}
+
+
+@dataclass
+class SportResult:
+    sport: str
+    status: str  # 'ok' | 'error' | 'timeout' | 'crashed'
+    updated: bool = False
+    seconds: float = 0.0
+    error: Optional[str] = None
+    timings: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+def worker_loop(sport: str, conn, runner: Callable[..., bool], registry) -> None:
+    """
+    Body of a sport worker: wait for a `force` flag, run one grading pass,
+    send back a result dict. Returns when the parent closes the pipe.
+    """
+    while True:
+        try:
+            force = conn.recv()
+        except (EOFError, OSError):
+            return
+        registry.start_cycle()
+        start = time.perf_counter()
+        result = {'updated': False, 'error': None}
+        try:
+            result['updated'] = bool(runner(force=force))
+        except Exception:
+            result['error'] = traceback.format_exc()
+        result['seconds'] = time.perf_counter() - start
+        result['timings'] = registry.timings
+        conn.send(result)
+
+
+class _Worker:
+    def __init__(self, ctx, target: Callable, sport: str):
+        self.ctx = ctx
+        self.target = target
+        self.sport = sport
+        self.proc = None
+        self.conn = None
+        self.started = 0.0
+
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.is_alive()
+
+    def start(self) -> None:
+        parent_conn, child_conn = self.ctx.Pipe()
+        self.proc = self.ctx.Process(target=self.target, args=(self.sport, child_conn),
+                                     name=f"grader-{self.sport}", daemon=True)
+        self.proc.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+    def submit(self, force: bool) -> None:
+        if not self.alive():
+            self.start()
+        self.started = time.perf_counter()
+        self.conn.send(force)
+
+    def kill(self) -> None:
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.join(5)
+        if self.conn is not None:
+            self.conn.close()
+        self.proc = self.conn = None
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+        if self.proc is not None:
+            self.proc.join(5)
+            if self.proc.is_alive():
+                self.proc.kill()
+        self.proc = self.conn = None
+
+
+class GradingPool:
+    """Persistent worker process per sport, with per-sport timeouts."""
+
+    def __init__(self, target: Callable, timeouts: Optional[dict[str, float]] = None,
+                 default_timeout: float = DEFAULT_TIMEOUT):
+        """
+        target(sport, conn) runs in the child; it must be a module-level
+        function (spawn start method on macOS pickles it by name) and
+        normally just calls `worker_loop`.
+        """
+        self.ctx = mp.get_context()
+        self.target = target
+        self.timeouts = {**SPORT_TIMEOUTS, **(timeouts or {})}
+        self.default_timeout = default_timeout
+        self.workers: dict[str, _Worker] = {}
+
+    def timeout_for(self, sport: str) -> float:
+        return self.timeouts.get(sport, self.default_timeout)
+
+    def run(self, sports, force: bool = False) -> dict[str, SportResult]:
+        """Grade `sports` concurrently; returns once every sport finished or timed out."""
+        results: dict[str, SportResult] = {}
+        running: dict[object, _Worker] = {}
+        for sport in sports:
+            worker = self.workers.get(sport) or _Worker(self.ctx, self.target, sport)
+            self.workers[sport] = worker
+            try:
+                worker.submit(force)
+            except (OSError, ValueError) as e:
+                # Broken pipe from a worker that died between cycles; retry once fresh
+                worker.kill()
+                try:
+                    worker.submit(force)
+                except Exception:
+                    results[sport] = SportResult(sport, 'crashed', error=str(e))
+                    continue
+            running[worker.conn] = worker
+
+        while running:
+            now = time.perf_counter()
+            deadlines = {conn: w.started + self.timeout_for(w.sport) for conn, w in running.items()}
+            ready = wait(list(running), timeout=max(0.0, min(deadlines.values()) - now))
+            for conn in ready:
+                worker = running.pop(conn)
+                try:
+                    msg = conn.recv()
+                except (EOFError, OSError):
+                    code = worker.proc.exitcode if worker.proc else None
+                    results[worker.sport] = SportResult(
+                        worker.sport, 'crashed', seconds=time.perf_counter() - worker.started,
+                        error=f"worker exited (code {code})")
+                    worker.kill()
+                    continue
+                results[worker.sport] = SportResult(
+                    worker.sport, 'error' if msg['error'] else 'ok', updated=msg['updated'],
+                    seconds=msg['seconds'], error=msg['error'], timings=msg['timings'])
+
+            now = time.perf_counter()
+            for conn in [c for c in running if deadlines[c] <= now]:
+                worker = running.pop(conn)
+                worker.kill()
+                results[worker.sport] = SportResult(
+                    worker.sport, 'timeout', seconds=now - worker.started,
+                    error=f"no result after {self.timeout_for(worker.sport):.0f}s; worker killed")
+        return results
+
+    def close(self) -> None:
+        for worker in self.workers.values():
+            worker.close()
+        self.workers = {}
+
+
+def format_sport_report(results: dict[str, SportResult], wall_seconds: float) -> str:
+    """One line per sport plus wall-clock vs. summed time (the parallel speed-up)."""
+    lines = [f"{'sport':<10} {'status':<8} {'updated':>7} {'seconds':>8}"]
+    for sport, r in results.items():
+        lines.append(f"{sport:<10} {r.status:<8} {'yes' if r.updated else 'no':>7} {r.seconds:>7.2f}s")
+    total = sum(r.seconds for r in results.values())
+    lines.append(f"{'wall':<10} {'':<8} {'':>7} {wall_seconds:>7.2f}s  (sum {total:.2f}s)")
+    return '\n'.join(lines)
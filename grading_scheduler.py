@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Game-End Grading Scheduler
+--------------------------
+Works out when each pending pick's game should be over and tells the
+auto-grader which sports are due, instead of polling every sport on a fixed
+interval.
+
+    expected end = game_time + typical game length (per sport) + stats lag
+
+A pick becomes due at its expected end. If it is still pending after its sport
+was graded (box score not posted yet, overtime, delay), it is retried with
+exponential backoff. Between due times the auto-grader sleeps.
+
+Usage (dry run - show what is due and when):
+    python3 grading_scheduler.py
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from tracking_archive import pick_datetime, pick_key
+from tracking_stream import iter_picks
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Typical tip-to-final length in hours
+SPORT_GAME_HOURS = {
+    'nba': 2.5,
+    'ncaab': 2.25,
+    'nfl': 3.5,
+    'soccer': 2.0,
+}
+
+# Box scores usually post a few minutes after the final whistle
+STATS_LAG = timedelta(minutes=10)
+
+# Retry backoff while a due pick is still pending
+RETRY_BASE = timedelta(minutes=10)
+RETRY_MAX = timedelta(hours=2)
+
+# Tracking files whose pending picks drive each sport's grader in auto_grader.py
+SCHEDULED_TRACKING_FILES = {
+    'nba': [
+        'nba/nba_points_props_tracking.json',
+        'nba/nba_assists_props_tracking.json',
+        'nba/nba_rebounds_props_tracking.json',
+        'nba/nba_3pt_props_tracking.json',
+        'nba/nba_picks_tracking.json',
+    ],
+    'nfl': [
+        'nfl/nfl_passing_yards_props_tracking.json',
+        'nfl/nfl_rushing_yards_props_tracking.json',
+        'nfl/nfl_receiving_yards_props_tracking.json',
+        'nfl/nfl_receptions_props_tracking.json',
+        'nfl/atd_model_tracking.json',
+        'nfl/nfl_picks_tracking.json',
+    ],
+    'ncaab': ['ncaa/ncaab_picks_tracking.json'],
+    'soccer': ['soccer/soccer_picks_tracking.json'],
+}
+
+
+@dataclass
+class PendingGame:
+    sport: str
+    key: str
+    expected_end: datetime
+    attempts: int = 0
+    next_try: Optional[datetime] = None
+
+    @property
+    def due_at(self) -> datetime:
+        return self.next_try or self.expected_end
+
+
+def expected_end(sport: str, game_time: datetime) -> datetime:
+    return game_time + timedelta(hours=SPORT_GAME_HOURS.get(sport, 3.0)) + STATS_LAG
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """10m, 20m, 40m, 80m, then every 2h."""
+    return min(RETRY_BASE * (2 ** max(attempts - 1, 0)), RETRY_MAX)
+
+
+class GradingScheduler:
+    """Tracks pending picks across all tracking files and their due times."""
+
+    def __init__(self, tracking_files: dict[str, list[str]] = SCHEDULED_TRACKING_FILES,
+                 root: str = SCRIPT_DIR):
+        self.tracking_files = tracking_files
+        self.root = root
+        self.pending: dict[str, PendingGame] = {}
+
+    def refresh(self) -> None:
+        """Re-read pending picks (streamed, hot files only). Keeps retry state for picks still pending."""
+        seen = {}
+        for sport, files in self.tracking_files.items():
+            for rel in files:
+                path = os.path.join(self.root, rel)
+                if not os.path.exists(path):
+                    continue
+                try:
+                    picks = list(iter_picks(path, status='pending'))
+                except ValueError:
+                    continue
+                for p in picks:
+                    game_time = pick_datetime(p)
+                    if game_time is None:
+                        continue
+                    key = f"{rel}:{pick_key(p)}"
+                    seen[key] = self.pending.get(key) or PendingGame(sport, key, expected_end(sport, game_time))
+        self.pending = seen
+
+    def due_sports(self, now: Optional[datetime] = None) -> dict[str, int]:
+        """Sports with at least one pick past its due time -> number of due picks."""
+        now = now or datetime.now(timezone.utc)
+        due: dict[str, int] = {}
+        for g in self.pending.values():
+            if g.due_at <= now:
+                due[g.sport] = due.get(g.sport, 0) + 1
+        return due
+
+    def record_attempt(self, sports, now: Optional[datetime] = None) -> None:
+        """
+        Call after grading `sports`: re-reads tracking files and pushes any
+        still-pending due picks back with backoff.
+        """
+        now = now or datetime.now(timezone.utc)
+        sports = set(sports)
+        self.refresh()
+        for g in self.pending.values():
+            if g.sport in sports and g.due_at <= now:
+                g.attempts += 1
+                g.next_try = now + retry_delay(g.attempts)
+
+    def next_wake(self, now: Optional[datetime] = None,
+                  max_sleep: float = 900, min_sleep: float = 60) -> float:
+        """Seconds until the next pick is due, clamped to [min_sleep, max_sleep]."""
+        now = now or datetime.now(timezone.utc)
+        upcoming = [g.due_at for g in self.pending.values() if g.due_at > now]
+        if not upcoming:
+            return max_sleep
+        seconds = (min(upcoming) - now).total_seconds()
+        return max(min_sleep, min(seconds, max_sleep))
+
+
+def main():
+    scheduler = GradingScheduler()
+    scheduler.refresh()
+    now = datetime.now(timezone.utc)
+    print(f"{len(scheduler.pending)} pending picks tracked")
+    for sport, count in sorted(scheduler.due_sports(now).items()):
+        print(f"  due now: {sport} ({count} picks)")
+    by_sport: dict[str, datetime] = {}
+    for g in scheduler.pending.values():
+        if g.due_at > now and (g.sport not in by_sport or g.due_at < by_sport[g.sport]):
+            by_sport[g.sport] = g.due_at
+    for sport, due_at in sorted(by_sport.items(), key=lambda x: x[1]):
+        print(f"  next {sport}: {due_at.isoformat()} (in {(due_at - now).total_seconds() / 60:.0f} min)")
+    print(f"next wake in {scheduler.next_wake(now, max_sleep=86400):.0f}s")
+
+
+if __name__ == '__main__':
+    main()
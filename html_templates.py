@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Shared HTML Templates
+---------------------
+One Jinja2 environment for every model's HTML output. Page pieces live in
+`templates/` at the repo root:
+
+    base.html            <head>, stylesheet, page container. Pages rendered with
+                         `page=` link assets/courtside.<hash>.css (site_assets.py);
+                         without it props.css is inlined
+    stats_header.html    brand header with the season record
+    pick_card.html       one prop pick card
+    tracking_table.html  summary grid, daily performance, recent form, model performance
+    props_page.html      the props page assembled from the pieces above
+    history_panel.html   lazy "Pick History" card for the tracking dashboards (tracking_shards.py)
+
+Templates are compiled once per process and kept in the environment's cache.
+Their bytecode is also written to `templates/.cache/`, so a fresh process skips
+the compile step too. The auto-grader re-renders every model in one process,
+so each page after the first reuses the compiled set.
+
+Models that still keep their page as an inline template string compile it
+with `compile_template(source)`. The result is memoized by source, so a
+repeated render only re-runs the template.
+
+    html = render('props_page.html', page=OUTPUT_HTML, title="CourtSide Analytics - NBA Points", ...)
+    template = compile_template(template_str)      # instead of jinja2.Template(template_str)
+
+`template_version()` digests the template files and this module. The
+auto-grader folds it into every page's render digest, so editing a template
+re-renders the pages built from it.
+
+Benchmark: tools/bench_templates.py
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from render_manifest import file_fingerprint
+from site_assets import page_assets
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(SCRIPT_DIR, 'templates')
+BYTECODE_DIR = os.path.join(TEMPLATE_DIR, '.cache')
+
+CLV_TAGS = {
+    'positive': {"text": "✅ CLV: Beat Line", "color": "green"},
+    'negative': {"text": "⚠️ CLV: Missed Line", "color": "red"},
+    'neutral': {"text": "➖ CLV: Neutral", "color": "blue"},
+    None: {"text": "⏳ CLV: Tracking", "color": "blue"},
+}
+
+_env: Optional[Environment] = None
+_inline: dict[str, Template] = {}
+
+
+def signed(value: Any, digits: int = 1) -> str:
+    """+1.5 / -0.3 style number."""
+    try:
+        return f"{float(value):+.{digits}f}"
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def american_odds(value: Any) -> str:
+    """-110 / +150, or N/A when missing."""
+    if value is None or value == '':
+        return 'N/A'
+    try:
+        odds = int(value)
+    except (TypeError, ValueError):
+        return str(value)
+    return f'+{odds}' if odds > 0 else str(odds)
+
+
+def tone(value: Any, positive: str = 'txt-green', negative: str = 'txt-red') -> str:
+    """CSS class for a profit/ROI number: green above zero, red below."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return ''
+    if value > 0:
+        return positive
+    if value < 0:
+        return negative
+    return ''
+
+
+def clv_tag(clv_status: Any) -> Optional[dict[str, str]]:
+    """Reasoning tag for a tracked pick's CLV status (None for unknown statuses)."""
+    tag = CLV_TAGS.get(clv_status)
+    return dict(tag) if tag else None
+
+
+def environment() -> Environment:
+    """The shared environment (built on first use)."""
+    global _env
+    if _env is None:
+        os.makedirs(BYTECODE_DIR, exist_ok=True)
+        _env = Environment(
+            loader=FileSystemLoader(TEMPLATE_DIR),
+            bytecode_cache=FileSystemBytecodeCache(BYTECODE_DIR),
+            cache_size=-1,
+            auto_reload=True,
+        )
+        _env.filters['signed'] = signed
+        _env.filters['odds'] = american_odds
+        _env.filters['tone'] = tone
+    return _env
+
+
+def get_template(name: str) -> Template:
+    """Compiled template from `templates/` (cached)."""
+    return environment().get_template(name)
+
+
+def render(name: str, page: Optional[str] = None, **context: Any) -> str:
+    """
+    Render a template from `templates/`. With `page` (the output file), the page
+    links the shared stylesheet and logo sprites (see site_assets.py) instead of
+    inlining the CSS.
+    """
+    if page is not None:
+        context.setdefault('assets', page_assets(page))
+    return get_template(name).render(**context)
+
+
+def template_version() -> str:
+    """Digest of templates/*, plus this module's filters and asset wiring."""
+    files = sorted(entry.path for entry in os.scandir(TEMPLATE_DIR) if entry.is_file())
+    return file_fingerprint(*files, __file__)
+
+
+def compile_template(source: str) -> Template:
+    """Compiled inline template, memoized by its source text."""
+    template = _inline.get(source)
+    if template is None:
+        template = environment().from_string(source)
+        _inline[source] = template
+    return template
+
+
+def precompile() -> int:
+    """Compile every template in `templates/` (fills the bytecode cache). Returns the count."""
+    env = environment()
+    names = env.list_templates(extensions=['html', 'css'])
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+if __name__ == '__main__':
+    print(f"Compiled {precompile()} templates into {BYTECODE_DIR}")
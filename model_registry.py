@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Model Plugin Registry
+---------------------
+Declares every model the auto-grader drives and the entry points it uses:
+
+    grade    - settles pending picks (returns a count when it can)
+    stats    - computes tracking stats for the HTML
+    render   - regenerates the model's HTML
+    tracking - regenerates the model's tracking dashboard from its tracking file alone
+
+Modules are imported once per process and only re-executed when their source
+file's mtime changes, so a long `auto_grader.py --loop` no longer re-runs every
+model's top-level code (nba_api, pandas, config) each cycle. Each cycle also
+records how long imports, grading and rendering took per model.
+
+    registry = ModelRegistry()
+    mod = registry.load('nba_points_props_model')
+    with registry.timed('nba_points_props_model', 'grade'):
+        registry.entry('nba_points_props_model', 'grade')()
+    registry.report()
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Callable, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    name: str
+    path: str  # relative to the repo root
+    sport: str
+    grade: Optional[str] = None
+    stats: Optional[str] = None
+    render: Optional[str] = None
+    tracking: Optional[str] = None
+
+
+MODELS = [
+    # NBA props are graded together by auto_grader.grade_nba_props()
+    ModelSpec('nba_points_props_model', 'nba/nba_points_props_model.py', 'nba',
+              stats='calculate_tracking_stats', render='generate_html_output'),
+    ModelSpec('nba_assists_props_model', 'nba/nba_assists_props_model.py', 'nba',
+              stats='calculate_tracking_stats', render='generate_html_output'),
+    ModelSpec('nba_rebounds_props_model', 'nba/nba_rebounds_props_model.py', 'nba',
+              stats='calculate_tracking_stats', render='generate_html_output'),
+    ModelSpec('nba_3pt_props_model', 'nba/nba_3pt_props_model.py', 'nba',
+              stats='calculate_tracking_stats', render='generate_html_output'),
+    ModelSpec('nba_model_IMPROVED', 'nba/nba_model_IMPROVED.py', 'nba',
+              grade='update_pick_results', render='generate_tracking_html', tracking='generate_tracking_html'),
+    # NFL props are graded through nfl/props_grader.py
+    ModelSpec('nfl_passing_yards_props_model', 'nfl/nfl_passing_yards_props_model.py', 'nfl',
+              stats='calculate_tracking_stats', render='generate_html_output'),
+    ModelSpec('nfl_rushing_yards_props_model', 'nfl/nfl_rushing_yards_props_model.py', 'nfl',
+              stats='calculate_tracking_stats', render='generate_html_output'),
+    ModelSpec('nfl_receiving_yards_props_model', 'nfl/nfl_receiving_yards_props_model.py', 'nfl',
+              stats='calculate_tracking_stats', render='generate_html_output'),
+    ModelSpec('nfl_receptions_props_model', 'nfl/nfl_receptions_props_model.py', 'nfl',
+              stats='calculate_tracking_stats', render='generate_html_output'),
+    ModelSpec('atd_model', 'nfl/atd_model.py', 'nfl',
+              stats='calculate_tracking_stats', render='generate_html_output'),
+    ModelSpec('nfl_model_IMPROVED', 'nfl/nfl_model_IMPROVED.py', 'nfl',
+              grade='grade_pending_picks', render='main', tracking='generate_tracking_html'),
+    ModelSpec('wnba_model', 'wnba/wnba_model.py', 'wnba',
+              stats='get_stats', render='generate_html'),
+    ModelSpec('wnba_props_model', 'wnba/wnba_props_model.py', 'wnba',
+              stats='get_stats', render='generate_html'),
+    ModelSpec('ncaab_model_2ndFINAL', 'ncaa/ncaab_model_2ndFINAL.py', 'ncaab',
+              grade='update_pick_results', render='generate_tracking_html', tracking='generate_tracking_html'),
+    ModelSpec('soccer_model_IMPROVED', 'soccer/soccer_model_IMPROVED.py', 'soccer',
+              grade='update_pick_results', render='main', tracking='generate_tracking_html'),
+    ModelSpec('best_plays_bot', 'best_plays_bot.py', 'all', render='main'),
+]
+
+
+class ModelRegistry:
+    """Loads model modules once and hot-reloads them only when their file changes."""
+
+    def __init__(self, specs: list[ModelSpec] = MODELS, root: str = SCRIPT_DIR):
+        self.specs = {s.name: s for s in specs}
+        self.root = root
+        self._modules: dict[str, ModuleType] = {}
+        self._mtimes: dict[str, float] = {}
+        self.timings: dict[str, dict[str, float]] = {}
+
+    def spec(self, name: str) -> ModelSpec:
+        return self.specs[name]
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.root, self.specs[name].path)
+
+    def names(self, sport: Optional[str] = None) -> list[str]:
+        return [n for n, s in self.specs.items() if sport is None or s.sport == sport]
+
+    def load(self, name: str) -> ModuleType:
+        """Return the module, importing it on first use or when its source changed."""
+        path = self.path(name)
+        mtime = os.path.getmtime(path)
+        mod = self._modules.get(name)
+        if mod is not None and self._mtimes.get(name) == mtime:
+            return mod
+
+        with self.timed(name, 'import'):
+            # Models import siblings by bare name (e.g. `from props_grader import ...`)
+            model_dir = os.path.dirname(path)
+            if model_dir not in sys.path:
+                sys.path.append(model_dir)
+            module_spec = importlib.util.spec_from_file_location(name, path)
+            mod = importlib.util.module_from_spec(module_spec)
+            sys.modules[name] = mod
+            try:
+                module_spec.loader.exec_module(mod)
+            except Exception:
+                # Keep serving the last good version if an edit broke the module
+                if name in self._modules:
+                    sys.modules[name] = self._modules[name]
+                else:
+                    sys.modules.pop(name, None)
+                raise
+
+        self._modules[name] = mod
+        self._mtimes[name] = mtime
+        return mod
+
+    def entry(self, name: str, kind: str) -> Optional[Callable]:
+        """The module's declared `grade` / `stats` / `render` / `tracking` callable, if it has one."""
+        attr = getattr(self.specs[name], kind)
+        if not attr:
+            return None
+        return getattr(self.load(name), attr, None)
+
+    def start_cycle(self) -> None:
+        self.timings = {}
+
+    @contextmanager
+    def timed(self, name: str, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            phases = self.timings.setdefault(name, {})
+            phases[phase] = phases.get(phase, 0.0) + time.perf_counter() - start
+
+    def report(self) -> str:
+        """Per-model import/grade/render seconds for the current cycle."""
+        lines = [f"{'model':<34} {'import':>8} {'grade':>8} {'render':>8}"]
+        totals = {'import': 0.0, 'grade': 0.0, 'render': 0.0}
+        for name, phases in self.timings.items():
+            cells = []
+            for phase in totals:
+                value = phases.get(phase)
+                if value is not None:
+                    totals[phase] += value
+                cells.append(f"{value:>7.2f}s" if value is not None else f"{'-':>8}")
+            lines.append(f"{name:<34} {' '.join(cells)}")
+        lines.append(f"{'TOTAL':<34} " + ' '.join(f"{v:>7.2f}s" for v in totals.values()))
+        return '\n'.join(lines)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+NBA Slate Simulator
+-------------------
+Turns the model's point estimates (`calculate_model_spread`,
+`calculate_model_total`) into probabilities. Every game on the slate is
+simulated in one NumPy batch from a fixed seed, so a refresh with the same
+inputs gives the same numbers.
+
+Home and away scores are drawn as a correlated bivariate normal:
+
+    mean home = (total + spread) / 2      mean away = (total - spread) / 2
+    sd(home - away) = MARGIN_SD           sd(home + away) = TOTAL_SD
+
+Scores are rounded to whole points and ties go to overtime. Each game's
+simulated margins and totals are reduced to histograms. Cover, over and win
+probabilities for the main line and every alt line are then cumulative-sum
+lookups, with pushes on whole-number lines.
+
+    sim = simulate_slate([4.5, -2.0], [228.0, 219.5])
+    sim.home_win                               # P(home wins) per game
+    sim.home_cover(0, [-3.5, -4.5, -5.5])      # (cover, push, lose) for home lines
+    sim.over(1, [217.5, 219.5, 221.5])         # (over, push, under)
+
+Benchmark and accuracy check: tools/bench_game_simulator.py
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+N_SIMS = 100_000
+SIM_SEED = 20251021
+
+# Historical NBA spread/total residual spreads around closing numbers
+MARGIN_SD = 12.5
+TOTAL_SD = 18.5
+
+# Overtime: each team scores ~10.5 in a 5-minute period
+OT_POINTS_MEAN = 10.5
+OT_POINTS_SD = 3.5
+MAX_OT_PERIODS = 3
+
+MAX_MARGIN = 90
+MAX_TOTAL = 400
+
+
+class SlateSimulation:
+    """Per-game histograms of simulated margins (home - away) and totals."""
+
+    def __init__(self, margin_counts: np.ndarray, total_counts: np.ndarray, n_sims: int):
+        self.n_sims = n_sims
+        # CDFs with a leading 0 column so CDF(k - 1) is always addressable
+        self._margin_cdf = np.hstack([np.zeros((len(margin_counts), 1)), np.cumsum(margin_counts, axis=1) / n_sims])
+        self._total_cdf = np.hstack([np.zeros((len(total_counts), 1)), np.cumsum(total_counts, axis=1) / n_sims])
+        # Ties are resolved in overtime, so a margin of 0 never survives
+        self.home_win = 1.0 - self._margin_cdf[:, MAX_MARGIN + 1]
+
+    def __len__(self) -> int:
+        return len(self.home_win)
+
+    @staticmethod
+    def _above(cdf_row: np.ndarray, x: np.ndarray, offset: int, top: int):
+        """(P(X > x), P(X == x)) from a padded CDF row over integers offset..offset+top."""
+        k = np.floor(x)
+        whole = (x == k) & (k - offset >= 0) & (k - offset <= top)
+        i = np.clip(k.astype(np.int64) - offset, -1, top)
+        cdf_k = cdf_row[..., i + 1]
+        cdf_below = cdf_row[..., np.maximum(i, 0)]
+        return 1.0 - cdf_k, np.where(whole, cdf_k - cdf_below, 0.0)
+
+    def home_cover(self, game: int, home_lines: Sequence[float]):
+        """(cover, push, lose) for the home side at each home spread (e.g. -5.5)."""
+        lines = np.asarray(home_lines, dtype=float)
+        # Home covers when margin + line > 0, i.e. margin > -line
+        cover, push = self._above(self._margin_cdf[game], -lines, -MAX_MARGIN, 2 * MAX_MARGIN)
+        return cover, push, 1.0 - cover - push
+
+    def over(self, game: int, totals: Sequence[float]):
+        """(over, push, under) at each total line."""
+        lines = np.asarray(totals, dtype=float)
+        over, push = self._above(self._total_cdf[game], lines, 0, MAX_TOTAL)
+        return over, push, 1.0 - over - push
+
+
+def simulate_slate(model_spreads: Sequence[float], model_totals: Sequence[float],
+                   n_sims: int = N_SIMS, seed: int = SIM_SEED,
+                   margin_sd: float = MARGIN_SD, total_sd: float = TOTAL_SD) -> SlateSimulation:
+    """
+    Simulate every game at once. `model_spreads` are expected home margins
+    (positive = home favored), `model_totals` expected combined points.
+    """
+    spreads = np.asarray(model_spreads, dtype=np.float64)
+    totals = np.asarray(model_totals, dtype=np.float64)
+    n_games = len(spreads)
+    rng = np.random.default_rng(seed)
+
+    # Per-team sd and correlation that reproduce the margin and total sds
+    var_team = (total_sd ** 2 + margin_sd ** 2) / 4.0
+    rho = (total_sd ** 2 - margin_sd ** 2) / (total_sd ** 2 + margin_sd ** 2)
+    sd = np.sqrt(var_team)
+
+    z = rng.standard_normal((2, n_games, n_sims), dtype=np.float32)
+    home_mean = ((totals + spreads) / 2.0)[:, None]
+    away_mean = ((totals - spreads) / 2.0)[:, None]
+    home = np.rint(home_mean + sd * z[0]).astype(np.int32)
+    away = np.rint(away_mean + sd * (rho * z[0] + np.sqrt(1.0 - rho ** 2) * z[1])).astype(np.int32)
+
+    # Overtime until someone leads; a coin flip settles the rare triple-OT tie
+    for _ in range(MAX_OT_PERIODS):
+        tied = home == away
+        n_tied = int(tied.sum())
+        if not n_tied:
+            break
+        ot = np.rint(rng.normal(OT_POINTS_MEAN, OT_POINTS_SD, (2, n_tied))).astype(np.int32)
+        home[tied] += ot[0]
+        away[tied] += ot[1]
+    tied = home == away
+    if tied.any():
+        home[tied] += np.where(rng.random(int(tied.sum())) < 0.5, 1, 0)
+        away[tied] += np.where(home[tied] > away[tied], 0, 1)
+
+    margin = np.clip(home - away, -MAX_MARGIN, MAX_MARGIN) + MAX_MARGIN
+    total = np.clip(home + away, 0, MAX_TOTAL)
+
+    # One bincount per quantity for the whole slate: offset each game into its own block
+    game_ix = np.arange(n_games, dtype=np.int64)[:, None]
+    margin_width, total_width = 2 * MAX_MARGIN + 1, MAX_TOTAL + 1
+    margin_counts = np.bincount((game_ix * margin_width + margin).ravel(),
+                                minlength=n_games * margin_width).reshape(n_games, margin_width)
+    total_counts = np.bincount((game_ix * total_width + total).ravel(),
+                               minlength=n_games * total_width).reshape(n_games, total_width)
+    return SlateSimulation(margin_counts, total_counts, n_sims)
+
+
+def line_ladder(sim: SlateSimulation, game: int, home_spreads: Sequence[float],
+                totals: Sequence[float]) -> dict:
+    """Home cover / over probabilities keyed by line, for storing with a game's result."""
+    cover, _, _ = sim.home_cover(game, home_spreads)
+    over, _, _ = sim.over(game, totals)
+    return {
+        'spreads': {float(l): round(float(p), 4) for l, p in zip(home_spreads, cover)},
+        'totals': {float(l): round(float(p), 4) for l, p in zip(totals, over)},
+    }
+
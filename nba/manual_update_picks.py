@@ -4,10 +4,13 @@ Manual Pick Result Updater
 Use this when NBA API is blocked to manually enter game scores and update picks
 """
 
-import json
 import os
+import sys
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tracking_archive
+
 class Colors:
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -25,15 +28,25 @@ def load_tracking():
         print(f"{Colors.YELLOW}Make sure you're in the same directory as your tracking file{Colors.END}")
         return None
     
-    with open(tracking_file, 'r') as f:
-        return json.load(f)
+    # Full history, so the record below includes picks rolled into the archive
+    return tracking_archive.load_tracking(tracking_file, full_history=True)
 
 def save_tracking(tracking_data):
-    """Save tracking data"""
-    with open('nba_picks_tracking.json', 'w') as f:
-        json.dump(tracking_data, f, indent=2)
+    """Save tracking data (cold picks go back to their archive partitions)"""
+    tracking_data.pop('summary', None)
+    tracking_archive.save_tracking('nba_picks_tracking.json', tracking_data)
     print(f"{Colors.GREEN}✅ Tracking data saved{Colors.END}")
 
+def record_summary(picks):
+    """Record counts computed from the picks"""
+    return {
+        'total_picks': len(picks),
+        'wins': sum(1 for p in picks if p.get('status', '').lower() == 'win'),
+        'losses': sum(1 for p in picks if p.get('status', '').lower() == 'loss'),
+        'pushes': sum(1 for p in picks if p.get('status', '').lower() == 'push'),
+        'pending': sum(1 for p in picks if p.get('status', '').lower() == 'pending'),
+    }
+
 def manual_update_picks():
     """Manually update pick results by entering scores"""
     
@@ -52,10 +65,11 @@ def manual_update_picks():
         print(f"{Colors.GREEN}✅ No pending picks to update!{Colors.END}")
         
         # Show summary
-        total = tracking_data['summary']['total_picks']
-        wins = tracking_data['summary']['wins']
-        losses = tracking_data['summary']['losses']
-        pushes = tracking_data['summary']['pushes']
+        summary = record_summary(tracking_data['picks'])
+        total = summary['total_picks']
+        wins = summary['wins']
+        losses = summary['losses']
+        pushes = summary['pushes']
         
         if total > 0:
             print(f"\n{Colors.CYAN}Current Record:{Colors.END}")
@@ -171,16 +185,11 @@ def manual_update_picks():
         pick['status'] = result
         pick['profit_loss'] = profit
         
-        # Update summary
-        tracking_data['summary']['pending'] -= 1
         if result == 'Win':
-            tracking_data['summary']['wins'] += 1
             print(f"\n{Colors.GREEN}✅ WIN - Profit: +${profit/100:.2f} units{Colors.END}")
         elif result == 'Loss':
-            tracking_data['summary']['losses'] += 1
             print(f"\n{Colors.RED}❌ LOSS - Loss: -${abs(profit)/100:.2f} units{Colors.END}")
         else:
-            tracking_data['summary']['pushes'] += 1
             print(f"\n{Colors.YELLOW}➖ PUSH - No change{Colors.END}")
         
         updated_count += 1
@@ -195,11 +204,12 @@ def manual_update_picks():
         print(f"Updated {updated_count} pick(s)")
         
         # Calculate and show stats
-        total = tracking_data['summary']['total_picks']
-        wins = tracking_data['summary']['wins']
-        losses = tracking_data['summary']['losses']
-        pushes = tracking_data['summary']['pushes']
-        pending_remaining = tracking_data['summary']['pending']
+        summary = record_summary(tracking_data['picks'])
+        total = summary['total_picks']
+        wins = summary['wins']
+        losses = summary['losses']
+        pushes = summary['pushes']
+        pending_remaining = summary['pending']
         
         print(f"\n{Colors.CYAN}Overall Record:{Colors.END}")
         print(f"  Total Picks: {total}")
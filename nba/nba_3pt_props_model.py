@@ -12,6 +12,7 @@ Targets:
 
 import json
 import os
+import sys
 import re
 import statistics
 import time
@@ -29,6 +30,26 @@ from nba_api.stats.static import players
 # Ensure pandas is available for nba_api DataFrames
 import pandas as pd  # noqa: F401
 
+# Hot/cold tracking storage, the per-run tracking index and shared HTML templates (repo root)
+try:
+    from html_templates import american_odds, clv_tag, render, tone
+    from run_context import RunContext
+    from tracking_archive import load_tracking, save_tracking
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import american_odds, clv_tag, render, tone
+    from run_context import RunContext
+    from tracking_archive import load_tracking, save_tracking
+
+# Vectorized scoring and game-log distributions used by analyze_props (sibling modules)
+try:
+    from prop_distributions import hit_prob, price_batch
+    from props_kernel import MarketSpec, score_batch, side_odds
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from prop_distributions import hit_prob, price_batch
+    from props_kernel import MarketSpec, score_batch, side_odds
+
 # Load environment variables
 load_dotenv()
 
@@ -59,6 +80,9 @@ MIN_EDGE_OVER_LINE = 1.0
 MIN_EDGE_UNDER_LINE = 0.8
 MIN_RECENT_FORM_EDGE = 1.0
 
+# Array form of calculate_ai_score / calculate_ev / calculate_probability_edge
+SCORING_SPEC = MarketSpec.for_market("threes", MIN_EDGE_OVER_LINE, MIN_EDGE_UNDER_LINE, MIN_RECENT_FORM_EDGE)
+
 
 class Colors:
     GREEN = "\033[92m"
@@ -73,17 +97,13 @@ class Colors:
 # TRACKING FUNCTIONS
 # =============================================================================
 
-def load_tracking_data():
-    """Load tracking data from JSON file"""
-    if os.path.exists(TRACKING_FILE):
-        with open(TRACKING_FILE, 'r') as f:
-            return json.load(f)
-    return {'picks': [], 'summary': {}}
+def load_tracking_data(full_history=False):
+    """Load tracking data (hot file only unless full_history=True)"""
+    return load_tracking(TRACKING_FILE, full_history=full_history, default={'picks': [], 'summary': {}})
 
 def save_tracking_data(tracking_data):
-    """Save tracking data to JSON file"""
-    with open(TRACKING_FILE, 'w') as f:
-        json.dump(tracking_data, f, indent=2)
+    """Save tracking data, rolling old settled picks into the archive"""
+    save_tracking(TRACKING_FILE, tracking_data)
 
 def track_new_picks(over_plays, under_plays):
     """Track new picks in the tracking file"""
@@ -134,6 +154,7 @@ def track_new_picks(over_plays, under_plays):
                 'team': play.get('team'),
                 'opponent': play.get('opponent'),
                 'ai_score': play.get('ai_score'),
+                'hit_prob': play.get('hit_prob'),
                 'odds': play.get('odds'),
                 'opening_odds': play.get('odds'),
                 'latest_odds': play.get('odds'),
@@ -1225,6 +1246,7 @@ def analyze_props(props_list, player_stats, three_factors):
     
     current_time = datetime.now(pytz.utc)
     
+    candidates = []
     for prop in props_list:
         player_name = prop.get("player")
         team = prop.get("team")
@@ -1284,19 +1306,35 @@ def analyze_props(props_list, player_stats, three_factors):
                     opponent_3pt = factors
                     break
 
+        candidates.append((prop, player_data, opponent_3pt))
+
+    # Score every candidate, both sides, in one vectorized pass (props_kernel.py)
+    batch = score_batch(SCORING_SPEC, [
+        (player_data, prop.get("prop_line"), side_odds(prop, "over"), side_odds(prop, "under"), opponent)
+        for prop, player_data, opponent in candidates
+    ])
+
+    # Reprice EV and probability edge from the game-log distributions where a player has
+    # one (prop_distributions.py); the capped heuristic stays for the rest
+    price_batch("FG3M", [prop.get("player") for prop, _, _ in candidates], batch)
+
+    for i, (prop, player_data, opponent_3pt) in enumerate(candidates):
+        player_name = prop.get("player")
+        prop_line = prop.get("prop_line")
+        opponent_team = prop.get("opponent")
         season_avg = float(player_data.get("season_3pm_avg", 0) or 0)
         recent_avg = float(player_data.get("recent_3pm_avg", 0) or 0)
 
         # OVER
-        over_score = calculate_ai_score(player_data, prop_line, "over", opponent_3pt)
+        over_score = float(batch["over_score"][i])
         if over_score >= MIN_AI_SCORE:
             if season_avg >= prop_line + 0.5 and recent_avg >= prop_line + 0.3:
                 over_odds = prop.get("over_price")
                 if over_odds is None:
                     over_odds = prop.get("under_price")
 
-                ev = calculate_ev(over_score, prop_line, season_avg, recent_avg, over_odds, "over")
-                prob_edge = calculate_probability_edge(over_score, season_avg, recent_avg, prop_line, over_odds, "over")
+                ev = float(batch["over_ev"][i])
+                prob_edge = float(batch["over_prob_edge"][i])
 
                 play = {
                     "player": player_name,
@@ -1313,6 +1351,7 @@ def analyze_props(props_list, player_stats, three_factors):
                     "edge": round(season_avg - prop_line, 2),
                     "ev": round(ev, 2),
                     "probability_edge": prob_edge,
+                    "hit_prob": hit_prob(batch, "over", i),
                 }
                 play["ai_rating"] = calculate_ai_rating_props(play)
                 over_plays.append(play)
@@ -1322,15 +1361,15 @@ def analyze_props(props_list, player_stats, three_factors):
             skipped_low_score += 1
 
         # UNDER
-        under_score = calculate_ai_score(player_data, prop_line, "under", opponent_3pt)
+        under_score = float(batch["under_score"][i])
         if under_score >= MIN_AI_SCORE:
             if season_avg <= prop_line - 0.5 and recent_avg <= prop_line - 0.3:
                 under_odds = prop.get("under_price")
                 if under_odds is None:
                     under_odds = prop.get("over_price")
 
-                ev = calculate_ev(under_score, prop_line, season_avg, recent_avg, under_odds, "under")
-                prob_edge = calculate_probability_edge(under_score, season_avg, recent_avg, prop_line, under_odds, "under")
+                ev = float(batch["under_ev"][i])
+                prob_edge = float(batch["under_prob_edge"][i])
 
                 play = {
                     "player": player_name,
@@ -1347,6 +1386,7 @@ def analyze_props(props_list, player_stats, three_factors):
                     "edge": round(prop_line - season_avg, 2),
                     "ev": round(ev, 2),
                     "probability_edge": prob_edge,
+                    "hit_prob": hit_prob(batch, "under", i),
                 }
                 play["ai_rating"] = calculate_ai_rating_props(play)
                 under_plays.append(play)
@@ -1536,22 +1576,12 @@ def generate_reasoning_tags(play, player_data, opponent_factors):
 # HTML output
 # =============================================================================
 
-def generate_html_output(over_plays, under_plays, stats=None, tracking_data=None, threes_factors=None, player_stats=None):
-    """Generate HTML output matching the modern styling guide"""
-    from datetime import datetime as dt
-    et = pytz.timezone('US/Eastern')
-    now = dt.now(et)
-    
-    # Helper function to format odds for display
-    def format_odds(odds_value):
-        if odds_value is None:
-            return 'N/A'
-        try:
-            odds = int(odds_value)
-            return f'+{odds}' if odds > 0 else str(odds)
-        except:
-            return str(odds_value) if odds_value else 'N/A'
-    
+def generate_html_output(over_plays, under_plays, stats=None, tracking_data=None, threes_factors=None, player_stats=None, context=None):
+    """Generate HTML output matching the modern styling guide (shared props_page template)"""
+    # Per-card player records and CLV lookups come from one index over tracking
+    if context is None and tracking_data:
+        context = RunContext(tracking_data)
+
     # Helper function to get short team name
     def get_short_team_name(team_name):
         short_name_map = {
@@ -1571,6 +1601,7 @@ def generate_html_output(over_plays, under_plays, stats=None, tracking_data=None
     
     player_stats_lookup = player_stats or {}
     defense_lookup = threes_factors or {}
+    stats = stats or {}
     
     # Get completed picks and calculate recent performance
     completed_picks = []
@@ -1578,864 +1609,89 @@ def generate_html_output(over_plays, under_plays, stats=None, tracking_data=None
         completed_picks = [p for p in tracking_data.get('picks', []) if p.get('status', '').lower() in ['win', 'loss']]
         # Sort by date (most recent first) - assuming picks have a date field
         completed_picks.sort(key=lambda x: x.get('game_time', ''), reverse=True)
-    
-    # Calculate Last 10, Last 20, and Last 50 picks performance
-    last_10 = calculate_recent_performance(completed_picks, 10)
-    last_20 = calculate_recent_performance(completed_picks, 20)
-    last_50 = calculate_recent_performance(completed_picks, 50)
-    
-    
 
-    daily_tracking_html = ""
-    if stats and 'today' in stats:
-        t_stats = stats.get('today', {'record':'0-0', 'profit':0, 'roi':0})
-        y_stats = stats.get('yesterday', {'record':'0-0', 'profit':0, 'roi':0})
+    def build_card(play, side):
+        prop_str = play.get('prop', '')
+        line_match = re.search(r'(\d+\.?\d*)\s*3PM', prop_str)
+        prop_line_display = line_match.group(0) if line_match else prop_str.replace('OVER ', '').replace('UNDER ', '')
         
-        t_profit_class = "txt-green" if t_stats['profit'] > 0 else ("txt-red" if t_stats['profit'] < 0 else "")
-        y_profit_class = "txt-green" if y_stats['profit'] > 0 else ("txt-red" if y_stats['profit'] < 0 else "")
-
-        daily_tracking_html = f"""
-        <section style="margin-top: 2rem;">
-            <div class="section-title">📅 Daily Performance</div>
-            <div class="metrics-grid" style="grid-template-columns: repeat(2, 1fr);">
-                <!-- Today -->
-                <div class="prop-card" style="padding: 1rem; margin:0;">
-                    <div style="font-size:0.75rem; color:var(--text-secondary); text-align:center; margin-bottom:0.5rem;">TODAY</div>
-                    <div style="text-align:center;">
-                        <div style="font-weight:700; font-size:1.1rem;">{t_stats['record']}</div>
-                        <div class="{t_profit_class}">{t_stats['profit']:+.1f}u</div>
-                        <div style="font-size:0.8rem; color:var(--text-secondary); margin-top:2px;">{t_stats['roi']:.1f}% ROI</div>
-                    </div>
-                </div>
-                <!-- Yesterday -->
-                <div class="prop-card" style="padding: 1rem; margin:0;">
-                    <div style="font-size:0.75rem; color:var(--text-secondary); text-align:center; margin-bottom:0.5rem;">YESTERDAY</div>
-                    <div style="text-align:center;">
-                        <div style="font-weight:700; font-size:1.1rem;">{y_stats['record']}</div>
-                        <div class="{y_profit_class}">{y_stats['profit']:+.1f}u</div>
-                         <div style="font-size:0.8rem; color:var(--text-secondary); margin-top:2px;">{y_stats['roi']:.1f}% ROI</div>
-                    </div>
-                </div>
-            </div>
-        </section>
-        """
-
-    # CSS Styles (defined separately to avoid f-string brace escaping issues)
-    css_styles = """
-        :root {
-            --bg-main: #121212;
-            --bg-card: #1e1e1e;
-            --bg-card-secondary: #2a2a2a;
-            --text-primary: #ffffff;
-            --text-secondary: #b3b3b3;
-            --accent-green: #4ade80;
-            --accent-red: #f87171;
-            --accent-blue: #60a5fa;
-            --border-color: #333333;
-        }
-
-        body {
-            margin: 0;
-            padding: 20px;
-            font-family: 'Inter', sans-serif;
-            background-color: var(--bg-main);
-            color: var(--text-primary);
-            -webkit-font-smoothing: antialiased;
-        }
-
-        .container { max-width: 800px; margin: 0 auto; }
-
-        header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 25px;
-            border-bottom: 1px solid var(--border-color);
-            padding-bottom: 15px;
-        }
-        h1 { margin: 0; font-size: 24px; font-weight: 700; margin-bottom: 5px; }
-        .subheader { font-size: 18px; font-weight: 600; color: var(--text-primary); margin-bottom: 5px; }
-        .date-sub { color: var(--text-secondary); font-size: 14px; margin-top: 5px; }
-
-        .summary-grid {
-            display: grid;
-            grid-template-columns: repeat(3, 1fr);
-            gap: 12px;
-            margin-bottom: 30px;
-        }
-        .stat-box {
-            background-color: var(--bg-card);
-            border-radius: 12px;
-            padding: 15px;
-            text-align: center;
-            border: 1px solid var(--border-color);
-        }
-        .stat-label { font-size: 12px; color: var(--text-secondary); text-transform: uppercase; margin-bottom: 5px; }
-        .stat-value { font-size: 20px; font-weight: 700; }
-
-        .section-title {
-            font-size: 18px;
-            margin-bottom: 15px;
-            display: flex; align-items: center;
-        }
-        .section-title span.highlight { color: var(--accent-green); margin-left: 8px; font-size: 14px; }
-
-        .prop-card {
-            background-color: var(--bg-card);
-            border-radius: 16px;
-            overflow: hidden;
-            margin-bottom: 20px;
-            border: 1px solid var(--border-color);
-            box-shadow: 0 4px 6px -1px rgba(0,0,0,0.2);
-        }
-
-        .card-header {
-            padding: 15px 20px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            background-color: var(--bg-card-secondary);
-            border-bottom: 1px solid var(--border-color);
-        }
-
-        .header-left { display: flex; align-items: center; gap: 12px; }
-        .team-logo { width: 45px; height: 45px; border-radius: 50%; padding: 2px; object-fit: contain; }
-        .player-info h2 { margin: 0; font-size: 18px; line-height: 1.2; }
-        .matchup-info { color: var(--text-secondary); font-size: 13px; margin-top: 2px; }
-        .game-meta { text-align: right; }
-        .game-date-time { font-size: 12px; color: var(--text-secondary); background: #333; padding: 6px 10px; border-radius: 6px; font-weight: 500; white-space: nowrap; }
-
-        .card-body { padding: 20px; }
-        .bet-main-row { margin-bottom: 15px; }
-        .bet-selection { font-size: 22px; font-weight: 800; }
-        .bet-selection .line { color: var(--text-primary); }
-        .bet-odds { font-size: 18px; color: var(--text-secondary); font-weight: 500; margin-left: 8px; }
-
-        .model-subtext { color: var(--text-secondary); font-size: 14px; margin-bottom: 20px; padding-bottom: 15px; border-bottom: 1px solid var(--border-color); }
-        .model-subtext strong { color: var(--text-primary); }
-
-        .metrics-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px; margin-bottom: 20px; }
-        .metric-item { background-color: var(--bg-main); padding: 10px; border-radius: 8px; text-align: center; }
-        .metric-lbl { display: block; font-size: 11px; color: var(--text-secondary); margin-bottom: 4px; }
-        .metric-val { font-size: 16px; font-weight: 700; }
-
-        .player-stats { background-color: var(--bg-card-secondary); border-radius: 8px; padding: 12px 15px; margin-bottom: 20px; display: flex; justify-content: space-between; align-items: center; border: 1px solid var(--border-color); }
-        .player-stats-label { font-size: 11px; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px; }
-        .player-stats-value { font-size: 16px; font-weight: 700; }
-        .player-stats-item { text-align: center; flex: 1; }
-        .player-stats-divider { width: 1px; height: 30px; background-color: var(--border-color); }
-
-        .tags-container { display: flex; flex-wrap: wrap; gap: 8px; }
-        .tag { font-size: 12px; padding: 6px 10px; border-radius: 6px; font-weight: 500; }
-
-        .txt-green { color: var(--accent-green); }
-        .txt-red { color: var(--accent-red); }
+        short_team = get_short_team_name(play.get('team', ''))
+        short_opponent = get_short_team_name(play.get('opponent', ''))
+        home_team = play.get('home_team', '')
+        matchup_display = f"{short_opponent} @ {short_team}" if play.get('team') == home_team else f"{short_team} @ {short_opponent}"
         
-        .tag-green { background-color: rgba(74, 222, 128, 0.15); color: var(--accent-green); }
-        .tag-red { background-color: rgba(248, 113, 113, 0.15); color: var(--accent-red); }
-        .tag-blue { background-color: rgba(96, 165, 250, 0.15); color: var(--accent-blue); }
+        player_data = player_stats_lookup.get(play.get('player'))
+        opponent_factors = defense_lookup.get(play.get('opponent'))
         
-        .metric-label {
-            font-size: 0.7rem;
-            text-transform: uppercase;
-            color: var(--text-secondary);
-            letter-spacing: 0.05em;
-            margin-bottom: 4px;
-            font-weight: 600;
-        }
-        .text-red { color: var(--accent-red); }
-        .tracking-section { margin-top: 3rem; }
-        .tracking-header { 
-            font-size: 1.5rem; 
-            font-weight: 700; 
-            color: var(--text-primary); 
-            margin-bottom: 1.5rem; 
-            border-bottom: 2px solid var(--border-color);
-            padding-bottom: 0.5rem;
-        }
-        .metrics-row {
-            display: flex;
-            gap: 1rem;
-            margin-top: 1.5rem;
-        }
-        .metric-title {
-            font-size: 0.7rem;
-            text-transform: uppercase;
-            color: var(--text-secondary);
-            letter-spacing: 0.05em;
-            margin-bottom: 4px;
-            font-weight: 600;
-        }
-        .metric-value {
-            font-size: 1.1rem;
-            font-weight: 800;
-            color: var(--text-primary);
-        }
-        .metric-value.good { color: var(--accent-green); }
-
-        @media (max-width: 600px) {
-            .summary-grid { grid-template-columns: repeat(2, 1fr); }
-            .stat-box:last-child { grid-column: span 2; }
-            .card-header { padding: 12px 15px; }
-            .team-logo { width: 38px; height: 38px; }
-            .player-info h2 { font-size: 16px; }
-        }
-    """
-    
-    # Pre-format header stats to avoid f-string syntax errors
-    s_wins = stats.get('wins', 0)
-    s_losses = stats.get('losses', 0)
-    s_wr = round(stats.get('win_rate', 0.0), 1)
-    s_prof = stats.get('total_profit', 0.0)
-    s_prof_str = f"{s_prof:+.1f}u"
-    s_prof_color = 'var(--accent-green)' if s_prof > 0 else 'var(--accent-red)'
-
-    # Define Header
-    html_header = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CourtSide Analytics - NBA 3PT</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-{css_styles}
-    </style>
-</head>
-<body>
-
-<div class="container">
-    <header>
-        <div>
-            <h1>CourtSide Analytics</h1>
-            <div class="subheader">NBA 3PT Props Model</div>
-            <div class="date-sub">Profitable Version &bull; Season {CURRENT_SEASON}</div>
-        </div>
-        <div style="text-align: right;">
-            <div class="metric-title">SEASON RECORD</div>
-            <div style="font-size: 1.2rem; font-weight: 700; color: var(--accent-green);">
-                {s_wins}-{s_losses} ({s_wr}%)
-            </div>
-            <div style="font-size: 0.9rem; color: {s_prof_color};">
-                 {s_prof_str}
-            </div>
-        </div>
-    </header>
-"""
-
-
-    # Generate OVER plays cards
-    over_html = ""
-    if over_plays:
-        over_html = '<section><div class="section-title">Top Value Plays <span class="highlight">Min AI Score: {}</span></div>'.format(MIN_AI_SCORE)
+        player_stats_data = context.player_stats(play.get('player'), calculate_player_stats) if tracking_data else None
+        tags = generate_reasoning_tags(play, player_data, opponent_factors)
         
-        for play in over_plays:
-            prop_str = play.get('prop', '')
-            line_match = re.search(r'(\d+\.?\d*)\s*3PM', prop_str)
-            prop_line_display = line_match.group(0) if line_match else prop_str.replace('OVER ', '').replace('UNDER ', '')
-            
-            game_datetime_str = format_game_datetime(play.get('game_time', ''))
-            team_abbrev = get_team_abbreviation(play.get('team', ''))
-            logo_url = f"https://a.espncdn.com/i/teamlogos/nba/500/{team_abbrev}.png"
-            
-            short_team = get_short_team_name(play.get('team', ''))
-            short_opponent = get_short_team_name(play.get('opponent', ''))
-            home_team = play.get('home_team', '')
-            matchup_display = f"{short_opponent} @ {short_team}" if play.get('team') == home_team else f"{short_team} @ {short_opponent}"
-            
-            player_data = player_stats_lookup.get(play.get('player'))
-            opponent_factors = defense_lookup.get(play.get('opponent'))
-            
-            player_stats_data = calculate_player_stats(play.get('player'), tracking_data) if tracking_data else None
-            tags = generate_reasoning_tags(play, player_data, opponent_factors)
-            
-            # Check for CLV status if tracking data is available
-            if tracking_data:
-                # Generate pick ID to match with tracking data
-                prop_str = play.get('prop', '')
-                match = re.search(r'(\d+\.?\d*)', prop_str)
-                prop_line = float(match.group(1)) if match else 0
-                bet_type = 'over'  # OVER plays
-                pick_id = f"{play['player']}_{prop_line}_{bet_type}_{play.get('game_time', '')}"
-                
-                # Find matching tracked pick
-                tracked_pick = next((p for p in tracking_data.get('picks', []) 
-                                    if p.get('pick_id') == pick_id), None)
-                
-                # Add CLV tag
-                if tracked_pick:
-                    clv = tracked_pick.get('clv_status')
-                    if clv == 'positive':
-                        tags.append({"text": "✅ CLV: Beat Line", "color": "green"})
-                    elif clv == 'negative':
-                        tags.append({"text": "⚠️ CLV: Missed Line", "color": "red"})
-                    elif clv == 'neutral':
-                        tags.append({"text": "➖ CLV: Neutral", "color": "blue"})
-                    elif clv is None:
-                        tags.append({"text": "⏳ CLV: Tracking", "color": "blue"})
-            tags_html = "".join([f'<span class="tag tag-{tag["color"]}">{tag["text"]}</span>\n' for tag in tags])
-            
-            season_avg = play.get('season_avg', 0)
-            edge = play.get('edge', 0)
-            model_prediction = season_avg + edge if edge > 0 else season_avg - abs(edge)
-            ai_score = play.get('ai_score', 0)
-            win_prob = min(70, max(40, 50 + (ai_score - 9.5) * 3))
-            
-            player_stats_html = ""
-            if player_stats_data:
-                player_roi_sign = '+' if player_stats_data['player_roi'] > 0 else ''
-                player_stats_html = f'''
-                <div class="player-stats">
-                    <div class="player-stats-item">
-                        <div class="player-stats-label">This Season</div>
-                        <div class="player-stats-value">{player_stats_data['season_record']}</div>
-                    </div>
-                    <div class="player-stats-divider"></div>
-                    <div class="player-stats-item">
-                        <div class="player-stats-label">Player ROI</div>
-                        <div class="player-stats-value txt-green">{player_roi_sign}{player_stats_data['player_roi']:.1f}%</div>
-                    </div>
-                </div>'''
-            
-            ev = play.get('ev', 0)
-            ev_display = f"{ev:+.1f}%" if ev != 0 else "0.0%"
-            ev_color_class = "txt-green" if ev > 0 else "txt-red" if ev < 0 else ""
-            
-            over_html += f'''
-        <div class="prop-card">
-            <div class="card-header">
-                <div class="header-left">
-                    <img src="{logo_url}" alt="{play.get('team', '')} Logo" class="team-logo">
-                    <div class="player-info">
-                        <h2>{play.get('player', '')}</h2>
-                        <div class="matchup-info">{matchup_display}</div>
-                    </div>
-                </div>
-                <div class="game-meta">
-                    <div class="game-date-time">{game_datetime_str}</div>
-                </div>
-            </div>
-            <div class="card-body">
-                <div class="bet-main-row">
-                    <div class="bet-selection">
-                        <span class="txt-green">OVER</span> 
-                        <span class="line">{prop_line_display}</span> 
-                        <span class="bet-odds">{format_odds(play.get('odds'))}</span>
-                    </div>
-                </div>
-                <div class="model-subtext">
-                    Model Predicts: <strong>{model_prediction:.1f} 3PM</strong> (Edge: {edge:+.1f})
-                </div>
-                <div class="metrics-grid">
-                    <div class="metric-item">
-                        <span class="metric-lbl">AI SCORE</span>
-                        <span class="metric-val txt-green">{play.get('ai_score', 0):.1f}</span>
-                    </div>
-                    <div class="metric-item">
-                        <span class="metric-lbl">EV</span>
-                        <span class="metric-val {ev_color_class}">{ev_display}</span>
-                    </div>
-                    <div class="metric-item">
-                        <span class="metric-lbl">WIN %</span>
-                        <span class="metric-val">{int(win_prob)}%</span>
-                    </div>
-                </div>
-                {player_stats_html}
-                <div class="tags-container">
-                    {tags_html}
-                </div>
-            </div>
-        </div>'''
+        # Check for CLV status if tracking data is available
+        if tracking_data:
+            # Generate pick ID to match with tracking data
+            match = re.search(r'(\d+\.?\d*)', prop_str)
+            prop_line = float(match.group(1)) if match else 0
+            pick_id = f"{play['player']}_{prop_line}_{side.lower()}_{play.get('game_time', '')}"
+            tracked_pick = context.find_pick(pick_id)
+            if tracked_pick:
+                tag = clv_tag(tracked_pick.get('clv_status'))
+                if tag:
+                    tags.append(tag)
         
-        over_html += "</section>"
-
-    # Generate UNDER plays cards
-    under_html = ""
-    if under_plays:
-        for play in under_plays:
-            prop_str = play.get('prop', '')
-            line_match = re.search(r'(\d+\.?\d*)\s*3PM', prop_str)
-            prop_line_display = line_match.group(0) if line_match else prop_str.replace('OVER ', '').replace('UNDER ', '')
-            
-            game_datetime_str = format_game_datetime(play.get('game_time', ''))
-            team_abbrev = get_team_abbreviation(play.get('team', ''))
-            logo_url = f"https://a.espncdn.com/i/teamlogos/nba/500/{team_abbrev}.png"
-            
-            short_team = get_short_team_name(play.get('team', ''))
-            short_opponent = get_short_team_name(play.get('opponent', ''))
-            home_team = play.get('home_team', '')
-            matchup_display = f"{short_opponent} @ {short_team}" if play.get('team') == home_team else f"{short_team} @ {short_opponent}"
-            
-            player_data = player_stats_lookup.get(play.get('player'))
-            opponent_factors = defense_lookup.get(play.get('opponent'))
-            
-            player_stats_data = calculate_player_stats(play.get('player'), tracking_data) if tracking_data else None
-            tags = generate_reasoning_tags(play, player_data, opponent_factors)
-            
-            # Check for CLV status if tracking data is available
-            if tracking_data:
-                # Generate pick ID to match with tracking data
-                prop_str = play.get('prop', '')
-                match = re.search(r'(\d+\.?\d*)', prop_str)
-                prop_line = float(match.group(1)) if match else 0
-                bet_type = 'under'  # UNDER plays
-                pick_id = f"{play['player']}_{prop_line}_{bet_type}_{play.get('game_time', '')}"
-                
-                # Find matching tracked pick
-                tracked_pick = next((p for p in tracking_data.get('picks', []) 
-                                    if p.get('pick_id') == pick_id), None)
-                
-                # Add CLV tag
-                if tracked_pick:
-                    clv = tracked_pick.get('clv_status')
-                    if clv == 'positive':
-                        tags.append({"text": "✅ CLV: Beat Line", "color": "green"})
-                    elif clv == 'negative':
-                        tags.append({"text": "⚠️ CLV: Missed Line", "color": "red"})
-                    elif clv == 'neutral':
-                        tags.append({"text": "➖ CLV: Neutral", "color": "blue"})
-                    elif clv is None:
-                        tags.append({"text": "⏳ CLV: Tracking", "color": "blue"})
-            tags_html = "".join([f'<span class="tag tag-{tag["color"]}">{tag["text"]}</span>\n' for tag in tags])
-            
-            season_avg = play.get('season_avg', 0)
-            edge = play.get('edge', 0)
+        season_avg = play.get('season_avg', 0)
+        edge = play.get('edge', 0)
+        if side == 'OVER':
+            model_prediction = season_avg + edge if edge > 0 else season_avg - abs(edge)
+        else:
             model_prediction = season_avg - abs(edge)
-            ai_score = play.get('ai_score', 0)
-            win_prob = min(70, max(40, 50 + (ai_score - 9.5) * 3))
-            
-            player_stats_html = ""
-            if player_stats_data:
-                player_roi_sign = '+' if player_stats_data['player_roi'] > 0 else ''
-                player_stats_html = f'''
-                <div class="player-stats">
-                    <div class="player-stats-item">
-                        <div class="player-stats-label">This Season</div>
-                        <div class="player-stats-value">{player_stats_data['season_record']}</div>
-                    </div>
-                    <div class="player-stats-divider"></div>
-                    <div class="player-stats-item">
-                        <div class="player-stats-label">Player ROI</div>
-                        <div class="player-stats-value txt-green">{player_roi_sign}{player_stats_data['player_roi']:.1f}%</div>
-                    </div>
-                </div>'''
-            
-            ev = play.get('ev', 0)
-            ev_display = f"{ev:+.1f}%" if ev != 0 else "0.0%"
-            ev_color_class = "txt-green" if ev > 0 else "txt-red" if ev < 0 else ""
-            
-            under_html += f'''
-        <div class="prop-card">
-            <div class="card-header">
-                <div class="header-left">
-                    <img src="{logo_url}" alt="{play.get('team', '')} Logo" class="team-logo">
-                    <div class="player-info">
-                        <h2>{play.get('player', '')}</h2>
-                        <div class="matchup-info">{matchup_display}</div>
-                    </div>
-                </div>
-                <div class="game-meta">
-                    <div class="game-date-time">{game_datetime_str}</div>
-                </div>
-            </div>
-            <div class="card-body">
-                <div class="bet-main-row">
-                    <div class="bet-selection">
-                        <span class="txt-red">UNDER</span> 
-                        <span class="line">{prop_line_display}</span> 
-                        <span class="bet-odds">{format_odds(play.get('odds'))}</span>
-                    </div>
-                </div>
-                <div class="model-subtext">
-                    Model Predicts: <strong>{model_prediction:.1f} 3PM</strong> (Edge: {edge:.1f})
-                </div>
-                <div class="metrics-grid">
-                    <div class="metric-item">
-                        <span class="metric-lbl">AI SCORE</span>
-                        <span class="metric-val txt-green">{play.get('ai_score', 0):.1f}</span>
-                    </div>
-                    <div class="metric-item">
-                        <span class="metric-lbl">EV</span>
-                        <span class="metric-val {ev_color_class}">{ev_display}</span>
-                    </div>
-                    <div class="metric-item">
-                        <span class="metric-lbl">WIN %</span>
-                        <span class="metric-val">{int(win_prob)}%</span>
-                    </div>
-                </div>
-                {player_stats_html}
-                <div class="tags-container">
-                    {tags_html}
-                </div>
-            </div>
-        </div>'''
-
-    # Summary stats grid
-    summary_html = ""
-    if stats and stats.get('total', 0) > 0:
-        roi_pct = stats.get('roi_pct', 0)
-        win_rate = stats.get('win_rate', 0)
-        wins = stats.get('wins', 0)
-        losses = stats.get('losses', 0)
-        roi_color_class = "txt-green" if roi_pct > 0 else "txt-red"
-        roi_sign = '+' if roi_pct > 0 else ''
-        summary_html = f'''
-    <section>
-        <div class="summary-grid">
-            <div class="stat-box">
-                <div class="stat-label">Season ROI</div>
-                <div class="stat-value {roi_color_class}">{roi_sign}{roi_pct:.1f}%</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-label">Win Rate</div>
-                <div class="stat-value">{win_rate:.1f}%</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-label">Record</div>
-                <div class="stat-value">{wins}-{losses}</div>
-            </div>
-        </div>
-    </section>'''
-    
-    # Model performance section
-    performance_html = ""
-    if stats and stats.get('total', 0) > 0:
-        total = stats['total']
-        wins = stats['wins']
-        losses = stats['losses']
-        win_rate = stats['win_rate']
-        roi_pct = stats['roi_pct']
-        
-        roi_color_class = "txt-green" if roi_pct > 0 else "txt-red"
-        roi_sign = '+' if roi_pct > 0 else ''
-        
-        over_record = stats['over_record']
-        over_roi = stats['over_roi']
-        over_roi_color_class = "txt-green" if over_roi > 0 else "txt-red"
-        over_roi_sign = '+' if over_roi > 0 else ''
-        
-        under_record = stats['under_record']
-        under_roi = stats['under_roi']
-        under_roi_color_class = "txt-green" if under_roi > 0 else "txt-red"
-        under_roi_sign = '+' if under_roi > 0 else ''
-        
-        performance_html = f'''
-    <section>
-        <div class="section-title">NBA 3PT Model Performance</div>
-        <div class="summary-grid">
-            <div class="stat-box">
-                <div class="stat-label">Overall Record</div>
-                <div class="stat-value">{wins}-{losses}</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-label">ROI</div>
-                <div class="stat-value {roi_color_class}">{roi_sign}{roi_pct:.1f}%</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-label">OVER: {over_record}</div>
-                <div class="stat-value {over_roi_color_class}">{over_roi_sign}{over_roi:.1f}% ROI</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-label">UNDER: {under_record}</div>
-                <div class="stat-value {under_roi_color_class}">{under_roi_sign}{under_roi:.1f}% ROI</div>
-            </div>
-        </div>
-    </section>'''
-    
-    # Tracking section HTML
-    tracking_html = ""
-    if tracking_data and completed_picks:
-        # Format win rate classes
-        last_10_wr_class = 'good' if last_10['win_rate'] >= 55 else ('text-red' if last_10['win_rate'] < 50 else '')
-        last_10_profit_class = 'good' if last_10['profit'] > 0 else ('text-red' if last_10['profit'] < 0 else '')
-        last_10_roi_class = 'good' if last_10['roi'] > 0 else ('text-red' if last_10['roi'] < 0 else '')
-        
-        last_20_wr_class = 'good' if last_20['win_rate'] >= 55 else ('text-red' if last_20['win_rate'] < 50 else '')
-        last_20_profit_class = 'good' if last_20['profit'] > 0 else ('text-red' if last_20['profit'] < 0 else '')
-        last_20_roi_class = 'good' if last_20['roi'] > 0 else ('text-red' if last_20['roi'] < 0 else '')
-        
-        last_50_wr_class = 'good' if last_50['win_rate'] >= 55 else ('text-red' if last_50['win_rate'] < 50 else '')
-        last_50_profit_class = 'good' if last_50['profit'] > 0 else ('text-red' if last_50['profit'] < 0 else '')
-        last_50_roi_class = 'good' if last_50['roi'] > 0 else ('text-red' if last_50['roi'] < 0 else '')
-        
-        tracking_html = f'''
-        <!-- PERFORMANCE STATS (Last 10/20/50) -->
-        <div class="tracking-section">
-            <div class="tracking-header">🔥 Recent Form</div>
-            
-            <div class="metrics-row" style="margin-bottom: 1.5rem;">
-                <!-- Last 10 -->
-                <div class="prop-card" style="flex: 1; padding: 1.5rem;">
-                    <div class="metric-title" style="margin-bottom: 0.5rem; text-align: center;">LAST 10</div>
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; text-align: center;">
-                        <div>
-                            <div class="metric-label">Record</div>
-                            <div class="metric-value">{last_10['record']}</div>
-                        </div>
-                        <div>
-                            <div class="metric-label">Win Rate</div>
-                            <div class="metric-value {last_10_wr_class}">{last_10['win_rate']:.0f}%</div>
-                        </div>
-                        <div>
-                            <div class="metric-label">Profit</div>
-                            <div class="metric-value {last_10_profit_class}">{last_10['profit']:+.1f}u</div>
-                        </div>
-                        <div>
-                            <div class="metric-label">ROI</div>
-                            <div class="metric-value {last_10_roi_class}">{last_10['roi']:+.1f}%</div>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Last 20 -->
-                <div class="prop-card" style="flex: 1; padding: 1.5rem;">
-                    <div class="metric-title" style="margin-bottom: 0.5rem; text-align: center;">LAST 20</div>
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; text-align: center;">
-                        <div>
-                            <div class="metric-label">Record</div>
-                            <div class="metric-value">{last_20['record']}</div>
-                        </div>
-                        <div>
-                            <div class="metric-label">Win Rate</div>
-                            <div class="metric-value {last_20_wr_class}">{last_20['win_rate']:.0f}%</div>
-                        </div>
-                        <div>
-                            <div class="metric-label">Profit</div>
-                            <div class="metric-value {last_20_profit_class}">{last_20['profit']:+.1f}u</div>
-                        </div>
-                        <div>
-                            <div class="metric-label">ROI</div>
-                            <div class="metric-value {last_20_roi_class}">{last_20['roi']:+.1f}%</div>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Last 50 -->
-                <div class="prop-card" style="flex: 1; padding: 1.5rem;">
-                    <div class="metric-title" style="margin-bottom: 0.5rem; text-align: center;">LAST 50</div>
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; text-align: center;">
-                        <div>
-                            <div class="metric-label">Record</div>
-                            <div class="metric-value">{last_50['record']}</div>
-                        </div>
-                        <div>
-                            <div class="metric-label">Win Rate</div>
-                            <div class="metric-value {last_50_wr_class}">{last_50['win_rate']:.0f}%</div>
-                        </div>
-                        <div>
-                            <div class="metric-label">Profit</div>
-                            <div class="metric-value {last_50_profit_class}">{last_50['profit']:+.1f}u</div>
-                        </div>
-                        <div>
-                            <div class="metric-label">ROI</div>
-                            <div class="metric-value {last_50_roi_class}">{last_50['roi']:+.1f}%</div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-        '''
-    
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CourtSide Analytics</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root {{
-            --bg-main: #121212;
-            --bg-card: #1e1e1e;
-            --bg-card-secondary: #2a2a2a;
-            --text-primary: #ffffff;
-            --text-secondary: #b3b3b3;
-            --accent-green: #4ade80;
-            --accent-red: #f87171;
-            --accent-blue: #60a5fa;
-            --border-color: #333333;
-        }}
-
-        body {{
-            margin: 0;
-            padding: 20px;
-            font-family: 'Inter', sans-serif;
-            background-color: var(--bg-main);
-            color: var(--text-primary);
-            -webkit-font-smoothing: antialiased;
-        }}
-
-        .container {{ max-width: 800px; margin: 0 auto; }}
-
-        header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 25px;
-            border-bottom: 1px solid var(--border-color);
-            padding-bottom: 15px;
-        }}
-        h1 {{ margin: 0; font-size: 24px; font-weight: 700; margin-bottom: 5px; }}
-        .subheader {{ font-size: 18px; font-weight: 600; color: var(--text-primary); margin-bottom: 5px; }}
-        .date-sub {{ color: var(--text-secondary); font-size: 14px; margin-top: 5px; }}
-
-        .summary-grid {{
-            display: grid;
-            grid-template-columns: repeat(3, 1fr);
-            gap: 12px;
-            margin-bottom: 30px;
-        }}
-        .stat-box {{
-            background-color: var(--bg-card);
-            border-radius: 12px;
-            padding: 15px;
-            text-align: center;
-            border: 1px solid var(--border-color);
-        }}
-        .stat-label {{ font-size: 12px; color: var(--text-secondary); text-transform: uppercase; margin-bottom: 5px; }}
-        .stat-value {{ font-size: 20px; font-weight: 700; }}
-
-        .section-title {{
-            font-size: 18px;
-            margin-bottom: 15px;
-            display: flex; align-items: center;
-        }}
-        .section-title span.highlight {{ color: var(--accent-green); margin-left: 8px; font-size: 14px; }}
-
-        .prop-card {{
-            background-color: var(--bg-card);
-            border-radius: 16px;
-            overflow: hidden;
-            margin-bottom: 20px;
-            border: 1px solid var(--border-color);
-            box-shadow: 0 4px 6px -1px rgba(0,0,0,0.2);
-        }}
-
-        .card-header {{
-            padding: 15px 20px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            background-color: var(--bg-card-secondary);
-            border-bottom: 1px solid var(--border-color);
-        }}
-
-        .header-left {{ display: flex; align-items: center; gap: 12px; }}
-        .team-logo {{ width: 45px; height: 45px; border-radius: 50%; padding: 2px; object-fit: contain; }}
-        .player-info h2 {{ margin: 0; font-size: 18px; line-height: 1.2; }}
-        .matchup-info {{ color: var(--text-secondary); font-size: 13px; margin-top: 2px; }}
-        .game-meta {{ text-align: right; }}
-        .game-date-time {{ font-size: 12px; color: var(--text-secondary); background: #333; padding: 6px 10px; border-radius: 6px; font-weight: 500; white-space: nowrap; }}
-
-        .card-body {{ padding: 20px; }}
-        .bet-main-row {{ margin-bottom: 15px; }}
-        .bet-selection {{ font-size: 22px; font-weight: 800; }}
-        .bet-selection .line {{ color: var(--text-primary); }}
-        .bet-odds {{ font-size: 18px; color: var(--text-secondary); font-weight: 500; margin-left: 8px; }}
-
-        .model-subtext {{ color: var(--text-secondary); font-size: 14px; margin-bottom: 20px; padding-bottom: 15px; border-bottom: 1px solid var(--border-color); }}
-        .model-subtext strong {{ color: var(--text-primary); }}
-
-        .metrics-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px; margin-bottom: 20px; }}
-        .metric-item {{ background-color: var(--bg-main); padding: 10px; border-radius: 8px; text-align: center; }}
-        .metric-lbl {{ display: block; font-size: 11px; color: var(--text-secondary); margin-bottom: 4px; }}
-        .metric-val {{ font-size: 16px; font-weight: 700; }}
-
-        .player-stats {{ background-color: var(--bg-card-secondary); border-radius: 8px; padding: 12px 15px; margin-bottom: 20px; display: flex; justify-content: space-between; align-items: center; border: 1px solid var(--border-color); }}
-        .player-stats-label {{ font-size: 11px; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px; }}
-        .player-stats-value {{ font-size: 16px; font-weight: 700; }}
-        .player-stats-item {{ text-align: center; flex: 1; }}
-        .player-stats-divider {{ width: 1px; height: 30px; background-color: var(--border-color); }}
-
-        .tags-container {{ display: flex; flex-wrap: wrap; gap: 8px; }}
-        .tag {{ font-size: 12px; padding: 6px 10px; border-radius: 6px; font-weight: 500; }}
-
-        .txt-green {{ color: var(--accent-green); }}
-        .txt-red {{ color: var(--accent-red); }}
-        
-        .tag-green {{ background-color: rgba(74, 222, 128, 0.15); color: var(--accent-green); }}
-        .tag-red {{ background-color: rgba(248, 113, 113, 0.15); color: var(--accent-red); }}
-        .tag-blue {{ background-color: rgba(96, 165, 250, 0.15); color: var(--accent-blue); }}
+        ai_score = play.get('ai_score', 0)
+        # Distribution hit rate when the play was priced from game logs (prop_distributions.py),
+        # so WIN % agrees with the card's EV; the AI-score mapping is the fallback
+        hit_rate = play.get('hit_prob')
+        win_prob = hit_rate * 100 if hit_rate is not None else min(70, max(40, 50 + (ai_score - 9.5) * 3))
+        ev = play.get('ev', 0)
         
-        .metric-label {{
-            font-size: 0.7rem;
-            text-transform: uppercase;
-            color: var(--text-secondary);
-            letter-spacing: 0.05em;
-            margin-bottom: 4px;
-            font-weight: 600;
-        }}
-        .text-red {{ color: var(--accent-red); }}
-        .tracking-section {{ margin-top: 3rem; }}
-        .tracking-header {{ 
-            font-size: 1.5rem; 
-            font-weight: 700; 
-            color: var(--text-primary); 
-            margin-bottom: 1.5rem; 
-            border-bottom: 2px solid var(--border-color);
-            padding-bottom: 0.5rem;
-        }}
-        .metrics-row {{
-            display: flex;
-            gap: 1rem;
-            margin-top: 1.5rem;
-        }}
-        .metric-title {{
-            font-size: 0.7rem;
-            text-transform: uppercase;
-            color: var(--text-secondary);
-            letter-spacing: 0.05em;
-            margin-bottom: 4px;
-            font-weight: 600;
-        }}
-        .metric-value {{
-            font-size: 1.1rem;
-            font-weight: 800;
-            color: var(--text-primary);
-        }}
-        .metric-value.good {{ color: var(--accent-green); }}
-
-        @media (max-width: 600px) {{
-            .summary-grid {{ grid-template-columns: repeat(2, 1fr); }}
-            .stat-box:last-child {{ grid-column: span 2; }}
-            .card-header {{ padding: 12px 15px; }}
-            .team-logo {{ width: 38px; height: 38px; }}
-            .player-info h2 {{ font-size: 16px; }}
-        }}
-    </style>
-</head>
-<body>
-
-<div class="container">
-    <header>
-        <div>
-            <h1>CourtSide Analytics</h1>
-            <div class="subheader">NBA 3PT Model</div>
-            <div class="date-sub">Profitable Version • Season {CURRENT_SEASON}</div>
-        </div>
-        <div style="text-align: right;">
-            <div class="metric-title">SEASON RECORD</div>
-            <div style="font-size: 1.2rem; font-weight: 700; color: var(--accent-green);">
-                {stats['wins']}-{stats['losses']} ({stats['win_rate']:.1f}%)
-            </div>
-            <div style="font-size: 0.9rem; color: {'var(--accent-green)' if stats['total_profit'] > 0 else 'var(--accent-red)'};">
-                 {stats['total_profit']:+.1f}u
-            </div>
-        </div>
-    </header>
-
-    {summary_html}
-'''
-    full_html = html_header
-    if over_html: full_html += over_html
-    if under_html: full_html += under_html
-    full_html += daily_tracking_html
-    full_html += tracking_html
-    full_html += performance_html
-    full_html += "</div></body></html>"
-
-    return full_html
+        return {
+            'logo_url': f"https://a.espncdn.com/i/teamlogos/nba/500/{get_team_abbreviation(play.get('team', ''))}.png",
+            'team': play.get('team', ''),
+            'player': play.get('player', ''),
+            'matchup': matchup_display,
+            'game_time': format_game_datetime(play.get('game_time', '')),
+            'side': side,
+            'line': prop_line_display,
+            'odds': american_odds(play.get('odds')),
+            'prediction': f"{model_prediction:.1f} 3PM",
+            'edge': f"{edge:+.1f}" if side == 'OVER' else f"{edge:.1f}",
+            'metrics': [
+                ('AI SCORE', f"{ai_score:.1f}", 'txt-green'),
+                ('EV', f"{ev:+.1f}%" if ev != 0 else "0.0%", tone(ev)),
+                ('WIN %', f"{win_prob:.0f}%", ''),
+            ],
+            'player_record': player_stats_data,
+            'tags': tags,
+        }
 
+    has_record = stats.get('total', 0) > 0
+    return render(
+        'props_page.html',
+        page=OUTPUT_HTML,
+        title="CourtSide Analytics - NBA 3PT",
+        subheader="NBA 3PT Props Model",
+        tagline=f"Profitable Version • Season {CURRENT_SEASON}",
+        record={'wins': stats.get('wins', 0), 'losses': stats.get('losses', 0),
+                'win_rate': stats.get('win_rate', 0.0), 'profit': stats.get('total_profit', 0.0)},
+        summary=None,
+        sections=[
+            {'title': "Top Value Plays", 'highlight': f"Min AI Score: {MIN_AI_SCORE}",
+             'cards': [build_card(play, 'OVER') for play in over_plays or []]},
+            {'title': "", 'cards': [build_card(play, 'UNDER') for play in under_plays or []]},
+        ],
+        daily={'today': stats['today'], 'yesterday': stats.get('yesterday', {'record': '0-0', 'profit': 0, 'roi': 0})}
+              if 'today' in stats else None,
+        recent=[(f"LAST {n}", calculate_recent_performance(completed_picks, n)) for n in (10, 20, 50)]
+               if tracking_data and completed_picks else None,
+        performance={'title': "NBA 3PT Model Performance", 'stats': stats} if has_record else None,
+    )
 
 def save_html(html_content: str) -> bool:
     try:
@@ -2473,7 +1729,8 @@ def main():
     track_new_picks(over_plays, under_plays)
     
     # Calculate tracking stats for HTML display
-    tracking_data = load_tracking_data()
+    tracking_data = load_tracking_data(full_history=True)
+    context = RunContext(tracking_data)
     stats = calculate_tracking_stats(tracking_data)
 
     print(f"\n{Colors.BOLD}{Colors.GREEN}{'='*80}{Colors.END}")
@@ -2507,7 +1764,7 @@ def main():
         )
 
     print(f"\n{Colors.CYAN}Generating HTML report...{Colors.END}")
-    html_content = generate_html_output(over_plays, under_plays, stats, tracking_data, three_factors, player_stats)
+    html_content = generate_html_output(over_plays, under_plays, stats, tracking_data, three_factors, player_stats, context)
     save_html(html_content)
 
     print(f"\n{Colors.BOLD}{Colors.GREEN}{'='*80}{Colors.END}")
@@ -1,22 +1,43 @@
 import csv
 import json
 import os
+import sys
 import re
 import traceback
 import shutil
 from datetime import datetime, timedelta
-from jinja2 import Template
 import requests
 from dotenv import load_dotenv
 import pytz
 import pandas as pd
-from collections import defaultdict
 
 # Import for the NBA's official stats API
 from nba_api.stats.endpoints import leaguedashteamstats, scoreboardv2
 from nba_api.stats.static import teams as nba_teams
 import time
 
+# Hot/cold tracking storage, team-name resolver, HTML templates and pick-history shards (shared modules at the repo root)
+try:
+    from html_templates import compile_template
+    from run_context import RunContext
+    from team_resolver import TeamResolver
+    from tracking_archive import load_tracking, save_tracking
+    from tracking_shards import history_panel, write_history
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import compile_template
+    from run_context import RunContext
+    from team_resolver import TeamResolver
+    from tracking_archive import load_tracking, save_tracking
+    from tracking_shards import history_panel, write_history
+
+# Monte Carlo slate simulator (sibling module)
+try:
+    from game_simulator import line_ladder, simulate_slate
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from game_simulator import line_ladder, simulate_slate
+
 # =========================
 # CONFIG
 # =========================
@@ -107,53 +128,55 @@ class Colors:
 # TEAM NAME NORMALIZATION
 # =========================
 
+# Feed spellings that differ from the canonical nba_api team names
+TEAM_NAME_ALIASES = {
+    "LA Clippers": "Los Angeles Clippers",
+    "L.A. Clippers": "Los Angeles Clippers",
+    "LAC": "Los Angeles Clippers",
+    "LA Lakers": "Los Angeles Lakers",
+    "L.A. Lakers": "Los Angeles Lakers",
+    "LAL": "Los Angeles Lakers",
+}
+
+NBA_TEAM_NAMES = [
+    "Atlanta Hawks",
+    "Boston Celtics",
+    "Brooklyn Nets",
+    "Charlotte Hornets",
+    "Chicago Bulls",
+    "Cleveland Cavaliers",
+    "Dallas Mavericks",
+    "Denver Nuggets",
+    "Detroit Pistons",
+    "Golden State Warriors",
+    "Houston Rockets",
+    "Indiana Pacers",
+    "Los Angeles Clippers",
+    "Los Angeles Lakers",
+    "Memphis Grizzlies",
+    "Miami Heat",
+    "Milwaukee Bucks",
+    "Minnesota Timberwolves",
+    "New Orleans Pelicans",
+    "New York Knicks",
+    "Oklahoma City Thunder",
+    "Orlando Magic",
+    "Philadelphia 76ers",
+    "Phoenix Suns",
+    "Portland Trail Blazers",
+    "Sacramento Kings",
+    "San Antonio Spurs",
+    "Toronto Raptors",
+    "Utah Jazz",
+    "Washington Wizards",
+]
+
+# Compiled once; every name seen this run is memoized
+TEAM_RESOLVER = TeamResolver(NBA_TEAM_NAMES, aliases=TEAM_NAME_ALIASES)
+
 def normalize_team_name(team_name):
     """Normalize team names for consistent matching across APIs"""
-    name = team_name.strip()
-
-    # Comprehensive mapping
-    name_map = {
-        # LA teams - handle variations
-        "LA Clippers": "Los Angeles Clippers",
-        "L.A. Clippers": "Los Angeles Clippers",
-        "LAC": "Los Angeles Clippers",
-        "LA Lakers": "Los Angeles Lakers",
-        "L.A. Lakers": "Los Angeles Lakers",
-        "LAL": "Los Angeles Lakers",
-        # All 30 NBA teams
-        "Atlanta Hawks": "Atlanta Hawks",
-        "Boston Celtics": "Boston Celtics",
-        "Brooklyn Nets": "Brooklyn Nets",
-        "Charlotte Hornets": "Charlotte Hornets",
-        "Chicago Bulls": "Chicago Bulls",
-        "Cleveland Cavaliers": "Cleveland Cavaliers",
-        "Dallas Mavericks": "Dallas Mavericks",
-        "Denver Nuggets": "Denver Nuggets",
-        "Detroit Pistons": "Detroit Pistons",
-        "Golden State Warriors": "Golden State Warriors",
-        "Houston Rockets": "Houston Rockets",
-        "Indiana Pacers": "Indiana Pacers",
-        "Los Angeles Clippers": "Los Angeles Clippers",
-        "Los Angeles Lakers": "Los Angeles Lakers",
-        "Memphis Grizzlies": "Memphis Grizzlies",
-        "Miami Heat": "Miami Heat",
-        "Milwaukee Bucks": "Milwaukee Bucks",
-        "Minnesota Timberwolves": "Minnesota Timberwolves",
-        "New Orleans Pelicans": "New Orleans Pelicans",
-        "New York Knicks": "New York Knicks",
-        "Oklahoma City Thunder": "Oklahoma City Thunder",
-        "Orlando Magic": "Orlando Magic",
-        "Philadelphia 76ers": "Philadelphia 76ers",
-        "Phoenix Suns": "Phoenix Suns",
-        "Portland Trail Blazers": "Portland Trail Blazers",
-        "Sacramento Kings": "Sacramento Kings",
-        "San Antonio Spurs": "San Antonio Spurs",
-        "Toronto Raptors": "Toronto Raptors",
-        "Utah Jazz": "Utah Jazz",
-        "Washington Wizards": "Washington Wizards",
-    }
-
-    return name_map.get(name, name)
+    return TEAM_RESOLVER.resolve(team_name) or team_name.strip()
 
 def get_team_name(api_name):
     """Normalize team name for consistent lookups"""
@@ -163,21 +186,9 @@ def get_team_name(api_name):
 # TRACKING FUNCTIONS
 # =========================
 
-def load_picks_tracking():
-    """Load existing picks tracking data"""
-    if os.path.exists(PICKS_TRACKING_FILE):
-        with open(PICKS_TRACKING_FILE, 'r') as f:
-            return json.load(f)
-    return {
-        "picks": [],
-        "summary": {
-            "total_picks": 0,
-            "wins": 0,
-            "losses": 0,
-            "pushes": 0,
-            "pending": 0
-        }
-    }
+def load_picks_tracking(full_history=False):
+    """Load existing picks tracking data (hot file only unless full_history=True)"""
+    return load_tracking(PICKS_TRACKING_FILE, full_history=full_history, default={"picks": []})
 
 def save_picks_tracking(tracking_data):
     """Save picks tracking data with automatic backup"""
@@ -185,43 +196,35 @@ def save_picks_tracking(tracking_data):
         backup_file = f"{PICKS_TRACKING_FILE}.backup"
         shutil.copy2(PICKS_TRACKING_FILE, backup_file)
 
-    with open(PICKS_TRACKING_FILE, 'w') as f:
-        json.dump(tracking_data, f, indent=2)
+    # Record stats are computed from the picks (calculate_tracking_stats); a stored
+    # summary would only cover the hot file's last 14 days
+    tracking_data.pop('summary', None)
+    save_tracking(PICKS_TRACKING_FILE, tracking_data)
     print(f"{Colors.GREEN}✓ Tracking data saved to {PICKS_TRACKING_FILE}{Colors.END}")
 
-def get_team_historical_performance():
+def pick_bet_team(pick):
+    """Team a spread pick backs (None for totals and unrecognized picks)"""
+    home_team = normalize_team_name(pick.get('home_team', ''))
+    away_team = normalize_team_name(pick.get('away_team', ''))
+    # NBA uses 'pick' field, NCAA uses 'pick_text' field
+    pick_text = pick.get('pick', pick.get('pick_text', '')).upper()
+
+    if 'BET:' in pick_text:
+        if home_team.upper() in pick_text:
+            return home_team
+        elif away_team.upper() in pick_text:
+            return away_team
+    return None
+
+def load_run_context():
+    """Load full tracking history once and index it for this run"""
+    return RunContext(load_picks_tracking(full_history=True), team_of=pick_bet_team)
+
+def get_team_historical_performance(context=None):
     """Calculate historical win rates for all teams"""
-    tracking_data = load_picks_tracking()
-    team_stats = defaultdict(lambda: {'wins': 0, 'losses': 0, 'profit': 0})
-
-    for pick in tracking_data.get('picks', []):
-        status = pick.get('status', '')
-        if status not in ['win', 'loss']:
-            continue
-
-        home_team = normalize_team_name(pick.get('home_team', ''))
-        away_team = normalize_team_name(pick.get('away_team', ''))
-        # NBA uses 'pick' field, NCAA uses 'pick_text' field
-        pick_text = pick.get('pick', pick.get('pick_text', '')).upper()
-        profit = pick.get('profit_loss', pick.get('profit', 0))
-
-        # Determine which team we bet on
-        bet_team = None
-        if 'BET:' in pick_text:
-            if home_team.upper() in pick_text:
-                bet_team = home_team
-            elif away_team.upper() in pick_text:
-                bet_team = away_team
-
-        if not bet_team:
-            continue
-
-        if status == 'win':
-            team_stats[bet_team]['wins'] += 1
-        elif status == 'loss':
-            team_stats[bet_team]['losses'] += 1
-
-        team_stats[bet_team]['profit'] += profit if profit else 0
+    if context is None:
+        context = load_run_context()
+    team_stats = context.team_records
 
     # Calculate win rates
     team_performance = {}
@@ -317,14 +320,17 @@ def get_team_performance_indicator(team_name, team_performance):
             'message': f"{team_name} - Poor performer: {record} ({win_rate:.0f}%) | {profit:+.2f}u over {total} picks"
         }
 
-def log_confident_pick(game_data, pick_type, edge, model_line, market_line):
-    """Log a confident pick to the tracking file"""
-    tracking_data = load_picks_tracking()
+def log_confident_pick(game_data, pick_type, edge, model_line, market_line, context=None):
+    """Log a confident pick to the tracking file (or to the run context, saved once by the caller)"""
+    tracking_data = context.tracking if context is not None else load_picks_tracking()
 
     pick_id = f"{game_data['home_team']}_{game_data['away_team']}_{game_data['commence_time']}_{pick_type}"
 
     # Check if this pick already exists
-    existing_pick = next((p for p in tracking_data['picks'] if p['pick_id'] == pick_id), None)
+    if context is not None:
+        existing_pick = context.find_pick(pick_id)
+    else:
+        existing_pick = next((p for p in tracking_data['picks'] if p['pick_id'] == pick_id), None)
     if existing_pick:
         return
 
@@ -356,11 +362,11 @@ def log_confident_pick(game_data, pick_type, edge, model_line, market_line):
         "clv_status": None  # Will be calculated when closing line is updated
     }
 
-    tracking_data['picks'].append(pick_entry)
-    tracking_data['summary']['total_picks'] += 1
-    tracking_data['summary']['pending'] += 1
-
-    save_picks_tracking(tracking_data)
+    if context is not None:
+        context.add_pick(pick_entry)
+    else:
+        tracking_data['picks'].append(pick_entry)
+        save_picks_tracking(tracking_data)
 
     print(f"{Colors.GREEN}📝 LOGGED PICK: {pick_text} (Edge: {edge:+.1f}){Colors.END}")
 
@@ -472,6 +478,37 @@ def fetch_completed_scores_nba():
         print(f"{Colors.RED}Error fetching NBA scores: {e}{Colors.END}")
         return []
 
+def et_game_date(time_str):
+    """ET calendar date of an ISO game time string (None if missing or unparseable)"""
+    if not time_str:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(time_str).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = pytz.utc.localize(dt)
+    return dt.astimezone(pytz.timezone('US/Eastern')).date()
+
+def index_completed_games(completed_games):
+    """
+    Index completed games once by (normalized home, normalized away, ET date).
+    Also returns a (home, away) index for picks without a usable date and the
+    (first, last) ET date window the scores cover.
+    """
+    by_key = {}
+    by_matchup = {}
+    for game in completed_games:
+        if not game.get('completed'):
+            continue
+        home = normalize_team_name(game['home_team'])
+        away = normalize_team_name(game['away_team'])
+        by_key[(home, away, et_game_date(game.get('commence_time')))] = game
+        by_matchup[(home, away)] = game
+    dates = [d for (_, _, d) in by_key if d]
+    window = (min(dates), max(dates)) if dates else None
+    return by_key, by_matchup, window
+
 def update_pick_results():
     """Check for completed games and update pick results"""
     tracking_data = load_picks_tracking()
@@ -498,111 +535,108 @@ def update_pick_results():
 
     updated_count = 0
 
+    # One index over the completed games, then one lookup per pick
+    games_by_key, games_by_matchup, window = index_completed_games(completed_games)
+    skipped_outside_window = 0
+
     for pick in pending_picks:
-        # Find matching completed game
-        for game in completed_games:
-            if not game.get('completed'):
-                continue
+        pick_date = et_game_date(pick.get('game_time') or pick.get('game_date'))
+        if pick_date and window and not (window[0] <= pick_date <= window[1]):
+            # Game isn't covered by the scores feed - nothing to match against
+            skipped_outside_window += 1
+            continue
 
-            home_team = normalize_team_name(game['home_team'])
-            away_team = normalize_team_name(game['away_team'])
+        pick_home = normalize_team_name(pick['home_team'])
+        pick_away = normalize_team_name(pick['away_team'])
+        if pick_date and window:
+            game = games_by_key.get((pick_home, pick_away, pick_date))
+        else:
+            game = games_by_matchup.get((pick_home, pick_away))
+        if game is None:
+            continue
+        home_team, away_team = pick_home, pick_away
 
-            pick_home = normalize_team_name(pick['home_team'])
-            pick_away = normalize_team_name(pick['away_team'])
+        scores = game.get('scores')
+        if not scores or len(scores) < 2:
+            print(f"{Colors.RED}⚠️  Found match but missing scores: {away_team} @ {home_team}{Colors.END}")
+            continue
 
-            if home_team == pick_home and away_team == pick_away:
-                # Found the game!
-                scores = game.get('scores')
-                if not scores or len(scores) < 2:
-                    print(f"{Colors.RED}⚠️  Found match but missing scores: {away_team} @ {home_team}{Colors.END}")
-                    continue
+        try:
+            home_score_str = next((s['score'] for s in scores if s['name'] == game['home_team']), None)
+            away_score_str = next((s['score'] for s in scores if s['name'] == game['away_team']), None)
+
+            if home_score_str is None or away_score_str is None:
+                print(f"{Colors.RED}⚠️  Could not parse scores for: {away_team} @ {home_team}{Colors.END}")
+                continue
 
-                try:
-                    home_score_str = next((s['score'] for s in scores if s['name'] == game['home_team']), None)
-                    away_score_str = next((s['score'] for s in scores if s['name'] == game['away_team']), None)
+            home_score = int(home_score_str)
+            away_score = int(away_score_str)
 
-                    if home_score_str is None or away_score_str is None:
-                        print(f"{Colors.RED}⚠️  Could not parse scores for: {away_team} @ {home_team}{Colors.END}")
-                        continue
+        except (ValueError, TypeError) as e:
+            print(f"{Colors.RED}Error parsing scores for {game['home_team']}: {e}{Colors.END}")
+            continue
 
-                    home_score = int(home_score_str)
-                    away_score = int(away_score_str)
+        print(f"  ✓ Updating: {away_team} {away_score} @ {home_team} {home_score}")
 
-                except (ValueError, TypeError) as e:
-                    print(f"{Colors.RED}Error parsing scores for {game['home_team']}: {e}{Colors.END}")
-                    continue
+        pick['actual_home_score'] = home_score
+        pick['actual_away_score'] = away_score
 
-                print(f"  ✓ Updating: {away_team} {away_score} @ {home_team} {home_score}")
+        actual_total = home_score + away_score
+        actual_spread = home_score - away_score
 
-                pick['actual_home_score'] = home_score
-                pick['actual_away_score'] = away_score
+        if pick['pick_type'] == 'Spread':
+            market_spread = float(pick['market_line'])
+            pick_text = pick['pick']
 
-                actual_total = home_score + away_score
-                actual_spread = home_score - away_score
+            if pick_home in pick_text:
+                cover_margin = actual_spread + market_spread
+            else:
+                cover_margin = -actual_spread - market_spread
+
+            if abs(cover_margin) < 0.01:
+                pick['status'] = 'push'
+                pick['result'] = 'Push'
+                pick['profit_loss'] = 0
+            elif cover_margin > 0:
+                pick['status'] = 'win'
+                pick['result'] = 'Win'
+                pick['profit_loss'] = 100
+            else:
+                pick['status'] = 'loss'
+                pick['result'] = 'Loss'
+                pick['profit_loss'] = -110
+
+        elif pick['pick_type'] == 'Total':
+            market_total = float(pick['market_line'])
+            pick_text = pick['pick']
+            total_diff = actual_total - market_total
+
+            if abs(total_diff) < 0.01:
+                pick['status'] = 'push'
+                pick['result'] = 'Push'
+                pick['profit_loss'] = 0
+            elif 'OVER' in pick_text and total_diff > 0:
+                pick['status'] = 'win'
+                pick['result'] = 'Win'
+                pick['profit_loss'] = 100
+            elif 'UNDER' in pick_text and total_diff < 0:
+                pick['status'] = 'win'
+                pick['result'] = 'Win'
+                pick['profit_loss'] = 100
+            else:
+                pick['status'] = 'loss'
+                pick['result'] = 'Loss'
+                pick['profit_loss'] = -110
 
-                if pick['pick_type'] == 'Spread':
-                    market_spread = float(pick['market_line'])
-                    pick_text = pick['pick']
+        updated_count += 1
+        print(f"    Result: {pick['result']}")
 
-                    if pick_home in pick_text:
-                        cover_margin = actual_spread + market_spread
-                    else:
-                        cover_margin = -actual_spread - market_spread
-
-                    if abs(cover_margin) < 0.01:
-                        pick['status'] = 'push'
-                        pick['result'] = 'Push'
-                        pick['profit_loss'] = 0
-                    elif cover_margin > 0:
-                        pick['status'] = 'win'
-                        pick['result'] = 'Win'
-                        pick['profit_loss'] = 100
-                    else:
-                        pick['status'] = 'loss'
-                        pick['result'] = 'Loss'
-                        pick['profit_loss'] = -110
-
-                elif pick['pick_type'] == 'Total':
-                    market_total = float(pick['market_line'])
-                    pick_text = pick['pick']
-                    total_diff = actual_total - market_total
-
-                    if abs(total_diff) < 0.01:
-                        pick['status'] = 'push'
-                        pick['result'] = 'Push'
-                        pick['profit_loss'] = 0
-                    elif 'OVER' in pick_text and total_diff > 0:
-                        pick['status'] = 'win'
-                        pick['result'] = 'Win'
-                        pick['profit_loss'] = 100
-                    elif 'UNDER' in pick_text and total_diff < 0:
-                        pick['status'] = 'win'
-                        pick['result'] = 'Win'
-                        pick['profit_loss'] = 100
-                    else:
-                        pick['status'] = 'loss'
-                        pick['result'] = 'Loss'
-                        pick['profit_loss'] = -110
-
-                updated_count += 1
-                print(f"    Result: {pick['result']}")
-                break
-
-    # Recalculate summary using status field to match NCAA model
-    tracking_data['summary'] = {
-        'total_picks': len(tracking_data['picks']),
-        'wins': sum(1 for p in tracking_data['picks'] if p.get('status', '').lower() == 'win'),
-        'losses': sum(1 for p in tracking_data['picks'] if p.get('status', '').lower() == 'loss'),
-        'pushes': sum(1 for p in tracking_data['picks'] if p.get('status', '').lower() == 'push'),
-        'pending': sum(1 for p in tracking_data['picks'] if p.get('status', '').lower() == 'pending')
-    }
+    if skipped_outside_window:
+        print(f"{Colors.YELLOW}Skipped {skipped_outside_window} picks outside the scores window{Colors.END}")
 
     save_picks_tracking(tracking_data)
 
     if updated_count > 0:
-        # Recalculate summary
-        tracking_data['summary'] = calculate_summary_stats(tracking_data['picks'])
-        save_picks_tracking(tracking_data)
         print(f"{Colors.GREEN}✅ Updated {updated_count} picks{Colors.END}")
         
         # Regenerate HTML
@@ -613,13 +647,15 @@ def update_pick_results():
     return updated_count
 
 def calculate_tracking_stats(tracking_data):
-    """Calculate tracking statistics"""
+    """Calculate tracking statistics from the picks themselves (pass full history for the all-time record)"""
+    picks = tracking_data.get('picks', [])
+    statuses = [p.get('status', '').lower() for p in picks]
     stats = {
-        'total_picks': tracking_data['summary']['total_picks'],
-        'wins': tracking_data['summary']['wins'],
-        'losses': tracking_data['summary']['losses'],
-        'pushes': tracking_data['summary']['pushes'],
-        'pending': tracking_data['summary']['pending'],
+        'total_picks': len(picks),
+        'wins': statuses.count('win'),
+        'losses': statuses.count('loss'),
+        'pushes': statuses.count('push'),
+        'pending': statuses.count('pending'),
         'win_rate': 0.0,
         'total_profit': 0,
         'roi': 0.0
@@ -629,7 +665,7 @@ def calculate_tracking_stats(tracking_data):
     if decided > 0:
         stats['win_rate'] = (stats['wins'] / decided) * 100
 
-    stats['total_profit'] = sum(p.get('profit_loss', 0) for p in tracking_data['picks'])
+    stats['total_profit'] = sum(p.get('profit_loss') or 0 for p in picks)
 
     total_risked = decided * 110
     if total_risked > 0:
@@ -637,46 +673,11 @@ def calculate_tracking_stats(tracking_data):
 
     return stats
 
-def get_historical_performance_by_edge(tracking_data):
+def get_historical_performance_by_edge(context):
     """Calculate win rates by edge magnitude for A.I. Rating system"""
-    picks = tracking_data.get('picks', [])
-    completed_picks = [p for p in picks if p.get('status') in ['win', 'loss']]
-    
-    # Group picks by edge range
-    edge_ranges = defaultdict(lambda: {'wins': 0, 'losses': 0})
-    
-    for pick in completed_picks:
-        edge = abs(float(pick.get('edge', 0)))
-        status = pick.get('status', '')
-        
-        # Create edge range buckets
-        if edge >= 10:
-            range_key = "10+"
-        elif edge >= 8:
-            range_key = "8-9.9"
-        elif edge >= 6:
-            range_key = "6-7.9"
-        elif edge >= 4:
-            range_key = "4-5.9"
-        elif edge >= 3:
-            range_key = "3-3.9"
-        else:
-            range_key = "0-2.9"
-        
-        if status == 'win':
-            edge_ranges[range_key]['wins'] += 1
-        elif status == 'loss':
-            edge_ranges[range_key]['losses'] += 1
-    
-    # Calculate win rates
-    performance_by_edge = {}
-    for range_key, stats in edge_ranges.items():
-        total = stats['wins'] + stats['losses']
-        if total >= 5:  # Only use ranges with sufficient data
-            win_rate = stats['wins'] / total if total > 0 else 0.5
-            performance_by_edge[range_key] = win_rate
-    
-    return performance_by_edge
+    # Edge buckets ("10+", "8-9.9", ... "0-2.9") are tallied when the context is built;
+    # only ranges with sufficient data are used
+    return context.edge_win_rates(min_picks=5)
 
 def calculate_ai_rating(game_data, team_performance, historical_edge_performance):
     """
@@ -851,9 +852,9 @@ def calculate_stats_for_picks(picks):
         }
     }
 
-def generate_tracking_html():
+def generate_tracking_html(context=None):
     """Generate HTML dashboard for tracking picks"""
-    tracking_data = load_picks_tracking()
+    tracking_data = context.tracking if context is not None else load_picks_tracking(full_history=True)
     stats = calculate_tracking_stats(tracking_data)
 
     # Get current time in Eastern timezone
@@ -1606,6 +1607,8 @@ def generate_tracking_html():
             </div>
         </div>
 
+        {{ history_panel }}
+
         <div class="text-center text-gray-400 text-sm" style="margin-top: 2rem;">
             <p>Last updated: {{ timestamp }}</p>
         </div>
@@ -1613,7 +1616,10 @@ def generate_tracking_html():
 </body>
 </html>'''
 
-    template = Template(template_str)
+    # Settled picks go to month shards the page loads on demand (tracking_shards.py)
+    write_history(TRACKING_HTML_FILE, tracking_data['picks'])
+
+    template = compile_template(template_str)
     html_output = template.render(
         stats=stats,
         pending_picks=pending_picks,
@@ -1639,7 +1645,8 @@ def generate_tracking_html():
         display_total_pushes=display_total_pushes,
         last_100=last_100,
         last_50=last_50,
-        last_20=last_20
+        last_20=last_20,
+        history_panel=history_panel(TRACKING_HTML_FILE)
     )
 
     with open(TRACKING_HTML_FILE, 'w', encoding='utf-8') as f:
@@ -2115,20 +2122,26 @@ def validate_market_line(spread, total, home_team, away_team):
     # Return True if lines are reasonable, False if they're too extreme
     return len(issues) == 0 or (abs(spread) < 30 and 170 < total < 270)
 
-def process_games(games, stats, splits_data=None, schedule_data=None):
+def process_games(games, stats, splits_data=None, schedule_data=None, context=None):
     """Process each game and generate predictions with improved validation"""
     results = []
 
-    # Load historical team performance
-    team_performance = get_team_historical_performance()
+    # Tracking history is loaded and indexed once per run
+    if context is None:
+        context = load_run_context()
+
+    # Historical team performance
+    team_performance = get_team_historical_performance(context)
     
-    # Load historical edge performance for A.I. Rating calculation
-    tracking_data = load_picks_tracking()
-    historical_edge_performance = get_historical_performance_by_edge(tracking_data)
+    # Historical edge performance for A.I. Rating calculation
+    historical_edge_performance = get_historical_performance_by_edge(context)
     
     # Track if we need to save updated CLV data
     clv_updated = False
 
+    # (model_spread, model_total, home spreads, totals) per result, simulated together after the loop
+    sim_inputs = []
+
     for game in games:
         try:
             # Normalize team names from The Odds API
@@ -2285,7 +2298,7 @@ def process_games(games, stats, splits_data=None, schedule_data=None):
                     # Update closing line for existing spread picks
                     if '✅' in ats_pick and abs(spread_edge) >= CONFIDENT_SPREAD_EDGE:
                         spread_pick_id = f"{home_team}_{away_team}_{commence_time}_spread"
-                        existing_spread_pick = next((p for p in tracking_data['picks'] if p.get('pick_id') == spread_pick_id), None)
+                        existing_spread_pick = context.find_pick(spread_pick_id)
                         
                         if existing_spread_pick:
                             # Update closing line if it has changed
@@ -2303,7 +2316,7 @@ def process_games(games, stats, splits_data=None, schedule_data=None):
                     # Update closing line for existing total picks
                     if '✅' in total_pick and abs(total_edge) >= CONFIDENT_TOTAL_EDGE:
                         total_pick_id = f"{home_team}_{away_team}_{commence_time}_total"
-                        existing_total_pick = next((p for p in tracking_data['picks'] if p.get('pick_id') == total_pick_id), None)
+                        existing_total_pick = context.find_pick(total_pick_id)
                         
                         if existing_total_pick:
                             # Update closing line if it has changed
@@ -2321,27 +2334,57 @@ def process_games(games, stats, splits_data=None, schedule_data=None):
                 # Fail gracefully - don't break the model if CLV update fails
                 print(f"{Colors.YELLOW}⚠ Error updating CLV: {e}{Colors.END}")
 
+            # Every line any book is hanging on this game, for the probability ladder
+            alt_spreads, alt_totals = {home_spread}, {market_total}
+            for book in game['bookmakers']:
+                for m in book.get('markets', []):
+                    if m['key'] == 'spreads':
+                        alt_spreads.update(o['point'] for o in m['outcomes']
+                                           if normalize_team_name(o['name']) == home_team)
+                    elif m['key'] == 'totals':
+                        alt_totals.update(o['point'] for o in m['outcomes'][:1])
+            sim_inputs.append((model_spread, model_total, sorted(alt_spreads), sorted(alt_totals)))
             results.append(result)
 
             # Log ONLY confident picks with higher thresholds
             if '✅' in ats_pick and abs(spread_edge) >= CONFIDENT_SPREAD_EDGE:
-                log_confident_pick(result, 'spread', spread_edge, model_spread, home_spread)
+                log_confident_pick(result, 'spread', spread_edge, model_spread, home_spread, context)
 
             if '✅' in total_pick and abs(total_edge) >= CONFIDENT_TOTAL_EDGE:
-                log_confident_pick(result, 'total', total_edge, model_total, market_total)
+                log_confident_pick(result, 'total', total_edge, model_total, market_total, context)
 
         except Exception as e:
             print(f"{Colors.YELLOW}⚠ Error processing game: {e}{Colors.END}")
             traceback.print_exc()
             continue
 
-    # Save updated CLV data if any picks were updated
-    if clv_updated:
-        save_picks_tracking(tracking_data)
-        print(f"{Colors.GREEN}✓ Updated CLV data for existing picks{Colors.END}")
+    # One save for new picks and CLV updates
+    if clv_updated or context.new_picks:
+        save_picks_tracking(context.tracking)
+        if clv_updated:
+            print(f"{Colors.GREEN}✓ Updated CLV data for existing picks{Colors.END}")
 
+    attach_simulated_probabilities(results, sim_inputs)
     return results
 
+def attach_simulated_probabilities(results, sim_inputs):
+    """Simulate the whole slate once and add win/cover/over probabilities to each result"""
+    if not results:
+        return
+    sim = simulate_slate([s[0] for s in sim_inputs], [s[1] for s in sim_inputs])
+    for i, (result, (_, _, alt_spreads, alt_totals)) in enumerate(zip(results, sim_inputs)):
+        home_spread = float(result['Market Spread'])
+        cover, push, lose = sim.home_cover(i, [home_spread])
+        over, total_push, under = sim.over(i, [result['Market Total']])
+        result["home_win_prob"] = round(float(sim.home_win[i]), 4)
+        result["home_cover_prob"] = round(float(cover[0]), 4)
+        result["away_cover_prob"] = round(float(lose[0]), 4)
+        result["spread_push_prob"] = round(float(push[0]), 4)
+        result["over_prob"] = round(float(over[0]), 4)
+        result["under_prob"] = round(float(under[0]), 4)
+        result["total_push_prob"] = round(float(total_push[0]), 4)
+        result["line_probs"] = line_ladder(sim, i, alt_spreads, alt_totals)
+
 # =========================
 # DISPLAY & SAVE
 # =========================
@@ -2393,6 +2436,10 @@ def display_terminal(results):
         if r['Total Explanation']:
             print(f"     {Colors.CYAN}{r['Total Explanation']}{Colors.END}")
         print(f"  📈 Predicted: {r['Predicted Score']}")
+        if 'home_win_prob' in r:
+            print(f"  🎲 Sim: {r['home_team']} win {r['home_win_prob']:.1%} | "
+                  f"cover {r['home_cover_prob']:.1%} / {r['away_cover_prob']:.1%} | "
+                  f"over {r['over_prob']:.1%} / under {r['under_prob']:.1%}")
         print()
 
 def save_csv(results):
@@ -2400,16 +2447,20 @@ def save_csv(results):
     if not results:
         return
 
+    # The nested line_probs ladder doesn't fit a flat row; main-line probabilities have their own columns
+    fieldnames = [k for k, v in results[0].items() if not isinstance(v, dict)]
     with open(CSV_FILE, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=results[0].keys())
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
         writer.writeheader()
         writer.writerows(results)
 
     print(f"{Colors.GREEN}✓ CSV saved: {CSV_FILE}{Colors.END}")
 
-def save_html(results):
-    # Load tracking data for display
-    tracking_data = load_picks_tracking()
+def save_html(results, context=None):
+    # Tracking data for display
+    if context is None:
+        context = load_run_context()
+    tracking_data = context.tracking
     
     # Get pending picks - ensure pending picks only show upcoming games (not past ones waiting for update)
     # We can filter out stale pending picks if needed, but usually we want to see everything marked as pending
@@ -2570,7 +2621,7 @@ def save_html(results):
             # Check for matching spread pick
             if '✅' in result.get('ATS Pick', ''):
                 spread_pick_id = f"{result['home_team']}_{result['away_team']}_{result['commence_time']}_spread"
-                spread_pick = next((p for p in tracking_data.get('picks', []) if p.get('pick_id') == spread_pick_id), None)
+                spread_pick = context.find_pick(spread_pick_id)
                 
                 if spread_pick:
                     result['clv_status_spread'] = spread_pick.get('clv_status')
@@ -2578,7 +2629,7 @@ def save_html(results):
             # Check for matching total pick
             if '✅' in result.get('Total Pick', ''):
                 total_pick_id = f"{result['home_team']}_{result['away_team']}_{result['commence_time']}_total"
-                total_pick = next((p for p in tracking_data.get('picks', []) if p.get('pick_id') == total_pick_id), None)
+                total_pick = context.find_pick(total_pick_id)
                 
                 if total_pick:
                     result['clv_status_total'] = total_pick.get('clv_status')
@@ -3110,7 +3161,7 @@ def save_html(results):
         'San Antonio Spurs': 'SAS', 'Toronto Raptors': 'TOR', 'Utah Jazz': 'UTA', 'Washington Wizards': 'WAS'
     }
 
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         results=results,
         timestamp=timestamp_str,
@@ -3146,7 +3197,10 @@ def main():
     # STEP 1: Update old picks
     print(f"{Colors.BOLD}{Colors.CYAN}STEP 1: Checking for Completed Games{Colors.END}")
     update_pick_results()
-    generate_tracking_html()
+
+    # Graded history, loaded and indexed once for the rest of the run
+    context = load_run_context()
+    generate_tracking_html(context)
 
     # STEP 2: Fetch composite stats
     print(f"\n{Colors.BOLD}{Colors.CYAN}STEP 2: Fetching Composite Stats (Season + Form){Colors.END}")
@@ -3173,7 +3227,7 @@ def main():
 
     # STEP 6: Process and analyze
     print(f"\n{Colors.BOLD}{Colors.CYAN}STEP 6: Processing Games & Generating Picks{Colors.END}\n")
-    results = process_games(games, composite_stats, splits_data, schedule_data)
+    results = process_games(games, composite_stats, splits_data, schedule_data, context)
 
     if results:
         print(f"\n{Colors.BOLD}{Colors.GREEN}✅ Analyzed {len(results)} games with complete odds{Colors.END}\n")
@@ -3197,17 +3251,16 @@ def main():
 
         display_terminal(sorted_results)
         save_csv(sorted_results)
-        save_html(sorted_results)
+        save_html(sorted_results, context)
     else:
         print(f"\n{Colors.YELLOW}⚠️  No games with complete betting lines found.{Colors.END}\n")
 
     # STEP 7: Generate final tracking dashboard
     print(f"\n{Colors.BOLD}{Colors.CYAN}STEP 7: Generating Final Tracking Dashboard{Colors.END}")
-    generate_tracking_html()
+    generate_tracking_html(context)
 
     # Display tracking summary
-    tracking_data = load_picks_tracking()
-    stats = calculate_tracking_stats(tracking_data)
+    stats = calculate_tracking_stats(context.tracking)
 
     print(f"\n{Colors.BOLD}{'='*90}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.YELLOW}📊 TRACKING SUMMARY 📊{Colors.END}")
@@ -2,10 +2,10 @@ import csv
 import json
 import os
 import re
+import sys
 import traceback
 import shutil
 from datetime import datetime, timedelta
-from jinja2 import Template
 import requests
 from dotenv import load_dotenv
 import pytz
@@ -15,6 +15,17 @@ import pandas as pd
 from nba_api.stats.endpoints import leaguedashteamstats, scoreboardv2
 import time 
 
+# Team-name resolver and HTML templates (shared modules at the repo root)
+try:
+    from html_templates import compile_template
+    from team_resolver import TeamResolver
+    from tracking_archive import load_tracking, save_tracking
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import compile_template
+    from team_resolver import TeamResolver
+    from tracking_archive import load_tracking, save_tracking
+
 # =========================
 # CONFIG
 # =========================
@@ -93,69 +104,59 @@ TEAM_NAME_MAP = {
 # TRACKING FUNCTIONS
 # =========================
 
+# Feed spellings that differ from the canonical nba_api team names
+TEAM_NAME_ALIASES = {
+    "LA Clippers": "Los Angeles Clippers",
+    "L.A. Clippers": "Los Angeles Clippers",
+    "LAC": "Los Angeles Clippers",
+    "LA Lakers": "Los Angeles Lakers",
+    "L.A. Lakers": "Los Angeles Lakers",
+    "LAL": "Los Angeles Lakers",
+}
+
+NBA_TEAM_NAMES = [
+    "Atlanta Hawks",
+    "Boston Celtics",
+    "Brooklyn Nets",
+    "Charlotte Hornets",
+    "Chicago Bulls",
+    "Cleveland Cavaliers",
+    "Dallas Mavericks",
+    "Denver Nuggets",
+    "Detroit Pistons",
+    "Golden State Warriors",
+    "Houston Rockets",
+    "Indiana Pacers",
+    "Los Angeles Clippers",
+    "Los Angeles Lakers",
+    "Memphis Grizzlies",
+    "Miami Heat",
+    "Milwaukee Bucks",
+    "Minnesota Timberwolves",
+    "New Orleans Pelicans",
+    "New York Knicks",
+    "Oklahoma City Thunder",
+    "Orlando Magic",
+    "Philadelphia 76ers",
+    "Phoenix Suns",
+    "Portland Trail Blazers",
+    "Sacramento Kings",
+    "San Antonio Spurs",
+    "Toronto Raptors",
+    "Utah Jazz",
+    "Washington Wizards",
+]
+
+# Compiled once; every name seen this run is memoized
+TEAM_RESOLVER = TeamResolver(NBA_TEAM_NAMES, aliases=TEAM_NAME_ALIASES)
+
 def normalize_team_name(team_name):
     """Normalize team names for consistent matching across APIs"""
-    name = team_name.strip()
-    
-    # Comprehensive mapping - handles variations from different APIs
-    name_map = {
-        # LA teams - handle variations
-        "LA Clippers": "Los Angeles Clippers",
-        "L.A. Clippers": "Los Angeles Clippers",
-        "LAC": "Los Angeles Clippers",
-        "LA Lakers": "Los Angeles Lakers",
-        "L.A. Lakers": "Los Angeles Lakers",
-        "LAL": "Los Angeles Lakers",
-        # All 30 NBA teams
-        "Atlanta Hawks": "Atlanta Hawks",
-        "Boston Celtics": "Boston Celtics",
-        "Brooklyn Nets": "Brooklyn Nets",
-        "Charlotte Hornets": "Charlotte Hornets",
-        "Chicago Bulls": "Chicago Bulls",
-        "Cleveland Cavaliers": "Cleveland Cavaliers",
-        "Dallas Mavericks": "Dallas Mavericks",
-        "Denver Nuggets": "Denver Nuggets",
-        "Detroit Pistons": "Detroit Pistons",
-        "Golden State Warriors": "Golden State Warriors",
-        "Houston Rockets": "Houston Rockets",
-        "Indiana Pacers": "Indiana Pacers",
-        "Los Angeles Clippers": "Los Angeles Clippers",
-        "Los Angeles Lakers": "Los Angeles Lakers",
-        "Memphis Grizzlies": "Memphis Grizzlies",
-        "Miami Heat": "Miami Heat",
-        "Milwaukee Bucks": "Milwaukee Bucks",
-        "Minnesota Timberwolves": "Minnesota Timberwolves",
-        "New Orleans Pelicans": "New Orleans Pelicans",
-        "New York Knicks": "New York Knicks",
-        "Oklahoma City Thunder": "Oklahoma City Thunder",
-        "Orlando Magic": "Orlando Magic",
-        "Philadelphia 76ers": "Philadelphia 76ers",
-        "Phoenix Suns": "Phoenix Suns",
-        "Portland Trail Blazers": "Portland Trail Blazers",
-        "Sacramento Kings": "Sacramento Kings",
-        "San Antonio Spurs": "San Antonio Spurs",
-        "Toronto Raptors": "Toronto Raptors",
-        "Utah Jazz": "Utah Jazz",
-        "Washington Wizards": "Washington Wizards",
-    }
-    
-    return name_map.get(name, name)
+    return TEAM_RESOLVER.resolve(team_name) or team_name.strip()
 
 def load_picks_tracking():
-    """Load existing picks tracking data"""
-    if os.path.exists(PICKS_TRACKING_FILE):
-        with open(PICKS_TRACKING_FILE, 'r') as f:
-            return json.load(f)
-    return {
-        "picks": [], 
-        "summary": {
-            "total_picks": 0, 
-            "wins": 0, 
-            "losses": 0, 
-            "pushes": 0,
-            "pending": 0
-        }
-    }
+    """Load picks tracking data, including picks rolled into the archive partitions"""
+    return load_tracking(PICKS_TRACKING_FILE, full_history=True, default={"picks": []})
 
 def save_picks_tracking(tracking_data):
     """Save picks tracking data with automatic backup"""
@@ -165,8 +166,10 @@ def save_picks_tracking(tracking_data):
         shutil.copy2(PICKS_TRACKING_FILE, backup_file)
         print(f"{Colors.CYAN}✓ Backup created: {backup_file}{Colors.END}")
     
-    with open(PICKS_TRACKING_FILE, 'w') as f:
-        json.dump(tracking_data, f, indent=2)
+    # Cold picks go back to their archive partitions; the record is computed from
+    # the picks (summarize_picks), so no stored summary is written
+    tracking_data.pop('summary', None)
+    save_tracking(PICKS_TRACKING_FILE, tracking_data)
     print(f"{Colors.GREEN}✓ Tracking data saved to {PICKS_TRACKING_FILE}{Colors.END}")
     print(f"{Colors.GREEN}  Total picks in file: {len(tracking_data['picks'])}{Colors.END}")
 
@@ -218,8 +221,6 @@ def log_confident_pick(game_data, pick_type, edge, model_line, market_line):
     }
     
     tracking_data['picks'].append(pick_entry)
-    tracking_data['summary']['total_picks'] += 1
-    tracking_data['summary']['pending'] += 1
     
     save_picks_tracking(tracking_data)
     
@@ -423,35 +424,33 @@ def update_pick_results():
         print(f"\n{Colors.RED}✗ Error updating results: {e}{Colors.END}")
         traceback.print_exc()
     
-    # Recalculate summary from actual pick data
-    tracking_data['summary'] = {
-        'total_picks': len(tracking_data['picks']),
-        'wins': sum(1 for p in tracking_data['picks'] if p.get('result') == 'Win'),
-        'losses': sum(1 for p in tracking_data['picks'] if p.get('result') == 'Loss'),
-        'pushes': sum(1 for p in tracking_data['picks'] if p.get('result') == 'Push'),
-        'pending': sum(1 for p in tracking_data['picks'] if p.get('status') == 'Pending')
-    }
-    
     save_picks_tracking(tracking_data)
     
     if updated:
-        wins = tracking_data['summary']['wins']
-        losses = tracking_data['summary']['losses']
-        pushes = tracking_data['summary']['pushes']
+        summary = summarize_picks(tracking_data['picks'])
+        wins = summary['wins']
+        losses = summary['losses']
+        pushes = summary['pushes']
         print(f"\n{Colors.GREEN}{'='*90}{Colors.END}")
         print(f"{Colors.GREEN}✅ RESULTS UPDATED! Record: {wins}-{losses}-{pushes}{Colors.END}")
         print(f"{Colors.GREEN}{'='*90}{Colors.END}")
     else:
         print(f"\n{Colors.YELLOW}⚠️  No new results found{Colors.END}")
 
+def summarize_picks(picks):
+    """Record counts computed from the picks themselves"""
+    return {
+        'total_picks': len(picks),
+        'wins': sum(1 for p in picks if p.get('status', '').lower() == 'win'),
+        'losses': sum(1 for p in picks if p.get('status', '').lower() == 'loss'),
+        'pushes': sum(1 for p in picks if p.get('status', '').lower() == 'push'),
+        'pending': sum(1 for p in picks if p.get('status', '').lower() == 'pending')
+    }
+
 def calculate_tracking_stats(tracking_data):
     """Calculate tracking statistics"""
     stats = {
-        'total_picks': tracking_data['summary']['total_picks'],
-        'wins': tracking_data['summary']['wins'],
-        'losses': tracking_data['summary']['losses'],
-        'pushes': tracking_data['summary']['pushes'],
-        'pending': tracking_data['summary']['pending'],
+        **summarize_picks(tracking_data['picks']),
         'win_rate': 0.0,
         'total_profit': 0,
         'roi': 0.0
@@ -711,7 +710,7 @@ def generate_tracking_html():
 </body>
 </html>'''
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         stats=stats,
         pending_picks=pending_picks,
@@ -1397,7 +1396,7 @@ def save_html(results):
     </body>
     </html>'''
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         results=results, 
         timestamp=timestamp_str,
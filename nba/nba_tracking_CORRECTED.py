@@ -4,10 +4,13 @@ NBA TRACKING - CORRECTED VERSION
 Reads from nba_picks_tracking.json and generates dashboard with CORRECT stats
 """
 
-import json
 import os
+import sys
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tracking_archive import load_tracking
+
 def load_tracking_data():
     """Load picks tracking data"""
     file = 'nba_picks_tracking.json'
@@ -17,10 +20,7 @@ def load_tracking_data():
         print(f"Looking for: {os.path.abspath(file)}")
         return None
     
-    with open(file, 'r') as f:
-        data = json.load(f)
-    
-    return data
+    return load_tracking(file, full_history=True)
 
 def calculate_correct_stats(picks):
     """Calculate stats ONLY from completed picks"""
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+NBA Prop Distribution Engine
+----------------------------
+Fits a per-player, per-stat distribution to this season's game logs and
+stores it as precomputed CDF and quantile tables, so the probability of any
+line is a table lookup instead of the AI-score -> 40-70% mapping in
+`calculate_ev`. Alternate lines and ladders can be priced directly.
+
+    PTS, REB   discretized normal       (roughly symmetric, wide support)
+    AST, FG3M  negative binomial        (over-dispersed counts; Poisson if not)
+
+Each fit is blended with the player's empirical game-log histogram. The
+empirical share is n / (n + SHRINK_GAMES), so regulars lean on their own
+history and short samples lean on the parametric shape.
+
+Stats are integers, so the CDF is tabulated at 0..max for every player:
+
+    P(over 24.5) = 1 - CDF[24]
+    P(over 25)   = 1 - CDF[25], P(push) = PMF[25]
+
+Pricing is a gather over the tables. Every line at every book, for every
+player, takes milliseconds.
+
+All players' game logs come from one PlayerGameLogs call. Tables are cached
+for 6 hours in nba/nba_prop_distributions_cache.npz.
+
+The props models price every play with `price_batch`: where a player has a
+table, the batch's EV and probability edge come from the distribution instead
+of the capped heuristic, so ratings and play selection follow it too.
+
+Usage:
+    from prop_distributions import load_tables, price_batch
+    tables = load_tables()
+    p_over, p_push, p_under = tables['PTS'].price(['Jalen Brunson'] * 3, [24.5, 26.5, 28.5])
+
+    python3 nba/prop_distributions.py "Jalen Brunson" PTS 24.5 26.5 28.5
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DISTRIBUTION_CACHE = os.path.join(SCRIPT_DIR, "nba_prop_distributions_cache.npz")
+CACHE_HOURS = 6
+CURRENT_SEASON = '2025-26'
+
+# Stat -> (family, table support 0..max; the last bin holds the tail)
+STAT_FAMILIES = {
+    'PTS': ('normal', 80),
+    'REB': ('normal', 35),
+    'AST': ('negbin', 30),
+    'FG3M': ('negbin', 16),
+}
+SHRINK_GAMES = 15
+MIN_GAMES = 5
+MIN_NORMAL_SD = 1.0
+QUANTILE_GRID = np.round(np.arange(0.01, 1.0, 0.01), 2)
+
+_erf = np.frompyfunc(math.erf, 1, 1)
+
+
+def _normal_cdf(x: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + _erf(np.asarray(x, dtype=float) / math.sqrt(2.0)).astype(float))
+
+
+def normal_pmf(mean: float, sd: float, max_k: int) -> np.ndarray:
+    """Normal discretized to 0..max_k with continuity correction; mass below 0 goes to 0."""
+    sd = max(sd, MIN_NORMAL_SD)
+    edges = _normal_cdf((np.arange(max_k + 1) + 0.5 - mean) / sd)
+    pmf = np.diff(np.concatenate(([0.0], edges)))
+    pmf[-1] += 1.0 - edges[-1]
+    return pmf
+
+
+def negbin_pmf(mean: float, var: float, max_k: int) -> np.ndarray:
+    """Method-of-moments negative binomial on 0..max_k (Poisson when not over-dispersed)."""
+    k = np.arange(max_k + 1)
+    if mean <= 0:
+        pmf = np.zeros(max_k + 1)
+        pmf[0] = 1.0
+        return pmf
+    lgamma_k1 = np.array([math.lgamma(i + 1) for i in k])
+    if var > mean:
+        r = mean * mean / (var - mean)
+        p = r / (r + mean)
+        log_pmf = (np.array([math.lgamma(i + r) for i in k]) - math.lgamma(r) - lgamma_k1
+                   + r * math.log(p) + k * math.log1p(-p))
+    else:
+        log_pmf = -mean + k * math.log(mean) - lgamma_k1
+    pmf = np.exp(log_pmf)
+    pmf[-1] += max(0.0, 1.0 - pmf.sum())
+    return pmf
+
+
+def fit_pmf(values: Sequence[float], family: str, max_k: int) -> np.ndarray:
+    """Blend of the parametric fit and the empirical histogram of one player's games."""
+    values = np.clip(np.asarray(values, dtype=float), 0, max_k)
+    n = len(values)
+    if n == 0:
+        return negbin_pmf(0.0, 0.0, max_k)
+    mean = float(values.mean())
+    var = float(values.var(ddof=1)) if n > 1 else mean
+    if family == 'negbin':
+        parametric = negbin_pmf(mean, var, max_k)
+    else:
+        parametric = normal_pmf(mean, math.sqrt(var), max_k)
+    empirical = np.bincount(np.rint(values).astype(int), minlength=max_k + 1)[:max_k + 1] / n
+    w = n / (n + SHRINK_GAMES)
+    pmf = w * empirical + (1.0 - w) * parametric
+    return pmf / pmf.sum()
+
+
+class DistributionTable:
+    """CDF / quantile tables for one stat, one row per player."""
+
+    def __init__(self, stat: str, players: Sequence[str], cdf: np.ndarray,
+                 quantiles: np.ndarray, games: np.ndarray, means: np.ndarray):
+        self.stat = stat
+        self.players = list(players)
+        self.index = {name: i for i, name in enumerate(self.players)}
+        self._lower = {name.lower(): i for i, name in enumerate(self.players)}
+        self.cdf = cdf
+        # PMF as a difference of CDF columns, with a leading zero column for k = -1
+        self._cdf_pad = np.hstack([np.zeros((len(self.players), 1)), cdf])
+        self.quantiles = quantiles
+        self.games = games
+        self.means = means
+
+    @property
+    def max_k(self) -> int:
+        return self.cdf.shape[1] - 1
+
+    def rows(self, players: Iterable[str]) -> np.ndarray:
+        """Row index per name (-1 when the player has no table)."""
+        idx, lower = self.index, self._lower
+        return np.fromiter((idx.get(p, lower.get(str(p).lower(), -1)) for p in players), dtype=np.int64)
+
+    def price_rows(self, rows: np.ndarray, lines) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(P(over), P(push), P(under)) for row indices and lines; NaN where rows == -1."""
+        rows = np.asarray(rows, dtype=np.int64)
+        lines = np.asarray(lines, dtype=float)
+        k = np.floor(lines)
+        whole = (lines == k) & (k >= 0) & (k < self.max_k)
+        k = np.clip(k.astype(np.int64), -1, self.max_k)
+        safe = np.where(rows < 0, 0, rows)
+        cdf_k = self._cdf_pad[safe, k + 1]
+        cdf_below = self._cdf_pad[safe, np.maximum(k, 0)]
+        p_over = 1.0 - cdf_k
+        p_push = np.where(whole, cdf_k - cdf_below, 0.0)
+        p_under = 1.0 - p_over - p_push
+        missing = rows < 0
+        if missing.any():
+            p_over, p_push, p_under = (np.where(missing, np.nan, a) for a in (p_over, p_push, p_under))
+        return p_over, p_push, p_under
+
+    def price(self, players: Iterable[str], lines) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self.price_rows(self.rows(players), lines)
+
+    def quantile(self, players: Iterable[str], q: float) -> np.ndarray:
+        """Value at quantile q (0.01-0.99) per player, e.g. q=0.5 is the fair line."""
+        col = int(np.abs(QUANTILE_GRID - q).argmin())
+        rows = self.rows(players)
+        return np.where(rows < 0, np.nan, self.quantiles[np.maximum(rows, 0), col])
+
+
+def build_tables(game_logs, min_games: int = MIN_GAMES) -> dict[str, DistributionTable]:
+    """
+    Tables for every stat from a league game-log frame with PLAYER_NAME, MIN
+    and the stat columns. DNPs (0 minutes) are dropped.
+    """
+    logs = game_logs[game_logs['MIN'].fillna(0) > 0] if 'MIN' in game_logs.columns else game_logs
+    grouped = {name: g for name, g in logs.groupby('PLAYER_NAME', sort=True) if len(g) >= min_games}
+    names = list(grouped)
+    tables = {}
+    for stat, (family, max_k) in STAT_FAMILIES.items():
+        if stat not in logs.columns:
+            continue
+        cdf = np.empty((len(names), max_k + 1))
+        quantiles = np.empty((len(names), len(QUANTILE_GRID)))
+        games = np.empty(len(names), dtype=np.int64)
+        means = np.empty(len(names))
+        for i, name in enumerate(names):
+            values = grouped[name][stat].dropna().to_numpy(dtype=float)
+            row = np.cumsum(fit_pmf(values, family, max_k))
+            row[-1] = 1.0
+            cdf[i] = row
+            quantiles[i] = np.searchsorted(row, QUANTILE_GRID - 1e-12)
+            games[i] = len(values)
+            means[i] = values.mean()
+        tables[stat] = DistributionTable(stat, names, cdf, quantiles, games, means)
+    return tables
+
+
+def fetch_game_logs(season: str = CURRENT_SEASON):
+    """Every player's regular-season game logs in one request."""
+    from nba_api.stats.endpoints import playergamelogs
+    logs = playergamelogs.PlayerGameLogs(
+        season_nullable=season,
+        season_type_nullable='Regular Season',
+        timeout=60,
+    )
+    time.sleep(0.6)
+    return logs.get_data_frames()[0]
+
+
+def save_tables(tables: dict[str, DistributionTable], path: str = DISTRIBUTION_CACHE) -> None:
+    arrays = {'built_at': np.array(datetime.now().isoformat())}
+    for stat, t in tables.items():
+        arrays[f'{stat}_players'] = np.array(t.players)
+        arrays[f'{stat}_cdf'] = t.cdf
+        arrays[f'{stat}_quantiles'] = t.quantiles
+        arrays[f'{stat}_games'] = t.games
+        arrays[f'{stat}_means'] = t.means
+    tmp = f"{path}.tmp.npz"
+    np.savez_compressed(tmp, **arrays)
+    os.replace(tmp, path)
+
+
+def read_tables(path: str = DISTRIBUTION_CACHE) -> dict[str, DistributionTable]:
+    with np.load(path, allow_pickle=False) as data:
+        return {
+            stat: DistributionTable(stat, data[f'{stat}_players'].tolist(), data[f'{stat}_cdf'],
+                                    data[f'{stat}_quantiles'], data[f'{stat}_games'], data[f'{stat}_means'])
+            for stat in STAT_FAMILIES if f'{stat}_cdf' in data
+        }
+
+
+def load_tables(season: str = CURRENT_SEASON, max_age_hours: float = CACHE_HOURS,
+                path: str = DISTRIBUTION_CACHE) -> dict[str, DistributionTable]:
+    """Cached tables if fresh, otherwise refit from a new game-log pull."""
+    if os.path.exists(path):
+        age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(path))
+        if age < timedelta(hours=max_age_hours):
+            return read_tables(path)
+    tables = build_tables(fetch_game_logs(season))
+    save_tables(tables, path)
+    return tables
+
+
+_TABLES: Optional[dict[str, DistributionTable]] = None
+
+
+def _table(stat: str) -> Optional[DistributionTable]:
+    """Table for `stat`, None if the tables can't be loaded (no nba_api, API down). Loaded once per process."""
+    global _TABLES
+    if _TABLES is None:
+        try:
+            _TABLES = load_tables()
+        except Exception as e:
+            print(f"  Distribution tables unavailable: {e}")
+            _TABLES = {}
+    return _TABLES.get(stat)
+
+
+def hit_probabilities(stat: str, players: Sequence[str], lines) -> Optional[tuple[list, list]]:
+    """
+    (P(over wins), P(under wins)) per prop, rounded to 3dp, None for players
+    without a table. Returns None if the tables can't be loaded.
+    """
+    table = _table(stat)
+    if table is None:
+        return None
+    p_over, _, p_under = table.price(players, lines)
+    return tuple([None if np.isnan(v) else round(float(v), 3) for v in probs] for probs in (p_over, p_under))
+
+
+def price_batch(stat: str, players: Sequence[str], batch: dict[str, np.ndarray]) -> int:
+    """
+    Reprice a props_kernel `score_batch` result in place from the distributions.
+
+    Adds `over_hit_prob` / `under_hit_prob` (NaN where a player has no table)
+    and, for every prop that has one, replaces `{side}_ev` with the
+    distribution EV at the batch's odds and `{side}_prob_edge` with
+    P(win) - implied probability. Props without a table keep the heuristic
+    values. Returns the number of props priced from a distribution.
+    """
+    table = _table(stat)
+    n = len(batch['line'])
+    if table is None or n == 0:
+        batch['over_hit_prob'] = batch['under_hit_prob'] = np.full(n, np.nan)
+        return 0
+    p_over, p_push, p_under = table.price(players, batch['line'])
+    priced = ~np.isnan(p_over)
+    for side, p_win in (('over', p_over), ('under', p_under)):
+        odds = batch[f'{side}_odds']
+        payout = np.where(odds > 0, odds / 100.0, 100.0 / np.abs(odds))
+        implied = 1.0 / (1.0 + payout)
+        batch[f'{side}_hit_prob'] = p_win
+        batch[f'{side}_ev'] = np.where(priced, expected_value(p_win, p_push, odds), batch[f'{side}_ev'])
+        batch[f'{side}_prob_edge'] = np.where(priced, p_win - implied, batch[f'{side}_prob_edge'])
+    return int(priced.sum())
+
+
+def hit_prob(batch: dict[str, np.ndarray], side: str, i: int) -> Optional[float]:
+    """One play's distribution hit probability from a priced batch (3dp), None if it has no table."""
+    value = float(batch[f'{side}_hit_prob'][i])
+    return None if math.isnan(value) else round(value, 3)
+
+
+def expected_value(p_win, p_push, odds) -> np.ndarray:
+    """EV in percent of stake for American odds, with pushes refunded."""
+    odds = np.asarray(odds, dtype=float)
+    payout = np.where(odds > 0, odds / 100.0, 100.0 / np.abs(odds))
+    p_win = np.asarray(p_win, dtype=float)
+    p_loss = 1.0 - p_win - np.asarray(p_push, dtype=float)
+    return (p_win * payout - p_loss) * 100.0
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Price prop lines from game-log distributions')
+    parser.add_argument('player')
+    parser.add_argument('stat', choices=list(STAT_FAMILIES))
+    parser.add_argument('lines', type=float, nargs='+')
+    args = parser.parse_args()
+
+    table = load_tables()[args.stat]
+    rows = table.rows([args.player])
+    if rows[0] < 0:
+        print(f"No {args.stat} table for {args.player}")
+        return
+    r = rows[0]
+    print(f"{table.players[r]} {args.stat}: {table.games[r]} games, mean {table.means[r]:.1f}, "
+          f"median {table.quantiles[r, 49]:.0f}")
+    p_over, p_push, p_under = table.price_rows(np.repeat(rows, len(args.lines)), args.lines)
+    for line, o, p, u in zip(args.lines, p_over, p_push, p_under):
+        print(f"  {line:>5}: over {o:.1%}  push {p:.1%}  under {u:.1%}")
+
+
+if __name__ == '__main__':
+    main()
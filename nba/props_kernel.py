@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+NBA Props Scoring Kernel
+------------------------
+Array versions of the props models' `calculate_ai_score`, `calculate_ev` and
+`calculate_probability_edge`. One call scores every prop (both sides) with a
+handful of NumPy operations instead of running the scalar if/elif ladders once
+per prop and side, which matters when scanning alternate lines.
+
+Results are bit-for-bit identical to the scalar functions in
+nba_points/assists/rebounds/3pt_props_model.py: terms are added in the same
+order and `round(x, 2)` is reproduced exactly (see `round2`).
+`tools/bench_props_kernel.py` checks parity and times 10k / 100k props.
+
+    spec = MarketSpec.for_market('rebounds', MIN_EDGE_OVER_LINE, MIN_EDGE_UNDER_LINE, MIN_RECENT_FORM_EDGE)
+    batch = score_batch(spec, [(player_data, line, over_odds, under_odds, opponent_factors), ...])
+    batch['over_score'], batch['under_ev'], batch['over_prob_edge'], ...
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+# (threshold, points) ladders; first matching tier wins, like the scalar elif chains
+Tiers = tuple[tuple[float, float], ...]
+
+
+@dataclass(frozen=True)
+class MarketSpec:
+    """Everything that differs between the four NBA props models' scoring."""
+    season_key: str
+    recent_key: str
+    rate_key: str                     # per-36 production
+    factor_key: str                   # opponent factor in the team factors dict
+    min_edge_over: float
+    min_edge_under: float
+    min_recent_edge: float
+    recent_margin: float              # recent vs season swing that earns +1.0
+    over_rate_tiers: Tiers            # rate >= threshold
+    under_rate_tiers: Tiers           # rate < threshold
+    efficiency_key: Optional[str] = None
+    over_efficiency_tiers: Tiers = ()     # efficiency >= threshold
+    under_efficiency_tiers: Tiers = ()    # efficiency < threshold
+    # Assists/rebounds/3PT read stats as `float(x or default)`, so 0/None fall
+    # back to the default; the points model uses `.get(key, default)` as-is.
+    falsy_to_default: bool = True
+
+    @classmethod
+    def for_market(cls, market: str, min_edge_over: float, min_edge_under: float,
+                   min_recent_edge: float) -> 'MarketSpec':
+        base = _MARKETS[market]
+        return cls(min_edge_over=min_edge_over, min_edge_under=min_edge_under,
+                   min_recent_edge=min_recent_edge, **base)
+
+
+_MARKETS: dict[str, dict[str, Any]] = {
+    'points': dict(
+        season_key='season_pts_avg', recent_key='recent_pts_avg', rate_key='pts_per_36',
+        factor_key='defense_factor', recent_margin=1.0,
+        over_rate_tiers=((25.0, 1.5), (20.0, 1.0), (15.0, 0.5)),
+        under_rate_tiers=((15.0, 1.0), (18.0, 0.5)),
+        efficiency_key='fg_pct', over_efficiency_tiers=((0.48, 0.5), (0.45, 0.3)),
+        falsy_to_default=False,
+    ),
+    'assists': dict(
+        season_key='season_ast_avg', recent_key='recent_ast_avg', rate_key='ast_per_36',
+        factor_key='assists_factor', recent_margin=0.8,
+        over_rate_tiers=((10.0, 1.5), (8.0, 1.0), (6.0, 0.5)),
+        under_rate_tiers=((4.0, 1.0), (6.0, 0.5)),
+    ),
+    'rebounds': dict(
+        season_key='season_reb_avg', recent_key='recent_reb_avg', rate_key='reb_per_36',
+        factor_key='rebounding_factor', recent_margin=0.8,
+        over_rate_tiers=((12.0, 1.5), (10.0, 1.0), (8.0, 0.5)),
+        under_rate_tiers=((6.0, 1.0), (8.0, 0.5)),
+    ),
+    'threes': dict(
+        season_key='season_3pm_avg', recent_key='recent_3pm_avg', rate_key='fg3m_per_36',
+        factor_key='three_point_factor', recent_margin=0.8,
+        over_rate_tiers=((4.0, 1.5), (3.0, 1.0), (2.0, 0.5)),
+        under_rate_tiers=((1.5, 1.0), (2.0, 0.5)),
+        efficiency_key='fg3_pct', over_efficiency_tiers=((0.40, 0.5), (0.38, 0.3)),
+        under_efficiency_tiers=((0.32, 0.3),),
+    ),
+}
+
+
+def round2(x: np.ndarray) -> np.ndarray:
+    """
+    Elementwise `round(x, 2)` with Python's exact semantics. np.round scales by
+    100 first, which can land on the other side of a .5 tie; the few values
+    that are that close to a tie are re-rounded with Python's round().
+    """
+    x = np.asarray(x, dtype=float)
+    out = np.round(x, 2)
+    scaled = x * 100.0
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        idx = np.flatnonzero(near_tie)
+        out[idx] = [round(float(v), 2) for v in x[idx]]
+    return out
+
+
+def _ladder_ge(values: np.ndarray, tiers: Tiers, default: float) -> np.ndarray:
+    return np.select([values >= t for t, _ in tiers], [p for _, p in tiers], default)
+
+
+def _ladder_lt(values: np.ndarray, tiers: Tiers, default: float) -> np.ndarray:
+    return np.select([values < t for t, _ in tiers], [p for _, p in tiers], default)
+
+
+def score_side(spec: MarketSpec, side: str, season_avg, recent_avg, per_36, consistency,
+               line, opp_factor, games_played, minutes, efficiency=None) -> np.ndarray:
+    """A.I. score (0-10, 2dp) for one side of every prop; mirrors calculate_ai_score."""
+    season_avg = np.asarray(season_avg, dtype=float)
+    recent_avg = np.asarray(recent_avg, dtype=float)
+    per_36 = np.asarray(per_36, dtype=float)
+    consistency = np.asarray(consistency, dtype=float)
+    line = np.asarray(line, dtype=float)
+    opp_factor = np.asarray(opp_factor, dtype=float)
+
+    if side == 'over':
+        edge = season_avg - line
+        edge_pts = _ladder_ge(edge, ((spec.min_edge_over, 3.5), (1.5, 2.5), (1.0, 1.5), (0.5, 0.5)), -2.0)
+        dead = (edge < 0.5) & (recent_avg < line + 0.5)
+        recent_edge = recent_avg - line
+        recent_pts = np.select(
+            [recent_edge >= spec.min_recent_edge, recent_edge >= 1.0,
+             recent_avg > season_avg + spec.recent_margin, recent_avg >= line],
+            [2.5, 1.5, 1.0, 0.5], -1.5)
+        rate_pts = _ladder_ge(per_36, spec.over_rate_tiers, 0.0)
+        consistency_pts = consistency * 0.8
+        if spec.efficiency_key and spec.over_efficiency_tiers:
+            eff_pts = _ladder_ge(np.asarray(efficiency, dtype=float), spec.over_efficiency_tiers, 0.0)
+        else:
+            eff_pts = 0.0
+        opp_pts = np.select([opp_factor > 1.05, opp_factor < 0.95], [1.0, -0.5], 0.0)
+        capped = season_avg < line + 0.5
+    else:
+        edge = line - season_avg
+        edge_pts = _ladder_ge(edge, ((spec.min_edge_under, 3.5), (1.2, 2.5), (0.8, 1.5), (0.4, 0.5)), -2.0)
+        dead = (edge < 0.4) & (recent_avg > line - 0.5)
+        recent_edge = line - recent_avg
+        recent_pts = np.select(
+            [recent_edge >= spec.min_recent_edge, recent_edge >= 1.0,
+             recent_avg < season_avg - spec.recent_margin, recent_avg <= line],
+            [2.5, 1.5, 1.0, 0.5], -1.5)
+        rate_pts = _ladder_lt(per_36, spec.under_rate_tiers, 0.0)
+        consistency_pts = (1.0 - consistency) * 0.5
+        if spec.efficiency_key and spec.under_efficiency_tiers:
+            eff_pts = _ladder_lt(np.asarray(efficiency, dtype=float), spec.under_efficiency_tiers, 0.0)
+        else:
+            eff_pts = 0.0
+        opp_pts = np.select([opp_factor < 0.95, opp_factor > 1.05], [1.0, -0.5], 0.0)
+        capped = season_avg > line - 0.5
+
+    # Same left-to-right order as the scalar code so every sum rounds identically
+    score = 4.0 + edge_pts
+    score = score + recent_pts
+    score = score + rate_pts
+    score = score + consistency_pts
+    score = score + eff_pts
+    score = score + opp_pts
+
+    final = np.minimum(10.0, np.maximum(0.0, score))
+    final = np.where(capped, np.minimum(final, 8.5), final)
+    final = round2(final)
+
+    ineligible = (np.asarray(games_played) < 5) | (np.asarray(minutes, dtype=float) < 15) | dead
+    return np.where(ineligible, 0.0, final)
+
+
+def implied_probability(odds) -> np.ndarray:
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(odds > 0, 100 / (odds + 100), np.abs(odds) / (np.abs(odds) + 100))
+
+
+def model_probability(ai_score, season_avg, recent_avg, line, side: str) -> np.ndarray:
+    """Model win probability shared by calculate_ev and calculate_probability_edge (40-70%)."""
+    ai_score = np.asarray(ai_score, dtype=float)
+    season_avg = np.asarray(season_avg, dtype=float)
+    recent_avg = np.asarray(recent_avg, dtype=float)
+    line = np.asarray(line, dtype=float)
+
+    ai_multiplier = np.maximum(0.0, (ai_score - 9.0) / 1.0)
+    edge = season_avg - line if side == 'over' else line - season_avg
+    edge_factor = np.minimum(np.abs(edge) / 2.0, 1.0)
+    if side == 'over':
+        recent_factor = np.where(recent_avg > season_avg, np.minimum((recent_avg - season_avg) / 2.0, 0.1), 0.0)
+    else:
+        recent_factor = np.where(recent_avg < season_avg, np.minimum((season_avg - recent_avg) / 2.0, 0.1), 0.0)
+
+    prob = 0.50 + ai_multiplier * 0.15 + edge_factor * 0.15 + recent_factor
+    return np.minimum(np.maximum(prob, 0.40), 0.70)
+
+
+def expected_value(ai_score, line, season_avg, recent_avg, odds, side: str) -> np.ndarray:
+    """EV in percent; mirrors calculate_ev."""
+    odds = np.asarray(odds, dtype=float)
+    p = model_probability(ai_score, season_avg, recent_avg, line, side)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ev = np.where(odds > 0, (p * (odds / 100)) - (1 - p), (p * (100 / np.abs(odds))) - (1 - p))
+    return ev * 100
+
+
+def probability_edge(ai_score, season_avg, recent_avg, line, odds, side: str) -> np.ndarray:
+    """|model prob - market implied prob|; mirrors calculate_probability_edge."""
+    p = model_probability(ai_score, season_avg, recent_avg, line, side)
+    return np.abs(p - implied_probability(odds))
+
+
+def _stat(data: dict, key: str, default: float, falsy_to_default: bool) -> float:
+    if falsy_to_default:
+        return float(data.get(key, default) or default)
+    return data.get(key, default)
+
+
+def prop_inputs(spec: MarketSpec, rows: Iterable[tuple]) -> dict[str, np.ndarray]:
+    """
+    Column arrays from (player_data, line, over_odds, under_odds, opponent_factors)
+    rows, read the same way each model's scalar code reads them. Missing odds
+    become -110 (what calculate_ev does with None).
+    """
+    cols: dict[str, list] = {k: [] for k in (
+        'season_avg', 'recent_avg', 'per_36', 'consistency', 'games_played', 'minutes',
+        'efficiency', 'line', 'over_odds', 'under_odds', 'opp_factor')}
+    coerce = spec.falsy_to_default
+    for player_data, line, over_odds, under_odds, opponent in rows:
+        cols['season_avg'].append(_stat(player_data, spec.season_key, 0, coerce))
+        cols['recent_avg'].append(_stat(player_data, spec.recent_key, 0, coerce))
+        cols['per_36'].append(_stat(player_data, spec.rate_key, 0, coerce))
+        cols['consistency'].append(_stat(player_data, 'consistency_score', 0.3, coerce))
+        cols['games_played'].append(_stat(player_data, 'games_played', 0, coerce))
+        cols['minutes'].append(_stat(player_data, 'minutes', 0, coerce))
+        cols['efficiency'].append(_stat(player_data, spec.efficiency_key, 0, coerce) if spec.efficiency_key else 0.0)
+        cols['line'].append(line)
+        cols['over_odds'].append(-110 if over_odds is None else over_odds)
+        cols['under_odds'].append(-110 if under_odds is None else under_odds)
+        factor = 1.0
+        if opponent:
+            factor = opponent.get(spec.factor_key, 1.0)
+            if coerce:
+                factor = factor or 1.0
+        cols['opp_factor'].append(factor)
+    return {k: np.asarray(v, dtype=float) for k, v in cols.items()}
+
+
+def score_arrays(spec: MarketSpec, season_avg, recent_avg, per_36, consistency, line,
+                 over_odds, under_odds, opp_factor, games_played, minutes,
+                 efficiency=None) -> dict[str, np.ndarray]:
+    """Over/under scores, EV and probability edge for every prop at once."""
+    out = {}
+    for side, odds in (('over', over_odds), ('under', under_odds)):
+        score = score_side(spec, side, season_avg, recent_avg, per_36, consistency, line,
+                           opp_factor, games_played, minutes, efficiency)
+        out[f'{side}_score'] = score
+        out[f'{side}_ev'] = expected_value(score, line, season_avg, recent_avg, odds, side)
+        out[f'{side}_prob_edge'] = probability_edge(score, season_avg, recent_avg, line, odds, side)
+    return out
+
+
+def score_batch(spec: MarketSpec, rows: Iterable[tuple]) -> dict[str, np.ndarray]:
+    """`prop_inputs` + `score_arrays`; the returned dict also carries the input columns."""
+    cols = prop_inputs(spec, rows)
+    cols.update(score_arrays(
+        spec, cols['season_avg'], cols['recent_avg'], cols['per_36'], cols['consistency'],
+        cols['line'], cols['over_odds'], cols['under_odds'], cols['opp_factor'],
+        cols['games_played'], cols['minutes'], cols['efficiency']))
+    return cols
+
+
+def side_odds(prop: dict, side: str):
+    """Price for `side`, falling back to the other side's price (None if neither)."""
+    other = 'under' if side == 'over' else 'over'
+    odds = prop.get(f'{side}_price')
+    return prop.get(f'{other}_price') if odds is None else odds
@@ -8,14 +8,18 @@ This will add them back as completed picks.
 
 import json
 import os
+import sys
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tracking_archive
+
 TRACKING_FILE = "nba_picks_tracking.json"
 
 # Load current tracking data
 if os.path.exists(TRACKING_FILE):
-    with open(TRACKING_FILE, 'r') as f:
-        tracking_data = json.load(f)
+    # Full history, so the counts below include picks rolled into the archive
+    tracking_data = tracking_archive.load_tracking(TRACKING_FILE, full_history=True)
     print(f"✓ Loaded tracking file: {len(tracking_data['picks'])} picks")
 else:
     print("❌ Tracking file not found!")
@@ -101,8 +105,9 @@ except KeyboardInterrupt:
         print("Exiting without saving.")
         exit(0)
 
-# Recalculate summary
-tracking_data['summary'] = {
+# Recalculate the record (reported only; the tracking file keeps no stored summary)
+tracking_data.pop('summary', None)
+summary = {
     'total_picks': len(tracking_data['picks']),
     'wins': sum(1 for p in tracking_data['picks'] if p.get('result') == 'Win'),
     'losses': sum(1 for p in tracking_data['picks'] if p.get('result') == 'Loss'),
@@ -116,15 +121,14 @@ with open(backup_file, 'w') as f:
     json.dump(tracking_data, f, indent=2)
 print(f"\n✓ Backup created: {backup_file}")
 
-# Save updated tracking data
-with open(TRACKING_FILE, 'w') as f:
-    json.dump(tracking_data, f, indent=2)
+# Save updated tracking data (cold picks go back to their archive partitions)
+tracking_archive.save_tracking(TRACKING_FILE, tracking_data)
 
 print("\n" + "="*80)
 print("✅ RECOVERY COMPLETE!")
 print("="*80)
-print(f"Total picks now: {tracking_data['summary']['total_picks']}")
-print(f"Record: {tracking_data['summary']['wins']}-{tracking_data['summary']['losses']}-{tracking_data['summary']['pushes']}")
+print(f"Total picks now: {summary['total_picks']}")
+print(f"Record: {summary['wins']}-{summary['losses']}-{summary['pushes']}")
 total_profit = sum(p.get('profit_loss', 0) for p in tracking_data['picks']) / 100
 print(f"Profit: {total_profit:+.2f} units")
 print("\nRun the main script now to see your complete tracking history!")
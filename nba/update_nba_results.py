@@ -4,12 +4,15 @@ Automated NBA Pick Results Updater
 Fetches actual game scores from ESPN API and updates pick statuses automatically
 """
 
-import json
 import os
+import sys
 from datetime import datetime, timezone
 import requests
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import tracking_archive
+
 class Colors:
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -26,13 +29,13 @@ def load_tracking():
         print(f"{Colors.RED}❌ No tracking file found: {tracking_file}{Colors.END}")
         return None
 
-    with open(tracking_file, 'r') as f:
-        return json.load(f)
+    # Full history, so the record below includes picks rolled into the archive
+    return tracking_archive.load_tracking(tracking_file, full_history=True)
 
 def save_tracking(tracking_data):
-    """Save tracking data"""
-    with open('nba_picks_tracking.json', 'w') as f:
-        json.dump(tracking_data, f, indent=2)
+    """Save tracking data (cold picks go back to their archive partitions)"""
+    tracking_data.pop('summary', None)
+    tracking_archive.save_tracking('nba_picks_tracking.json', tracking_data)
     print(f"{Colors.GREEN}✅ Tracking data saved{Colors.END}")
 
 def fetch_game_scores(game_date_str):
@@ -265,16 +268,11 @@ def update_results():
             pick['status'] = result
             pick['profit_loss'] = profit
 
-            # Update summary
-            tracking_data['summary']['pending'] -= 1
             if result == 'Win':
-                tracking_data['summary']['wins'] += 1
                 result_symbol = f"{Colors.GREEN}✅ WIN{Colors.END}"
             elif result == 'Loss':
-                tracking_data['summary']['losses'] += 1
                 result_symbol = f"{Colors.RED}❌ LOSS{Colors.END}"
             else:
-                tracking_data['summary']['pushes'] += 1
                 result_symbol = f"{Colors.YELLOW}➖ PUSH{Colors.END}"
 
             print(f"  {result_symbol}: {pick['matchup']} ({home_score}-{away_score}) - {pick['pick_type']}: {pick['pick']}")
@@ -289,10 +287,11 @@ def update_results():
         print(f"{Colors.BOLD}{'='*70}{Colors.END}\n")
 
         # Show summary
-        wins = tracking_data['summary']['wins']
-        losses = tracking_data['summary']['losses']
-        pushes = tracking_data['summary']['pushes']
-        pending_remaining = tracking_data['summary']['pending']
+        picks = tracking_data['picks']
+        wins = sum(1 for p in picks if p.get('status', '').lower() == 'win')
+        losses = sum(1 for p in picks if p.get('status', '').lower() == 'loss')
+        pushes = sum(1 for p in picks if p.get('status', '').lower() == 'push')
+        pending_remaining = sum(1 for p in picks if p.get('status', '').lower() == 'pending')
 
         print(f"{Colors.CYAN}Current Record:{Colors.END}")
         print(f"  Wins: {wins}")
@@ -12,6 +12,7 @@ from typing import List, Optional
 from datetime import datetime
 import json
 import os
+import sys
 
 app = FastAPI(
     title="CourtSide Analytics API",
@@ -36,6 +37,14 @@ if not os.path.exists(PICKS_TRACKING_FILE):
     # For local development with parent directory structure
     PICKS_TRACKING_FILE = os.path.join(os.path.dirname(BASE_DIR), 'nba', 'nba_picks_tracking.json')
 
+# In the repo checkout, read archived picks too (tracking_archive.py at the repo root).
+# The deployed image only has the full-history snapshot written by update_api_data.sh.
+sys.path.append(os.path.dirname(BASE_DIR))
+try:
+    from tracking_archive import load_tracking
+except ImportError:
+    load_tracking = None
+
 # =====================
 # DATA MODELS (Pydantic schemas for API responses)
 # =====================
@@ -85,6 +94,8 @@ def load_tracking_data():
         raise HTTPException(status_code=404, detail="Model data not found. Run your NBA model first.")
 
     try:
+        if load_tracking is not None:
+            return load_tracking(PICKS_TRACKING_FILE, full_history=True)
         with open(PICKS_TRACKING_FILE, 'r') as f:
             return json.load(f)
     except Exception as e:
@@ -3,8 +3,14 @@
 
 cd "$(dirname "$0")"
 
-echo "📊 Copying latest NBA picks data..."
-cp ../nba/nba_picks_tracking.json .
+echo "📊 Exporting latest NBA picks data (hot file + archived history)..."
+python3 -c "
+import json, sys
+sys.path.insert(0, '..')
+from tracking_archive import load_tracking
+with open('nba_picks_tracking.json', 'w') as f:
+    json.dump(load_tracking('../nba/nba_picks_tracking.json', full_history=True), f, indent=2)
+"
 
 # Check if there are changes
 if git diff --quiet nba_picks_tracking.json 2>/dev/null; then
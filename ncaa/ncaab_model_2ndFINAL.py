@@ -1,11 +1,11 @@
 import csv
 import json
 import os
+import sys
 import re
 import traceback
 import shutil
 from datetime import datetime, timedelta
-from jinja2 import Template
 import requests
 from dotenv import load_dotenv
 import pytz
@@ -19,6 +19,19 @@ except ImportError:
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     from fetch_ncaab_stats import fetch_sports_reference_stats
 
+# Hot/cold tracking storage, team resolver, HTML templates and pick-history shards (shared modules at the repo root)
+try:
+    from html_templates import compile_template
+    from team_resolver import TeamResolver
+    from tracking_archive import load_tracking, save_tracking
+    from tracking_shards import history_panel, write_history
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import compile_template
+    from team_resolver import TeamResolver
+    from tracking_archive import load_tracking, save_tracking
+    from tracking_shards import history_panel, write_history
+
 # =========================
 # CONFIG
 # =========================
@@ -129,48 +142,43 @@ class Colors:
 # TRACKING FUNCTIONS
 # =========================
 
+# Odds API / abbreviation spellings -> Sports-Reference school names
+TEAM_NAME_ALIASES = {
+    # Common abbreviations
+    "UConn": "Connecticut",
+    "UCF": "Central Florida",
+    "UNLV": "Nevada Las Vegas",
+    "USC": "Southern California",
+    "UCLA": "California Los Angeles",
+    "LSU": "Louisiana State",
+    "TCU": "Texas Christian",
+    "SMU": "Southern Methodist",
+    "BYU": "Brigham Young",
+    "VCU": "Virginia Commonwealth",
+    "UTEP": "Texas El Paso",
+    
+    # State variations
+    "Miami FL": "Miami",
+    "Miami (FL)": "Miami",
+    "Miami OH": "Miami Ohio",
+    "Miami (OH)": "Miami Ohio",
+    "Arkansas-Little Rock": "Little Rock",
+    "SE Louisiana": "Southeastern Louisiana",
+    "SE Missouri St": "Southeast Missouri State",
+    
+    # Common full names
+    "St. John's": "St John's",
+    "Saint John's": "St John's",
+}
+
 def normalize_team_name(team_name):
     """Normalize team names for consistent matching across APIs"""
     name = team_name.strip()
-    
-    # Common variations and abbreviations
-    name_map = {
-        # Common abbreviations
-        "UConn": "Connecticut",
-        "UCF": "Central Florida",
-        "UNLV": "Nevada Las Vegas",
-        "USC": "Southern California",
-        "UCLA": "California Los Angeles",
-        "LSU": "Louisiana State",
-        "TCU": "Texas Christian",
-        "SMU": "Southern Methodist",
-        "BYU": "Brigham Young",
-        "VCU": "Virginia Commonwealth",
-        "UTEP": "Texas El Paso",
-        
-        # State variations
-        "Miami FL": "Miami",
-        "Miami (FL)": "Miami",
-        "Miami OH": "Miami Ohio",
-        "Miami (OH)": "Miami Ohio",
-        
-        # Common full names
-        "St. John's": "St John's",
-        "Saint John's": "St John's",
-    }
-    
-    return name_map.get(name, name)
+    return TEAM_NAME_ALIASES.get(name, name)
 
-def load_picks_tracking():
-    """Load existing picks tracking data"""
-    if os.path.exists(PICKS_TRACKING_FILE):
-        try:
-            with open(PICKS_TRACKING_FILE, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            print(f"{Colors.RED}Error reading tracking file! Creating a new one.{Colors.END}")
-            return {"picks": [], "summary": {}}
-    return {
+def load_picks_tracking(full_history=False):
+    """Load existing picks tracking data (hot file only unless full_history=True)"""
+    return load_tracking(PICKS_TRACKING_FILE, full_history=full_history, default={
         "picks": [], 
         "summary": {
             "total_picks": 0, 
@@ -179,7 +187,7 @@ def load_picks_tracking():
             "pushes": 0,
             "pending": 0
         }
-    }
+    })
 
 def save_picks_tracking(tracking_data):
     """Save picks tracking data with automatic backup"""
@@ -188,10 +196,9 @@ def save_picks_tracking(tracking_data):
         shutil.copy2(PICKS_TRACKING_FILE, backup_file)
         # print(f"{Colors.CYAN}✓ Backup created: {backup_file}{Colors.END}") # Optional: can be noisy
     
-    with open(PICKS_TRACKING_FILE, 'w') as f:
-        json.dump(tracking_data, f, indent=2)
+    hot_data = save_tracking(PICKS_TRACKING_FILE, tracking_data)
     print(f"{Colors.GREEN}✓ Tracking data saved to {PICKS_TRACKING_FILE}{Colors.END}")
-    print(f"{Colors.GREEN}  Total picks in file: {len(tracking_data['picks'])}{Colors.END}")
+    print(f"{Colors.GREEN}  Total picks in file: {len(hot_data['picks'])}{Colors.END}")
 
 def log_confident_pick(game_data, pick_type, edge, model_line, market_line):
     """Log a confident pick to the tracking file"""
@@ -265,6 +272,37 @@ def fetch_completed_scores():
         print(f"{Colors.RED}Error fetching scores: {e}{Colors.END}")
         return []
 
+def et_game_date(time_str):
+    """ET calendar date of an ISO game time string (None if missing or unparseable)"""
+    if not time_str:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(time_str).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = pytz.utc.localize(dt)
+    return dt.astimezone(pytz.timezone('US/Eastern')).date()
+
+def index_completed_games(completed_games):
+    """
+    Index completed games once by (normalized home, normalized away, ET date).
+    Also returns a (home, away) index for picks without a usable date and the
+    (first, last) ET date window the scores cover.
+    """
+    by_key = {}
+    by_matchup = {}
+    for game in completed_games:
+        if not game.get('completed'):
+            continue
+        home = normalize_team_name(game['home_team'])
+        away = normalize_team_name(game['away_team'])
+        by_key[(home, away, et_game_date(game.get('commence_time')))] = game
+        by_matchup[(home, away)] = game
+    dates = [d for (_, _, d) in by_key if d]
+    window = (min(dates), max(dates)) if dates else None
+    return by_key, by_matchup, window
+
 def update_pick_results():
     """Update tracking data with results from completed games"""
     tracking_data = load_picks_tracking()
@@ -291,56 +329,64 @@ def update_pick_results():
     
     updated_count = 0
     
+    # One index over the completed games, then one lookup per pick
+    games_by_key, games_by_matchup, window = index_completed_games(completed_games)
+    skipped_outside_window = 0
+
     for pick in pending_picks:
-        # Find matching completed game
-        for game in completed_games:
-            if not game.get('completed'):
+        pick_date = et_game_date(pick.get('game_time') or pick.get('game_date'))
+        if pick_date and window and not (window[0] <= pick_date <= window[1]):
+            # Game isn't covered by the scores feed - nothing to match against
+            skipped_outside_window += 1
+            continue
+
+        pick_home = normalize_team_name(pick['home_team'])
+        pick_away = normalize_team_name(pick['away_team'])
+        if pick_date and window:
+            game = games_by_key.get((pick_home, pick_away, pick_date))
+        else:
+            game = games_by_matchup.get((pick_home, pick_away))
+        if game is None:
+            continue
+        home_team, away_team = pick_home, pick_away
+
+        scores = game.get('scores')
+        if not scores or len(scores) < 2:
+            continue
+
+        try:
+            home_score_str = next((s['score'] for s in scores if s['name'] == game['home_team']), None)
+            away_score_str = next((s['score'] for s in scores if s['name'] == game['away_team']), None)
+
+            if home_score_str is None or away_score_str is None:
                 continue
-                
-            home_team = normalize_team_name(game['home_team'])
-            away_team = normalize_team_name(game['away_team'])
-            
-            pick_home = normalize_team_name(pick['home_team'])
-            pick_away = normalize_team_name(pick['away_team'])
-            
-            if home_team == pick_home and away_team == pick_away:
-                # Found the game!
-                scores = game.get('scores')
-                if not scores or len(scores) < 2:
-                    continue
-                
-                try:
-                    home_score_str = next((s['score'] for s in scores if s['name'] == game['home_team']), None)
-                    away_score_str = next((s['score'] for s in scores if s['name'] == game['away_team']), None)
-                    
-                    if home_score_str is None or away_score_str is None:
-                        continue
-                        
-                    home_score = int(home_score_str)
-                    away_score = int(away_score_str)
-                
-                except (ValueError, TypeError):
-                    print(f"{Colors.RED}Error parsing scores for {game['home_team']}{Colors.END}")
-                    continue
-                
-                # Calculate result based on pick type
-                if pick['pick_type'] == 'spread':
-                    result = evaluate_spread_pick(pick, home_score, away_score)
-                else:  # total
-                    result = evaluate_total_pick(pick, home_score, away_score)
-                
-                # Update pick
-                pick['status'] = result['status']
-                pick['result'] = result['result']
-                pick['profit'] = result['profit']
-                pick['actual_score'] = f"{away_team} {away_score}, {home_team} {home_score}"
-                
-                updated_count += 1
-                
-                print(f"{Colors.GREEN}✓ Updated: {pick['pick_text']} -> {result['status'].upper()}{Colors.END}")
-                
-                break
-    
+
+            home_score = int(home_score_str)
+            away_score = int(away_score_str)
+
+        except (ValueError, TypeError):
+            print(f"{Colors.RED}Error parsing scores for {game['home_team']}{Colors.END}")
+            continue
+
+        # Calculate result based on pick type
+        if pick['pick_type'] == 'spread':
+            result = evaluate_spread_pick(pick, home_score, away_score)
+        else:  # total
+            result = evaluate_total_pick(pick, home_score, away_score)
+
+        # Update pick
+        pick['status'] = result['status']
+        pick['result'] = result['result']
+        pick['profit'] = result['profit']
+        pick['actual_score'] = f"{away_team} {away_score}, {home_team} {home_score}"
+
+        updated_count += 1
+
+        print(f"{Colors.GREEN}✓ Updated: {pick['pick_text']} -> {result['status'].upper()}{Colors.END}")
+
+    if skipped_outside_window:
+        print(f"{Colors.YELLOW}Skipped {skipped_outside_window} picks outside the scores window{Colors.END}")
+
     if updated_count > 0:
         # Recalculate summary
         tracking_data['summary'] = calculate_summary_stats(tracking_data['picks'])
@@ -687,41 +733,26 @@ def estimate_team_strength(team_name):
 # GAME PROCESSING
 # =========================
 
+# (stats dict, resolver) for the stats loaded this run
+_stats_resolver = (None, None)
+
+def get_stats_resolver(stats_dict):
+    """Team-name resolver compiled once per stats dict (keys + TEAM_NAME_ALIASES)"""
+    global _stats_resolver
+    source, resolver = _stats_resolver
+    if source is not stats_dict or len(resolver.canonical) != len(stats_dict):
+        resolver = TeamResolver(stats_dict.keys(), aliases=TEAM_NAME_ALIASES)
+        _stats_resolver = (stats_dict, resolver)
+    return resolver
+
 def smart_stats_lookup(team_name, stats_dict):
     """
     Intelligent lookup for team stats handling naming differences
-    (e.g., 'Binghamton Bearcats' (Odds API) vs 'Binghamton' (Sports Ref))
+    (e.g., 'Binghamton Bearcats' (Odds API) vs 'Binghamton' (Sports Ref)).
+    Exact name, then alias, then longest school-name prefix, then a fuzzy
+    match; unmatched names are collected on the resolver for reporting.
     """
-    # 1. Direct match
-    if team_name in stats_dict:
-        return stats_dict[team_name]
-    
-    # 2. Try normalized name
-    norm_name = normalize_team_name(team_name)
-    if norm_name in stats_dict:
-        return stats_dict[norm_name]
-
-    # 3. Clean common suffixes/mascots
-    # Sports-Ref usually uses just the school name (e.g. "Duke")
-    # Odds API uses full name (e.g. "Duke Blue Devils")
-    
-    # Search for stats key that appears at the start of the team name
-    # e.g. team_name="Army Knights", key="Army" -> Match!
-    # e.g. team_name="Binghamton Bearcats", key="Binghamton" -> Match!
-    
-    # Sort keys by length (longest first) to match "North Carolina" before "North"
-    sorted_keys = sorted(stats_dict.keys(), key=len, reverse=True)
-    
-    for key in sorted_keys:
-        # Check if the stats key (e.g. "Virginia Tech") is in the team name (e.g. "Virginia Tech Hokies")
-        if key in team_name:
-            # print(f"  Matched '{team_name}' to '{key}'")
-            return stats_dict[key]
-            
-    # 4. Reverse check for State/St./etc.
-    # e.g. team_name="Kansas St", key="Kansas State"
-    
-    return None
+    return get_stats_resolver(stats_dict).lookup(team_name, stats_dict)
 
 def extract_best_odds(bookmakers, market_type):
     """Extract best available odds for a given market, prioritizing Hard Rock Bet"""
@@ -866,6 +897,12 @@ def process_games(games, team_stats):
             traceback.print_exc()
             continue
     
+    # Teams priced at league averages because no stats key matched
+    unmatched = get_stats_resolver(team_stats).unmatched if team_stats else {}
+    if unmatched:
+        print(f"{Colors.YELLOW}⚠️  No stats match for {len(unmatched)} team(s), using league averages: "
+              f"{', '.join(sorted(unmatched))}{Colors.END}")
+    
     return results
 
 def predict_game(home_team, away_team, home_stats, away_stats):
@@ -1065,7 +1102,7 @@ def save_html(results):
     timestamp_str = datetime.now(et).strftime('%Y-%m-%d %I:%M %p ET')
     
     # Load tracking data for display
-    tracking_data = load_picks_tracking()
+    tracking_data = load_picks_tracking(full_history=True)
     stats = calculate_tracking_stats(tracking_data)
     
     # Calculate recent performance breakdown (last 100, 50, 20)
@@ -1524,7 +1561,7 @@ def save_html(results):
 </body>
 </html>"""
 
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         results=results, 
         timestamp=timestamp_str,
@@ -1619,7 +1656,7 @@ def calculate_recent_performance(picks_list, count):
 
 def generate_tracking_html():
     """Generate tracking dashboard HTML"""
-    tracking_data = load_picks_tracking()
+    tracking_data = load_picks_tracking(full_history=True)
     stats = calculate_tracking_stats(tracking_data)
     
     all_picks = tracking_data.get('picks', [])
@@ -1917,7 +1954,7 @@ def generate_tracking_html():
     </body>
     </html>'''
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         stats=stats,  # Add stats to template context
         timestamp=timestamp,
@@ -2011,7 +2048,7 @@ def calculate_recent_performance(picks_list, count):
 
 def generate_tracking_html():
     """Generate tracking dashboard HTML"""
-    tracking_data = load_picks_tracking()
+    tracking_data = load_picks_tracking(full_history=True)
     stats = calculate_tracking_stats(tracking_data)
     
     all_picks = tracking_data.get('picks', [])
@@ -2458,6 +2495,8 @@ def generate_tracking_html():
                 </div>
             </div>
         </div>
+
+        {{ history_panel }}
         
         <div class="text-center text-gray-400 text-sm" style="margin-top: 2rem;">
             <p>Last updated: {{ timestamp }}</p>
@@ -2465,11 +2504,14 @@ def generate_tracking_html():
     </div>
 </body>
 </html>'''
+
+    # Settled picks go to month shards the page loads on demand (tracking_shards.py)
+    write_history(TRACKING_HTML_FILE, all_picks)
     
     # Custom filter for date formatting
     # (This function has been moved to the global scope, outside generate_tracking_html)
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     # *** THIS IS THE FIX: ***
     # We no longer register it as a filter
     # template.filters['format_date'] = format_date
@@ -2481,7 +2523,8 @@ def generate_tracking_html():
         last_20=last_20,
         season_stats=season_stats,
         timestamp=timestamp,
-        format_date=format_date
+        format_date=format_date,
+        history_panel=history_panel(TRACKING_HTML_FILE)
     )
     
     try:
@@ -2539,7 +2582,7 @@ def main():
         generate_tracking_html()
         
         # Display tracking summary
-        tracking_data = load_picks_tracking()
+        tracking_data = load_picks_tracking(full_history=True)
         stats = calculate_tracking_stats(tracking_data)
         
         print(f"\n{Colors.BOLD}{'='*100}{Colors.END}")
@@ -5,12 +5,19 @@ import re
 import traceback
 import shutil
 from datetime import datetime, timedelta
-from jinja2 import Template
 import requests
 from dotenv import load_dotenv
 import pytz
 import pandas as pd
 from collections import defaultdict
+import sys
+
+# Shared HTML template environment (repo root)
+try:
+    from html_templates import compile_template
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import compile_template
 
 # =========================
 # CONFIG
@@ -1672,7 +1679,7 @@ def save_html(results):
 </body>
 </html>"""
 
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         results=results, 
         timestamp=timestamp_str
@@ -2257,7 +2264,7 @@ def generate_tracking_html():
     # Custom filter for date formatting
     # (This function has been moved to the global scope, outside generate_tracking_html)
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     # *** THIS IS THE FIX: ***
     # We no longer register it as a filter
     # template.filters['format_date'] = format_date
@@ -6,6 +6,7 @@ Optimized for +EV with Sharp Betting Logic & Advanced Tracking
 
 import json
 import os
+import sys
 import re
 import math
 from datetime import datetime, timedelta
@@ -17,6 +18,13 @@ from jinja2 import Template
 # Import grader for automated tracking
 from props_grader import grade_props_tracking_file
 
+# Hot/cold tracking storage (shared module at the repo root)
+try:
+    from tracking_archive import load_tracking, save_tracking
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tracking_archive import load_tracking, save_tracking
+
 # Load environment variables
 load_dotenv()
 
@@ -71,18 +79,11 @@ class Colors:
 # TRACKING SYSTEM
 # =============================================================================
 
-def load_tracking_data():
-    if os.path.exists(TRACKING_FILE):
-        try:
-            with open(TRACKING_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return {'picks': []}
-    return {'picks': []}
+def load_tracking_data(full_history=False):
+    return load_tracking(TRACKING_FILE, full_history=full_history)
 
 def save_tracking_data(data):
-    with open(TRACKING_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    save_tracking(TRACKING_FILE, data)
 
 def track_new_picks(recommendations):
     """Track new picks that aren't already pending/completed"""
@@ -915,7 +916,7 @@ def main():
     if not odds:
         print("No odds available.")
         # Still gen html for tracking
-        t_data = load_tracking_data()
+        t_data = load_tracking_data(full_history=True)
         ts = calculate_tracking_stats(t_data)
         generate_html_output([], ts, t_data)
         return
@@ -928,7 +929,7 @@ def main():
     track_new_picks(plays)
     
     # Stats & Output
-    t_data = load_tracking_data()
+    t_data = load_tracking_data(full_history=True)
     ts = calculate_tracking_stats(t_data)
     generate_html_output(plays, ts, t_data)
 
@@ -2,6 +2,10 @@
 """
 NFL Player Stats Fetcher - Fully Automated using nflreadpy
 Fetches player stats and populates cache files for NFL prop models
+
+All four caches come from one sorted groupby over the season's game logs
+(see build_stat_caches), including spread features: std, percentiles and a
+spread_consistency score derived from them.
 """
 
 import json
@@ -10,6 +14,11 @@ from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
 
+try:
+    from nfl_data_cache import load_season
+except ImportError:
+    from nfl.nfl_data_cache import load_season
+
 # Cache file paths
 RECEPTIONS_CACHE = SCRIPT_DIR / "nfl_player_receptions_stats_cache.json"
 RUSHING_YARDS_CACHE = SCRIPT_DIR / "nfl_player_rushing_yards_stats_cache.json"
@@ -25,6 +34,129 @@ def get_current_season():
     else:
         return now.year - 1
 
+# One entry per props cache: (stat column candidates, key stem). The first
+# candidate present in the data is used; stems give the cache keys, e.g.
+# season_rec_yds_avg / rec_yds_p25.
+STAT_MARKETS = {
+    'receptions': (['receptions', 'rec', 'receptions_total'], 'rec'),
+    'rushing': (['rushing_yards', 'rush_yds', 'rushing_yds', 'ry'], 'rush_yds'),
+    'receiving': (['receiving_yards', 'rec_yds', 'receiving_yds', 'recyds'], 'rec_yds'),
+    'passing': (['passing_yards', 'pass_yds', 'passing_yds', 'py'], 'pass_yds'),
+}
+# consistency_score = min(1, avg / scale * 0.8), the volume-based score the props
+# models are tuned against
+CONSISTENCY_SCALE = {'receptions': 8.0, 'rushing': 100.0, 'receiving': 100.0, 'passing': 300.0}
+PASS_ATTEMPT_COLUMNS = ['attempts', 'pass_attempts', 'pass_att', 'att']
+TEAM_COLUMNS = ['team', 'team_abbr', 'posteam', 'team_name']
+
+RECENT_GAMES = 5
+PERCENTILES = (0.10, 0.25, 0.50, 0.75, 0.90)
+
+def _first_column(df, candidates):
+    for col in candidates:
+        if col in df.columns:
+            return col
+    return None
+
+def consistency_from_spread(mean, std):
+    """
+    1 / (1 + coefficient of variation): 1.0 for a player who hits the same
+    number every week, 0.5 when the game-to-game std equals the mean.
+    Written as `spread_consistency` next to the volume-based consistency_score
+    the props models score with. Needs 2+ games; otherwise 0.
+    """
+    cv = std / mean.where(mean > 0)
+    return (1.0 / (1.0 + cv)).fillna(0.0).clip(0.0, 1.0)
+
+def build_stat_caches(df, player_col):
+    """
+    All four props caches from one sorted groupby over the season's game logs.
+
+    Per player and market: season mean, last-5 mean (season mean if fewer than
+    five games), games played, standard deviation, 10/25/50/75/90th
+    percentiles, the volume-based consistency_score and a spread-based
+    spread_consistency.
+    Returns (receptions, rushing, receiving, passing) dicts keyed by player name.
+    """
+    import pandas as pd
+
+    order = [c for c in ('season', 'week') if c in df.columns]
+    if order:
+        df = df.sort_values(order, kind='stable')
+    df = df[df[player_col].notna()]
+
+    stat_cols = {}
+    for market, (candidates, _) in STAT_MARKETS.items():
+        col = _first_column(df, candidates)
+        if col:
+            stat_cols[market] = col
+    att_col = _first_column(df, PASS_ATTEMPT_COLUMNS)
+    team_col = _first_column(df, TEAM_COLUMNS)
+
+    value_cols = sorted(set(stat_cols.values()) | ({att_col} if att_col else set()))
+    values = df[value_cols].apply(pd.to_numeric, errors='coerce')
+    players = df[player_col]
+
+    grouped = values.groupby(players, sort=False)
+    means = grouped.mean()
+    stds = grouped.std()
+    quantiles = grouped.quantile(list(PERCENTILES)).unstack()
+    games_played = players.groupby(players, sort=False).size()
+
+    # Last N games per player: rows are week-sorted, so count back from the end
+    from_end = players.groupby(players, sort=False).cumcount(ascending=False)
+    recent = values[from_end < RECENT_GAMES].groupby(players[from_end < RECENT_GAMES], sort=False).mean()
+    recent = recent.where(games_played.reindex(recent.index) >= RECENT_GAMES, means.reindex(recent.index))
+
+    if team_col:
+        teams = df[team_col].groupby(players, sort=False).last().reindex(means.index).astype(str)
+    else:
+        teams = pd.Series('UNK', index=means.index)
+
+    caches = {market: {} for market in STAT_MARKETS}
+    for market, col in stat_cols.items():
+        stem = STAT_MARKETS[market][1]
+        season_avg = means[col]
+        consistency = consistency_from_spread(season_avg, stds[col])
+        qs = quantiles[col]
+        frame = pd.DataFrame({
+            'avg': season_avg,
+            'recent': recent[col].reindex(means.index).fillna(season_avg),
+            'std': stds[col].fillna(0.0),
+            'consistency': (season_avg / CONSISTENCY_SCALE[market] * 0.8).clip(upper=1.0),
+            'spread_consistency': consistency,
+            'games': games_played.reindex(means.index),
+            'team': teams,
+            **{f"p{int(q * 100)}": qs[q] for q in PERCENTILES},
+        })
+        if market == 'passing' and att_col:
+            frame['att'] = means[att_col].fillna(0.0)
+        frame = frame[frame['avg'] > 0]
+
+        out = caches[market]
+        for name, row in zip(frame.index, frame.itertuples(index=False)):
+            entry = {
+                f"season_{stem}_avg": round(float(row.avg), 2),
+                f"recent_{stem}_avg": round(float(row.recent), 2),
+            }
+            if market in ('receptions', 'receiving'):
+                entry['target_share'] = 0.20  # Estimate - would need team data for accurate
+            elif market == 'rushing':
+                entry['carry_share'] = 0.20  # Estimate
+            elif market == 'passing':
+                entry['pass_attempts'] = round(float(getattr(row, 'att', 0.0)), 1)
+            entry['consistency_score'] = round(float(row.consistency), 2)
+            entry['spread_consistency'] = round(float(row.spread_consistency), 2)
+            entry[f"{stem}_std"] = round(float(row.std), 2)
+            for q in PERCENTILES:
+                key = f"p{int(q * 100)}"
+                entry[f"{stem}_{key}"] = round(float(getattr(row, key)), 1)
+            entry['games_played'] = int(row.games)
+            entry['team'] = str(row.team)
+            out[name] = entry
+
+    return caches['receptions'], caches['rushing'], caches['receiving'], caches['passing']
+
 def fetch_all_stats():
     """Fetch all NFL player stats using nflreadpy"""
     print("=" * 70)
@@ -32,178 +164,29 @@ def fetch_all_stats():
     print("=" * 70)
     print()
     
-    try:
-        import nflreadpy as nfl
-        print("✓ nflreadpy package loaded")
-    except ImportError:
-        print("✗ nflreadpy package not installed")
-        print("  Install with: pip install nflreadpy")
-        return False
-    
     season = get_current_season()
     print(f"Fetching stats for {season} season...\n")
     
     try:
-        # Load player stats for current season
-        print("Loading player stats from nflreadpy...")
-        player_stats = nfl.load_player_stats([season])
-        
-        # Convert to pandas if needed (nflreadpy uses polars)
-        try:
-            df = player_stats.to_pandas()
-        except:
-            # If it's already pandas or different format
-            df = player_stats
+        # Shared local Parquet cache; only hits nflreadpy when new games have finished
+        print("Loading player stats (nflreadpy season cache)...")
+        df = load_season('player_stats', season)
+        if df is None:
+            print("✗ nflreadpy package not installed and no cached season")
+            print("  Install with: pip install nflreadpy")
+            return False
         
         print(f"✓ Loaded {len(df)} player game records")
         print()
         
-        # Process stats for each prop type
-        receptions_stats = {}
-        rushing_stats = {}
-        receiving_stats = {}
-        passing_stats = {}
-        
         # Get unique players - use display_name for full names
-        if 'player_display_name' in df.columns:
-            player_col = 'player_display_name'
-        elif 'player_name' in df.columns:
-            player_col = 'player_name'
-        elif 'player' in df.columns:
-            player_col = 'player'
-        else:
+        player_col = _first_column(df, ['player_display_name', 'player_name', 'player'])
+        if not player_col:
             print("✗ Could not find player name column")
             return False
         
-        players = df[player_col].unique()
-        print(f"Processing {len(players)} players...\n")
-        
-        for player_name in players:
-            player_data = df[df[player_col] == player_name]
-            
-            if len(player_data) == 0:
-                continue
-            
-            # Get team (use most recent)
-            team_col = None
-            for col in ['team', 'team_abbr', 'posteam', 'team_name']:
-                if col in player_data.columns:
-                    team_col = col
-                    break
-            
-            team = player_data[team_col].iloc[-1] if team_col else 'UNK'
-            games_played = len(player_data)
-            
-            # RECEPTIONS
-            rec_col = None
-            for col in ['receptions', 'rec', 'receptions_total']:
-                if col in player_data.columns:
-                    rec_col = col
-                    break
-            
-            if rec_col:
-                # Data is already per-game, so just take mean
-                rec_avg = player_data[rec_col].mean() if games_played > 0 else 0
-                recent_rec = player_data.tail(5)[rec_col].mean() if len(player_data) >= 5 else rec_avg
-                
-                if rec_avg > 0:
-                    target_share = 0.20  # Estimate - would need team data for accurate
-                    consistency = min(1.0, (rec_avg / 8.0) * 0.8)
-                    
-                    receptions_stats[player_name] = {
-                        'season_rec_avg': round(rec_avg, 2),
-                        'recent_rec_avg': round(recent_rec, 2),
-                        'target_share': round(target_share, 2),
-                        'consistency_score': round(consistency, 2),
-                        'games_played': games_played,
-                        'team': str(team)
-                    }
-            
-            # RUSHING YARDS
-            rush_yds_col = None
-            for col in ['rushing_yards', 'rush_yds', 'rushing_yds', 'ry']:
-                if col in player_data.columns:
-                    rush_yds_col = col
-                    break
-            
-            if rush_yds_col:
-                # Data is already per-game, so just take mean
-                rush_yds_avg = player_data[rush_yds_col].mean() if games_played > 0 else 0
-                recent_rush_yds = player_data.tail(5)[rush_yds_col].mean() if len(player_data) >= 5 else rush_yds_avg
-                
-                if rush_yds_avg > 0:
-                    carry_share = 0.20  # Estimate
-                    consistency = min(1.0, (rush_yds_avg / 100.0) * 0.8)
-                    
-                    rushing_stats[player_name] = {
-                        'season_rush_yds_avg': round(rush_yds_avg, 2),
-                        'recent_rush_yds_avg': round(recent_rush_yds, 2),
-                        'carry_share': round(carry_share, 2),
-                        'consistency_score': round(consistency, 2),
-                        'games_played': games_played,
-                        'team': str(team)
-                    }
-            
-            # RECEIVING YARDS
-            rec_yds_col = None
-            for col in ['receiving_yards', 'rec_yds', 'receiving_yds', 'recyds']:
-                if col in player_data.columns:
-                    rec_yds_col = col
-                    break
-            
-            if rec_yds_col:
-                # Data is already per-game, so just take mean
-                rec_yds_avg = player_data[rec_yds_col].mean() if games_played > 0 else 0
-                recent_rec_yds = player_data.tail(5)[rec_yds_col].mean() if len(player_data) >= 5 else rec_yds_avg
-                
-                if rec_yds_avg > 0:
-                    target_share = 0.20  # Estimate
-                    consistency = min(1.0, (rec_yds_avg / 100.0) * 0.8)
-                    
-                    receiving_stats[player_name] = {
-                        'season_rec_yds_avg': round(rec_yds_avg, 2),
-                        'recent_rec_yds_avg': round(recent_rec_yds, 2),
-                        'target_share': round(target_share, 2),
-                        'consistency_score': round(consistency, 2),
-                        'games_played': games_played,
-                        'team': str(team)
-                    }
-            
-            # PASSING YARDS
-            pass_yds_col = None
-            for col in ['passing_yards', 'pass_yds', 'passing_yds', 'py']:
-                if col in player_data.columns:
-                    pass_yds_col = col
-                    break
-            
-            if pass_yds_col:
-                # Data is already per-game, so just take mean
-                pass_yds_avg = player_data[pass_yds_col].mean() if games_played > 0 else 0
-                recent_pass_yds = player_data.tail(5)[pass_yds_col].mean() if len(player_data) >= 5 else pass_yds_avg
-                
-                # Get pass attempts
-                pass_att_col = None
-                for col in ['attempts', 'pass_attempts', 'pass_att', 'att']:
-                    if col in player_data.columns:
-                        pass_att_col = col
-                        break
-                
-                pass_att_avg = 0
-                if pass_att_col:
-                    # Data is already per-game
-                    pass_att_avg = player_data[pass_att_col].mean() if games_played > 0 else 0
-                
-                if pass_yds_avg > 0:
-                    consistency = min(1.0, (pass_yds_avg / 300.0) * 0.8)
-                    
-                    passing_stats[player_name] = {
-                        'season_pass_yds_avg': round(pass_yds_avg, 2),
-                        'recent_pass_yds_avg': round(recent_pass_yds, 2),
-                        'pass_attempts': round(pass_att_avg, 1),
-                        'consistency_score': round(consistency, 2),
-                        'games_played': games_played,
-                        'team': str(team)
-                    }
+        print(f"Processing {df[player_col].nunique()} players...\n")
+        receptions_stats, rushing_stats, receiving_stats, passing_stats = build_stat_caches(df, player_col)
         
         # Save to cache files
         print("Saving stats to cache files...")
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+NFL Season Data Cache
+---------------------
+Local, versioned Parquet cache for nflreadpy season datasets, shared by the
+props grader, the stats fetcher and the NFL props models so one download
+serves the whole NFL pipeline.
+
+    nfl/.cache/nflreadpy/player_stats_2025.v1.parquet
+    nfl/.cache/nflreadpy/player_stats_2025.v1.json    <- manifest (max week, fetched_at)
+
+Refresh rules:
+- Past seasons never change: once cached after the Super Bowl they are never
+  re-downloaded.
+- `schedules` for the current season are re-fetched at most once an hour.
+- `player_stats` for the current season are re-fetched only when the
+  schedule shows games completed since the last fetch (plus a 6-hourly
+  re-check for 3 days after a game day, since stats post late). nflreadpy
+  serves whole seasons, so each refresh replaces the file outright and
+  upstream stat corrections for earlier weeks land too.
+
+Reads are memory-mapped (polars) and limited to the requested columns.
+
+Usage:
+    from nfl_data_cache import load_season
+    df = load_season('player_stats', 2025, columns=['season', 'week', 'team', 'passing_yards'])
+
+    python3 nfl/nfl_data_cache.py --season 2025          # warm / refresh the cache
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "nflreadpy"
+
+# Bump when the on-disk layout changes; old files are simply ignored
+CACHE_VERSION = 1
+
+DATASETS = ("player_stats", "schedules")
+SCHEDULE_TTL = timedelta(hours=1)
+# After a game day, player stats are re-checked every 6h for 3 days (late stat posting)
+STATS_RECHECK = timedelta(hours=6)
+STATS_RECHECK_DAYS = 3
+
+
+def current_season(now: Optional[datetime] = None) -> int:
+    """NFL season year (Jan-Aug belong to the previous season)."""
+    now = now or datetime.now()
+    return now.year if now.month >= 9 else now.year - 1
+
+
+def _paths(dataset: str, season: int) -> tuple[Path, Path]:
+    stem = f"{dataset}_{season}.v{CACHE_VERSION}"
+    return CACHE_DIR / f"{stem}.parquet", CACHE_DIR / f"{stem}.json"
+
+
+def _read_manifest(path: Path) -> dict:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _tmp_path(path: Path) -> Path:
+    """Per-process temp name so concurrent refreshes never share a partial file."""
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def _write_manifest(path: Path, manifest: dict) -> None:
+    tmp = _tmp_path(path)
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _to_pandas(frame) -> pd.DataFrame:
+    """nflreadpy returns polars frames; everything downstream is pandas."""
+    try:
+        return frame.to_pandas()
+    except Exception:
+        return frame
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _tmp_path(path)
+    try:
+        import polars as pl
+        pl.from_pandas(df).write_parquet(tmp)
+    except ImportError:
+        df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def _read_parquet(path: Path, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Memory-mapped read of just the columns that exist in the file."""
+    try:
+        import polars as pl
+        if columns is not None:
+            available = set(pl.read_parquet_schema(path))
+            columns = [c for c in columns if c in available]
+        return pl.read_parquet(path, columns=columns, memory_map=True).to_pandas()
+    except ImportError:
+        if columns is not None:
+            import pyarrow.parquet as pq
+            available = set(pq.read_schema(path).names)
+            columns = [c for c in columns if c in available]
+        return pd.read_parquet(path, columns=columns, memory_map=True)
+
+
+def _fetch(dataset: str, season: int) -> Optional[pd.DataFrame]:
+    try:
+        import nflreadpy as nfl
+    except ImportError:
+        return None
+    loader = {"player_stats": nfl.load_player_stats, "schedules": nfl.load_schedules}[dataset]
+    return _to_pandas(loader([season]))
+
+
+def _max_week(df: pd.DataFrame) -> Optional[int]:
+    if df is None or "week" not in df.columns or df.empty:
+        return None
+    week = pd.to_numeric(df["week"], errors="coerce").max()
+    return None if pd.isna(week) else int(week)
+
+
+def _completion_state(season: int) -> tuple[int, Optional[str]]:
+    """(completed games, latest completed gameday) from the cheap, hourly schedule cache."""
+    sched = load_season("schedules", season, columns=["gameday", "home_score", "away_score"])
+    if sched is None or sched.empty:
+        return 0, None
+    done = sched[sched["home_score"].notna() & sched["away_score"].notna()]
+    if done.empty:
+        return 0, None
+    return int(len(done)), str(done["gameday"].astype(str).max())
+
+
+def _is_stale(dataset: str, season: int, manifest: dict) -> bool:
+    fetched = manifest.get("fetched_at")
+    if not fetched:
+        return True
+    if season < current_season():
+        # Final once fetched after the season ended (Super Bowl is in February)
+        return fetched < f"{season + 1}-03-01"
+    age = datetime.now() - datetime.fromisoformat(fetched)
+    if dataset == "schedules":
+        return age > SCHEDULE_TTL
+
+    # player_stats: only when games have finished since the last fetch, plus a
+    # slow re-check for a few days after a game day because stats post late
+    completed, latest_gameday = _completion_state(season)
+    if completed > manifest.get("completed_games", 0):
+        return True
+    if latest_gameday and age > STATS_RECHECK:
+        days_since = (datetime.now() - datetime.fromisoformat(latest_gameday)).days
+        return days_since <= STATS_RECHECK_DAYS
+    return False
+
+
+def refresh_season(dataset: str, season: int, force: bool = False) -> bool:
+    """Bring one dataset/season up to date. Returns True if the file was (re)written."""
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset: {dataset}")
+    parquet_path, manifest_path = _paths(dataset, season)
+    manifest = _read_manifest(manifest_path)
+    if parquet_path.exists() and not force and not _is_stale(dataset, season, manifest):
+        return False
+
+    df = _fetch(dataset, season)
+    if df is None:
+        return False
+
+    _write_parquet(df, parquet_path)
+    _write_manifest(manifest_path, {
+        "dataset": dataset,
+        "season": season,
+        "version": CACHE_VERSION,
+        "rows": int(len(df)),
+        "max_week": _max_week(df),
+        "completed_games": _completion_state(season)[0] if dataset == "player_stats" else None,
+        "fetched_at": datetime.now().isoformat(),
+    })
+    return True
+
+
+def load_season(dataset: str, season: int, columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Season frame as pandas, from the local cache (refreshed first if stale).
+    `columns` is a wish list; names missing from the dataset are ignored.
+    Returns None if there is no cache and nflreadpy is unavailable.
+    """
+    parquet_path, _ = _paths(dataset, season)
+    try:
+        refresh_season(dataset, season)
+    except Exception as e:
+        # Network/nflreadpy trouble: fall back to whatever is cached
+        print(f"⚠️ nflreadpy refresh failed for {dataset} {season}: {e}")
+    if not parquet_path.exists():
+        return None
+    return _read_parquet(parquet_path, columns)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Warm the local nflreadpy Parquet cache")
+    parser.add_argument("--season", type=int, default=current_season())
+    parser.add_argument("--force", action="store_true", help="Re-download even if fresh")
+    args = parser.parse_args()
+    for dataset in ("schedules", "player_stats"):
+        wrote = refresh_season(dataset, args.season, force=args.force)
+        _, manifest_path = _paths(dataset, args.season)
+        m = _read_manifest(manifest_path)
+        state = "updated" if wrote else "up to date"
+        print(f"{dataset} {args.season}: {state} ({m.get('rows', 0)} rows, max week {m.get('max_week')})")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,16 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
 import pytz
+import sys
+
+# Shared HTML template environment and pick-history shards (repo root)
+try:
+    from html_templates import compile_template
+    from tracking_shards import history_panel, write_history
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import compile_template
+    from tracking_shards import history_panel, write_history
 
 # Load environment variables
 # Try root .env first (if exists), then local .env
@@ -732,7 +742,6 @@ def get_daily_stats(picks):
 
 def generate_picks_html(analyses, stats, tracker):
     """Generate HTML page with PROPS_HTML_STYLING_GUIDE aesthetic - REVISED COPY"""
-    from jinja2 import Template
     
     # Map for NFL logos (approximate ESPN codes)
     team_abbr_map = {
@@ -1232,7 +1241,7 @@ def generate_picks_html(analyses, stats, tracker):
 </body>
 </html>"""
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         analyses=analyses,
         timestamp=timestamp_str,
@@ -1279,6 +1288,9 @@ def normalize_nfl_tracking_data(bets_array):
             'home_team': '',  # NFL structure doesn't have this, need to extract from recommendation
             'away_team': '',
             'matchup': bet.get('recommendation', ''),  # Use recommendation as matchup placeholder
+            'game_time': bet.get('game_time', ''),  # Kickoff, for the pick history months
+            'actual_home_score': bet.get('actual_home_score'),
+            'actual_away_score': bet.get('actual_away_score'),
         }
         
         # Map NFL status + result to standard status
@@ -1435,7 +1447,6 @@ def calculate_recent_performance(picks_list, count):
 
 def generate_tracking_html():
     """Generate HTML dashboard for tracking picks with last 100/50/20 breakdown"""
-    from jinja2 import Template
     
     tracking_data = load_picks_tracking()
     stats = calculate_tracking_stats(tracking_data)
@@ -1908,14 +1919,19 @@ def generate_tracking_html():
             </div>
         </div>
 
+        {{ history_panel }}
+
         <div class="text-center text-gray-400 text-sm" style="margin-top: 2rem;">
             <p>Last updated: {{ timestamp }}</p>
         </div>
     </div>
 </body>
 </html>'''
+
+    # Settled picks go to month shards the page loads on demand (tracking_shards.py)
+    write_history(TRACKING_HTML_FILE, tracking_data['picks'])
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         stats=stats,
         pending_picks=pending_picks,
@@ -1925,6 +1941,7 @@ def generate_tracking_html():
         daily_perf=daily_perf,
         timestamp=timestamp,
         format_game_date=format_game_date,
+        history_panel=history_panel(TRACKING_HTML_FILE),
     )
     
     with open(TRACKING_HTML_FILE, 'w', encoding='utf-8') as f:
@@ -7,6 +7,7 @@ Focuses on target share, efficiency, and consistency.
 
 import json
 import os
+import sys
 import re
 import time
 from datetime import datetime, timedelta
@@ -17,6 +18,17 @@ from dotenv import load_dotenv
 # Import grader for automated tracking
 from props_grader import grade_props_tracking_file
 
+# Hot/cold tracking storage, the per-run tracking index and shared HTML templates (repo root)
+try:
+    from html_templates import clv_tag, render
+    from run_context import RunContext
+    from tracking_archive import load_tracking, save_tracking
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import clv_tag, render
+    from run_context import RunContext
+    from tracking_archive import load_tracking, save_tracking
+
 # Load environment variables
 load_dotenv()
 
@@ -48,18 +60,11 @@ class Colors:
 # TRACKING SYSTEM
 # =============================================================================
 
-def load_tracking_data():
-    if os.path.exists(TRACKING_FILE):
-        try:
-            with open(TRACKING_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return {'picks': []}
-    return {'picks': []}
+def load_tracking_data(full_history=False):
+    return load_tracking(TRACKING_FILE, full_history=full_history)
 
 def save_tracking_data(data):
-    with open(TRACKING_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    save_tracking(TRACKING_FILE, data)
 
 def track_new_picks(recommendations, odds_data):
     """Track new picks that aren't already pending/completed"""
@@ -647,309 +652,65 @@ def generate_html_output(plays, stats, tracking_data):
     completed_picks = [p for p in tracking_data['picks'] if p.get('status') in ['win', 'loss']]
     completed_picks.sort(key=lambda x: x.get('game_time', ''), reverse=True)
     
-    last_10 = calculate_recent_performance(completed_picks, 10)
-    last_20 = calculate_recent_performance(completed_picks, 20)
-    last_50 = calculate_recent_performance(completed_picks, 50)
-    
-    html_header = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CourtSide Analytics - NFL Receptions</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root {{
-            --bg-main: #121212;
-            --bg-card: #1e1e1e;
-            --bg-card-secondary: #2a2a2a;
-            --text-primary: #ffffff;
-            --text-secondary: #b3b3b3;
-            --accent-green: #4ade80;
-            --accent-red: #f87171;
-            --accent-blue: #60a5fa;
-            --border-color: #333333;
-        }}
-        body {{ margin: 0; padding: 20px; font-family: 'Inter', sans-serif; background-color: var(--bg-main); color: var(--text-primary); -webkit-font-smoothing: antialiased; }}
-        .container {{ max-width: 800px; margin: 0 auto; }}
-        
-        /* HEADER */
-        header {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 25px; border-bottom: 1px solid var(--border-color); padding-bottom: 15px; }}
-        h1 {{ margin: 0; font-size: 24px; font-weight: 700; margin-bottom: 5px; }}
-        .subheader {{ font-size: 18px; font-weight: 600; color: var(--text-primary); margin-bottom: 5px; }}
-        .date-sub {{ color: var(--text-secondary); font-size: 14px; margin-top: 5px; }}
-        .header-stats {{ text-align: right; }}
-        
-        /* SUMMARY GRID */
-        .summary-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px; margin-bottom: 30px; }}
-        .stat-box {{ background-color: var(--bg-card); border-radius: 12px; padding: 15px; text-align: center; border: 1px solid var(--border-color); }}
-        .stat-label {{ font-size: 12px; color: var(--text-secondary); text-transform: uppercase; margin-bottom: 5px; }}
-        .stat-value {{ font-size: 20px; font-weight: 700; }}
-        
-        /* CARDS */
-        .section-title {{ font-size: 18px; margin-bottom: 15px; display: flex; align-items: center; }}
-        .section-title span.highlight {{ color: var(--accent-green); margin-left: 8px; font-size: 14px; }}
-        
-        .prop-card {{ background-color: var(--bg-card); border-radius: 16px; overflow: hidden; margin-bottom: 20px; border: 1px solid var(--border-color); box-shadow: 0 4px 6px -1px rgba(0,0,0,0.2); }}
-        .card-header {{ padding: 15px 20px; display: flex; justify-content: space-between; align-items: center; background-color: var(--bg-card-secondary); border-bottom: 1px solid var(--border-color); }}
-        .header-left {{ display: flex; align-items: center; gap: 12px; }}
-        .team-logo {{ width: 45px; height: 45px; border-radius: 50%; padding: 2px; object-fit: contain; }}
-        .player-info h2 {{ margin: 0; font-size: 18px; line-height: 1.2; }}
-        .matchup-info {{ color: var(--text-secondary); font-size: 13px; margin-top: 2px; }}
-        .game-meta {{ text-align: right; }}
-        .game-date-time {{ font-size: 12px; color: var(--text-secondary); background: #333; padding: 6px 10px; border-radius: 6px; font-weight: 500; white-space: nowrap; }}
-        
-        .card-body {{ padding: 20px; }}
-        .bet-main-row {{ margin-bottom: 15px; }}
-        .bet-selection {{ font-size: 22px; font-weight: 800; }}
-        .bet-selection .line {{ color: var(--text-primary); }}
-        .bet-odds {{ font-size: 18px; color: var(--text-secondary); font-weight: 500; margin-left: 8px; }}
-        
-        .model-subtext {{ color: var(--text-secondary); font-size: 14px; margin-bottom: 20px; padding-bottom: 15px; border-bottom: 1px solid var(--border-color); }}
-        .model-subtext strong {{ color: var(--text-primary); }}
-        
-        .metrics-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px; margin-bottom: 20px; }}
-        .metric-item {{ background-color: var(--bg-main); padding: 10px; border-radius: 8px; text-align: center; }}
-        .metric-lbl {{ display: block; font-size: 11px; color: var(--text-secondary); margin-bottom: 4px; }}
-        .metric-val {{ font-size: 16px; font-weight: 700; }}
-        
-        .player-stats {{ background-color: var(--bg-card-secondary); border-radius: 8px; padding: 12px 15px; margin-bottom: 20px; display: flex; justify-content: space-between; align-items: center; border: 1px solid var(--border-color); }}
-        .player-stats-label {{ font-size: 11px; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px; }}
-        .player-stats-value {{ font-size: 16px; font-weight: 700; }}
-        .player-stats-item {{ text-align: center; flex: 1; }}
-        .player-stats-divider {{ width: 1px; height: 30px; background-color: var(--border-color); }}
-        
-        .tags-container {{ display: flex; flex-wrap: wrap; gap: 8px; }}
-        .tag {{ font-size: 12px; padding: 6px 10px; border-radius: 6px; font-weight: 500; }}
-        .tag-green {{ background-color: rgba(74, 222, 128, 0.15); color: var(--accent-green); }}
-        .tag-red {{ background-color: rgba(248, 113, 113, 0.15); color: var(--accent-red); }}
-        .tag-blue {{ background-color: rgba(96, 165, 250, 0.15); color: var(--accent-blue); }}
-        
-        .txt-green {{ color: var(--accent-green); }}
-        .txt-red {{ color: var(--accent-red); }}
-        
-        /* TRACKING SECTION */
-        .metric-value.good {{ color: var(--accent-green); }}
-        
-        @media (max-width: 600px) {{
-            .summary-grid {{ grid-template-columns: repeat(2, 1fr); }}
-            .stat-box:last-child {{ grid-column: span 2; }}
-            .card-header {{ padding: 12px 15px; }}
-        }}
-    </style>
-</head>
-<body>
-
-<div class="container">
-    <header>
-        <div>
-            <h1>CourtSide Analytics</h1>
-            <div class="subheader">NFL Receptions Props</div>
-            <div class="date-sub">Sharp +EV Model • Season {CURRENT_SEASON}</div>
-        </div>
-        <div class="header-stats">
-            <div style="font-size: 0.7rem; color: var(--text-secondary); margin-bottom: 4px; font-weight: 600;">SEASON RECORD</div>
-            <div style="font-size: 1.2rem; font-weight: 700; color: var(--accent-green);">
-                {stats['wins']}-{stats['losses']} ({stats['win_rate']}%)
-            </div>
-            <div style="font-size: 0.9rem; color: {'var(--accent-green)' if stats['profit'] > 0 else 'var(--accent-red)'};">
-                 {stats['profit']:+.2f}u
-            </div>
-            <div style="font-size: 0.7rem; color: var(--text-secondary); margin-top: 4px;">CLV: {stats.get('clv_rate', 0)}%</div>
-        </div>
-    </header>
-"""
+    # Per-card player records and CLV lookups come from one index over tracking
+    context = RunContext(tracking_data)
+    
+    def build_card(play):
+        # Use player team first, verify it's not UNK
+        team_key = play.get('team', 'UNK')
+        if team_key == 'UNK': team_key = play.get('home_team', 'NFL')
+        
+        tags = generate_reasoning_tags(play)
+        
+        # Check for CLV status
+        commence = play.get('commence_time', '')
+        g_date = commence[:10] if commence else datetime.now().strftime('%Y-%m-%d')
+        # ID format must match track_new_picks: Player_Type_Date
+        tracked_pick = context.find_pick(f"{play['player']}_{play.get('type')}_{g_date}")
+        if tracked_pick:
+            tag = clv_tag(tracked_pick.get('clv_status'))
+            if tag:
+                tags.append(tag)
+        
+        return {
+            'logo_url': f"https://a.espncdn.com/i/teamlogos/nfl/500/{get_team_abbreviation(team_key)}.png",
+            'team': team_key,
+            'player': play['player'],
+            'matchup': play.get('matchup', f"{play.get('away_team','')} @ {play.get('home_team','')}"),
+            'game_time': format_game_datetime(play.get('commence_time', play.get('game_time', ''))),
+            'side': play.get('type', 'PROPS'),
+            'line': f"{play.get('line', 0)} Recs",
+            'odds': play.get('odds', 0),
+            'prediction': f"{play.get('model_proj', 'N/A')} Recs",
+            'edge': f"{play.get('edge', 0.0):+.1f}",
+            'metrics': [
+                ('AI SCORE', play.get('ai_score', 0), 'txt-green'),
+                ('SEASON AVG', play.get('season_avg', 'N/A'), ''),
+                ('RECENT AVG', play.get('recent_avg', 'N/A'), ''),
+            ],
+            'player_record': context.player_stats(play['player'], calculate_player_stats),
+            'tags': tags,
+        }
     
-    def generate_cards(play_list, is_over):
-        c_html = ""
-        type_class = "txt-green" if is_over else "txt-red"
-        
-        for play in play_list:
-            # Use player team first, verify it's not UNK
-            team_key = play.get('team', 'UNK')
-            if team_key == 'UNK': team_key = play.get('home_team', 'NFL')
-            
-            team_abbr = get_team_abbreviation(team_key)
-            logo_url = f"https://a.espncdn.com/i/teamlogos/nfl/500/{team_abbr}.png"
-            
-            p_stats = calculate_player_stats(play['player'], tracking_data)
-            p_stats_html = ""
-            if p_stats:
-                roi_sign = '+' if p_stats['player_roi'] > 0 else ''
-                p_stats_html = f'''
-                <div class="player-stats">
-                    <div class="player-stats-item">
-                        <div class="player-stats-label">This Season</div>
-                        <div class="player-stats-value">{p_stats['season_record']}</div>
-                    </div>
-                    <div class="player-stats-divider"></div>
-                    <div class="player-stats-item">
-                        <div class="player-stats-label">Player ROI</div>
-                        <div class="player-stats-value txt-green">{roi_sign}{p_stats['player_roi']:.1f}%</div>
-                    </div>
-                </div>'''
-            
-            tags = generate_reasoning_tags(play)
-            
-            # Check for CLV status
-            if tracking_data:
-                commence = play.get('commence_time', '')
-                g_date = commence[:10] if commence else datetime.now().strftime('%Y-%m-%d')
-                # ID format must match track_new_picks: Player_Type_Date
-                p_id = f"{play['player']}_{play.get('type')}_{g_date}"
-                
-                tracked_pick = next((p for p in tracking_data.get('picks',[]) if p.get('pick_id') == p_id), None)
-                
-                if tracked_pick:
-                    clv = tracked_pick.get('clv_status')
-                    if clv == 'positive':
-                        tags.append({"text": "✅ CLV: Beat Line", "color": "green"})
-                    elif clv == 'negative':
-                        tags.append({"text": "⚠️ CLV: Missed Line", "color": "red"})
-                    elif clv == 'neutral':
-                        tags.append({"text": "➖ CLV: Neutral", "color": "blue"})
-                    elif clv is None:
-                        tags.append({"text": "⏳ CLV: Tracking", "color": "blue"})
-            tags_html = "".join([f'<span class="tag tag-{tag["color"]}">{tag["text"]}</span>' for tag in tags])
-            
-            # Safe parsing
-            play_type = play.get('type', 'PROPS')
-            play_line = play.get('line', 0)
-            play_odds = play.get('odds', 0)
-            model_proj = play.get('model_proj', 'N/A')
-            edge_val = play.get('edge', 0.0)
-            ai_sc = play.get('ai_score', 0)
-            s_avg = play.get('season_avg', 'N/A')
-            r_avg = play.get('recent_avg', 'N/A')
-            commence = play.get('commence_time', play.get('game_time', ''))
-            matchup = play.get('matchup', f"{play.get('away_team','')} @ {play.get('home_team','')}")
-            
-            c_html += f'''
-        <div class="prop-card">
-            <div class="card-header">
-                <div class="header-left">
-                    <img src="{logo_url}" alt="Logo" class="team-logo">
-                    <div class="player-info">
-                        <h2>{play['player']}</h2>
-                        <div class="matchup-info">{matchup}</div>
-                    </div>
-                </div>
-                <div class="game-meta">
-                    <div class="game-date-time">{format_game_datetime(commence)}</div>
-                </div>
-            </div>
-            <div class="card-body">
-                <div class="bet-main-row">
-                    <div class="bet-selection">
-                        <span class="{type_class}">{play_type}</span> 
-                        <span class="line">{play_line} Recs</span> 
-                        <span class="bet-odds">{play_odds}</span>
-                    </div>
-                </div>
-                <div class="model-subtext">
-                    Model Predicts: <strong>{model_proj} Recs</strong> (Edge: {edge_val:+.1f})
-                </div>
-                <div class="metrics-grid">
-                    <div class="metric-item">
-                        <span class="metric-lbl">AI SCORE</span>
-                        <span class="metric-val txt-green">{ai_sc}</span>
-                    </div>
-                    <div class="metric-item">
-                        <span class="metric-lbl">SEASON AVG</span>
-                        <span class="metric-val">{s_avg}</span>
-                    </div>
-                    <div class="metric-item">
-                        <span class="metric-lbl">RECENT AVG</span>
-                        <span class="metric-val">{r_avg}</span>
-                    </div>
-                </div>
-                {p_stats_html}
-                <div class="tags-container">
-                    {tags_html}
-                </div>
-            </div>
-        </div>'''
-        return c_html
-
-    over_html = generate_cards(over_plays, True)
-    under_html = generate_cards(under_plays, False)
-    
-    # Tracking Section
-    def get_track_class(val): return 'good' if val > 0 else 'txt-red'
-    
-    # --- Daily Performance Tracking HTML ---
-    daily_tracking_html = ""
-    if stats and 'today' in stats:
-        t_stats = stats['today']
-        y_stats = stats.get('yesterday', {'record':'0-0', 'profit':0, 'roi':0})
-        
-        daily_tracking_html = f"""
-        <section style="margin-top: 2rem;">
-            <div class="section-title">📅 Daily Performance</div>
-            <div class="metrics-grid" style="grid-template-columns: repeat(2, 1fr);">
-                <!-- Today -->
-                <div class="prop-card" style="padding: 1rem; margin:0;">
-                    <div style="font-size:0.75rem; color:var(--text-secondary); text-align:center; margin-bottom:0.5rem;">TODAY</div>
-                    <div style="text-align:center;">
-                        <div style="font-weight:700; font-size:1.1rem;">{t_stats['record']}</div>
-                        <div class="{get_track_class(t_stats['profit'])}">{t_stats['profit']:+.1f}u</div>
-                        <div style="font-size:0.8rem; color:var(--text-secondary); margin-top:2px;">{t_stats['roi']:.1f}% ROI</div>
-                    </div>
-                </div>
-                <!-- Yesterday -->
-                <div class="prop-card" style="padding: 1rem; margin:0;">
-                    <div style="font-size:0.75rem; color:var(--text-secondary); text-align:center; margin-bottom:0.5rem;">YESTERDAY</div>
-                    <div style="text-align:center;">
-                        <div style="font-weight:700; font-size:1.1rem;">{y_stats['record']}</div>
-                        <div class="{get_track_class(y_stats['profit'])}">{y_stats['profit']:+.1f}u</div>
-                         <div style="font-size:0.8rem; color:var(--text-secondary); margin-top:2px;">{y_stats['roi']:.1f}% ROI</div>
-                    </div>
-                </div>
-            </div>
-        </section>
-        """
-
-    tracking_html = f'''
-    <section style="margin-top: 3rem;">
-        <div class="section-title">🔥 Recent Form</div>
-        <div class="metrics-grid" style="grid-template-columns: repeat(3, 1fr);">
-            <!-- Last 10 -->
-            <div class="prop-card" style="padding: 1rem; margin:0;">
-                <div style="font-size:0.75rem; color:var(--text-secondary); text-align:center; margin-bottom:0.5rem;">LAST 10</div>
-                <div style="text-align:center;">
-                    <div style="font-weight:700;">{last_10['record']}</div>
-                    <div class="{get_track_class(last_10['profit'])}">{last_10['profit']:+.1f}u</div>
-                </div>
-            </div>
-            <!-- Last 20 -->
-            <div class="prop-card" style="padding: 1rem; margin:0;">
-                <div style="font-size:0.75rem; color:var(--text-secondary); text-align:center; margin-bottom:0.5rem;">LAST 20</div>
-                <div style="text-align:center;">
-                    <div style="font-weight:700;">{last_20['record']}</div>
-                    <div class="{get_track_class(last_20['profit'])}">{last_20['profit']:+.1f}u</div>
-                </div>
-            </div>
-            <!-- Last 50 -->
-            <div class="prop-card" style="padding: 1rem; margin:0;">
-                <div style="font-size:0.75rem; color:var(--text-secondary); text-align:center; margin-bottom:0.5rem;">LAST 50</div>
-                <div style="text-align:center;">
-                    <div style="font-weight:700;">{last_50['record']}</div>
-                    <div class="{get_track_class(last_50['profit'])}">{last_50['profit']:+.1f}u</div>
-                </div>
-            </div>
-        </div>
-    </section>
-    '''
-    
-    full_html = html_header
-    if over_html: full_html += f'<section><div class="section-title">Top OVERS <span class="highlight">Min Edge {MIN_EDGE_OVER}</span></div>{over_html}</section>'
-    if under_html: full_html += f'<section><div class="section-title">Top UNDERS <span class="highlight">Min Edge {MIN_EDGE_UNDER}</span></div>{under_html}</section>'
-    full_html += daily_tracking_html
-    full_html += tracking_html
-    full_html += "</div></body></html>"
+    html = render(
+        'props_page.html',
+        page=OUTPUT_HTML,
+        title="CourtSide Analytics - NFL Receptions",
+        subheader="NFL Receptions Props",
+        tagline=f"Sharp +EV Model • Season {CURRENT_SEASON}",
+        record={'wins': stats['wins'], 'losses': stats['losses'], 'win_rate': stats['win_rate'],
+                'profit': stats['profit'], 'profit_digits': 2, 'note': f"CLV: {stats.get('clv_rate', 0)}%"},
+        sections=[
+            {'title': "Top OVERS", 'highlight': f"Min Edge {MIN_EDGE_OVER}", 'cards': [build_card(p) for p in over_plays]},
+            {'title': "Top UNDERS", 'highlight': f"Min Edge {MIN_EDGE_UNDER}", 'cards': [build_card(p) for p in under_plays]},
+        ],
+        daily={'today': stats['today'], 'yesterday': stats.get('yesterday', {'record': '0-0', 'profit': 0, 'roi': 0})}
+              if stats and 'today' in stats else None,
+        recent=[(f"LAST {n}", calculate_recent_performance(completed_picks, n)) for n in (10, 20, 50)],
+    )
     
     with open(OUTPUT_HTML, 'w') as f:
-        f.write(full_html)
+        f.write(html)
     print(f"\n✅ HTML saved: {OUTPUT_HTML}")
 
 # =============================================================================
@@ -983,7 +744,7 @@ def main():
     else:
         print(f"No odds found. Generating HTML with tracking data only.")
         
-    t_data = load_tracking_data()
+    t_data = load_tracking_data(full_history=True)
     ts = calculate_tracking_stats(t_data)
     
     generate_html_output(plays, ts, t_data)
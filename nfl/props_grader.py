@@ -18,11 +18,22 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
+import pandas as pd
 import pytz
 try:
     from nfl.sleeper_client import SleeperClient
 except ImportError:
     from sleeper_client import SleeperClient
+try:
+    from nfl.nfl_data_cache import load_season
+except ImportError:
+    from nfl_data_cache import load_season
+try:
+    from tracking_archive import save_tracking
+except ImportError:
+    import sys
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+    from tracking_archive import save_tracking
 
 
 ET_TZ = pytz.timezone("US/Eastern")
@@ -102,9 +113,8 @@ def _load_json(path: Path) -> dict[str, Any]:
 
 
 def _save_json(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    # Rolls newly settled picks past the hot window into the archive
+    save_tracking(path, data)
 
 
 def _detect_player_col(df) -> Optional[str]:
@@ -132,33 +142,13 @@ def _detect_date_col(df) -> Optional[str]:
     return None
 
 
-def _ensure_pandas_df(player_stats) -> Any:
-    """
-    nflreadpy may return a polars dataframe. Convert to pandas if possible.
-    """
-    try:
-        return player_stats.to_pandas()
-    except Exception:
-        return player_stats
-
-
 def _load_nflreadpy_player_stats(season_year: int):
-    try:
-        import nflreadpy as nfl
-    except Exception:
-        return None
-
-    player_stats = nfl.load_player_stats([season_year])
-    return _ensure_pandas_df(player_stats)
+    """Season player stats from the shared local Parquet cache (see nfl_data_cache.py)."""
+    return load_season("player_stats", season_year, columns=_GRADER_STAT_COLUMNS)
 
 
 def _load_nflreadpy_schedules(season_year: int):
-    try:
-        import nflreadpy as nfl
-    except Exception:
-        return None
-    schedules = nfl.load_schedules([season_year])
-    return _ensure_pandas_df(schedules)
+    return load_season("schedules", season_year, columns=_GRADER_SCHEDULE_COLUMNS)
 
 
 def _find_stat_value(row: Any, candidates: Iterable[str]) -> Optional[float]:
@@ -250,300 +240,330 @@ TEAM_NAME_TO_ABBR: dict[str, str] = {
 # Inverse map for abbr lookups
 ABBR_TO_TEAM_NAME = {v: k for k, v in TEAM_NAME_TO_ABBR.items()}
 
+# Only these columns are read from the Parquet cache
+_GRADER_STAT_COLUMNS = sorted(
+    {"season", "week", "team", "player_display_name", "player_name", "player", "display_name", "name",
+     "rush_td", "rec_td"}
+    | {c for spec in GRADE_SPECS.values() for c in spec.stat_candidates}
+)
+_GRADER_SCHEDULE_COLUMNS = ["gameday", "week", "home_team", "away_team", "home_score", "away_score", "game_status"]
+
+
+# Default tracking file per market (graded together by grade_all_props)
+NFL_PROPS_TRACKING_FILES: dict[str, Path] = {
+    "passing_yards": Path(__file__).resolve().parent / "nfl_passing_yards_props_tracking.json",
+    "rushing_yards": Path(__file__).resolve().parent / "nfl_rushing_yards_props_tracking.json",
+    "receiving_yards": Path(__file__).resolve().parent / "nfl_receiving_yards_props_tracking.json",
+    "receptions": Path(__file__).resolve().parent / "nfl_receptions_props_tracking.json",
+    "anytime_td": Path(__file__).resolve().parent / "atd_model_tracking.json",
+}
 
-def grade_props_tracking_file(
-    tracking_file: str | Path,
-    *,
-    stat_kind: str,
-    hours_after_game_to_grade: float = 4.0,
-    hours_after_game_to_void: float = 36.0,
-    verbose: bool = True,
-) -> int:
+
+@dataclass
+class SeasonIndex:
     """
-    Grade pending picks in the tracking file using nflreadpy player stats.
+    nflreadpy data for one season, loaded once and indexed for lookups.
 
-    - If a pick is older than hours_after_game_to_grade, attempt to fetch its stat.
-    - If stat still can't be found and the pick is older than hours_after_game_to_void,
-      mark as PUSH/VOID (so it doesn't stay pending forever).
+    games:  (gameday "YYYY-MM-DD", team abbr) -> schedule row
+    dates:  gamedays that have any game
+    rows:   (week, team, last name, first initial) -> positional row in `stats`
+            (first matching row in file order, same as the old linear scan)
     """
-    spec = GRADE_SPECS.get(stat_kind)
-    if not spec:
-        raise ValueError(f"Unknown stat_kind: {stat_kind}")
-
-    tracking_path = Path(tracking_file)
-    tracking_data = _load_json(tracking_path)
-    picks = tracking_data.get("picks", []) or []
-    pending = [p for p in picks if str(p.get("status", "")).lower() == "pending"]
-    if not pending:
-        return 0
+    season: int
+    stats: Any
+    games: dict[tuple[str, str], dict[str, Any]]
+    dates: set[str]
+    rows: dict[tuple[int, Optional[str], str, str], int]
+
+    def find_player_row(self, week: int, team_abbr: str, player_name: str):
+        p_first, p_last = _name_first_last(player_name)
+        team = team_abbr if self.has_team else None
+        pos = self.rows.get((week, team, p_last, p_first[:1]))
+        return None if pos is None else self.stats.iloc[pos]
+
+    @property
+    def has_team(self) -> bool:
+        return "team" in getattr(self.stats, "columns", [])
 
-    # Determine season from the first pending pick (fallback to current-year heuristics)
-    season_year = None
-    for p in pending:
-        season_year = _pick_season_year_from_game_time(str(p.get("game_time", "")))
-        if season_year:
-            break
-    if season_year is None:
-        season_year = datetime.now(ET_TZ).year
 
+def _build_season_index(season_year: int, verbose: bool = True) -> Optional[SeasonIndex]:
     df = _load_nflreadpy_player_stats(season_year)
     if df is None:
         if verbose:
             print("⚠️ nflreadpy not available; cannot auto-grade NFL props yet.")
-        return 0
+        return None
 
     player_col = _detect_player_col(df)
     if not player_col:
         if verbose:
             print("⚠️ Could not detect nflreadpy player column; cannot grade.")
             print(f"Detected player_col={player_col}")
-        return 0
+        return None
 
     sched_df = _load_nflreadpy_schedules(season_year)
     if sched_df is None:
         if verbose:
             print("⚠️ nflreadpy schedules not available; cannot map game dates to weeks.")
-        return 0
+        return None
     if "gameday" not in getattr(sched_df, "columns", []) or "week" not in getattr(sched_df, "columns", []):
         if verbose:
             print("⚠️ nflreadpy schedules missing required columns (gameday/week); cannot grade.")
-        return 0
+        return None
 
-    # Initialize Sleeper Client
-    sleeper = SleeperClient()
-    weekly_stats_cache = {} # (season, week) -> stats_dict
+    # Schedule: one pass, keyed by (gameday, team) for both sides of each game
+    games: dict[tuple[str, str], dict[str, Any]] = {}
+    dates: set[str] = set()
+    for row in sched_df.to_dict("records"):
+        gameday = str(row.get("gameday"))
+        dates.add(gameday)
+        for side in ("home_team", "away_team"):
+            games.setdefault((gameday, str(row.get(side))), row)
+
+    # Player stats: normalize each distinct name once, then key every row
+    df = df[df["season"] == season_year].reset_index(drop=True)
+    names = df[player_col].astype(str)
+    first_last = {n: _name_first_last(n) for n in names.unique()}
+    keys = pd.DataFrame({
+        "week": pd.to_numeric(df["week"], errors="coerce"),
+        "team": df["team"].astype(str) if "team" in df.columns else None,
+        "last": names.map(lambda n: first_last[n][1]),
+        "initial": names.map(lambda n: first_last[n][0][:1]),
+    })
+    keys = keys[keys["week"].notna() & (keys["last"] != "")]
+    keys = keys.drop_duplicates(["week", "team", "last", "initial"], keep="first")
+    rows = {
+        (int(w), t, last, ini): pos
+        for pos, w, t, last, ini in zip(keys.index, keys["week"], keys["team"], keys["last"], keys["initial"])
+    }
+    return SeasonIndex(season=season_year, stats=df, games=games, dates=dates, rows=rows)
+
+
+def _settle(pick: dict[str, Any], spec: GradeSpec, actual: float, prop_line: float,
+            bet_type: str, now_et: datetime) -> None:
+    """Apply the W/L/PUSH and profit/loss rules shared by both stat sources."""
+    if actual == prop_line:
+        pick["status"] = "push"
+        pick["result"] = "PUSH"
+    else:
+        if spec.stat_kind == "anytime_td":
+            # ATD bets have no real line: any touchdown is a WIN
+            is_win = actual >= 1
+        elif bet_type == "over":
+            is_win = actual > prop_line
+        else:
+            is_win = actual < prop_line
+        pick["status"] = "win" if is_win else "loss"
+        pick["result"] = "WIN" if is_win else "LOSS"
+
+    pick[spec.actual_field] = float(actual)
+    pick["updated_at"] = now_et.isoformat()
+
+    # Profit/loss in cents, from the odds the bet was placed at
+    odds = pick.get('opening_odds') or pick.get('odds', -110)
+    if pick['status'] == 'win':
+        if odds > 0:
+            pick['profit_loss'] = int(odds)  # e.g. +150 pays $150
+        else:
+            pick['profit_loss'] = int((100.0 / abs(odds)) * 100)  # e.g. -110 pays ~$91
+    elif pick['status'] == 'loss':
+        pick['profit_loss'] = -100
+    else:  # push
+        pick['profit_loss'] = 0
+
+
+def _void(pick: dict[str, Any], spec: GradeSpec, now_et: datetime) -> None:
+    pick["status"] = "push"
+    pick["result"] = "VOID"
+    pick[spec.actual_field] = None
+    pick["updated_at"] = now_et.isoformat()
 
-    updated = 0
+
+def grade_all_props(
+    tracking_files: Optional[dict[str, str | Path]] = None,
+    *,
+    hours_after_game_to_grade: float = 4.0,
+    hours_after_game_to_void: float = 36.0,
+    verbose: bool = True,
+) -> dict[str, int]:
+    """
+    Grade pending picks from every NFL props tracking file in one pass.
+
+    nflreadpy season frames are loaded once per season and indexed by
+    (week, team, normalized name); every pending pick from every file is then
+    resolved with dict lookups. Sleeper is tried first for each pick, and
+    weekly Sleeper stats are shared across files.
+
+    tracking_files: {stat_kind: path}, default NFL_PROPS_TRACKING_FILES.
+    Returns {stat_kind: graded_count}. Each file is written at most once.
+    """
+    tracking_files = tracking_files or NFL_PROPS_TRACKING_FILES
+    for stat_kind in tracking_files:
+        if stat_kind not in GRADE_SPECS:
+            raise ValueError(f"Unknown stat_kind: {stat_kind}")
+
+    books: dict[str, dict[str, Any]] = {}
+    pending: list[tuple[str, dict[str, Any]]] = []
+    for stat_kind, path in tracking_files.items():
+        tracking_path = Path(path)
+        tracking_data = _load_json(tracking_path)
+        books[stat_kind] = {"path": tracking_path, "data": tracking_data, "updated": 0}
+        for p in tracking_data.get("picks", []) or []:
+            if str(p.get("status", "")).lower() == "pending":
+                pending.append((stat_kind, p))
+    if not pending:
+        return {k: 0 for k in books}
+
+    seasons: dict[int, Optional[SeasonIndex]] = {}
+    sleeper = SleeperClient()
+    weekly_stats_cache = {}  # (season, week) -> stats_dict
+    # Resolve every pending player's Sleeper id up front (dict lookups on the persisted index)
+    player_ids = sleeper.get_player_ids(str(p.get("player", "")) for _, p in pending)
     now_et = datetime.now(ET_TZ)
 
-    for pick in pending:
-        game_time = str(pick.get("game_time", ""))
-        game_dt_et = _parse_game_time_to_et_date(game_time)
+    for stat_kind, pick in pending:
+        spec = GRADE_SPECS[stat_kind]
+        game_dt_et = _parse_game_time_to_et_date(str(pick.get("game_time", "")))
         if not game_dt_et:
             continue
 
-        hours_ago = (now_et - game_dt_et).total_seconds() / 3600.0
-        # Check happens later after game completion detection
+        season_year = _pick_season_year_from_game_time(str(pick.get("game_time", "")))
+        if season_year not in seasons:
+            seasons[season_year] = _build_season_index(season_year, verbose=verbose)
+        season = seasons[season_year]
+        if season is None:
+            continue
 
+        hours_ago = (now_et - game_dt_et).total_seconds() / 3600.0
         target_date = game_dt_et.strftime("%Y-%m-%d")
         player_name = str(pick.get("player", ""))
         team_name = str(pick.get("team", ""))
-        
+
         # Resolve Abbr: Handle both "Buffalo Bills" and "BUF"
         team_abbr = None
         if team_name:
-            if team_name.upper() in ABBR_TO_TEAM_NAME: # Already an abbr
+            if team_name.upper() in ABBR_TO_TEAM_NAME:  # Already an abbr
                 team_abbr = team_name.upper()
-            else: # Try mapping from full name
+            else:  # Try mapping from full name
                 team_abbr = TEAM_NAME_TO_ABBR.get(team_name)
-        
+
         prop_line = _safe_float(pick.get("prop_line"))
         bet_type = str(pick.get("bet_type", "")).lower()
         if prop_line is None or bet_type not in {"over", "under"}:
             continue
 
-        # Candidate match: first/last
         p_first, p_last = _name_first_last(player_name)
         if not p_first or not p_last:
             continue
 
-        # Map gameday -> week using schedules, then filter player stats by that week.
-        sched_day = sched_df[sched_df["gameday"].astype(str) == target_date]
-        if getattr(sched_day, "empty", False):
-            # If too old, void it
+        if target_date not in season.dates:
+            # No games that day; if too old, void it
             if hours_ago >= hours_after_game_to_void:
-                pick["status"] = "push"
-                pick["result"] = "VOID"
-                pick[spec.actual_field] = None
-                pick["updated_at"] = now_et.isoformat()
-                updated += 1
+                _void(pick, spec, now_et)
+                books[stat_kind]["updated"] += 1
             continue
 
-        if team_abbr:
-            sched_team = sched_day[(sched_day["home_team"] == team_abbr) | (sched_day["away_team"] == team_abbr)]
-            if not getattr(sched_team, "empty", False):
-                sched_day = sched_team
-            else:
-                # Specific game not found for this team on this day - could be a TNF/MNF date mismatch
-                # or the pick has the wrong team assigned.
-                continue
-        else:
-            # If no team_abbr, we can't reliably know which game is theirs.
-            # Avoid grading until we have a team.
+        # Without a team (or with no game for it that day - TNF/MNF mismatch or
+        # wrong team on the pick) we can't know which game is theirs
+        game = season.games.get((target_date, team_abbr)) if team_abbr else None
+        if game is None:
             continue
 
-        # Check if game appears completed (has scores)
-        # Must be after game start AND have significantly non-None scores.
-        # Use 3.5 hours as a conservative guess for NFL game length.
+        # Finished = scores posted 3h+ after kickoff, or an explicit final status
         game_finished = False
-        try:
-            row = sched_day.iloc[0]
-            home_s = _safe_float(row.get("home_score"))
-            away_s = _safe_float(row.get("away_score"))
-            
-            # If it has scores and it's been at least 3 hours since kickoff, it's likely finished.
-            if hours_ago > 3.0 and home_s is not None and away_s is not None:
-                game_finished = True
-            # Alternatively, check for a status column if it exists in nflreadpy
-            elif str(row.get("game_status", "")).lower() in ["closed", "final", "official"]:
-                game_finished = True
-        except Exception:
-            pass
-
-        # If game is finished, we can grade immediately.
-        # If not finished, we wait at least hours_after_game_to_grade (default 4)
+        home_s = _safe_float(game.get("home_score"))
+        away_s = _safe_float(game.get("away_score"))
+        if hours_ago > 3.0 and home_s is not None and away_s is not None:
+            game_finished = True
+        elif str(game.get("game_status", "")).lower() in ["closed", "final", "official"]:
+            game_finished = True
+
+        # Finished games grade immediately; otherwise wait hours_after_game_to_grade
         effective_buffer = 0.1 if game_finished else hours_after_game_to_grade
-        
         if hours_ago < effective_buffer:
             continue
 
-        week_val = _safe_float(sched_day.iloc[0].get("week"))
+        week_val = _safe_float(game.get("week"))
         if week_val is None:
             continue
         week = int(week_val)
 
         # --- ALPHA: Try Sleeper Grading First (Real-time) ---
-        sleeper_graded = False
         try:
             if (season_year, week) not in weekly_stats_cache:
                 weekly_stats_cache[(season_year, week)] = sleeper.get_weekly_stats(season_year, week)
-            
             stats = weekly_stats_cache[(season_year, week)]
-            pid = sleeper.get_player_id(player_name)
-            
+            pid = player_ids.get(player_name)
             if pid and pid in stats:
                 actual = sleeper.get_player_stat(stats, pid, stat_kind)
                 if actual is not None:
-                    # Found stats in Sleeper!
-                    if actual == prop_line:
-                        pick["status"] = "push"
-                        pick["result"] = "PUSH"
-                    else:
-                        if stat_kind == "anytime_td":
-                             is_win = actual >= 1
-                        elif bet_type == "over":
-                            is_win = actual > prop_line
-                        else:
-                            is_win = actual < prop_line
-                        pick["status"] = "win" if is_win else "loss"
-                        pick["result"] = "WIN" if is_win else "LOSS"
-                    
-                    pick[spec.actual_field] = float(actual)
-                    pick["updated_at"] = now_et.isoformat()
-                    
-                    # Profit/Loss logic
-                    odds = pick.get('opening_odds') or pick.get('odds', -110)
-                    if pick['status'] == 'win':
-                        p_l = int(odds) if odds > 0 else int((100.0 / abs(odds)) * 100)
-                        pick['profit_loss'] = p_l
-                    elif pick['status'] == 'loss':
-                        pick['profit_loss'] = -100
-                    else:
-                        pick['profit_loss'] = 0
-                        
-                    updated += 1
-                    sleeper_graded = True
+                    _settle(pick, spec, actual, prop_line, bet_type, now_et)
+                    books[stat_kind]["updated"] += 1
                     if verbose:
                         print(f"⚡ {stat_kind} graded via Sleeper: {player_name} {bet_type.upper()} {prop_line} -> {actual} ({pick['result']})")
+                    continue
         except Exception as e:
             if verbose:
                 print(f"⚠️ Sleeper grading failed for {player_name}: {e}")
 
-        if sleeper_graded:
-            continue
-
         # --- BETA: Fallback to nflreadpy (Robust/Official) ---
-        df_week = df[(df["season"] == season_year) & (df["week"] == week)]
-        if team_abbr and "team" in getattr(df_week, "columns", []):
-            df_week = df_week[df_week["team"].astype(str) == team_abbr]
-
-        # Find player row
-        try:
-            player_series = df_week[player_col].astype(str)
-        except Exception:
-            player_series = df_week[player_col]
-
-        def _matches(n: str) -> bool:
-            first, last = _name_first_last(n)
-            return (first == p_first and last == p_last) or (last == p_last and first.startswith(p_first[:1]))
-
-        match_idx = None
-        for idx, n in enumerate(list(player_series)):
-            if _matches(str(n)):
-                match_idx = idx
-                break
-
-        if match_idx is None:
-            # If game is finished AND it's been a few hours since kickoff, and player not found -> DNP -> Void
-            # We wait 6.0 hours total (roughly 3 hours after game ends) to be safe vs data lag.
+        row = season.find_player_row(week, team_abbr, player_name)
+        if row is None:
+            # Player not in a finished game -> DNP -> Void. Wait 6h after kickoff
+            # (roughly 3h after the game ends) to be safe vs data lag.
             if (game_finished and hours_ago >= 6.0) or hours_ago >= hours_after_game_to_void:
-                pick["status"] = "push" # void
-                pick["result"] = "VOID"
-                pick[spec.actual_field] = None
-                pick["updated_at"] = now_et.isoformat()
-                updated += 1
+                _void(pick, spec, now_et)
+                books[stat_kind]["updated"] += 1
                 if verbose:
                     print(f"⚠ {player_name} not found in finished game -> VOID")
             continue
 
-        row = df_week.iloc[match_idx]
         if spec.stat_kind == "anytime_td":
-             # Special logic: Sum rushing_tds + receiving_tds
-             rush_td = _find_stat_value(row, ["rushing_tds", "rush_td"]) or 0
-             rec_td = _find_stat_value(row, ["receiving_tds", "rec_td"]) or 0
-             actual = float(rush_td + rec_td)
+            # Special logic: Sum rushing_tds + receiving_tds
+            rush_td = _find_stat_value(row, ["rushing_tds", "rush_td"]) or 0
+            rec_td = _find_stat_value(row, ["receiving_tds", "rec_td"]) or 0
+            actual = float(rush_td + rec_td)
         else:
             actual = _find_stat_value(row, spec.stat_candidates)
 
         if actual is None:
             if game_finished or hours_ago >= hours_after_game_to_void:
-                pick["status"] = "push"
-                pick["result"] = "VOID"
-                pick[spec.actual_field] = None
-                pick["updated_at"] = now_et.isoformat()
-                updated += 1
+                _void(pick, spec, now_et)
+                books[stat_kind]["updated"] += 1
                 if verbose:
                     print(f"⚠ {player_name} stats missing in finished game -> VOID")
             continue
 
-        # Determine W/L/PUSH
-        if actual == prop_line:
-            pick["status"] = "push"
-            pick["result"] = "PUSH"
-        else:
-            if spec.stat_kind == "anytime_td":
-                 # ATD is simple: If actual >= 1, WIN. Else LOSS (assuming line is 0.5 or implied 'anytime')
-                 # But usually ATD bets don't have a line like O/U 0.5, it's just "Anytime TD".
-                 # So if actual >= 1 it is a WIN.
-                 is_win = actual >= 1
-            elif bet_type == "over":
-                is_win = actual > prop_line
-            else:
-                is_win = actual < prop_line
-            pick["status"] = "win" if is_win else "loss"
-            pick["result"] = "WIN" if is_win else "LOSS"
-
-        pick[spec.actual_field] = float(actual)
-        pick["updated_at"] = now_et.isoformat()
-        
-        # Calculate profit/loss
-        odds = pick.get('opening_odds') or pick.get('odds', -110)
-        if pick['status'] == 'win':
-            if odds > 0:
-                pick['profit_loss'] = int(odds)  # e.g. +150 pays $150
-            else:
-                pick['profit_loss'] = int((100.0 / abs(odds)) * 100)  # e.g. -110 pays ~$91
-        elif pick['status'] == 'loss':
-            pick['profit_loss'] = -100
-        else:  # push
-            pick['profit_loss'] = 0
-        
-        updated += 1
-
+        _settle(pick, spec, actual, prop_line, bet_type, now_et)
+        books[stat_kind]["updated"] += 1
         if verbose:
             print(f"✓ {spec.stat_kind} graded: {player_name} {bet_type.upper()} {prop_line} -> {actual} ({pick['result']})")
 
-    if updated > 0:
-        _save_json(tracking_path, tracking_data)
-    return updated
+    for book in books.values():
+        if book["updated"] > 0:
+            _save_json(book["path"], book["data"])
+    return {k: b["updated"] for k, b in books.items()}
+
 
+def grade_props_tracking_file(
+    tracking_file: str | Path,
+    *,
+    stat_kind: str,
+    hours_after_game_to_grade: float = 4.0,
+    hours_after_game_to_void: float = 36.0,
+    verbose: bool = True,
+) -> int:
+    """
+    Grade pending picks in one tracking file using Sleeper / nflreadpy stats.
+
+    - If a pick is older than hours_after_game_to_grade, attempt to fetch its stat.
+    - If stat still can't be found and the pick is older than hours_after_game_to_void,
+      mark as PUSH/VOID (so it doesn't stay pending forever).
+
+    Prefer grade_all_props() when grading several markets.
+    """
+    return grade_all_props(
+        {stat_kind: tracking_file},
+        hours_after_game_to_grade=hours_after_game_to_grade,
+        hours_after_game_to_void=hours_after_game_to_void,
+        verbose=verbose,
+    )[stat_kind]
@@ -14,10 +14,22 @@ STATS_CACHE_DIR = os.path.join(CACHE_DIR, "stats")
 if not os.path.exists(STATS_CACHE_DIR):
     os.makedirs(STATS_CACHE_DIR)
 
+PLAYER_INDEX_FILE = os.path.join(CACHE_DIR, "sleeper_player_index.json")
+STATE_CACHE_FILE = os.path.join(CACHE_DIR, "sleeper_state.json")
+
+
+def normalize_name(name):
+    """Lowercase and strip periods/apostrophes ("D'Andre Swift Jr." -> "dandre swift jr")."""
+    return (name or '').lower().replace(".", "").replace("'", "").strip()
+
+
 class SleeperClient:
     def __init__(self):
         self.base_url = "https://api.sleeper.app/v1"
         self._players = None
+        self._index = None
+        self._state = None
+        self._weekly_stats = {}
 
     def _get_all_players(self):
         """Fetch all players and cache them locally for 24 hours."""
@@ -33,37 +45,118 @@ class SleeperClient:
             players = response.json()
             with open(PLAYER_CACHE_FILE, 'w') as f:
                 json.dump(players, f)
+            self._save_index(self._build_index(players))
             return players
         return {}
 
-    def get_player_id(self, name):
-        """Find player ID by name (case-insensitive)."""
+    @staticmethod
+    def _build_index(players):
+        """
+        Name -> player_id maps, built once per player cache refresh.
+        'full' mirrors the exact full_name match, 'first_last' the first + last
+        fallback; the first player in payload order wins, as in a linear scan.
+        """
+        full, first_last = {}, {}
+        for pid, player in players.items():
+            full.setdefault(normalize_name(player.get('full_name', '')), pid)
+            first = (player.get('first_name') or '').lower()
+            last = (player.get('last_name') or '').lower()
+            first_last.setdefault(f"{first} {last}".replace(".", "").replace("'", ""), pid)
+        full.pop('', None)
+        return {'full': full, 'first_last': first_last}
+
+    @staticmethod
+    def _save_index(index):
+        with open(PLAYER_INDEX_FILE, 'w') as f:
+            json.dump(index, f)
+
+    def _get_index(self):
+        """Load the persisted name index, rebuilding it if the player cache is newer or stale."""
+        if self._index is not None:
+            return self._index
+
+        fresh = (
+            os.path.exists(PLAYER_INDEX_FILE)
+            and os.path.exists(PLAYER_CACHE_FILE)
+            and os.path.getmtime(PLAYER_INDEX_FILE) >= os.path.getmtime(PLAYER_CACHE_FILE)
+            and datetime.now() - datetime.fromtimestamp(os.path.getmtime(PLAYER_CACHE_FILE)) < timedelta(hours=24)
+        )
+        if fresh:
+            with open(PLAYER_INDEX_FILE, 'r') as f:
+                self._index = json.load(f)
+            return self._index
+
         if self._players is None:
             self._players = self._get_all_players()
+        self._index = self._build_index(self._players)
+        if self._players:
+            self._save_index(self._index)
+        return self._index
 
-        normalized_name = name.lower().replace(".", "").replace("'", "").strip()
-        
-        # Exact match first
-        for pid, player in self._players.items():
-            full_name = player.get('full_name', '').lower().replace(".", "").replace("'", "").strip()
-            if full_name == normalized_name:
-                return pid
-        
-        # Partial match fallback
-        for pid, player in self._players.items():
-            first = player.get('first_name', '').lower()
-            last = player.get('last_name', '').lower()
-            if f"{first} {last}".replace(".", "").replace("'", "") == normalized_name:
-                return pid
-        
-        return None
+    def get_player_id(self, name):
+        """Find player ID by name (case-insensitive)."""
+        index = self._get_index()
+        normalized_name = normalize_name(name)
+        return index['full'].get(normalized_name) or index['first_last'].get(normalized_name)
+
+    def get_player_ids(self, names):
+        """Batch lookup: {name: player_id or None} using the same matching as get_player_id."""
+        return {name: self.get_player_id(name) for name in set(names)}
+
+    def _get_state(self):
+        """League state (current season/week), cached for an hour."""
+        if self._state is not None:
+            return self._state
+        if os.path.exists(STATE_CACHE_FILE):
+            mtime = os.path.getmtime(STATE_CACHE_FILE)
+            if datetime.now() - datetime.fromtimestamp(mtime) < timedelta(hours=1):
+                with open(STATE_CACHE_FILE, 'r') as f:
+                    self._state = json.load(f)
+                    return self._state
+        try:
+            response = requests.get(f"{self.base_url}/state/nfl", timeout=10)
+            if response.status_code == 200:
+                self._state = response.json()
+                with open(STATE_CACHE_FILE, 'w') as f:
+                    json.dump(self._state, f)
+                return self._state
+        except requests.RequestException:
+            pass
+        self._state = {}
+        return self._state
+
+    def is_week_final(self, season_year, week):
+        """A week is final once the league state has moved past it."""
+        state = self._get_state()
+        try:
+            current_season = int(state.get('season'))
+            current_week = int(state.get('week'))
+        except (TypeError, ValueError):
+            return False
+        return int(season_year) < current_season or (int(season_year) == current_season and int(week) < current_week)
 
     def get_weekly_stats(self, season_year, week):
-        """Fetch stats for a given week."""
+        """
+        Fetch stats for a given week.
+
+        Live weeks are cached for 15 minutes. Once a week is final its stats are
+        saved to a `.final.json` file that is never re-downloaded.
+        """
+        key = (int(season_year), int(week))
+        if key in self._weekly_stats:
+            return self._weekly_stats[key]
+
+        final_file = os.path.join(STATS_CACHE_DIR, f"nfl_stats_{season_year}_{week}.final.json")
+        if os.path.exists(final_file):
+            with open(final_file, 'r') as f:
+                self._weekly_stats[key] = json.load(f)
+                return self._weekly_stats[key]
+
         cache_file = os.path.join(STATS_CACHE_DIR, f"nfl_stats_{season_year}_{week}.json")
-        
-        if os.path.exists(cache_file):
-            # Cache hourly during active games
+        is_final = self.is_week_final(season_year, week)
+
+        if os.path.exists(cache_file) and not is_final:
+            # Cache for 15 minutes during active games
             mtime = os.path.getmtime(cache_file)
             if datetime.now() - datetime.fromtimestamp(mtime) < timedelta(minutes=15):
                 with open(cache_file, 'r') as f:
@@ -73,8 +166,15 @@ class SleeperClient:
         response = requests.get(url)
         if response.status_code == 200:
             stats = response.json()
-            with open(cache_file, 'w') as f:
-                json.dump(stats, f)
+            if is_final and stats:
+                with open(final_file, 'w') as f:
+                    json.dump(stats, f)
+                if os.path.exists(cache_file):
+                    os.remove(cache_file)
+                self._weekly_stats[key] = stats
+            else:
+                with open(cache_file, 'w') as f:
+                    json.dump(stats, f)
             return stats
         return {}
 
@@ -108,6 +208,13 @@ class SleeperClient:
             
         return player_stats.get(sleeper_key)
 
+    def get_player_stats_batch(self, season_year, week, names, stat_key):
+        """Batch lookup: {name: stat value or None} for one week and stat."""
+        stats = self.get_weekly_stats(season_year, week)
+        ids = self.get_player_ids(names)
+        return {name: self.get_player_stat(stats, pid, stat_key) if pid in stats else None
+                for name, pid in ids.items()}
+
 if __name__ == "__main__":
     client = SleeperClient()
     # Test with Joe Burrow (Week 15)
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Shared Pick Table
+-----------------
+One loader and one set of rollups for everything that reports across models:
+the unified dashboards, the best plays bot and the tracking health check.
+
+Every tracking file in `SOURCES` is read once (archive partitions included)
+and kept in a cache keyed by the files' mtimes, so a second dashboard in the
+same process, or the next cycle of a long-running process, only re-reads the
+files that changed. The picks are normalized into one table, and a single
+pass over it fills every rollup the reports use:
+
+    per model       total / wins / losses / pushes / pending / profit,
+                    today's and yesterday's W-L, picks missing a game time,
+                    pending picks per player (duplicates)
+    per team        W-L and profit on settled picks backing that team
+                    (spread/total picks name it; props use the player's team)
+
+Views merge the per-model rollups for any set of models:
+
+    table = load_table()
+    table.rows_for(DASHBOARD_MODELS)            # normalized picks
+    table.summary(DASHBOARD_MODELS)             # {'total', 'wins', ..., 'win_rate', 'record'}
+    table.sport_summaries(DASHBOARD_MODELS)     # {'NBA': {...}, 'NCAAB': {...}}
+    table.team_stats(DASHBOARD_MODELS)          # {'Boston Celtics': {'wins', 'losses', 'profit'}}
+    table.models['NBA Main']                    # one model's rollup
+    source_picks('nba/nba_picks_tracking.json') # raw picks, same cache
+
+Statuses are normalized to win / loss / push / void / pending ("won" and
+"Pending" count like "win" and "pending"). Profit is in cents (`profit_loss`,
+or `profit` where a model only writes that).
+
+Usage (print every model's rollup and the load time):
+    python3 pick_table.py
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional
+
+import pytz
+
+try:
+    from tracking_archive import list_partitions, load_tracking, pick_datetime
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from tracking_archive import list_partitions, load_tracking, pick_datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ET = pytz.timezone('US/Eastern')
+
+
+@dataclass(frozen=True)
+class PickSource:
+    name: str
+    path: str  # relative to the repo root
+    sport: str
+    category: str  # 'Props', 'Spread/Total', 'Total'
+    model_type: str  # 'spreads_totals' or '<stat>_props'
+    prop_label: str = ''  # stat shown in a prop's description ("3PT", "Rec Yds")
+
+
+SOURCES = [
+    PickSource('NBA Points Props', 'nba/nba_points_props_tracking.json', 'NBA', 'Props', 'points_props', 'PTS'),
+    PickSource('NBA Assists Props', 'nba/nba_assists_props_tracking.json', 'NBA', 'Props', 'assists_props', 'AST'),
+    PickSource('NBA Rebounds Props', 'nba/nba_rebounds_props_tracking.json', 'NBA', 'Props', 'rebounds_props', 'REB'),
+    PickSource('NBA 3PT Props', 'nba/nba_3pt_props_tracking.json', 'NBA', 'Props', '3pt_props', '3PT'),
+    PickSource('NFL Passing Yards', 'nfl/nfl_passing_yards_props_tracking.json', 'NFL', 'Props',
+               'passing_yards_props', 'Pass Yds'),
+    PickSource('NFL Rushing Yards', 'nfl/nfl_rushing_yards_props_tracking.json', 'NFL', 'Props',
+               'rushing_yards_props', 'Rush Yds'),
+    PickSource('NFL Receiving Yards', 'nfl/nfl_receiving_yards_props_tracking.json', 'NFL', 'Props',
+               'receiving_yards_props', 'Rec Yds'),
+    PickSource('NFL Receptions', 'nfl/nfl_receptions_props_tracking.json', 'NFL', 'Props', 'receptions_props', 'Rec'),
+    PickSource('NBA Main', 'nba/nba_picks_tracking.json', 'NBA', 'Spread/Total', 'spreads_totals'),
+    PickSource('NFL Main', 'nfl/nfl_picks_tracking.json', 'NFL', 'Spread/Total', 'spreads_totals'),
+    PickSource('NCAAB', 'ncaa/ncaab_picks_tracking.json', 'NCAAB', 'Spread/Total', 'spreads_totals'),
+    PickSource('Soccer', 'soccer/soccer_picks_tracking.json', 'Soccer', 'Total', 'spreads_totals'),
+]
+SOURCES_BY_NAME = {s.name: s for s in SOURCES}
+
+# What the unified dashboards show
+DASHBOARD_MODELS = ['NBA Main', 'NBA 3PT Props', 'NCAAB']
+
+STATUS_ALIASES = {'won': 'win', 'lost': 'loss', 'cancelled': 'void', 'refunded': 'void'}
+
+# path -> (file signature, picks, error)
+_picks_cache: dict[str, tuple[Any, list[dict[str, Any]], Optional[str]]] = {}
+_table: Optional[tuple[Any, 'PickTable']] = None
+
+
+def _full_path(path: str) -> str:
+    return path if os.path.isabs(path) else os.path.join(SCRIPT_DIR, path)
+
+
+def _signature(full_path: str) -> Any:
+    """(mtime, size) of the tracking file and each archive partition; None when missing."""
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        return None
+    sig = [(full_path, st.st_mtime_ns, st.st_size)]
+    for part in list_partitions(full_path):
+        try:
+            pst = part.stat()
+        except OSError:
+            continue
+        sig.append((str(part), pst.st_mtime_ns, pst.st_size))
+    return tuple(sig)
+
+
+def _load(path: str) -> tuple[list[dict[str, Any]], Optional[str]]:
+    full_path = _full_path(path)
+    sig = _signature(full_path)
+    cached = _picks_cache.get(full_path)
+    if cached and cached[0] == sig:
+        return cached[1], cached[2]
+    picks, error = [], None
+    if sig is None:
+        error = 'File not found'
+    else:
+        try:
+            data = load_tracking(full_path, full_history=True)
+            picks = [p for p in data.get('picks', []) if isinstance(p, dict)]
+        except Exception as e:
+            error = str(e)
+    _picks_cache[full_path] = (sig, picks, error)
+    return picks, error
+
+
+def source_picks(path: str) -> list[dict[str, Any]]:
+    """Raw picks of a tracking file, full history (cached until the file changes)."""
+    return _load(path)[0]
+
+
+def normalize_status(status: Any) -> str:
+    status = str(status or 'pending').strip().lower()
+    return STATUS_ALIASES.get(status, status)
+
+
+def _clean_pick_text(text: Any) -> str:
+    return str(text or '').replace('✅', '').replace('❌', '').replace('BET:', '').strip()
+
+
+def normalize_pick(pick: dict[str, Any], source: PickSource) -> dict[str, Any]:
+    """One row of the table: the fields every report uses, whatever the model's format."""
+    profit = pick.get('profit_loss')
+    if profit is None:
+        profit = pick.get('profit')
+    dt = pick_datetime(pick)
+    row = {
+        'sport': source.sport,
+        'model': source.name,
+        'model_type': source.model_type,
+        'category': source.category,
+        'pick_id': pick.get('pick_id', ''),
+        'status': normalize_status(pick.get('status')),
+        'game_date': pick.get('game_time') or pick.get('game_date') or pick.get('commence_time'),
+        'et_date': dt.astimezone(ET).strftime('%Y-%m-%d') if dt else None,
+        'matchup': '',
+        'pick_description': '',
+        'pick_type': '',
+        'odds': pick.get('odds') if pick.get('odds') is not None else -110,
+        'edge': pick.get('edge'),
+        'ai_score': pick.get('ai_score'),
+        'result': pick.get('result'),
+        'profit_loss': profit or 0,
+        'home_team': pick.get('home_team') or '',
+        'away_team': pick.get('away_team') or '',
+        'player': pick.get('player') or '',
+        'team': pick.get('team') or '',
+    }
+    if source.category == 'Props':
+        bet_type = str(pick.get('bet_type') or 'over').upper()
+        line = pick.get('prop_line', pick.get('line', ''))
+        row.update({
+            'matchup': f"{row['team']} vs {pick.get('opponent') or ''}",
+            'pick_description': f"{row['player'] or 'Unknown'} {bet_type} {line} {source.prop_label}".strip(),
+            'pick_type': 'Player Prop',
+        })
+    else:
+        matchup = pick.get('matchup')
+        if not matchup and row['away_team'] and row['home_team']:
+            matchup = f"{row['away_team']} @ {row['home_team']}"
+        pick_type = pick.get('pick_type') or pick.get('bet_type') or 'Unknown'
+        row.update({
+            'matchup': matchup or '',
+            'pick_description': _clean_pick_text(pick.get('pick_text') or pick.get('pick')
+                                                 or pick.get('recommendation')),
+            'pick_type': pick_type.capitalize() if isinstance(pick_type, str) else pick_type,
+        })
+    return row
+
+
+def bet_team(row: dict[str, Any]) -> Optional[str]:
+    """The team a settled pick was backing: named in a spread/total pick, the player's team for props."""
+    desc = row['pick_description']
+    if row['home_team'] and row['home_team'] in desc:
+        return row['home_team']
+    if row['away_team'] and row['away_team'] in desc:
+        return row['away_team']
+    return row['team'] or None
+
+
+def _counts() -> dict[str, Any]:
+    return {'total': 0, 'wins': 0, 'losses': 0, 'pushes': 0, 'pending': 0, 'profit_loss': 0}
+
+
+def _finish(counts: dict[str, Any]) -> dict[str, Any]:
+    decided = counts['wins'] + counts['losses']
+    return dict(counts,
+                win_rate=(counts['wins'] / decided * 100) if decided else 0,
+                record=f"{counts['wins']}-{counts['losses']}")
+
+
+def _merge(into: dict[str, Any], counts: dict[str, Any]):
+    for key in ('total', 'wins', 'losses', 'pushes', 'pending', 'profit_loss'):
+        into[key] += counts[key]
+
+
+class ModelRollup:
+    """Everything the reports need about one tracking file, filled in the table's single pass."""
+
+    def __init__(self, source: PickSource, exists: bool, error: Optional[str]):
+        self.source = source
+        self.exists = exists
+        self.error = error
+        self.rows: list[dict[str, Any]] = []
+        self.counts = _counts()
+        self.days = {'today': {'wins': 0, 'losses': 0}, 'yesterday': {'wins': 0, 'losses': 0}}
+        self.missing_game_time = 0
+        self.pending_players: Counter = Counter()
+        self.teams: dict[str, dict[str, Any]] = {}
+
+    @property
+    def summary(self) -> dict[str, Any]:
+        return _finish(self.counts)
+
+    def add(self, row: dict[str, Any], today: str, yesterday: str):
+        self.rows.append(row)
+        counts = self.counts
+        counts['total'] += 1
+        counts['profit_loss'] += row['profit_loss']
+        status = row['status']
+        if status == 'pending':
+            counts['pending'] += 1
+            self.pending_players[row['player'] or 'unknown'] += 1
+            return
+        if status == 'push':
+            counts['pushes'] += 1
+            return
+        if status not in ('win', 'loss'):
+            return
+        counts['wins' if status == 'win' else 'losses'] += 1
+        if row['et_date'] in (today, yesterday):
+            day = self.days['today' if row['et_date'] == today else 'yesterday']
+            day['wins' if status == 'win' else 'losses'] += 1
+        team = bet_team(row)
+        if team:
+            stats = self.teams.setdefault(team, {'wins': 0, 'losses': 0, 'profit': 0})
+            stats['wins' if status == 'win' else 'losses'] += 1
+            stats['profit'] += row['profit_loss']
+
+
+class PickTable:
+    """Normalized picks of every source, with per-model rollups built in one pass."""
+
+    def __init__(self, sources: Iterable[PickSource] = SOURCES, now: Optional[datetime] = None):
+        now = (now or datetime.now(ET)).astimezone(ET)
+        self.today = now.strftime('%Y-%m-%d')
+        self.yesterday = (now - timedelta(days=1)).strftime('%Y-%m-%d')
+        self.models: dict[str, ModelRollup] = {}
+        for source in sources:
+            picks, error = _load(source.path)
+            rollup = ModelRollup(source, exists=os.path.exists(_full_path(source.path)), error=error)
+            for pick in picks:
+                row = normalize_pick(pick, source)
+                if not (pick.get('game_time') or pick.get('game_date')):
+                    rollup.missing_game_time += 1
+                rollup.add(row, self.today, self.yesterday)
+            self.models[source.name] = rollup
+
+    def _selected(self, models: Optional[Iterable[str]]) -> list[ModelRollup]:
+        if models is None:
+            return list(self.models.values())
+        return [self.models[name] for name in models if name in self.models]
+
+    def rows_for(self, models: Optional[Iterable[str]] = None) -> list[dict[str, Any]]:
+        rows = []
+        for rollup in self._selected(models):
+            rows.extend(rollup.rows)
+        return rows
+
+    def summary(self, models: Optional[Iterable[str]] = None) -> dict[str, Any]:
+        counts = _counts()
+        for rollup in self._selected(models):
+            _merge(counts, rollup.counts)
+        return _finish(counts)
+
+    def sport_summaries(self, models: Optional[Iterable[str]] = None) -> dict[str, dict[str, Any]]:
+        """Per-sport summary, in the order sports first appear; sports with no picks are left out."""
+        by_sport: dict[str, dict[str, Any]] = {}
+        for rollup in self._selected(models):
+            if rollup.counts['total']:
+                _merge(by_sport.setdefault(rollup.source.sport, _counts()), rollup.counts)
+        return {sport: _finish(counts) for sport, counts in by_sport.items()}
+
+    def team_stats(self, models: Optional[Iterable[str]] = None) -> dict[str, dict[str, Any]]:
+        teams: dict[str, dict[str, Any]] = {}
+        for rollup in self._selected(models):
+            for team, stats in rollup.teams.items():
+                into = teams.setdefault(team, {'wins': 0, 'losses': 0, 'profit': 0})
+                for key in into:
+                    into[key] += stats[key]
+        return teams
+
+
+def load_table(sources: Iterable[PickSource] = SOURCES) -> PickTable:
+    """The shared table; rebuilt only when a source file changes or the ET date rolls."""
+    global _table
+    sources = tuple(sources)
+    key = (sources, datetime.now(ET).strftime('%Y-%m-%d'),
+           tuple(_signature(_full_path(s.path)) for s in sources))
+    if _table is None or _table[0] != key:
+        _table = (key, PickTable(sources))
+    return _table[1]
+
+
+def main():
+    import time
+
+    start = time.perf_counter()
+    table = load_table()
+    cold_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    load_table()
+    warm_ms = (time.perf_counter() - start) * 1000
+
+    for name, rollup in table.models.items():
+        s = rollup.summary
+        flag = f"  ⚠️ {rollup.error}" if rollup.error else ''
+        print(f"{name:22} {s['record']:>9} ({s['win_rate']:5.1f}%)  pending {s['pending']:3}  "
+              f"P/L {s['profit_loss'] / 100:+8.2f}u{flag}")
+    overall = table.summary()
+    print(f"\n📊 {overall['total']} picks, {overall['record']} ({overall['win_rate']:.1f}%) "
+          f"across {len(table.models)} models")
+    print(f"⏱️  first load {cold_ms:.0f} ms, cached {warm_ms:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
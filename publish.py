@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Site Publisher
+--------------
+Regenerates every page the site serves in one process, from one load:
+
+    props pages         NBA / NFL props and ATD pages, rebuilt from tracking
+    tracking pages      NBA, NCAAB, NFL and soccer tracking dashboards
+    best_plays.html     best plays, fire/solid record and breakdown
+    unified dashboards  unified, interactive (plus its data JSON) and premium
+
+First the load phase: model modules are imported once (model_registry.py), the
+shared asset bundles are built (site_assets.py) and every tracking file is
+read into the shared pick table (pick_table.py). Best plays and the unified
+dashboards render from that table; the model pages render through the same
+registry entry points the auto-grader uses.
+
+Then every page is one job in a single worker pool. A job digests its inputs
+before rendering (render_manifest.py): a page whose inputs are unchanged is
+neither rendered nor written, so git sees no change. Pages rendered here are
+also compared with the file on disk and written only when the bytes differ.
+The report lists each page's status and time, then the load and wall time.
+
+Nothing is graded and no odds are fetched; prediction pages such as
+nba/nba_model_output.html still come from running the model itself.
+
+Usage:
+    python3 publish.py                 # changed pages only
+    python3 publish.py --force         # re-render every page
+    python3 publish.py --only nba      # pages whose name contains "nba"
+    python3 publish.py --workers 1     # one page at a time
+    python3 publish.py --list          # list the pages and exit
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import pick_table
+import unified_dashboard
+import unified_dashboard_interactive
+import unified_dashboard_premium
+from auto_grader import (MANIFEST, REGISTRY, page_digest, render_nba_props_page,
+                         render_nfl_props_page, render_tracking_page)
+from render_manifest import write_if_changed
+from site_assets import asset_version
+
+DEFAULT_WORKERS = min(8, os.cpu_count() or 4)
+
+# ANSI Colors
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    CYAN = '\033[96m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+
+@dataclass(frozen=True)
+class Page:
+    name: str
+    model: Optional[str]  # registry model the page needs imported, if any
+    run: Callable[[bool], bool]  # run(force) -> True if written, False if current
+
+
+@dataclass
+class PageResult:
+    name: str
+    status: str  # 'written' | 'current' | 'error'
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def _tracking_page(name: str) -> Callable[[bool], bool]:
+    def run(force: bool) -> bool:
+        mod = REGISTRY.load(name)
+        # soccer names its tracking file TRACKING_FILE
+        tracking_file = getattr(mod, 'PICKS_TRACKING_FILE', None) or mod.TRACKING_FILE
+        return render_tracking_page(name, mod.TRACKING_HTML_FILE, tracking_file, force=force)
+    return run
+
+
+def _props_page(name: str) -> Callable[[bool], bool]:
+    render = render_nba_props_page if REGISTRY.spec(name).sport == 'nba' else render_nfl_props_page
+
+    def run(force: bool) -> bool:
+        updated = render(name, force=force)
+        if updated is None:
+            raise RuntimeError(f"{name} has no props page entry points")
+        return updated
+    return run
+
+
+def _best_plays(force: bool) -> bool:
+    bot = REGISTRY.load('best_plays_bot')
+    plays, fire_record, breakdown = bot.build_page()
+    digest = page_digest(bot, bot.OUTPUT_HTML, plays, fire_record, breakdown, force=force)
+    if digest is None:
+        return False
+    write_if_changed(bot.OUTPUT_HTML, bot.generate_html(plays, fire_record, breakdown))
+    MANIFEST.record(bot.OUTPUT_HTML, digest)
+    return True
+
+
+def _dashboard_digest(mod, data: dict, force: bool) -> Optional[str]:
+    # `generated_at` changes every run; the page only needs rewriting when the picks do
+    inputs = {k: v for k, v in data.items() if k != 'generated_at'}
+    return page_digest(mod, mod.OUTPUT_HTML, inputs, force=force)
+
+
+def _unified(force: bool) -> bool:
+    mod = unified_dashboard
+    data = mod.aggregate_all_picks(pick_table.load_table())
+    digest = _dashboard_digest(mod, data, force)
+    if digest is None:
+        return False
+    write_if_changed(mod.OUTPUT_HTML, mod.generate_unified_html(data))
+    MANIFEST.record(mod.OUTPUT_HTML, digest)
+    return True
+
+
+def _interactive(force: bool) -> bool:
+    mod = unified_dashboard_interactive
+    data = mod.aggregate_all_picks(pick_table.load_table())
+    digest = _dashboard_digest(mod, data, force)
+    if digest is None:
+        return False
+    mod.save_json_data(data)
+    write_if_changed(mod.OUTPUT_HTML, mod.generate_interactive_html(data))
+    MANIFEST.record(mod.OUTPUT_HTML, digest)
+    return True
+
+
+def _premium(force: bool) -> bool:
+    mod = unified_dashboard_premium
+    table = pick_table.load_table()
+    picks = mod.load_tracking_data(table)
+    stats = table.summary(pick_table.DASHBOARD_MODELS)
+    digest = page_digest(mod, mod.OUTPUT_HTML, picks, stats, force=force)
+    if digest is None:
+        return False
+    write_if_changed(mod.OUTPUT_HTML, mod.generate_html(picks, stats))
+    MANIFEST.record(mod.OUTPUT_HTML, digest)
+    return True
+
+
+def site_pages() -> list[Page]:
+    """Every page publish renders, model pages first (they take longest)."""
+    pages = []
+    for name, spec in REGISTRY.specs.items():
+        if spec.sport in ('nba', 'nfl') and spec.stats and spec.render:
+            pages.append(Page(name, name, _props_page(name)))
+    for name, spec in REGISTRY.specs.items():
+        if spec.tracking:
+            pages.append(Page(f"{name} (tracking)", name, _tracking_page(name)))
+    pages.append(Page('best_plays', 'best_plays_bot', _best_plays))
+    pages.append(Page('unified_dashboard', None, _unified))
+    pages.append(Page('unified_dashboard_interactive', None, _interactive))
+    pages.append(Page('unified_dashboard_premium', None, _premium))
+    return pages
+
+
+def load(pages: list[Page]) -> tuple[dict[str, str], dict[str, float]]:
+    """Import the models the pages need, build the asset bundles, load the pick table."""
+    errors, timings = {}, {}
+
+    start = time.perf_counter()
+    for model in dict.fromkeys(p.model for p in pages if p.model):
+        try:
+            REGISTRY.load(model)
+        except (Exception, SystemExit) as e:
+            # Some models exit at import time (e.g. no ODDS_API_KEY); their pages fail, the rest publish
+            errors[model] = f"import failed: {e!r}"
+    timings['imports'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    asset_version()
+    timings['assets'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pick_table.load_table()
+    timings['pick table'] = time.perf_counter() - start
+    return errors, timings
+
+
+def run_page(page: Page, force: bool) -> PageResult:
+    start = time.perf_counter()
+    try:
+        written = page.run(force)
+        status = 'written' if written else 'current'
+        return PageResult(page.name, status, time.perf_counter() - start)
+    except Exception:
+        return PageResult(page.name, 'error', time.perf_counter() - start, traceback.format_exc())
+
+
+def publish(pages: list[Page], force: bool = False,
+            workers: int = DEFAULT_WORKERS) -> tuple[list[PageResult], dict[str, float]]:
+    """Load once, then render `pages` through one worker pool; results come back in page order."""
+    errors, load_timings = load(pages)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='publish') as pool:
+        futures = {p.name: pool.submit(run_page, p, force) for p in pages if p.model not in errors}
+        results = []
+        for page in pages:
+            if page.model in errors:
+                results.append(PageResult(page.name, 'error', error=errors[page.model]))
+            else:
+                results.append(futures[page.name].result())
+    MANIFEST.save()
+    return results, load_timings
+
+
+def format_page_report(results: list[PageResult], load_timings: dict[str, float], wall_seconds: float) -> str:
+    """One line per page, then the load phase and wall-clock vs. summed page time."""
+    lines = [f"{'page':<44} {'status':<8} {'seconds':>8}"]
+    for r in results:
+        lines.append(f"{r.name:<44} {r.status:<8} {r.seconds:>7.2f}s")
+    counts = {s: sum(1 for r in results if r.status == s) for s in ('written', 'current', 'error')}
+    load_total = sum(load_timings.values())
+    lines.append(f"{'load':<44} {'':<8} {load_total:>7.2f}s  ("
+                 + ', '.join(f"{k} {v:.2f}s" for k, v in load_timings.items()) + ")")
+    page_total = sum(r.seconds for r in results)
+    lines.append(f"{'wall':<44} {'':<8} {wall_seconds:>7.2f}s  (pages sum {page_total:.2f}s; "
+                 f"{counts['written']} written, {counts['current']} current, {counts['error']} failed)")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Regenerate every site page in one process')
+    parser.add_argument('--force', action='store_true', help='Re-render pages even when their inputs are unchanged')
+    parser.add_argument('--only', action='append', default=[], help='Only pages whose name contains this (repeatable)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Pages rendered at once (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--list', action='store_true', help='List the pages and exit')
+    args = parser.parse_args()
+
+    pages = [p for p in site_pages() if not args.only or any(o in p.name for o in args.only)]
+    if args.list:
+        for page in pages:
+            print(page.name)
+        return
+
+    print(f"{Colors.BOLD}{Colors.CYAN}📤 Publishing {len(pages)} pages ({args.workers} workers){Colors.END}")
+    start = time.perf_counter()
+    results, load_timings = publish(pages, force=args.force, workers=args.workers)
+    wall = time.perf_counter() - start
+
+    for r in results:
+        if r.status == 'error':
+            print(f"{Colors.RED}❌ {r.name}:{Colors.END}\n{r.error}")
+    print()
+    print(format_page_report(results, load_timings, wall))
+    if any(r.status == 'error' for r in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
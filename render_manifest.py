@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Render Manifest
+---------------
+Skips re-rendering a page whose inputs haven't changed since it was last
+written. Before rendering, the caller hashes what the page is built from
+(the picks it shows, its stats, the tracking history, the ET date for the
+TODAY/YESTERDAY blocks). If the digest matches the one recorded for that
+output file, the render and the write are skipped and the page on disk, with
+its embedded "last updated" time, is left alone, so git sees no change.
+
+The volatile bookkeeping lives in one small file, `render_manifest.json`:
+
+    {"nba/nba_points_props.html": {"hash": "3f9c...", "rendered_at": "...", "checked_at": "..."}}
+
+`rendered_at` is when the page last actually changed; `checked_at` is the last
+cycle that confirmed it was still current. Sport workers run in separate
+processes, so `save()` merges this process's entries into the file on disk
+under a lock instead of overwriting it.
+
+    manifest = RenderManifest()
+    digest = fingerprint(active_plays, stats, tracking_data['picks'], date_bucket())
+    if not manifest.is_current(OUTPUT_HTML, digest):
+        save_html(render(...))
+        manifest.record(OUTPUT_HTML, digest)
+    else:
+        manifest.mark_checked(OUTPUT_HTML)
+    manifest.save()
+
+Usage (show what the manifest holds):
+    python3 render_manifest.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import pytz
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory lock, last writer wins
+    fcntl = None
+
+try:
+    from tracking_archive import list_partitions
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from tracking_archive import list_partitions
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+MANIFEST_FILE = SCRIPT_DIR / "render_manifest.json"
+
+ET = pytz.timezone('US/Eastern')
+
+
+def date_bucket(now: Optional[datetime] = None) -> str:
+    """ET calendar date; pages with TODAY/YESTERDAY blocks go stale when it rolls."""
+    return (now or datetime.now(ET)).astimezone(ET).strftime('%Y-%m-%d')
+
+
+def fingerprint(*inputs: Any) -> str:
+    """Stable digest of JSON-like inputs (dict key order doesn't matter)."""
+    payload = json.dumps(inputs, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_fingerprint(*paths: str | Path) -> str:
+    """Digest of the files' bytes; a missing file hashes as its name alone."""
+    digest = hashlib.sha256()
+    for path in paths:
+        path = Path(path)
+        digest.update(str(path.name).encode('utf-8'))
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b'\0missing')
+    return digest.hexdigest()
+
+
+def tracking_fingerprint(tracking_file: str | Path) -> str:
+    """Digest of a tracking file plus its archive partitions (see tracking_archive.py)."""
+    return file_fingerprint(tracking_file, *list_partitions(tracking_file))
+
+
+def write_if_changed(path: str | Path, data: str | bytes) -> bool:
+    """Write `data` to `path` unless the file already holds exactly that; True when written."""
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+class RenderManifest:
+    """Last-rendered input digest per output file, persisted in `render_manifest.json`."""
+
+    def __init__(self, path: str | Path = MANIFEST_FILE):
+        self.path = Path(path)
+        self.entries: dict[str, dict[str, str]] = self._read()
+        self._dirty: set[str] = set()
+
+    def _key(self, output: str | Path) -> str:
+        output = Path(output).resolve()
+        try:
+            return output.relative_to(SCRIPT_DIR).as_posix()
+        except ValueError:
+            return output.as_posix()
+
+    def _read(self) -> dict[str, dict[str, str]]:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def is_current(self, output: str | Path, digest: str) -> bool:
+        """True when `output` exists and was last rendered from inputs with this digest."""
+        entry = self.entries.get(self._key(output))
+        return bool(entry) and entry.get('hash') == digest and Path(output).exists()
+
+    def record(self, output: str | Path, digest: str):
+        """Note that `output` was just rendered from inputs with this digest."""
+        key = self._key(output)
+        now = _now()
+        self.entries[key] = {'hash': digest, 'rendered_at': now, 'checked_at': now}
+        self._dirty.add(key)
+
+    def mark_checked(self, output: str | Path):
+        """Note that `output` was found current this cycle."""
+        key = self._key(output)
+        if key in self.entries:
+            self.entries[key]['checked_at'] = _now()
+            self._dirty.add(key)
+
+    def save(self):
+        """Merge this process's changes into the manifest on disk."""
+        if not self._dirty:
+            return
+        with open(self.path.with_suffix('.lock'), 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            on_disk = self._read()
+            for key in self._dirty:
+                on_disk[key] = self.entries[key]
+            tmp = self.path.with_suffix('.json.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(on_disk, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+            self.entries = on_disk
+        self._dirty.clear()
+
+
+def main():
+    manifest = RenderManifest()
+    if not manifest.entries:
+        print(f"No pages recorded in {MANIFEST_FILE}")
+        return
+    for key, entry in sorted(manifest.entries.items()):
+        print(f"{key:50} rendered {entry.get('rendered_at', '?'):26} checked {entry.get('checked_at', '?')}")
+
+
+if __name__ == '__main__':
+    main()
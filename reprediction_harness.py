@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Historical Re-prediction Harness
+--------------------------------
+Fits the main models' hand-set weights (`HOME_COURT_ADVANTAGE`,
+`SEASON_WEIGHT` / `FORM_WEIGHT`, `BACK_TO_BACK_PENALTY`, `TOTAL_CALIBRATION`,
+...) against a season of results, offline.
+
+1. Team game logs (score and possessions per team per game) are turned into
+   as-of-date snapshots. Each game sees its teams' season, last-N and
+   home/road ratings from strictly earlier games only.
+2. For each candidate weight set, every historical game is re-predicted
+   with the model's own `calculate_model_spread` / `calculate_model_total`
+   (NBA) or `predict_game` (NCAAB). The functions are lifted out of the
+   model source, so no API keys or nba_api calls are needed. Weight sets run
+   in parallel on a process pool.
+3. Each set is scored on spread/total MAE against final scores. Where a
+   closing line is known (tracking files, or a --lines CSV), it is also
+   scored ATS and over/under.
+
+Only constants the prediction code actually reads can be swept. NCAAB's
+`PACE_ADJUSTMENT_WEIGHT`, `CONFERENCE_TIERS`, `SEASON_WEIGHT` / `FORM_WEIGHT`
+and the `SPLITS_WEIGHT`s are defined in the models but never used by the
+prediction functions, so they are rejected rather than reported as flat.
+NCAAB games are re-predicted from season ratings, as the model feeds
+`predict_game` season stats.
+
+Game logs:
+    NBA    fetched with nba_api LeagueGameLog, cached in nba/.cache/game_logs/
+    NCAAB  --logs CSV with game_id, date, team, home (1/0), pts and either
+           poss or fga, fta, oreb, tov
+
+Usage:
+    python3 reprediction_harness.py nba --season 2024-25 --grid HOME_COURT_ADVANTAGE=2:4:0.5 SEASON_WEIGHT=0.4:0.8:0.05
+    python3 reprediction_harness.py nba --grid BACK_TO_BACK_PENALTY=-4:0:0.5 TOTAL_CALIBRATION=0:14:2 --csv weights.csv
+    python3 reprediction_harness.py ncaab --logs ncaa/game_logs_2025.csv --grid HOME_COURT_ADVANTAGE=2:5:0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from backtest_sweep import parse_axis
+from team_resolver import TeamResolver
+from tracking_archive import load_tracking
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+NBA_LOG_CACHE = SCRIPT_DIR / "nba" / ".cache" / "game_logs"
+NBA_LOG_TTL = timedelta(hours=12)
+
+# Both teams need this many prior games before a game is re-predicted
+MIN_GAMES = 5
+MIN_SPLIT_GAMES = 3
+
+SPORTS = {
+    'nba': {
+        'model': SCRIPT_DIR / "nba" / "nba_model_IMPROVED.py",
+        'functions': ('normalize_team_name', 'get_team_name', 'is_back_to_back',
+                      'calculate_model_spread', 'calculate_model_total'),
+        'params': ('HOME_COURT_ADVANTAGE', 'SEASON_WEIGHT', 'FORM_WEIGHT', 'BACK_TO_BACK_PENALTY',
+                   'REST_ADVANTAGE_BONUS', 'TOTAL_CALIBRATION'),
+        'tracking': SCRIPT_DIR / "nba" / "nba_picks_tracking.json",
+    },
+    'ncaab': {
+        'model': SCRIPT_DIR / "ncaa" / "ncaab_model_2ndFINAL.py",
+        'functions': ('predict_game',),
+        'params': ('HOME_COURT_ADVANTAGE',),
+        'tracking': SCRIPT_DIR / "ncaa" / "ncaab_picks_tracking.json",
+    },
+}
+
+EASTERN = pytz.timezone('US/Eastern')
+
+
+# =========================
+# MODEL LOADING
+# =========================
+
+def load_model(sport: str) -> dict[str, Any]:
+    """
+    Exec the model's module-level constants, `Colors` and the prediction
+    functions in a fresh namespace (no imports of nba_api, no odds key).
+    """
+    cfg = SPORTS[sport]
+    path = cfg['model']
+    tree = ast.parse(path.read_text())
+    ns: dict[str, Any] = {
+        '__file__': str(path), 'os': os, 'json': json, 'datetime': datetime, 'timedelta': timedelta,
+        'TeamResolver': TeamResolver, 'print': lambda *args, **kwargs: None,
+    }
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and all(isinstance(t, ast.Name) and t.id.isupper() for t in node.targets):
+            try:
+                exec(compile(ast.Module(body=[node], type_ignores=[]), str(path), 'exec'), ns)
+            except Exception:
+                continue  # e.g. PARAMS built from a missing API key
+        elif isinstance(node, ast.ClassDef) and node.name == 'Colors':
+            exec(compile(ast.Module(body=[node], type_ignores=[]), str(path), 'exec'), ns)
+    funcs = [n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name in cfg['functions']]
+    exec(compile(ast.Module(body=funcs, type_ignores=[]), str(path), 'exec'), ns)
+    if 'is_back_to_back' in ns:
+        # Rest days don't depend on the weights; the schedule is fixed for a run
+        ns['is_back_to_back'] = _memo_back_to_back(ns['is_back_to_back'])
+    return ns
+
+
+def _memo_back_to_back(func):
+    memo: dict[tuple[str, str], bool] = {}
+
+    def is_back_to_back(team_name, game_date_str, schedule_data):
+        key = (team_name, game_date_str)
+        if key not in memo:
+            memo[key] = func(team_name, game_date_str, schedule_data)
+        return memo[key]
+    return is_back_to_back
+
+
+def check_params(sport: str, names, ns: dict[str, Any]):
+    allowed = SPORTS[sport]['params']
+    for name in names:
+        if name in allowed:
+            continue
+        if name in ns:
+            raise ValueError(f"{name} is defined in {SPORTS[sport]['model'].name} but not read by "
+                             f"{', '.join(SPORTS[sport]['functions'])}; sweeping it would change nothing")
+        raise ValueError(f"unknown {sport} parameter {name} (choose from {', '.join(allowed)})")
+
+
+# =========================
+# GAME LOGS -> SNAPSHOTS
+# =========================
+
+def _possessions(df: pd.DataFrame) -> pd.Series:
+    cols = {c.lower(): c for c in df.columns}
+    if 'poss' in cols:
+        return df[cols['poss']].astype(float)
+    return (df[cols['fga']] + 0.44 * df[cols['fta']] - df[cols['oreb']] + df[cols['tov']]).astype(float)
+
+
+def read_game_logs(path: str) -> pd.DataFrame:
+    """Team game logs from CSV into game_id, date, team, home, pts, poss."""
+    df = pd.read_csv(path)
+    cols = {c.lower(): c for c in df.columns}
+    return pd.DataFrame({
+        'game_id': df[cols['game_id']].astype(str),
+        'date': pd.to_datetime(df[cols['date']]).dt.strftime('%Y-%m-%d'),
+        'team': df[cols['team']].astype(str),
+        'home': df[cols['home']].astype(bool),
+        'pts': df[cols['pts']].astype(float),
+        'poss': _possessions(df),
+    })
+
+
+def fetch_nba_game_logs(season: str) -> Optional[pd.DataFrame]:
+    """One LeagueGameLog call per season, cached for 12h (forever once the season is over)."""
+    NBA_LOG_CACHE.mkdir(parents=True, exist_ok=True)
+    cache = NBA_LOG_CACHE / f"{season}.csv"
+    if cache.exists():
+        age = datetime.now() - datetime.fromtimestamp(cache.stat().st_mtime)
+        season_over = int(season[:4]) + 1 < datetime.now().year or (
+            int(season[:4]) + 1 == datetime.now().year and datetime.now().month >= 7)
+        if season_over or age < NBA_LOG_TTL:
+            return read_game_logs(str(cache))
+    try:
+        from nba_api.stats.endpoints import leaguegamelog
+    except ImportError:
+        print("nba_api is not installed: pip install nba_api (or pass --logs)")
+        return None
+    raw = leaguegamelog.LeagueGameLog(season=season, player_or_team_abbreviation='T',
+                                      timeout=60).get_data_frames()[0]
+    logs = pd.DataFrame({
+        'game_id': raw['GAME_ID'].astype(str),
+        'date': raw['GAME_DATE'],
+        'team': raw['TEAM_NAME'],
+        'home': raw['MATCHUP'].str.contains(' vs. ').astype(int),
+        'pts': raw['PTS'],
+        'poss': (raw['FGA'] + 0.44 * raw['FTA'] - raw['OREB'] + raw['TOV']).round(1),
+    })
+    logs.to_csv(cache, index=False)
+    return read_game_logs(str(cache))
+
+
+def _ratings(pts, opp_pts, poss, n):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        off = 100.0 * pts / poss
+        deff = 100.0 * opp_pts / poss
+        return off, deff, poss / n
+
+
+@dataclass
+class HistoricalGame:
+    date: str            # YYYY-MM-DD (local game date)
+    date_str: str        # MM/DD/YYYY, as the NBA model's schedule helpers expect
+    home: str
+    away: str
+    home_pts: float
+    away_pts: float
+    home_snap: dict      # {'season'|'form'|'home'|'road': (off, def, pace, games)}
+    away_snap: dict
+
+
+def build_games(logs: pd.DataFrame, last_n: int) -> list[HistoricalGame]:
+    """Pair team rows into games and attach each team's pre-game snapshot."""
+    rows = logs.sort_values(['team', 'date', 'game_id']).reset_index(drop=True)
+    opp = rows.groupby('game_id')['pts'].transform('sum') - rows['pts']
+    rows['opp_pts'] = opp
+    # Average both teams' possession estimates so each game has one pace
+    rows['poss'] = rows.groupby('game_id')['poss'].transform('mean')
+    g = rows.groupby('team', sort=False)
+
+    snaps = {}
+    for col in ('pts', 'opp_pts', 'poss'):
+        snaps[('season', col)] = g[col].cumsum() - rows[col]
+        snaps[('form', col)] = g[col].transform(lambda s: s.shift().rolling(last_n, min_periods=1).sum()).fillna(0)
+    snaps[('season', 'n')] = g.cumcount()
+    snaps[('form', 'n')] = np.minimum(snaps[('season', 'n')], last_n)
+    for loc, flag in (('home', True), ('road', False)):
+        mask = rows['home'] == flag
+        for col in ('pts', 'opp_pts', 'poss'):
+            x = rows[col].where(mask, 0.0)
+            snaps[(loc, col)] = x.groupby(rows['team']).cumsum() - x
+        m = mask.astype(int)
+        snaps[(loc, 'n')] = m.groupby(rows['team']).cumsum() - m
+
+    per_row = {}
+    for kind in ('season', 'form', 'home', 'road'):
+        off, deff, pace = _ratings(snaps[(kind, 'pts')], snaps[(kind, 'opp_pts')],
+                                   snaps[(kind, 'poss')], snaps[(kind, 'n')])
+        per_row[kind] = list(zip(off, deff, pace, snaps[(kind, 'n')]))
+
+    by_game: dict[str, dict[bool, int]] = {}
+    for i, (game_id, home) in enumerate(zip(rows['game_id'], rows['home'])):
+        by_game.setdefault(game_id, {})[bool(home)] = i
+
+    games = []
+    for game_id, sides in by_game.items():
+        if set(sides) != {True, False}:
+            continue
+        h, a = sides[True], sides[False]
+        if min(per_row['season'][h][3], per_row['season'][a][3]) < MIN_GAMES:
+            continue
+        snap = lambda i: {kind: per_row[kind][i] for kind in per_row}
+        date = rows['date'][h]
+        date_str = datetime.strptime(date, '%Y-%m-%d').strftime('%m/%d/%Y')
+        games.append(HistoricalGame(date, date_str, rows['team'][h], rows['team'][a],
+                                    float(rows['pts'][h]), float(rows['pts'][a]), snap(h), snap(a)))
+    games.sort(key=lambda x: x.date)
+    return games
+
+
+# =========================
+# CLOSING LINES
+# =========================
+
+def _et_date(value: str) -> Optional[str]:
+    try:
+        dt = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        return dt.strftime('%Y-%m-%d')
+    return dt.astimezone(EASTERN).strftime('%Y-%m-%d')
+
+
+def load_closing_lines(sport: str, teams, lines_csv: Optional[str] = None) -> dict[tuple, dict]:
+    """
+    {(date, home, away): {'spread': home line, 'total': line}} from the
+    sport's tracking file (picked games only) plus an optional CSV with
+    date, home_team, away_team, spread, total.
+    """
+    resolver = TeamResolver(teams)
+    lines: dict[tuple, dict] = {}
+    for pick in load_tracking(str(SPORTS[sport]['tracking']), full_history=True).get('picks', []):
+        date = _et_date(pick.get('game_date') or pick.get('game_time') or '')
+        home, away = resolver.resolve(pick.get('home_team', '')), resolver.resolve(pick.get('away_team', ''))
+        line = pick.get('closing_line', pick.get('market_line'))
+        if not (date and home and away) or line is None:
+            continue
+        kind = 'spread' if 'spread' in str(pick.get('pick_type', '')).lower() else 'total'
+        lines.setdefault((date, home, away), {})[kind] = float(line)
+    if lines_csv:
+        with open(lines_csv, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                home, away = resolver.resolve(row['home_team']), resolver.resolve(row['away_team'])
+                if not (home and away):
+                    continue
+                entry = lines.setdefault((pd.to_datetime(row['date']).strftime('%Y-%m-%d'), home, away), {})
+                for kind in ('spread', 'total'):
+                    if row.get(kind) not in (None, ''):
+                        entry[kind] = float(row[kind])
+    return lines
+
+
+# =========================
+# RE-PREDICTION
+# =========================
+
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(sport: str, games: list[HistoricalGame], lines: dict, schedule: dict):
+    _WORKER.update(sport=sport, games=games, lines=lines, schedule=schedule, ns=load_model(sport))
+
+
+def _blend(snap: dict, season_w: float, form_w: float):
+    season, form = snap['season'], snap['form']
+    return tuple(season_w * s + form_w * f for s, f in zip(season[:3], form[:3]))
+
+
+def repredict(weights: dict[str, float], sport: str = None, games=None, lines=None, schedule=None,
+              ns: dict = None) -> dict[str, Any]:
+    """Re-run every game under one weight set; returns MAE and ATS/O-U records."""
+    sport = sport or _WORKER['sport']
+    games = games if games is not None else _WORKER['games']
+    lines = lines if lines is not None else _WORKER['lines']
+    schedule = schedule if schedule is not None else _WORKER['schedule']
+    ns = ns or _WORKER['ns']
+    for name, value in weights.items():
+        ns[name] = value
+    # The NCAAB model predicts from season stats; only the NBA model blends in recent form
+    season_w, form_w = (ns['SEASON_WEIGHT'], ns['FORM_WEIGHT']) if sport == 'nba' else (1.0, 0.0)
+
+    model_spread = np.full(len(games), np.nan)
+    model_total = np.full(len(games), np.nan)
+    for i, game in enumerate(games):
+        h_off, h_def, h_pace = _blend(game.home_snap, season_w, form_w)
+        a_off, a_def, a_pace = _blend(game.away_snap, season_w, form_w)
+        if sport == 'nba':
+            stats = {
+                game.home: {"NET_RATING": round(h_off - h_def, 1), "Pace": round(h_pace, 2),
+                            "OffRtg": round(h_off, 1), "DefRtg": round(h_def, 1)},
+                game.away: {"NET_RATING": round(a_off - a_def, 1), "Pace": round(a_pace, 2),
+                            "OffRtg": round(a_off, 1), "DefRtg": round(a_def, 1)},
+            }
+            splits = None
+            hs, rs = game.home_snap['home'], game.away_snap['road']
+            if hs[3] >= MIN_SPLIT_GAMES and rs[3] >= MIN_SPLIT_GAMES:
+                splits = {'Home': {game.home: {"NET_RATING": round(hs[0] - hs[1], 1)}},
+                          'Road': {game.away: {"NET_RATING": round(rs[0] - rs[1], 1)}}}
+            spread = ns['calculate_model_spread'](game.home, game.away, stats, splits, schedule, game.date_str)
+            total = ns['calculate_model_total'](game.home, game.away, stats, splits)
+        else:
+            pred = ns['predict_game'](
+                game.home, game.away,
+                {'offensive_rating': h_off, 'defensive_rating': h_def, 'pace': h_pace},
+                {'offensive_rating': a_off, 'defensive_rating': a_def, 'pace': a_pace})
+            spread, total = pred['spread'], pred['total']
+        if spread is not None and total is not None:
+            model_spread[i], model_total[i] = spread, total
+
+    margin = np.array([g.home_pts - g.away_pts for g in games])
+    actual_total = np.array([g.home_pts + g.away_pts for g in games])
+    ok = ~np.isnan(model_spread)
+    result = {
+        'games': int(ok.sum()),
+        'spread_mae': float(np.abs(model_spread[ok] - margin[ok]).mean()) if ok.any() else np.nan,
+        'total_mae': float(np.abs(model_total[ok] - actual_total[ok]).mean()) if ok.any() else np.nan,
+        'spread_bias': float((model_spread[ok] - margin[ok]).mean()) if ok.any() else np.nan,
+        'total_bias': float((model_total[ok] - actual_total[ok]).mean()) if ok.any() else np.nan,
+    }
+
+    # ATS: back the side the model prefers against the home line; O/U likewise
+    ats, ou = [0, 0, 0], [0, 0, 0]
+    for i, game in enumerate(games):
+        line = lines.get((game.date, game.home, game.away))
+        if not line or not ok[i]:
+            continue
+        if 'spread' in line:
+            pick = np.sign(model_spread[i] + line['spread'])
+            outcome = np.sign(margin[i] + line['spread'])
+            if pick != 0:
+                ats[0 if outcome == pick else 2 if outcome == 0 else 1] += 1
+        if 'total' in line:
+            pick = np.sign(model_total[i] - line['total'])
+            outcome = np.sign(actual_total[i] - line['total'])
+            if pick != 0:
+                ou[0 if outcome == pick else 2 if outcome == 0 else 1] += 1
+    result['ats'], result['ou'] = tuple(ats), tuple(ou)
+    return result
+
+
+def build_schedule(logs: pd.DataFrame) -> dict[str, list[str]]:
+    """Team -> game dates ('%m/%d/%Y'), the shape `is_back_to_back` expects."""
+    schedule: dict[str, set] = {}
+    for team, date in zip(logs['team'], logs['date']):
+        schedule.setdefault(team, set()).add(datetime.strptime(date, '%Y-%m-%d').strftime('%m/%d/%Y'))
+    return {team: sorted(dates) for team, dates in schedule.items()}
+
+
+def weight_sets(axes: dict[str, np.ndarray]) -> list[dict[str, float]]:
+    sets = [dict(zip(axes, map(float, values))) for values in itertools.product(*axes.values())]
+    for ws in sets:
+        if 'SEASON_WEIGHT' in ws and 'FORM_WEIGHT' not in ws:
+            ws['FORM_WEIGHT'] = round(1.0 - ws['SEASON_WEIGHT'], 4)
+    return sets
+
+
+def _record(wlp) -> str:
+    w, l, p = wlp
+    hit = f"{w / (w + l) * 100:.1f}%" if w + l else "-"
+    return f"{w}-{l}" + (f"-{p}" if p else "") + f" ({hit})"
+
+
+def format_report(rows: list[tuple[dict, dict]], baseline: tuple[dict, dict], top: int) -> str:
+    names = sorted({k for ws, _ in rows for k in ws})
+    head = ' '.join(f"{n[:20]:>20}" for n in names)
+    out = [f"{head} {'games':>6} {'sprd MAE':>9} {'tot MAE':>8} {'sprd bias':>9} {'ATS':>18} {'O/U':>18}"]
+
+    def line(ws, r, label=''):
+        vals = ' '.join(f"{ws.get(n, np.nan):>20g}" for n in names)
+        return (f"{vals} {r['games']:>6} {r['spread_mae']:>9.2f} {r['total_mae']:>8.2f} "
+                f"{r['spread_bias']:>+9.2f} {_record(r['ats']):>18} {_record(r['ou']):>18}{label}")
+
+    out.append(line(*baseline, '   <- current constants'))
+    for ws, r in sorted(rows, key=lambda x: x[1]['spread_mae'])[:top]:
+        out.append(line(ws, r))
+    return '\n'.join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-predict past games under candidate model weights')
+    parser.add_argument('sport', choices=sorted(SPORTS))
+    parser.add_argument('--season', default='2024-25', help='NBA season for LeagueGameLog')
+    parser.add_argument('--logs', help='Team game log CSV (required for ncaab)')
+    parser.add_argument('--lines', help='Extra closing lines CSV: date, home_team, away_team, spread, total')
+    parser.add_argument('--grid', nargs='+', required=True, help='Axes as NAME=start:stop:step or NAME=a,b,c')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--csv', help='Write every weight set to this CSV')
+    args = parser.parse_args()
+
+    ns = load_model(args.sport)
+    axes = dict(parse_axis(s) for s in args.grid)
+    try:
+        check_params(args.sport, axes, ns)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.logs:
+        logs = read_game_logs(args.logs)
+    elif args.sport == 'nba':
+        logs = fetch_nba_game_logs(args.season)
+    else:
+        parser.error("ncaab needs --logs (no game-log source is wired up for college yet)")
+    if logs is None or logs.empty:
+        return
+    if args.sport == 'nba':
+        logs['team'] = logs['team'].map(ns['normalize_team_name'])
+
+    last_n = int(ns.get('LAST_N_GAMES', 10))
+    games = build_games(logs, last_n)
+    lines = load_closing_lines(args.sport, sorted(logs['team'].unique()), args.lines)
+    schedule = build_schedule(logs)
+    sets = weight_sets(axes)
+    print(f"{len(games)} games with {MIN_GAMES}+ prior games each, "
+          f"{sum(1 for g in games if (g.date, g.home, g.away) in lines)} with a closing line; "
+          f"{len(sets)} weight sets")
+
+    start = time.perf_counter()
+    baseline = repredict({}, args.sport, games, lines, schedule, load_model(args.sport))
+    workers = args.workers or os.cpu_count() or 1
+    if workers == 1 or len(sets) == 1:
+        sweep_ns = load_model(args.sport)
+        results = [repredict(ws, args.sport, games, lines, schedule, sweep_ns) for ws in sets]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(args.sport, games, lines, schedule)) as pool:
+            results = list(pool.map(repredict, sets, chunksize=max(1, len(sets) // (workers * 4))))
+    print(f"re-predicted in {time.perf_counter() - start:.1f}s\n")
+    current = {name: ns[name] for name in sets[0]}
+    print(format_report(list(zip(sets, results)), (current, baseline), args.top))
+
+    if args.csv:
+        names = sorted({k for ws in sets for k in ws})
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(names + ['games', 'spread_mae', 'total_mae', 'spread_bias', 'total_bias',
+                                     'ats_w', 'ats_l', 'ats_p', 'ou_w', 'ou_l', 'ou_p'])
+            for ws, r in zip(sets, results):
+                writer.writerow([ws.get(n) for n in names] + [
+                    r['games'], round(r['spread_mae'], 3), round(r['total_mae'], 3),
+                    round(r['spread_bias'], 3), round(r['total_bias'], 3), *r['ats'], *r['ou']])
+        print(f"\nWrote {len(sets)} weight sets to {args.csv}")
+
+
+if __name__ == '__main__':
+    main()
@@ -109,6 +109,14 @@ else
     ((FAIL_COUNT++))
 fi
 
+# Re-render tracking dashboards, best plays and the unified dashboards in one process
+echo -e "${YELLOW}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
+echo -e "${GREEN}▶ Publishing site pages${NC}"
+echo -e "${YELLOW}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
+cd "$SCRIPT_DIR"
+python3 publish.py 2>&1 || echo -e "${YELLOW}⚠️  Some pages failed to publish (see report above)${NC}"
+echo ""
+
 # Calculate total time
 END_TIME=$(date +%s)
 DURATION=$((END_TIME - START_TIME))
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Per-Run Tracking Context
+------------------------
+Loads a tracking file once per model run and indexes it in a single pass, so
+the calculations and HTML generators that need historical records stop
+reloading and re-scanning the whole history:
+
+    by pick_id      -> the tracked pick (CLV tags, closing-line updates)
+    by player       -> that player's picks (per-card season record / ROI)
+    by team         -> wins / losses / profit on settled picks backing a team
+    by edge bucket  -> wins / losses on settled picks ("10+", "8-9.9", ...)
+
+Each model keeps its own reducer for player records (the props models count
+results slightly differently); the context only hands it that player's picks
+and memoizes the answer, so a card costs a dict lookup however long the
+history gets.
+
+Picks logged during the run go through `add_pick`, which keeps the indexes in
+step and lets the model save once at the end instead of once per pick.
+
+    context = RunContext.load(TRACKING_FILE, default={'picks': []}, team_of=pick_bet_team)
+    context.find_pick(pick_id)
+    context.player_stats("Jalen Brunson", calculate_player_stats)
+    context.team_records["Boston Celtics"]     # {'wins': 12, 'losses': 7, 'profit': 410}
+    context.edge_win_rates(min_picks=5)        # {"4-5.9": 0.56, ...}
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+try:
+    from tracking_archive import load_tracking
+except ImportError:
+    import os
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from tracking_archive import load_tracking
+
+# Lower bound of each |edge| bucket, widest first
+EDGE_BUCKETS = (
+    (10.0, "10+"),
+    (8.0, "8-9.9"),
+    (6.0, "6-7.9"),
+    (4.0, "4-5.9"),
+    (3.0, "3-3.9"),
+    (0.0, "0-2.9"),
+)
+
+
+def edge_bucket(edge: Any) -> Optional[str]:
+    """Bucket label for a pick's edge (sign ignored), or None if it isn't a number."""
+    try:
+        edge = abs(float(edge))
+    except (TypeError, ValueError):
+        return None
+    for floor, label in EDGE_BUCKETS:
+        if edge >= floor:
+            return label
+    return None
+
+
+class RunContext:
+    """Tracking data for one run, indexed by pick id, player, team and edge bucket."""
+
+    def __init__(self, tracking_data: dict[str, Any],
+                 team_of: Optional[Callable[[dict[str, Any]], Optional[str]]] = None):
+        self.tracking = tracking_data
+        self.tracking.setdefault('picks', [])
+        self._team_of = team_of
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._by_player: dict[str, list[dict[str, Any]]] = {}
+        self._player_stats: dict[tuple[Any, str], Any] = {}
+        self.team_records: dict[str, dict[str, Any]] = {}
+        self.edge_records: dict[str, dict[str, int]] = {}
+        self.new_picks = 0
+        for pick in self.tracking['picks']:
+            self._index(pick)
+
+    @classmethod
+    def load(cls, tracking_file: str, default: Optional[dict[str, Any]] = None,
+             team_of: Optional[Callable[[dict[str, Any]], Optional[str]]] = None) -> 'RunContext':
+        """Load the full history (hot file + archive) once and index it."""
+        return cls(load_tracking(tracking_file, full_history=True, default=default), team_of=team_of)
+
+    @property
+    def picks(self) -> list[dict[str, Any]]:
+        return self.tracking['picks']
+
+    def _index(self, pick: dict[str, Any]):
+        if not isinstance(pick, dict):
+            return
+        pick_id = pick.get('pick_id')
+        if pick_id is not None:
+            self._by_id.setdefault(pick_id, pick)
+        player = pick.get('player')
+        if player is not None:
+            self._by_player.setdefault(player, []).append(pick)
+            if self._player_stats:
+                self._player_stats = {k: v for k, v in self._player_stats.items() if k[1] != player}
+
+        status = pick.get('status', '')
+        if status not in ('win', 'loss'):
+            return
+        bucket = edge_bucket(pick.get('edge', 0))
+        if bucket is not None:
+            record = self.edge_records.setdefault(bucket, {'wins': 0, 'losses': 0})
+            record['wins' if status == 'win' else 'losses'] += 1
+        team = self._team_of(pick) if self._team_of else None
+        if team:
+            record = self.team_records.setdefault(team, {'wins': 0, 'losses': 0, 'profit': 0})
+            record['wins' if status == 'win' else 'losses'] += 1
+            # NBA writes 'profit_loss', NCAA writes 'profit'
+            record['profit'] += pick.get('profit_loss', pick.get('profit', 0)) or 0
+
+    def add_pick(self, pick: dict[str, Any]):
+        """Append a newly logged pick to the tracking data and the indexes."""
+        self.tracking['picks'].append(pick)
+        self._index(pick)
+        self.new_picks += 1
+
+    def find_pick(self, pick_id: str) -> Optional[dict[str, Any]]:
+        """The first tracked pick with this id, or None."""
+        return self._by_id.get(pick_id)
+
+    def player_picks(self, player_name: str) -> list[dict[str, Any]]:
+        """Every tracked pick on this player, in tracking order."""
+        return self._by_player.get(player_name, [])
+
+    def player_stats(self, player_name: str,
+                     reducer: Callable[[str, dict[str, Any]], Any]) -> Any:
+        """
+        `reducer(player_name, tracking_data)` run over just this player's picks,
+        memoized. Any model's `calculate_player_stats` works as the reducer.
+        """
+        key = (reducer, player_name)
+        try:
+            return self._player_stats[key]
+        except KeyError:
+            stats = reducer(player_name, {'picks': self.player_picks(player_name)})
+            self._player_stats[key] = stats
+            return stats
+
+    def edge_win_rates(self, min_picks: int = 5) -> dict[str, float]:
+        """Win rate per edge bucket, for buckets with at least `min_picks` settled picks."""
+        rates = {}
+        for bucket, record in self.edge_records.items():
+            total = record['wins'] + record['losses']
+            if total >= min_picks:
+                rates[bucket] = record['wins'] / total
+        return rates
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Shared Site Assets
+------------------
+Static files that every generated page references instead of carrying its own
+copy, so a phone that opened one page at game time already has them cached
+for the rest:
+
+    assets/courtside.<hash>.css     the dark props theme (templates/props.css)
+    assets/history.<hash>.js        the lazy pick-history table (templates/history.js)
+    assets/logos-nba.<hash>.svg     one sprite per league: every team logo the
+    assets/logos-nfl.<hash>.svg     pages show, as <symbol id="nba-bos"> entries
+    assets/manifest.json            which sprite file holds which logos
+
+File names carry a hash of their content, so they can be cached forever and a
+changed stylesheet or sprite gets a new URL. Old files are kept (pages that
+weren't re-rendered still point at them) until `--prune` finds no page using them.
+
+The CSS/JS bundles are built on demand the first time a page asks for them. The
+sprites are built by this script: it scans the published pages for ESPN logo
+URLs, downloads each logo once at sprite size and packs them into the SVG.
+Logos missing from the sprite fall back to the ESPN image.
+
+    assets = page_assets(OUTPUT_HTML)      # URLs relative to that page
+    assets.stylesheet                      # "../assets/courtside.1a2b3c4d5e.css"
+    assets.script('history.js')            # "../assets/history.5e4d3c2b1a.js"
+    assets.logo("https://a.espncdn.com/i/teamlogos/nba/500/bos.png")
+                                           # "../assets/logos-nba.9f8e7d6c5b.svg#nba-bos" or None
+
+Usage:
+    python3 site_assets.py                 # build the CSS/JS bundles
+    python3 site_assets.py --logos         # also (re)build the logo sprites
+    python3 site_assets.py --prune         # delete bundles no page references
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ASSET_DIR = SCRIPT_DIR / 'assets'
+ASSET_MANIFEST = ASSET_DIR / 'manifest.json'
+STYLESHEET = 'courtside.css'
+
+# Bundle name -> source files, concatenated in order
+BUNDLES = {
+    STYLESHEET: [SCRIPT_DIR / 'templates' / 'props.css'],
+    'history.js': [SCRIPT_DIR / 'templates' / 'history.js'],
+}
+
+# Sport folders whose pages are published (GitHub Pages serves the repo root)
+PAGE_DIRS = ['.', 'nba', 'nfl', 'ncaa', 'cfb', 'soccer', 'wnba', 'mlb']
+
+LOGO_SIZE = 96
+ESPN_LOGO = re.compile(r'https?://a\.espncdn\.com/(?:combiner/i\?img=)?/?i/teamlogos/(\w+)/500/([\w-]+)\.png')
+ESPN_LOGO_FETCH = "https://a.espncdn.com/combiner/i?img=/i/teamlogos/{league}/500/{abbr}.png&h={size}&w={size}"
+
+_bundles: dict[str, tuple[float, str]] = {}
+_manifest: Optional[tuple[float, dict[str, Any]]] = None
+
+
+def content_name(stem: str, data: bytes, ext: str) -> str:
+    """`courtside.1a2b3c4d5e.css` style name from the file's content."""
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}.{ext}"
+
+
+def _write_asset(name: str, data: bytes) -> Path:
+    path = ASSET_DIR / name
+    if not path.exists():
+        ASSET_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    return path
+
+
+def bundle_bytes(bundle: str) -> bytes:
+    """A bundle's sources concatenated, indentation and blank lines dropped."""
+    lines = []
+    for source in BUNDLES[bundle]:
+        lines.extend(line.strip() for line in source.read_text().splitlines())
+    return ('\n'.join(line for line in lines if line) + '\n').encode('utf-8')
+
+
+def build_bundle(bundle: str) -> str:
+    """Write the fingerprinted bundle if it doesn't exist yet; returns its file name."""
+    mtime = max(source.stat().st_mtime for source in BUNDLES[bundle])
+    built = _bundles.get(bundle)
+    if built is None or built[0] != mtime:
+        data = bundle_bytes(bundle)
+        stem, ext = bundle.rsplit('.', 1)
+        built = (mtime, content_name(stem, data, ext))
+        _write_asset(built[1], data)
+        _bundles[bundle] = built
+    return built[1]
+
+
+def build_stylesheet() -> str:
+    return build_bundle(STYLESHEET)
+
+
+def load_manifest() -> dict[str, Any]:
+    """assets/manifest.json (re-read only when it changes)."""
+    global _manifest
+    try:
+        mtime = ASSET_MANIFEST.stat().st_mtime
+    except OSError:
+        return {'logos': {}}
+    if _manifest is None or _manifest[0] != mtime:
+        with open(ASSET_MANIFEST, 'r') as f:
+            data = json.load(f)
+        data.setdefault('logos', {})
+        for sprite in data['logos'].values():
+            sprite['ids'] = set(sprite.get('ids', []))
+        _manifest = (mtime, data)
+    return _manifest[1]
+
+
+def _save_manifest(data: dict[str, Any]):
+    out = {'logos': {league: {'file': sprite['file'], 'ids': sorted(sprite['ids'])}
+                     for league, sprite in sorted(data['logos'].items())}}
+    ASSET_DIR.mkdir(parents=True, exist_ok=True)
+    with open(ASSET_MANIFEST, 'w') as f:
+        json.dump(out, f, indent=2)
+
+
+def logo_id(logo_url: str) -> Optional[tuple[str, str]]:
+    """(league, symbol id) for an ESPN team logo URL, e.g. ("nba", "nba-bos")."""
+    match = ESPN_LOGO.search(logo_url or '')
+    if not match:
+        return None
+    league, abbr = match.group(1).lower(), match.group(2).lower()
+    return league, f"{league}-{abbr}"
+
+
+class PageAssets:
+    """Asset URLs as seen from one output page."""
+
+    def __init__(self, page: str | Path):
+        base = os.path.relpath(ASSET_DIR, Path(page).resolve().parent)
+        self.base = Path(base).as_posix()
+        self.stylesheet = self.script(STYLESHEET)
+        self._logos = load_manifest()['logos']
+
+    def script(self, bundle: str) -> str:
+        """URL of a bundle from BUNDLES (built if needed)."""
+        return f"{self.base}/{build_bundle(bundle)}"
+
+    def logo(self, logo_url: str) -> Optional[str]:
+        """`<use href>` target for this logo in its league sprite, or None if it isn't in one."""
+        found = logo_id(logo_url)
+        if not found:
+            return None
+        league, symbol = found
+        sprite = self._logos.get(league)
+        if not sprite or symbol not in sprite['ids']:
+            return None
+        return f"{self.base}/{sprite['file']}#{symbol}"
+
+
+def page_assets(page: str | Path) -> PageAssets:
+    return PageAssets(page)
+
+
+def asset_version() -> list[str]:
+    """Current bundle file names; a page linking older ones should be re-rendered."""
+    names = [build_bundle(bundle) for bundle in BUNDLES]
+    return names + sorted(sprite['file'] for sprite in load_manifest()['logos'].values())
+
+
+def published_pages(root: Path = SCRIPT_DIR) -> list[Path]:
+    pages = []
+    for folder in PAGE_DIRS:
+        pages.extend(sorted((root / folder).glob('*.html')))
+    return pages
+
+
+def collect_logos(pages: Iterable[Path]) -> dict[str, set[str]]:
+    """{league: {abbr, ...}} for every ESPN team logo the pages show."""
+    found: dict[str, set[str]] = {}
+    for page in pages:
+        try:
+            text = page.read_text(errors='ignore')
+        except OSError:
+            continue
+        for league, abbr in ESPN_LOGO.findall(text):
+            found.setdefault(league.lower(), set()).add(abbr.lower())
+    return found
+
+
+def build_logo_sprites(teams: dict[str, set[str]], size: int = LOGO_SIZE,
+                       session=None) -> dict[str, dict[str, Any]]:
+    """Download each logo once and pack each league into one SVG sprite."""
+    import requests
+
+    session = session or requests.Session()
+    manifest = load_manifest()
+    for league, abbrs in sorted(teams.items()):
+        symbols, ids = [], set()
+        for abbr in sorted(abbrs):
+            url = ESPN_LOGO_FETCH.format(league=league, abbr=abbr, size=size)
+            try:
+                resp = session.get(url, timeout=15)
+                resp.raise_for_status()
+            except requests.RequestException as e:
+                print(f"   ⚠️  {league}/{abbr}: {e}")
+                continue
+            if not resp.headers.get('Content-Type', 'image/png').startswith('image/'):
+                continue
+            data = base64.b64encode(resp.content).decode('ascii')
+            symbol = f"{league}-{abbr}"
+            symbols.append(f'<symbol id="{symbol}" viewBox="0 0 {size} {size}">'
+                           f'<image width="{size}" height="{size}" href="data:image/png;base64,{data}"/></symbol>')
+            ids.add(symbol)
+        if not symbols:
+            continue
+        svg = ('<svg xmlns="http://www.w3.org/2000/svg" style="display:none">\n'
+               + '\n'.join(symbols) + '\n</svg>\n').encode('utf-8')
+        name = content_name(f"logos-{league}", svg, 'svg')
+        _write_asset(name, svg)
+        manifest['logos'][league] = {'file': name, 'ids': ids}
+        print(f"   ✅ {name}: {len(ids)} logos, {len(svg) / 1024:.0f} KB")
+    _save_manifest(manifest)
+    return manifest['logos']
+
+
+def prune(pages: Iterable[Path]) -> list[Path]:
+    """Delete fingerprinted bundles that no page (and no manifest entry) references."""
+    referenced = {build_bundle(bundle) for bundle in BUNDLES}
+    referenced.update(sprite['file'] for sprite in load_manifest()['logos'].values())
+    for page in pages:
+        try:
+            text = page.read_text(errors='ignore')
+        except OSError:
+            continue
+        referenced.update(re.findall(r'assets/([\w.-]+\.(?:css|svg|js))', text))
+    removed = []
+    for path in ASSET_DIR.glob('*.*.*'):
+        if path.suffix in ('.css', '.svg', '.js') and path.name not in referenced:
+            path.unlink()
+            removed.append(path)
+    return removed
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build the shared stylesheet and logo sprites')
+    parser.add_argument('--logos', action='store_true', help='Download logos and rebuild the sprites')
+    parser.add_argument('--size', type=int, default=LOGO_SIZE, help='Logo size in the sprite (px)')
+    parser.add_argument('--prune', action='store_true', help='Delete bundles no page references')
+    args = parser.parse_args()
+
+    for bundle in BUNDLES:
+        name = build_bundle(bundle)
+        print(f"🎨 {name}: {(ASSET_DIR / name).stat().st_size / 1024:.1f} KB")
+
+    pages = published_pages()
+    if args.logos:
+        teams = collect_logos(pages)
+        # Pages already on the sprite no longer carry the ESPN URL; keep those logos too
+        for league, sprite in load_manifest()['logos'].items():
+            teams.setdefault(league, set()).update(i.split('-', 1)[1] for i in sprite['ids'])
+        print(f"🏀 {sum(len(v) for v in teams.values())} logos across {len(pages)} pages")
+        build_logo_sprites(teams, size=args.size)
+    if args.prune:
+        for path in prune(pages):
+            print(f"   🗑️  {path.name}")
+
+
+if __name__ == '__main__':
+    main()
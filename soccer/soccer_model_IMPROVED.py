@@ -19,8 +19,17 @@ import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
-from jinja2 import Template
 import pytz
+import sys
+
+# Shared HTML template environment and pick-history shards (repo root)
+try:
+    from html_templates import compile_template
+    from tracking_shards import history_panel, write_history
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import compile_template
+    from tracking_shards import history_panel, write_history
 
 # Load environment variables
 load_dotenv()
@@ -38,6 +47,7 @@ ODDS_API_BASE = "https://api.the-odds-api.com/v4"
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_HTML = SCRIPT_DIR / "soccer_totals_output.html"  # Keep same filename for GitHub Pages
 TRACKING_FILE = SCRIPT_DIR / "soccer_picks_tracking.json"
+TRACKING_HTML_FILE = SCRIPT_DIR / "soccer_tracking_dashboard.html"
 
 # Sharp +EV thresholds
 SPREAD_THRESHOLD = 0.25  # 0.25 goal spread edge to display
@@ -961,7 +971,7 @@ def generate_html(analyses, tracking_data=None):
 </body>
 </html>"""
     
-    template = Template(HTML_TEMPLATE)
+    template = compile_template(HTML_TEMPLATE)
     html = template.render(
         analyses=analyses,
         timestamp=datetime.now().strftime('%B %d, %Y at %I:%M %p ET'),
@@ -1268,8 +1278,17 @@ def update_pick_results():
         print("⚠️  No completed scores found")
         return 0
     
-    # Create lookup dict: (home_team, away_team, sport_key) -> (home_score, away_score)
+    et = pytz.timezone('US/Eastern')
+
+    def et_date(time_str):
+        try:
+            return datetime.fromisoformat(str(time_str).replace('Z', '+00:00')).astimezone(et).date()
+        except (TypeError, ValueError):
+            return None
+
+    # Create lookup dict: (home_team, away_team, sport_key, ET date) -> (home_score, away_score)
     scores_dict = {}
+    score_dates = set()
     for score in completed_scores:
         home_team = score.get('home_team', '')
         away_team = score.get('away_team', '')
@@ -1280,25 +1299,35 @@ def update_pick_results():
             try:
                 home_score = float(scores[0].get('score', 0))
                 away_score = float(scores[1].get('score', 0))
-                key = (home_team, away_team, sport_key)
-                scores_dict[key] = (home_score, away_score)
+                game_date = et_date(score.get('commence_time'))
+                scores_dict[(home_team, away_team, sport_key, game_date)] = (home_score, away_score)
+                # Undated picks still match on teams alone
+                scores_dict.setdefault((home_team, away_team, sport_key, None), (home_score, away_score))
+                if game_date:
+                    score_dates.add(game_date)
             except (ValueError, TypeError):
                 continue
     
     updated_count = 0
-    et = pytz.timezone('US/Eastern')
+    first_date = min(score_dates) if score_dates else None
+    last_date = max(score_dates) if score_dates else None
     
     for pick in pending_picks:
         try:
             home_team = pick.get('home_team', '')
             away_team = pick.get('away_team', '')
             sport_key = pick.get('sport_key', '')
+            pick_date = et_date(pick.get('game_time') or pick.get('game_date'))
+            
+            # Games outside the scores window can't match - skip before any lookup
+            if pick_date and first_date and not (first_date <= pick_date <= last_date):
+                continue
             
             # Try to find score
-            key = (home_team, away_team, sport_key)
+            key = (home_team, away_team, sport_key, pick_date)
             if key not in scores_dict:
                 # Try without sport_key (some APIs may not include it)
-                key_alt = (home_team, away_team, '')
+                key_alt = (home_team, away_team, '', pick_date)
                 if key_alt in scores_dict:
                     home_score, away_score = scores_dict[key_alt]
                 else:
@@ -1503,6 +1532,7 @@ def calculate_recent_performance(picks_list, count):
 
 def generate_tracking_html():
     """Generate HTML dashboard for tracking picks with last 100/50/20 breakdown"""
+    tracking_html_file = TRACKING_HTML_FILE
     tracking_data = load_picks_tracking()
     stats = calculate_tracking_stats(tracking_data)
     
@@ -1963,14 +1993,19 @@ def generate_tracking_html():
             </div>
         </div>
 
+        {{ history_panel }}
+
         <div class="text-center text-gray-400 text-sm" style="margin-top: 2rem;">
             <p>Last updated: {{ timestamp }}</p>
         </div>
     </div>
 </body>
 </html>'''
+
+    # Settled picks go to month shards the page loads on demand (tracking_shards.py)
+    write_history(tracking_html_file, tracking_data['picks'])
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         stats=stats,
         pending_picks=pending_picks,
@@ -1979,9 +2014,9 @@ def generate_tracking_html():
         last_20=last_20,
         timestamp=timestamp,
         format_game_date=format_game_date,
+        history_panel=history_panel(tracking_html_file),
     )
     
-    tracking_html_file = SCRIPT_DIR / "soccer_tracking_dashboard.html"
     with open(tracking_html_file, 'w', encoding='utf-8') as f:
         f.write(html_output)
     
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Team Name Resolver
+------------------
+Maps whatever a feed calls a team (The Odds API, nba_api, Sports-Reference)
+onto one canonical key. The resolver is compiled once from the canonical names
+plus an alias table, and every answer is memoized, so resolving a whole slate
+costs a few dict lookups:
+
+    1. exact:   "Duke" / "duke" / "UConn" (alias)          -> canonical key
+    2. prefix:  "Duke Blue Devils" -> longest canonical key whose tokens start
+                the name ("North Carolina Central" beats "North Carolina"), as
+                long as the words left over read as a mascot: at most three
+                words that don't start another team's name, so
+                "Arkansas-Little Rock Trojans" is not taken for "Arkansas"
+    3. fuzzy:   difflib close match on the name, then on the name without its
+                last word (the mascot), for spelling drift between feeds
+
+Names are compared as lowercase words without punctuation, and a leading or
+trailing "St" reads as Saint / State ("Kansas St Wildcats" -> "Kansas State").
+
+Names that still don't match return None and are recorded in `unmatched`,
+so callers can report them instead of dropping games silently.
+
+    resolver = TeamResolver(team_stats.keys(), aliases={"UConn": "Connecticut"})
+    resolver.resolve("UConn Huskies")        # -> "Connecticut"
+    resolver.lookup("Army Knights", team_stats)
+    resolver.unmatched                       # {"Some Unknown Team": 2}
+
+Usage (resolve names against the NCAAB stats cache):
+    python3 team_resolver.py ncaa/ncaab_stats_cache.json "UConn Huskies" "Kansas St Wildcats"
+"""
+
+from __future__ import annotations
+
+import difflib
+import re
+from typing import Any, Iterable, Mapping, Optional
+
+FUZZY_CUTOFF = 0.88
+# "Blue Devils", "Fightin Blue Hens"; longer leftovers are part of the school name
+MAX_MASCOT_WORDS = 3
+
+_DROP = re.compile(r"[.'’]")
+_SPLIT = re.compile(r"[()\-,/]")
+
+
+def name_tokens(name: str) -> tuple[str, ...]:
+    """Lowercased words with punctuation dropped; "St" is expanded by position."""
+    words = _SPLIT.sub(' ', _DROP.sub('', name.replace('&', ' and '))).lower().split()
+    if not words:
+        return ()
+    # "St. John's" -> saint, "Kansas St" -> state
+    return tuple(
+        ('saint' if i == 0 else 'state') if w == 'st' else w
+        for i, w in enumerate(words)
+    )
+
+
+class TeamResolver:
+    """Compiled exact/prefix/fuzzy matcher from feed names to canonical keys."""
+
+    def __init__(self, canonical: Iterable[str], aliases: Optional[Mapping[str, str]] = None):
+        self.canonical = list(canonical)
+        self._exact: dict[str, str] = {}
+        self._by_tokens: dict[tuple[str, ...], str] = {}
+        self._trie: dict[str, Any] = {}
+        self._cache: dict[str, Optional[str]] = {}
+        self.unmatched: dict[str, int] = {}
+
+        for key in self.canonical:
+            self._add(key, key)
+        for alias, target in (aliases or {}).items():
+            canonical_key = self._exact.get(target) or self._by_tokens.get(name_tokens(target))
+            if canonical_key is not None:
+                self._add(alias, canonical_key)
+        self._fuzzy_pool = {' '.join(t): key for t, key in self._by_tokens.items()}
+
+    def _add(self, name: str, key: str):
+        self._exact.setdefault(name, key)
+        tokens = name_tokens(name)
+        if not tokens:
+            return
+        self._by_tokens.setdefault(tokens, key)
+        node = self._trie
+        for tok in tokens:
+            node = node.setdefault(tok, {})
+        node.setdefault('', key)
+
+    def _longest(self, tokens: tuple[str, ...]) -> tuple[Optional[str], int]:
+        """Longest canonical name whose tokens are a prefix of `tokens`, and its length."""
+        node, best, depth = self._trie, None, 0
+        for i, tok in enumerate(tokens, 1):
+            node = node.get(tok)
+            if node is None:
+                break
+            if '' in node:
+                best, depth = node[''], i
+        return best, depth
+
+    def _is_mascot(self, words: tuple[str, ...]) -> bool:
+        return len(words) <= MAX_MASCOT_WORDS and self._longest(words)[0] is None
+
+    def _prefix(self, tokens: tuple[str, ...]) -> Optional[str]:
+        """Longest canonical name that starts `tokens` and leaves only a mascot."""
+        best, depth = self._longest(tokens)
+        if best is None or not self._is_mascot(tokens[depth:]):
+            return None
+        return best
+
+    def _fuzzy(self, tokens: tuple[str, ...]) -> Optional[str]:
+        candidates = [' '.join(tokens)]
+        if len(tokens) > 1:
+            candidates.append(' '.join(tokens[:-1]))
+        for text in candidates:
+            match = difflib.get_close_matches(text, self._fuzzy_pool, n=1, cutoff=FUZZY_CUTOFF)
+            if match:
+                return self._fuzzy_pool[match[0]]
+        return None
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Canonical key for `name`, or None (recorded in `unmatched`)."""
+        try:
+            key = self._cache[name]
+        except KeyError:
+            key = self._exact.get(name) or self._exact.get(name.strip())
+            if key is None:
+                tokens = name_tokens(name)
+                key = self._by_tokens.get(tokens) or self._prefix(tokens) or self._fuzzy(tokens)
+            self._cache[name] = key
+        if key is None:
+            self.unmatched[name] = self.unmatched.get(name, 0) + 1
+        return key
+
+    def lookup(self, name: str, table: Mapping[str, Any]) -> Any:
+        """`table[resolve(name)]`, or None when the name can't be matched."""
+        key = self.resolve(name)
+        return table.get(key) if key is not None else None
+
+
+def main():
+    import json
+    import sys
+
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    with open(sys.argv[1], 'r') as f:
+        data = json.load(f)
+    resolver = TeamResolver(data.get('teams', data))
+    for name in sys.argv[2:]:
+        print(f"{name!r:40} -> {resolver.resolve(name)!r}")
+
+
+if __name__ == '__main__':
+    main()
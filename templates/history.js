@@ -0,0 +1,284 @@
+/*
+ * Pick History table for the tracking dashboards (see tracking_shards.py).
+ *
+ * Each `.ch-history[data-history-index]` panel fetches its index.json once the
+ * page has loaded, then the newest month shard. Older months are fetched as
+ * the table scrolls toward them, or all at once when a type/result/search
+ * filter needs the full history. Only the rows in view exist in the DOM.
+ */
+(function () {
+  'use strict';
+
+  const ROW_HEIGHT = 40;
+  const VISIBLE_ROWS = 12;
+  const OVERSCAN = 6;
+  const RESULT_LABEL = {win: 'Win', loss: 'Loss', push: 'Push'};
+
+  const CSS = [
+    '.ch-history-controls{display:flex;flex-wrap:wrap;gap:.5rem;margin-bottom:.75rem}',
+    '.ch-history-controls select,.ch-history-controls input{background:#1a1a1a;color:#e5e5e5;border:1px solid #333;border-radius:.5rem;padding:.45rem .6rem;font-size:.85rem}',
+    '.ch-history-controls input{flex:1;min-width:8rem}',
+    '.ch-history-note{color:#9ca3af;font-size:.8rem;margin:.25rem 0 .5rem}',
+    '.ch-history-head,.ch-history-row{display:grid;grid-template-columns:5.5rem minmax(0,2fr) 4.5rem minmax(0,1.6fr) 3.5rem 3.5rem 3.5rem 4.5rem;gap:.5rem;align-items:center;padding:0 .5rem;font-size:.8rem}',
+    '.ch-history-head{color:#9ca3af;text-transform:uppercase;font-size:.7rem;padding-bottom:.4rem;border-bottom:1px solid #333}',
+    '.ch-history-view{position:relative;overflow-y:auto;-webkit-overflow-scrolling:touch}',
+    '.ch-history-row{position:absolute;left:0;right:0;height:' + ROW_HEIGHT + 'px;border-bottom:1px solid #262626}',
+    '.ch-history-row>span{overflow:hidden;white-space:nowrap;text-overflow:ellipsis}',
+    '.ch-history .win{color:#10b981;font-weight:600}.ch-history .loss{color:#ef4444;font-weight:600}.ch-history .push{color:#9ca3af}',
+    '.ch-history .num{text-align:right}',
+    '@media (max-width:640px){.ch-history-head,.ch-history-row{grid-template-columns:4.5rem minmax(0,1fr) 3rem 4rem}.ch-history .wide{display:none}}'
+  ].join('');
+
+  const MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+
+  function escapeHtml(value) {
+    return String(value == null ? '' : value).replace(/[&<>"']/g, function (c) {
+      return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+    });
+  }
+
+  function signed(value, digits) {
+    if (value == null || isNaN(value)) return '';
+    return (value > 0 ? '+' : '') + Number(value).toFixed(digits);
+  }
+
+  function monthLabel(month) {
+    const parts = month.split('-');
+    return MONTH_NAMES[Number(parts[1]) - 1] + ' ' + parts[0];
+  }
+
+  function fetchJson(url, cache) {
+    return fetch(url, {cache: cache || 'default'}).then(function (resp) {
+      if (!resp.ok) throw new Error(url + ': ' + resp.status);
+      return resp.json();
+    });
+  }
+
+  function option(value, label) {
+    const opt = document.createElement('option');
+    opt.value = value;
+    opt.textContent = label;
+    return opt;
+  }
+
+  class HistoryPanel {
+    constructor(root) {
+      this.root = root;
+      this.indexUrl = root.getAttribute('data-history-index');
+      this.base = this.indexUrl.replace(/[^\/]*$/, '');
+      this.months = [];
+      this.shards = {};
+      this.loading = {};
+      this.rows = [];
+      this.view = [];
+      this.filter = {month: '', type: '', status: '', q: ''};
+      this.frame = 0;
+    }
+
+    async start() {
+      let index;
+      try {
+        index = await fetchJson(this.indexUrl, 'no-cache');
+      } catch (err) {
+        this.note('Pick history is unavailable right now.');
+        return;
+      }
+      this.index = index;
+      this.months = index.months || [];
+      this.col = {};
+      index.columns.forEach((name, i) => { this.col[name] = i; });
+      if (!this.months.length) {
+        this.note('No settled picks yet.');
+        return;
+      }
+      this.build();
+      await this.loadMonth(this.months[0]);
+    }
+
+    note(text) {
+      this.root.innerHTML = '<p class="ch-history-note">' + escapeHtml(text) + '</p>';
+    }
+
+    build() {
+      const controls = document.createElement('div');
+      controls.className = 'ch-history-controls';
+
+      this.monthSelect = document.createElement('select');
+      this.monthSelect.setAttribute('aria-label', 'Month');
+      this.monthSelect.appendChild(option('', 'All months (' + this.index.total + ')'));
+      this.months.forEach(m => {
+        const record = m.wins + '-' + m.losses + (m.pushes ? '-' + m.pushes : '');
+        this.monthSelect.appendChild(option(m.month, monthLabel(m.month) + ' · ' + record));
+      });
+
+      this.typeSelect = document.createElement('select');
+      this.typeSelect.setAttribute('aria-label', 'Pick type');
+      this.typeSelect.appendChild(option('', 'All types'));
+      (this.index.types || []).forEach(t => this.typeSelect.appendChild(option(t, t)));
+
+      this.statusSelect = document.createElement('select');
+      this.statusSelect.setAttribute('aria-label', 'Result');
+      this.statusSelect.appendChild(option('', 'All results'));
+      Object.keys(RESULT_LABEL).forEach(s => this.statusSelect.appendChild(option(s, RESULT_LABEL[s] + 's')));
+
+      this.search = document.createElement('input');
+      this.search.type = 'search';
+      this.search.placeholder = 'Search team or pick';
+      this.search.setAttribute('aria-label', 'Search');
+
+      controls.append(this.monthSelect, this.typeSelect, this.statusSelect, this.search);
+
+      this.summary = document.createElement('p');
+      this.summary.className = 'ch-history-note';
+
+      const head = document.createElement('div');
+      head.className = 'ch-history-head';
+      head.innerHTML = '<span>Date</span><span class="wide">Game</span><span class="wide">Type</span>' +
+        '<span>Pick</span><span class="num wide">Line</span><span class="num wide">Edge</span>' +
+        '<span>Result</span><span class="num">Units</span>';
+
+      this.viewport = document.createElement('div');
+      this.viewport.className = 'ch-history-view';
+      this.viewport.setAttribute('role', 'table');
+      this.viewport.style.maxHeight = (ROW_HEIGHT * VISIBLE_ROWS) + 'px';
+      this.spacer = document.createElement('div');
+      this.viewport.appendChild(this.spacer);
+
+      this.root.innerHTML = '';
+      this.root.append(controls, this.summary, head, this.viewport);
+
+      const update = () => this.update();
+      let typing = 0;
+      this.monthSelect.addEventListener('change', update);
+      this.typeSelect.addEventListener('change', update);
+      this.statusSelect.addEventListener('change', update);
+      this.search.addEventListener('input', () => {
+        clearTimeout(typing);
+        typing = setTimeout(update, 150);
+      });
+      this.viewport.addEventListener('scroll', () => this.schedule(), {passive: true});
+    }
+
+    loadMonth(m) {
+      if (this.shards[m.month]) return Promise.resolve();
+      if (!this.loading[m.month]) {
+        this.loading[m.month] = fetchJson(this.base + m.file + '?v=' + m.hash).then(shard => {
+          this.shards[m.month] = shard.rows || [];
+          this.collect();
+        }).catch(() => {
+          delete this.loading[m.month];
+        });
+      }
+      return this.loading[m.month];
+    }
+
+    loadAll() {
+      return Promise.all(this.months.map(m => this.loadMonth(m)));
+    }
+
+    collect() {
+      this.rows = [];
+      this.months.forEach(m => {
+        const rows = this.shards[m.month];
+        if (rows) this.rows = this.rows.concat(rows);
+      });
+      this.apply();
+    }
+
+    async update() {
+      this.filter = {
+        month: this.monthSelect.value,
+        type: this.typeSelect.value,
+        status: this.statusSelect.value,
+        q: this.search.value.trim().toLowerCase()
+      };
+      const f = this.filter;
+      if (f.month) {
+        await this.loadMonth(this.months.find(m => m.month === f.month));
+      } else if (f.type || f.status || f.q) {
+        await this.loadAll();
+      }
+      this.viewport.scrollTop = 0;
+      this.apply();
+    }
+
+    apply() {
+      const c = this.col;
+      const f = this.filter;
+      this.view = this.rows.filter(r =>
+        (!f.month || r[c.d].lastIndexOf(f.month, 0) === 0) &&
+        (!f.type || r[c.t] === f.type) &&
+        (!f.status || r[c.s] === f.status) &&
+        (!f.q || (r[c.g] + ' ' + r[c.p]).toLowerCase().indexOf(f.q) !== -1));
+
+      let wins = 0, losses = 0, pushes = 0, units = 0;
+      this.view.forEach(r => {
+        if (r[c.s] === 'win') wins++;
+        else if (r[c.s] === 'loss') losses++;
+        else pushes++;
+        units += r[c.u] || 0;
+      });
+      const loaded = this.months.filter(m => this.shards[m.month]).length;
+      const older = !f.month && loaded < this.months.length && !(f.type || f.status || f.q);
+      this.summary.textContent = this.view.length + ' picks · ' + wins + '-' + losses +
+        (pushes ? '-' + pushes : '') + ' · ' + signed(units, 2) + 'u' +
+        (older ? ' · scroll for older months' : '');
+
+      this.spacer.style.height = (this.view.length * ROW_HEIGHT) + 'px';
+      this.draw();
+    }
+
+    schedule() {
+      if (this.frame) return;
+      this.frame = requestAnimationFrame(() => {
+        this.frame = 0;
+        this.draw();
+      });
+    }
+
+    draw() {
+      const c = this.col;
+      const first = Math.max(0, Math.floor(this.viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+      const last = Math.min(this.view.length, first + VISIBLE_ROWS + 2 * OVERSCAN);
+      let html = '';
+      for (let i = first; i < last; i++) {
+        const r = this.view[i];
+        const status = r[c.s];
+        html += '<div class="ch-history-row" role="row" style="top:' + (i * ROW_HEIGHT) + 'px">' +
+          '<span>' + escapeHtml(r[c.d]) + '</span>' +
+          '<span class="wide" title="' + escapeHtml(r[c.r]) + '">' + escapeHtml(r[c.g]) + '</span>' +
+          '<span class="wide">' + escapeHtml(r[c.t]) + '</span>' +
+          '<span title="' + escapeHtml(r[c.p]) + '">' + escapeHtml(r[c.p]) + '</span>' +
+          '<span class="num wide">' + escapeHtml(r[c.l]) + '</span>' +
+          '<span class="num wide">' + signed(r[c.e], 1) + '</span>' +
+          '<span class="' + status + '">' + (RESULT_LABEL[status] || escapeHtml(status)) + '</span>' +
+          '<span class="num ' + (r[c.u] > 0 ? 'win' : r[c.u] < 0 ? 'loss' : '') + '">' + signed(r[c.u], 2) + '</span>' +
+          '</div>';
+      }
+      this.spacer.innerHTML = html;
+
+      // Unfiltered "All months": fetch the next month before the reader runs out of rows
+      const f = this.filter;
+      if (!f.month && !f.type && !f.status && !f.q && last >= this.view.length - OVERSCAN) {
+        const next = this.months.find(m => !this.shards[m.month]);
+        if (next) this.loadMonth(next);
+      }
+    }
+  }
+
+  function start() {
+    const panels = document.querySelectorAll('.ch-history[data-history-index]');
+    if (!panels.length || !window.fetch) return;
+    const style = document.createElement('style');
+    style.textContent = CSS;
+    document.head.appendChild(style);
+    panels.forEach(root => new HistoryPanel(root).start());
+  }
+
+  // After first paint: the history never competes with the dashboard's own content
+  if (document.readyState === 'complete') {
+    start();
+  } else {
+    window.addEventListener('load', start);
+  }
+})();
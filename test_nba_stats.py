@@ -19,7 +19,7 @@ def test_grading_logic():
     print(f"Testing stats calculation for {mod.__name__}")
     
     # 1. Load Tracking Data
-    t_data = mod.load_tracking_data()
+    t_data = mod.load_tracking_data(full_history=True)
     print(f"Loaded {len(t_data.get('picks', []))} picks")
     
     # 2. Check for recent graded picks
@@ -6,6 +6,9 @@ Behavior:
 - For each original `*_tracking.json` with a corresponding fixed file in
   `tools/reports/fixed/` (naming convention: relative_path with os.sep -> '__' + '.fixed.json'),
   copy original to backup then overwrite original with fixed content.
+- Files with archive partitions (tracking_archive) are backed up with their
+  archive folder and written through `save_tracking`, so the full-history fixed
+  copy is split back into hot file and partitions instead of replacing the hot file.
 - Writes a CSV log `tools/reports/overwrite_log.csv` listing actions performed.
 
 Run only after reviewing backups and fixed copies.
@@ -16,9 +19,14 @@ import os
 import shutil
 from pathlib import Path
 import csv
+import sys
 from datetime import datetime
 
 WORKDIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKDIR))
+
+from tracking_archive import archive_dir, list_partitions, save_tracking  # noqa: E402
+
 FIXED_DIR = WORKDIR / 'tools' / 'reports' / 'fixed'
 OUT_DIR = WORKDIR / 'tools' / 'reports'
 TIMESTAMP = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
@@ -40,6 +48,9 @@ def backup_file(orig: str, backup_base: Path):
     dest = backup_base / rel
     dest.parent.mkdir(parents=True, exist_ok=True)
     shutil.copy2(orig, dest)
+    if list_partitions(orig):
+        archive = archive_dir(orig)
+        shutil.copytree(archive, backup_base / archive.relative_to(WORKDIR), dirs_exist_ok=True)
     return dest
 
 
@@ -47,6 +58,9 @@ def overwrite(orig: str, fixed: Path):
     # Read fixed JSON and write to orig path atomically
     with open(fixed, 'r') as f:
         data = json.load(f)
+    if list_partitions(orig):
+        save_tracking(orig, data)
+        return
     tmp = Path(orig).with_suffix('.tmp')
     with open(tmp, 'w') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Time `best_plays_bot` fire-tracking grading: per-play file scans vs `SourceIndex`.
+
+The previous grader re-read every TRACKING_SOURCES file for each pending
+tracked play and compared it against every pick. This replays that loop
+(`legacy_resolve`, kept here only for comparison) against the current
+`best_plays_tracking.json`, then grades the same plays through a SourceIndex
+loaded once. Nothing is saved.
+
+Both must settle the same plays the same way, with one allowed difference:
+the old loop stopped at the first fallback match within a file, so a play
+could be graded by another prop of the same player and side that day even
+though its exact `source_pick_id` pick was graded further down the same file.
+The index always prefers the exact pick; those plays are counted, and must
+agree with their exact pick.
+
+Also times `get_pending_plays` bet-type rates: one `calculate_bet_type_stats`
+scan per pending pick vs. the index's per-model memo.
+
+`--regrade` also grades the already-settled plays (reset to pending in the
+copy), which exercises the matching on plays whose sources have results.
+
+Usage:
+    python3 tools/bench_best_plays.py
+    python3 tools/bench_best_plays.py --regrade --plays 400
+"""
+import argparse
+import copy
+import sys
+import time
+from pathlib import Path
+
+WORKDIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKDIR))
+
+import best_plays_bot as bot  # noqa: E402
+
+
+def legacy_resolve(tracked_plays):
+    """The pre-index grading loop: every source file loaded and scanned per play."""
+    loads = 0
+    for tp in tracked_plays:
+        if tp.get('status') != 'pending':
+            continue
+        matched = False
+        tp_src = tp.get('source_pick_id')
+        for _, filepath, _, _ in bot.TRACKING_SOURCES:
+            picks = bot.load_tracking_data(filepath)
+            loads += 1
+            for p in picks:
+                p_src = p.get('pick_id') or p.get('pickId')
+                if tp_src and p_src and tp_src == p_src:
+                    status = (p.get('status') or 'pending').lower()
+                    if status in ['win', 'won']:
+                        tp['status'] = 'win'
+                        matched = True
+                    elif status in ['loss', 'lost']:
+                        tp['status'] = 'loss'
+                        matched = True
+                    if matched:
+                        break
+                if not matched:
+                    try:
+                        p_player = (p.get('player') or p.get('team') or '').strip().lower()
+                        tp_player = (tp.get('player') or '').strip().lower()
+                        p_bet = (p.get('bet_type') or p.get('pick_type') or '').strip().upper()
+                        tp_bet = (tp.get('bet_type') or '').strip().upper()
+                        p_time = bot.parse_game_time(p.get('game_time') or p.get('game_date'))
+                        if isinstance(tp.get('game_time'), str):
+                            tp_time = bot.parse_game_time(tp.get('game_time'))
+                        else:
+                            tp_time = tp.get('game_time')
+                        p_date = p_time.date().isoformat() if p_time else None
+                        tp_date = tp_time.date().isoformat() if tp_time else None
+                        if p_player == tp_player:
+                            bet_matched = (p_bet in tp_bet or tp_bet in p_bet)
+                            date_matched = (p_date == tp_date) if (p_date and tp_date) else True
+                            if bet_matched and date_matched:
+                                status = (p.get('status') or 'pending').lower()
+                                if status in ['win', 'won']:
+                                    tp['status'] = 'win'
+                                    matched = True
+                                elif status in ['loss', 'lost']:
+                                    tp['status'] = 'loss'
+                                    matched = True
+                                elif status in ['push', 'void', 'cancelled', 'refunded']:
+                                    tp['status'] = 'void'
+                                    matched = True
+                                if matched:
+                                    break
+                    except Exception:
+                        continue
+    return loads
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark best_plays_bot fire-tracking grading')
+    parser.add_argument('--plays', type=int, default=0, help='Only the first N pending tracked plays (default: all)')
+    parser.add_argument('--regrade', action='store_true', help='Also grade settled plays (reset to pending in a copy)')
+    args = parser.parse_args()
+
+    size_mb = Path(bot.FIRE_TRACKING_FILE).stat().st_size / 1e6
+    plays = bot.load_fire_tracking().get('plays', [])
+    if args.regrade:
+        plays = [dict(p, status='pending') for p in plays]
+    pending = [p for p in plays if p.get('status') == 'pending']
+    if args.plays:
+        pending = pending[:args.plays]
+    print(f"{Path(bot.FIRE_TRACKING_FILE).name}: {size_mb:.1f} MB, {len(plays)} plays, "
+          f"{len(pending)} pending graded here")
+
+    legacy_plays = copy.deepcopy(pending)
+    start = time.perf_counter()
+    loads = legacy_resolve(legacy_plays)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    indexed_plays = copy.deepcopy(pending)
+    start = time.perf_counter()
+    sources = bot.SourceIndex()
+    load_ms = (time.perf_counter() - start) * 1000
+    settled = bot.resolve_pending(indexed_plays, sources)
+    indexed_ms = (time.perf_counter() - start) * 1000
+
+    exact_fixes, mismatched = 0, []
+    for a, b in zip(legacy_plays, indexed_plays):
+        if a.get('status') == b.get('status'):
+            continue
+        exact = bot.SourceIndex.find_result(sources, {'source_pick_id': b.get('source_pick_id')})
+        if exact and exact == b.get('status'):
+            exact_fixes += 1
+        else:
+            mismatched.append((a.get('player'), a.get('status'), b.get('status')))
+    assert not mismatched, f"grading differs: {mismatched[:5]}"
+    print(f"grading: per-play scans {legacy_ms:.0f} ms ({loads} file loads), "
+          f"SourceIndex {indexed_ms:.0f} ms ({len(bot.TRACKING_SOURCES)} loads, index {load_ms:.0f} ms) "
+          f"-> {legacy_ms / max(indexed_ms, 1e-9):.0f}x")
+    print(f"   {settled} settled; same results except {exact_fixes} now graded by their exact source pick")
+
+    # Bet-type win rate for every pick as if it were pending (worst case for get_pending_plays)
+    start = time.perf_counter()
+    legacy_rates = [bot.calculate_bet_type_stats(picks, p.get('bet_type', p.get('pick_type', 'unknown')))
+                    for picks in sources.picks.values() for p in picks]
+    scan_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    memo_rates = [sources.bet_type_rate(name, p.get('bet_type', p.get('pick_type', 'unknown')))
+                  for name, picks in sources.picks.items() for p in picks]
+    memo_ms = (time.perf_counter() - start) * 1000
+    assert legacy_rates == memo_rates, 'bet-type rates differ'
+    print(f"bet-type rates for {len(memo_rates)} picks: rescan {scan_ms:.0f} ms, "
+          f"memoized {memo_ms:.0f} ms ({scan_ms / max(memo_ms, 1e-9):.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Time `nba/game_simulator.py` on a full slate and check it against closed form.
+
+Before overtime, the simulated margin and total are normal (then rounded), so
+cover/over probabilities at half-point lines have a closed form. Overtime can
+only move the games that were tied after regulation, so the simulated rates
+must sit within that tie rate (plus sampling noise) of the normal CDF.
+
+Usage:
+    python3 tools/bench_game_simulator.py
+    python3 tools/bench_game_simulator.py --games 15 --sims 100000 --ladder 20
+"""
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+WORKDIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKDIR / 'nba'))
+
+from game_simulator import MARGIN_SD, TOTAL_SD, simulate_slate  # noqa: E402
+
+
+def normal_above(x, mean, sd):
+    return 0.5 * math.erfc((x - mean) / (sd * math.sqrt(2)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark + accuracy check for the slate simulator')
+    parser.add_argument('--games', type=int, default=15)
+    parser.add_argument('--sims', type=int, default=100_000)
+    parser.add_argument('--ladder', type=int, default=20, help='Alt lines either side of the main line')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    spreads = rng.uniform(-12, 12, args.games).round(1)
+    totals = rng.uniform(210, 240, args.games).round(1)
+
+    simulate_slate(spreads[:1], totals[:1], n_sims=1000)  # warm up
+    start = time.perf_counter()
+    sim = simulate_slate(spreads, totals, n_sims=args.sims)
+    sim_ms = (time.perf_counter() - start) * 1000
+
+    steps = np.arange(-args.ladder, args.ladder + 0.5, 0.5)
+    start = time.perf_counter()
+    for g in range(args.games):
+        sim.home_cover(g, np.round(-spreads[g]) + steps)
+        sim.over(g, np.round(totals[g]) + steps)
+    price_ms = (time.perf_counter() - start) * 1000
+    n_lines = 2 * len(steps) * args.games
+    print(f"{args.games} games x {args.sims:,} sims: simulate {sim_ms:.0f} ms, "
+          f"{n_lines} lines priced in {price_ms:.1f} ms")
+
+    worst, tie_rate = 0.0, 0.0
+    for g in range(args.games):
+        for off in (-10.5, -4.5, 4.5, 10.5):
+            margin_line = round(spreads[g]) + off
+            cover, _, _ = sim.home_cover(g, [-margin_line])
+            worst = max(worst, abs(cover[0] - normal_above(margin_line, spreads[g], MARGIN_SD)))
+            total_line = round(totals[g]) + off
+            over, _, _ = sim.over(g, [total_line])
+            worst = max(worst, abs(over[0] - normal_above(total_line, totals[g], TOTAL_SD)))
+        tie_rate = max(tie_rate, normal_above(-0.5, spreads[g], MARGIN_SD) - normal_above(0.5, spreads[g], MARGIN_SD))
+    tolerance = 4 / math.sqrt(args.sims) + tie_rate
+    print(f"max |sim - normal| at half-point lines: {worst:.4f} (tolerance {tolerance:.4f})")
+    if worst > tolerance:
+        sys.exit(1)
+
+    for g in range(min(args.games, 5)):
+        cover, push, _ = sim.home_cover(g, [round(-spreads[g])])
+        over, _, _ = sim.over(g, [totals[g]])
+        print(f"  model {spreads[g]:+5.1f} / {totals[g]:.1f}: home win {sim.home_win[g]:.1%}, "
+              f"cover {round(-spreads[g]):+d} {cover[0]:.1%} (push {push[0]:.1%}), over {over[0]:.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Check `nba/props_kernel.py` against the scalar scoring code and time both.
+
+The scalar `calculate_ai_score`, `calculate_ev` and `calculate_probability_edge`
+(plus the MIN_* constants) are lifted straight out of each NBA props model's
+source, so the comparison runs without nba_api or an odds key. Every market
+is checked for exact equality on random props (including alt-line style
+grids around each player's average), then timed at 10k and 100k props.
+
+Usage:
+    python3 tools/bench_props_kernel.py
+    python3 tools/bench_props_kernel.py --sizes 1000 10000 --markets points
+"""
+import argparse
+import ast
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+WORKDIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKDIR / 'nba'))
+
+from props_kernel import MarketSpec, prop_inputs, score_arrays, score_batch  # noqa: E402
+
+MODELS = {
+    'points': ('nba_points_props_model.py', 'defense_factor'),
+    'assists': ('nba_assists_props_model.py', 'assists_factor'),
+    'rebounds': ('nba_rebounds_props_model.py', 'rebounding_factor'),
+    'threes': ('nba_3pt_props_model.py', 'three_point_factor'),
+}
+SCALAR_FUNCS = ('calculate_ai_score', 'calculate_ev', 'calculate_probability_edge')
+CONSTANTS = ('MIN_EDGE_OVER_LINE', 'MIN_EDGE_UNDER_LINE', 'MIN_RECENT_FORM_EDGE')
+
+
+def load_scalar(market):
+    """Exec just the scoring functions and constants from the model source."""
+    filename, _ = MODELS[market]
+    tree = ast.parse((WORKDIR / 'nba' / filename).read_text())
+    keep = [n for n in tree.body
+            if (isinstance(n, ast.FunctionDef) and n.name in SCALAR_FUNCS)
+            or (isinstance(n, ast.Assign) and any(getattr(t, 'id', None) in CONSTANTS for t in n.targets))]
+    ns = {}
+    exec(compile(ast.Module(body=keep, type_ignores=[]), filename, 'exec'), ns)
+    return ns
+
+
+def make_rows(market, n, seed=7):
+    """Random players, each priced at a grid of alternate lines around their average."""
+    _, factor_key = MODELS[market]
+    rng = random.Random(seed)
+    scale = {'points': 30, 'assists': 10, 'rebounds': 12, 'threes': 4}[market]
+    spec = MarketSpec.for_market(market, 0, 0, 0)
+    rows = []
+    while len(rows) < n:
+        avg = round(rng.uniform(0.2, scale), 1)
+        player = {
+            spec.season_key: avg,
+            spec.recent_key: round(max(0.0, avg + rng.uniform(-3, 3) * scale / 30), 1),
+            spec.rate_key: round(avg * rng.uniform(1.0, 1.6), 1),
+            'consistency_score': round(rng.random(), 2),
+            'games_played': rng.randint(0, 40),
+            'minutes': round(rng.uniform(5, 38), 1),
+        }
+        if spec.efficiency_key:
+            player[spec.efficiency_key] = round(rng.uniform(0.28, 0.55), 3)
+        opponent = rng.choice([None, {factor_key: round(rng.uniform(0.85, 1.15), 3)}])
+        for step in range(-6, 7):
+            line = max(0.5, round(avg + step * 0.5) - 0.5)
+            rows.append((player, line, rng.choice([-150, -125, -115, -110, 100, 110, 135]),
+                         rng.choice([-140, -120, -110, 105, 120]), opponent))
+    return rows[:n]
+
+
+def scalar_run(ns, rows):
+    out = {k: [] for k in ('over_score', 'under_score', 'over_ev', 'under_ev', 'over_prob_edge', 'under_prob_edge')}
+    for player, line, over_odds, under_odds, opponent in rows:
+        for side, odds in (('over', over_odds), ('under', under_odds)):
+            s = ns['calculate_ai_score'](player, line, side, opponent)
+            season = player.get(next(k for k in player if k.startswith('season_')), 0)
+            recent = player.get(next(k for k in player if k.startswith('recent_')), 0)
+            out[f'{side}_score'].append(s)
+            out[f'{side}_ev'].append(ns['calculate_ev'](s, line, season, recent, odds, side))
+            out[f'{side}_prob_edge'].append(ns['calculate_probability_edge'](s, season, recent, line, odds, side))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parity check + benchmark for the NBA props kernel')
+    parser.add_argument('--sizes', type=int, nargs='*', default=[10_000, 100_000])
+    parser.add_argument('--markets', nargs='*', default=list(MODELS))
+    args = parser.parse_args()
+
+    # kernel ms includes building the arrays from dicts; arrays ms is the NumPy scoring alone
+    print(f"{'market':<10} {'props':>8} {'scalar ms':>10} {'kernel ms':>10} {'arrays ms':>10} {'speedup':>8} {'scored':>7}  parity")
+    for market in args.markets:
+        ns = load_scalar(market)
+        spec = MarketSpec.for_market(market, ns['MIN_EDGE_OVER_LINE'], ns['MIN_EDGE_UNDER_LINE'],
+                                     ns['MIN_RECENT_FORM_EDGE'])
+        for n in args.sizes:
+            rows = make_rows(market, n)
+            start = time.perf_counter()
+            ref = scalar_run(ns, rows)
+            scalar_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            got = score_batch(spec, rows)
+            kernel_ms = (time.perf_counter() - start) * 1000
+            cols = prop_inputs(spec, rows)
+            start = time.perf_counter()
+            score_arrays(spec, cols['season_avg'], cols['recent_avg'], cols['per_36'], cols['consistency'],
+                         cols['line'], cols['over_odds'], cols['under_odds'], cols['opp_factor'],
+                         cols['games_played'], cols['minutes'], cols['efficiency'])
+            arrays_ms = (time.perf_counter() - start) * 1000
+            scored = int(np.count_nonzero(got['over_score']) + np.count_nonzero(got['under_score']))
+
+            mismatches = sum(int(np.count_nonzero(np.asarray(ref[k], dtype=float) != got[k])) for k in ref)
+            parity = 'exact' if mismatches == 0 else f'{mismatches} MISMATCHES'
+            print(f"{market:<10} {n:>8} {scalar_ms:>10.1f} {kernel_ms:>10.1f} {arrays_ms:>10.1f} "
+                  f"{scalar_ms / kernel_ms:>7.1f}x {scored:>7}  {parity}")
+            if mismatches:
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Time page rendering through `html_templates.py` against per-call compilation.
+
+Two comparisons, each rendering the same page `--renders` times:
+
+    props page    fresh Environment per render (compile every time) vs the
+                  shared environment's cached `props_page.html`
+    inline page   `jinja2.Template(source)` per render vs `compile_template(source)`
+
+Both sides of each comparison must produce identical HTML.
+
+Usage:
+    python3 tools/bench_templates.py
+    python3 tools/bench_templates.py --cards 40 --renders 50
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, Template
+
+WORKDIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKDIR))
+
+import html_templates  # noqa: E402
+from html_templates import compile_template, render  # noqa: E402
+
+INLINE_PAGE = """<html><body>
+{% for card in cards %}<div class="card">
+  <h3>{{ card.player }} ({{ card.team }})</h3>
+  <p>{{ card.side }} {{ card.line }} @ {{ card.odds }}</p>
+  {% if card.edge > 2 %}<span class="txt-green">{{ '%+.1f'|format(card.edge) }}</span>{% else %}<span>{{ card.edge }}</span>{% endif %}
+</div>{% endfor %}
+</body></html>"""
+
+
+def synthetic_page(n_cards):
+    cards = []
+    for i in range(n_cards):
+        edge = (i % 9) - 2.5
+        cards.append({
+            'logo_url': f'https://a.espncdn.com/i/teamlogos/nba/500/t{i % 30}.png',
+            'team': f'T{i % 30}',
+            'player': f'Player {i}',
+            'matchup': f'T{i % 30} @ T{(i + 7) % 30}',
+            'game_time': '7:30 PM ET',
+            'side': 'OVER' if i % 2 else 'UNDER',
+            'line': 20.5 + i % 7,
+            'odds': '-110',
+            'prediction': 22.4 + i % 5,
+            'edge': edge,
+            'metrics': [('AI SCORE', f'{7 + i % 3}.2', 'txt-green'), ('SEASON AVG', '21.8', ''),
+                        ('RECENT AVG', '23.1', 'txt-green')],
+            'player_record': {'season_record': f'{i % 6}-{i % 4}', 'player_roi': 4.2},
+            'tags': [{'text': 'Recent form', 'color': 'green'}],
+        })
+    half = n_cards // 2
+    record = {'wins': 120, 'losses': 98, 'win_rate': 55.0, 'profit': 9.4}
+    window = {'record': '12-8', 'win_rate': 60.0, 'profit': 3.1, 'roi': 15.5}
+    return {
+        'title': 'CourtSide Analytics - Bench',
+        'subheader': 'Bench Props Model',
+        'tagline': 'synthetic slate',
+        'record': record,
+        'summary': None,
+        'sections': [
+            {'title': 'Top OVERS', 'highlight': 'Min Edge 2.0', 'cards': cards[:half]},
+            {'title': 'Top UNDERS', 'highlight': 'Min Edge 2.0', 'cards': cards[half:]},
+        ],
+        'daily': {'today': {'record': '3-2', 'profit': 0.8, 'roi': 16.0},
+                  'yesterday': {'record': '1-4', 'profit': -3.3, 'roi': -66.0}},
+        'recent': [('Last 10', window), ('Last 20', window), ('Last 50', window)],
+        'recent_title': None,
+        'performance': None,
+    }
+
+
+def cold_env():
+    env = Environment(loader=FileSystemLoader(html_templates.TEMPLATE_DIR))
+    env.filters.update(html_templates.environment().filters)
+    return env
+
+
+def time_renders(fn, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        out = fn()
+    return (time.perf_counter() - start) * 1000, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the shared template environment')
+    parser.add_argument('--cards', type=int, default=30)
+    parser.add_argument('--renders', type=int, default=20)
+    args = parser.parse_args()
+
+    page = synthetic_page(args.cards)
+    render('props_page.html', **page)  # warm the shared cache
+
+    cold_ms, cold_html = time_renders(
+        lambda: cold_env().get_template('props_page.html').render(**page), args.renders)
+    warm_ms, warm_html = time_renders(lambda: render('props_page.html', **page), args.renders)
+    assert cold_html == warm_html, 'props page output differs'
+    print(f"props page ({args.cards} cards) x {args.renders}: compile each {cold_ms:.0f} ms, "
+          f"cached {warm_ms:.0f} ms ({cold_ms / max(warm_ms, 1e-9):.1f}x)")
+
+    cards = page['sections'][0]['cards'] + page['sections'][1]['cards']
+    compile_template(INLINE_PAGE)
+    raw_ms, raw_html = time_renders(lambda: Template(INLINE_PAGE).render(cards=cards), args.renders)
+    memo_ms, memo_html = time_renders(lambda: compile_template(INLINE_PAGE).render(cards=cards), args.renders)
+    assert raw_html == memo_html, 'inline page output differs'
+    print(f"inline page x {args.renders}: Template() {raw_ms:.0f} ms, "
+          f"compile_template() {memo_ms:.0f} ms ({raw_ms / max(memo_ms, 1e-9):.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark `tracking_stream.iter_picks` against `json.load`.
+
+Each method runs in a fresh child process so peak RSS (ru_maxrss) is not
+polluted by the other method. Reports peak RSS, time to the first pending
+pick, and total time to count all pending picks.
+
+Usage:
+    python3 tools/bench_tracking_stream.py
+    python3 tools/bench_tracking_stream.py nba/nba_points_props_tracking.json --status win
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+WORKDIR = Path(__file__).resolve().parents[1]
+DEFAULT_FILES = ['best_plays_tracking.json', 'unified_dashboard_data.json']
+
+CHILD = r'''
+import json, resource, sys, time
+sys.path.insert(0, sys.argv[1])
+method, path, status = sys.argv[2], sys.argv[3], sys.argv[4].lower()
+if method == 'stream':
+    from tracking_stream import iter_picks
+base_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+first = None
+count = 0
+if method == 'json.load':
+    with open(path) as f:
+        data = json.load(f)
+    picks = data if isinstance(data, list) else (data.get('picks') if 'picks' in data else data.get('plays', []))
+    for p in picks:
+        if isinstance(p, dict) and str(p.get('status') or 'pending').lower() == status:
+            if first is None:
+                first = time.perf_counter() - start
+            count += 1
+else:
+    for p in iter_picks(path, status=status):
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+total = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({'count': count, 'first': first, 'total': total,
+                  'peak_kb': peak_kb, 'delta_kb': peak_kb - base_kb}))
+'''
+
+
+def run_child(method, path, status):
+    out = subprocess.run(
+        [sys.executable, '-c', CHILD, str(WORKDIR), method, str(path), status],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare streaming reads with json.load')
+    parser.add_argument('files', nargs='*', default=DEFAULT_FILES)
+    parser.add_argument('--status', default='pending', help='Status to filter on (default: pending)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per method; best time is kept')
+    args = parser.parse_args()
+
+    print(f"{'file':<34} {'method':<10} {'size':>8} {'matches':>8} {'first ms':>9} {'total ms':>9} {'peak MB':>8} {'+heap MB':>9}")
+    for f in args.files:
+        path = Path(f) if os.path.isabs(f) else WORKDIR / f
+        if not path.exists():
+            print(f"{f:<34} (missing)")
+            continue
+        size_kb = path.stat().st_size / 1024
+        for method in ('json.load', 'stream'):
+            runs = [run_child(method, path, args.status) for _ in range(args.runs)]
+            best = min(runs, key=lambda r: r['total'])
+            first_ms = f"{best['first'] * 1000:.1f}" if best['first'] is not None else '-'
+            print(f"{f:<34} {method:<10} {size_kb:>6.0f}KB {best['count']:>8} {first_ms:>9} "
+                  f"{best['total'] * 1000:>9.1f} {best['peak_kb'] / 1024:>8.1f} {best['delta_kb'] / 1024:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -16,11 +16,16 @@ Checks performed:
 import json
 import glob
 import os
+import sys
 from pathlib import Path
 from statistics import median
 from datetime import datetime
 
 WORKDIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKDIR))
+
+from tracking_archive import read_tracking_file  # noqa: E402
+
 OUT_DIR = WORKDIR / 'tools' / 'reports'
 DETAIL_DIR = OUT_DIR / 'bet_realism_details'
 OUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -77,8 +82,7 @@ def safe_float(x):
 
 
 def analyze_file(path):
-    with open(path, 'r') as f:
-        data = json.load(f)
+    data = read_tracking_file(path)
     picks = normalize(data)
     total = len(picks)
     timestamps = []
@@ -5,10 +5,15 @@ Writes `audit_metrics_summary.csv` and per-model JSON summaries in `tools/metric
 import json
 import glob
 import os
+import sys
 from pathlib import Path
 from statistics import mean
 
 WORKDIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKDIR))
+
+from tracking_archive import read_tracking_file  # noqa: E402
+
 OUT_DIR = WORKDIR / "tools" / "metrics_out"
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -26,8 +31,7 @@ def am_to_decimal(odds):
 
 
 def process_file(path):
-    with open(path, 'r') as f:
-        data = json.load(f)
+    data = read_tracking_file(path)
 
     # Normalize different tracking file formats
     if isinstance(data, dict):
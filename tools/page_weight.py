@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Bytes and requests per generated page, first visit vs. with shared assets cached.
+
+For each page: HTML size, inline <style> bytes, and the requests it makes
+(stylesheets, scripts, images, SVG sprite files), split into local files
+under the repo (size known, cacheable across pages) and remote URLs (ESPN
+logos, fonts; size unknown). The session total counts each distinct URL
+once, as a phone opening every page in a row would fetch it.
+
+Usage:
+    python3 tools/page_weight.py                        # published props pages
+    python3 tools/page_weight.py nba/*.html best_plays.html
+"""
+import argparse
+import re
+import sys
+from pathlib import Path
+from urllib.parse import urlsplit
+
+WORKDIR = Path(__file__).resolve().parents[1]
+
+DEFAULT_PAGES = [
+    'nba/nba_points_props.html', 'nba/nba_rebounds_props.html', 'nba/nba_assists_props.html',
+    'nba/nba_3pt_props.html', 'nfl/nfl_passing_yards_props.html', 'nfl/nfl_rushing_yards_props.html',
+    'nfl/nfl_receiving_yards_props.html', 'nfl/nfl_receptions_props.html', 'best_plays.html',
+]
+
+STYLE_BLOCK = re.compile(r'<style[^>]*>(.*?)</style>', re.S | re.I)
+REFERENCES = [
+    ('css', re.compile(r'<link[^>]+href="([^"]+)"[^>]*rel="stylesheet"|<link[^>]+rel="stylesheet"[^>]*href="([^"]+)"', re.I)),
+    ('js', re.compile(r'<script[^>]+src="([^"]+)"', re.I)),
+    ('img', re.compile(r'<img[^>]+src="([^"]+)"', re.I)),
+    ('sprite', re.compile(r'<use[^>]+href="([^"#]+)#', re.I)),
+]
+
+
+def page_requests(page, html):
+    """[(kind, url, local Path or None)] for each distinct resource the page loads."""
+    seen, out = set(), []
+    for kind, pattern in REFERENCES:
+        for match in pattern.finditer(html):
+            url = next(g for g in match.groups() if g)
+            if url in seen or url.startswith('data:'):
+                continue
+            seen.add(url)
+            local = None
+            if not urlsplit(url).scheme:
+                local = (page.parent / url).resolve()
+            out.append((kind, url, local))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Page weight and request count for generated pages')
+    parser.add_argument('pages', nargs='*', help='HTML pages (default: the props pages and best_plays.html)')
+    args = parser.parse_args()
+
+    pages = [Path(p) for p in args.pages] or [WORKDIR / p for p in DEFAULT_PAGES]
+    session_urls = {}
+    totals = {'html': 0, 'style': 0, 'requests': 0, 'first': 0, 'repeat': 0}
+    print(f"{'page':38} {'html KB':>8} {'inline css':>10} {'requests':>8} {'remote':>6} {'local KB':>8}")
+    for page in pages:
+        if not page.exists():
+            print(f"{page.name:38} (missing)")
+            continue
+        html = page.read_text(errors='ignore')
+        html_bytes = len(html.encode('utf-8'))
+        style_bytes = sum(len(m.encode('utf-8')) for m in STYLE_BLOCK.findall(html))
+        reqs = page_requests(page, html)
+        local_bytes = 0
+        for kind, url, local in reqs:
+            size = local.stat().st_size if local and local.exists() else 0
+            local_bytes += size
+            session_urls[local or url] = size
+        remote = sum(1 for _, _, local in reqs if local is None)
+        print(f"{page.name:38} {html_bytes / 1024:8.1f} {style_bytes / 1024:9.1f}K {len(reqs):8} {remote:6} "
+              f"{local_bytes / 1024:8.1f}")
+        totals['html'] += html_bytes
+        totals['style'] += style_bytes
+        totals['requests'] += len(reqs) + 1
+        totals['first'] += html_bytes + local_bytes
+
+    if not session_urls and not totals['html']:
+        return
+    shared = sum(session_urls.values())
+    print(f"\n{len(pages)} pages: {totals['html'] / 1024:.1f} KB HTML "
+          f"({totals['style'] / 1024:.1f} KB of it inline CSS), {totals['requests']} requests")
+    print(f"Each page fetched cold: {totals['first'] / 1024:.1f} KB of HTML + local assets")
+    print(f"One session (assets cached after first use): {(totals['html'] + shared) / 1024:.1f} KB, "
+          f"{len(pages) + len(session_urls)} requests ({len(session_urls)} distinct resources)")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
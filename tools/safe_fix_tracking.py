@@ -10,15 +10,23 @@ Fixes applied (conservative):
 - If `profit_loss` missing but `profit` exists, copy `profit` -> `profit_loss`.
 - Normalize `status`/`result` casing to canonical values (WIN/LOSS/PUSH/VOID/PENDING).
 
+Archived picks (tracking_archive partitions) are included, so each copy holds the
+file's full history.
+
 Backups: writes cleaned copies only; originals remain untouched.
 """
 import json
 import glob
 import os
+import sys
 from pathlib import Path
 import re
 
 WORKDIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKDIR))
+
+from tracking_archive import read_tracking_file  # noqa: E402
+
 OUT_BASE = WORKDIR / 'tools' / 'reports' / 'fixed'
 OUT_BASE.mkdir(parents=True, exist_ok=True)
 
@@ -118,8 +126,7 @@ def process_file(path):
     rel = Path(path).relative_to(WORKDIR)
     out_path = OUT_BASE / (str(rel).replace(os.sep, '__') + '.fixed.json')
     try:
-        with open(path, 'r') as f:
-            data = json.load(f)
+        data = read_tracking_file(path)
     except Exception as e:
         return (path, False, f'read_error: {e}')
 
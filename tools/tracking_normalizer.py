@@ -115,16 +115,25 @@ def normalize_tracking(obj: Any) -> Any:
 
 
 def _cli_process_folder(folder: Path, write_back: bool = False):
+    # Archive-aware files are read with their full history and written back through
+    # save_tracking, so archived picks are normalized too and stay in their partitions
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from tracking_archive import list_partitions, read_tracking_file, save_tracking
+
     files = list(folder.glob('**/*_tracking.json'))
     changed = []
     for f in files:
         try:
-            data = json.loads(f.read_text())
+            data = read_tracking_file(f)
             norm = normalize_tracking(data)
             if json.dumps(norm, sort_keys=True) != json.dumps(data, sort_keys=True):
                 changed.append(str(f))
                 if write_back:
-                    f.write_text(json.dumps(norm, indent=2, ensure_ascii=False))
+                    if list_partitions(f):
+                        save_tracking(f, norm)
+                    else:
+                        f.write_text(json.dumps(norm, indent=2, ensure_ascii=False))
         except Exception:
             continue
     return changed
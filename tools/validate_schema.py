@@ -7,10 +7,15 @@ Outputs:
 import json
 import glob
 import os
+import sys
 from pathlib import Path
 import csv
 
 WORKDIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(WORKDIR))
+
+from tracking_archive import read_tracking_file  # noqa: E402
+
 OUT_DIR = WORKDIR / "tools" / "reports"
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -47,8 +52,7 @@ def normalize(data):
 
 
 def check_file(path):
-    with open(path, 'r') as f:
-        data = json.load(f)
+    data = read_tracking_file(path)
     picks = normalize(data)
     total = len(picks)
     picks_with_all_required = 0
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Hot/Cold Tracking Archive
+-------------------------
+Keeps each `*_tracking.json` file small by rolling settled picks that are older
+than a cutoff into per-season, per-month archive partitions:
+
+    nba/nba_points_props_tracking.json                      <- hot: pending + recent
+    nba/archive/nba_points_props_tracking/2025-26/2025-11.json
+    nba/archive/nba_points_props_tracking/2025-26/2025-12.json
+
+Graders, `retrieve_active_plays` and the best plays bot only need the hot file.
+Callers that need all-time records (tracking stats, dashboards) pass
+`full_history=True`, which is the only time archive partitions are opened.
+
+Usage (roll every archive-aware tracking file):
+    python3 tracking_archive.py --roll
+    python3 tracking_archive.py --roll --days 21 --dry-run
+    python3 tracking_archive.py --stats nba/nba_points_props_tracking.json
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Settled picks whose game is older than this stay out of the hot file
+HOT_WINDOW_DAYS = 14
+
+ARCHIVE_DIRNAME = "archive"
+SETTLED_STATUSES = {'win', 'won', 'loss', 'lost', 'push', 'void', 'cancelled', 'refunded'}
+
+# Month a season rolls over, per sport folder. Winter sports straddle two years
+# ("2025-26"); summer sports stay within one calendar year ("2025").
+SEASON_START_MONTH = {
+    'nba': 8,
+    'ncaa': 8,
+    'nfl': 8,
+    'soccer': 8,
+    'cfb': 8,
+    'wnba': 1,
+    'mlb': 1,
+}
+DEFAULT_SEASON_START_MONTH = 8
+
+
+def _empty_tracking() -> dict[str, Any]:
+    return {'picks': []}
+
+
+def pick_datetime(pick: dict[str, Any]) -> Optional[datetime]:
+    """Return the pick's game time as an aware UTC datetime (None if unparseable)."""
+    raw = pick.get('game_time') or pick.get('game_date') or pick.get('commence_time')
+    if not raw:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(raw).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def is_settled(pick: dict[str, Any]) -> bool:
+    return str(pick.get('status') or 'pending').lower() in SETTLED_STATUSES
+
+
+def pick_key(pick: dict[str, Any]) -> str:
+    """Stable identity used when merging picks into a partition."""
+    if pick.get('pick_id'):
+        return str(pick['pick_id'])
+    return '|'.join(str(pick.get(k, '')) for k in (
+        'game_time', 'game_date', 'player', 'home_team', 'away_team',
+        'bet_type', 'pick_type', 'prop_line', 'line', 'market_line',
+    ))
+
+
+def season_label(dt: datetime, start_month: int = DEFAULT_SEASON_START_MONTH) -> str:
+    if start_month <= 1:
+        return str(dt.year)
+    start_year = dt.year if dt.month >= start_month else dt.year - 1
+    return f"{start_year}-{str(start_year + 1)[-2:]}"
+
+
+def _season_start_month(tracking_file: Path) -> int:
+    return SEASON_START_MONTH.get(tracking_file.parent.name, DEFAULT_SEASON_START_MONTH)
+
+
+def archive_dir(tracking_file: str | Path) -> Path:
+    """`nba/nba_points_props_tracking.json` -> `nba/archive/nba_points_props_tracking/`"""
+    path = Path(tracking_file)
+    return path.parent / ARCHIVE_DIRNAME / path.stem
+
+
+def partition_path(tracking_file: str | Path, dt: datetime) -> Path:
+    path = Path(tracking_file)
+    season = season_label(dt, _season_start_month(path))
+    return archive_dir(path) / season / f"{dt.strftime('%Y-%m')}.json"
+
+
+def list_partitions(tracking_file: str | Path) -> list[Path]:
+    """All archive partitions for a tracking file, oldest first."""
+    base = archive_dir(tracking_file)
+    if not base.exists():
+        return []
+    return sorted(base.glob('*/*.json'), key=lambda p: p.stem)
+
+
+def split_hot_cold(picks: Iterable[dict[str, Any]], hot_days: float = HOT_WINDOW_DAYS,
+                   now: Optional[datetime] = None) -> tuple[list, list]:
+    """
+    Split picks into (hot, cold).
+
+    Cold = settled AND game time older than `hot_days`. Pending picks and picks
+    without a parseable game time always stay hot so nothing can be lost.
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=hot_days)
+    hot, cold = [], []
+    for p in picks:
+        if not isinstance(p, dict):
+            hot.append(p)
+            continue
+        dt = pick_datetime(p)
+        if dt is not None and dt < cutoff and is_settled(p):
+            cold.append(p)
+        else:
+            hot.append(p)
+    return hot, cold
+
+
+def _read_json(path: Path, default: Any) -> Any:
+    if not path.exists():
+        return default
+    try:
+        with path.open('r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return default
+
+
+def _write_json(path: Path, data: Any, indent: Optional[int] = 2) -> None:
+    """Write atomically so a crash mid-write never truncates a tracking file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open('w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent)
+    os.replace(tmp, path)
+
+
+def _merge_into_partitions(tracking_file: Path, cold: list[dict[str, Any]]) -> int:
+    """Upsert cold picks into their month partitions. Returns picks written."""
+    by_partition: dict[Path, list[dict[str, Any]]] = {}
+    for p in cold:
+        by_partition.setdefault(partition_path(tracking_file, pick_datetime(p)), []).append(p)
+
+    written = 0
+    for part, picks in by_partition.items():
+        existing = _read_json(part, _empty_tracking()).get('picks', [])
+        merged = {pick_key(p): p for p in existing}
+        for p in picks:
+            merged[pick_key(p)] = p
+        ordered = sorted(merged.values(), key=lambda p: pick_datetime(p) or datetime.min.replace(tzinfo=timezone.utc))
+        _write_json(part, {'picks': ordered})
+        written += len(picks)
+    return written
+
+
+def iter_archived_picks(tracking_file: str | Path, season: Optional[str] = None,
+                        month: Optional[str] = None) -> Iterator[dict[str, Any]]:
+    """
+    Yield archived picks, opening one partition at a time.
+
+    `season` is a label like "2025-26"; `month` is "YYYY-MM".
+    """
+    for part in list_partitions(tracking_file):
+        if season and part.parent.name != season:
+            continue
+        if month and part.stem != month:
+            continue
+        yield from _read_json(part, _empty_tracking()).get('picks', [])
+
+
+def load_tracking(tracking_file: str | Path, full_history: bool = False,
+                  default: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    """
+    Load a tracking file.
+
+    By default only the hot file is parsed. With `full_history=True` the archived
+    picks are prepended (oldest first) so the result looks exactly like the old
+    single-file layout.
+    """
+    path = Path(tracking_file)
+    data = _read_json(path, None)
+    if not isinstance(data, dict):
+        data = dict(default) if default is not None else _empty_tracking()
+        data['picks'] = list(data.get('picks', []))
+    data.setdefault('picks', [])
+
+    if full_history:
+        archived = list(iter_archived_picks(path))
+        if archived:
+            hot_keys = {pick_key(p) for p in data['picks'] if isinstance(p, dict)}
+            data['picks'] = [p for p in archived if pick_key(p) not in hot_keys] + data['picks']
+    return data
+
+
+def read_tracking_file(tracking_file: str | Path) -> Any:
+    """
+    Parse a tracking file in whatever layout it uses, with full history.
+
+    For the audit tools that scan every `*_tracking.json` (some are bare lists or
+    use other top-level keys). Files with archive partitions are always dicts
+    written by `save_tracking`, so those go through `load_tracking(full_history=True)`.
+    Raises like `json.load` on unreadable files.
+    """
+    path = Path(tracking_file)
+    if list_partitions(path):
+        return load_tracking(path, full_history=True)
+    with path.open('r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_tracking(tracking_file: str | Path, data: dict[str, Any],
+                  hot_days: float = HOT_WINDOW_DAYS) -> dict[str, Any]:
+    """
+    Save a tracking dict, rolling any cold picks into the archive first.
+
+    Safe to call with data loaded via `full_history=True`: archived picks are
+    upserted back into their own partitions instead of landing in the hot file.
+    Returns the dict that was written to the hot file.
+    """
+    path = Path(tracking_file)
+    hot, cold = split_hot_cold(data.get('picks', []), hot_days=hot_days)
+    if cold:
+        _merge_into_partitions(path, cold)
+    hot_data = dict(data)
+    hot_data['picks'] = hot
+    _write_json(path, hot_data)
+    return hot_data
+
+
+def roll_tracking_file(tracking_file: str | Path, hot_days: float = HOT_WINDOW_DAYS,
+                       dry_run: bool = False) -> int:
+    """Move cold picks out of one hot file. Returns the number of picks archived."""
+    path = Path(tracking_file)
+    data = _read_json(path, None)
+    if not isinstance(data, dict) or not isinstance(data.get('picks'), list):
+        return 0
+    _, cold = split_hot_cold(data['picks'], hot_days=hot_days)
+    if cold and not dry_run:
+        save_tracking(path, data, hot_days=hot_days)
+    return len(cold)
+
+
+# Tracking files whose owners read through load_tracking(). Only these may be
+# rolled; anything else would silently lose history from its own stats.
+ARCHIVED_TRACKING_FILES = [
+    'nba/nba_points_props_tracking.json',
+    'nba/nba_assists_props_tracking.json',
+    'nba/nba_rebounds_props_tracking.json',
+    'nba/nba_3pt_props_tracking.json',
+    'nba/nba_picks_tracking.json',
+    'nfl/nfl_passing_yards_props_tracking.json',
+    'nfl/nfl_rushing_yards_props_tracking.json',
+    'nfl/nfl_receiving_yards_props_tracking.json',
+    'nfl/nfl_receptions_props_tracking.json',
+    'nfl/atd_model_tracking.json',
+    'ncaa/ncaab_picks_tracking.json',
+]
+
+
+def find_tracking_files(root: str | Path = SCRIPT_DIR) -> list[Path]:
+    root = Path(root)
+    return [root / f for f in ARCHIVED_TRACKING_FILES if (root / f).exists()]
+
+
+def archive_stats(tracking_file: str | Path) -> dict[str, Any]:
+    path = Path(tracking_file)
+    parts = list_partitions(path)
+    hot = _read_json(path, _empty_tracking())
+    return {
+        'hot_picks': len(hot.get('picks', [])) if isinstance(hot, dict) else 0,
+        'hot_bytes': path.stat().st_size if path.exists() else 0,
+        'partitions': len(parts),
+        'archived_bytes': sum(p.stat().st_size for p in parts),
+    }
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Roll settled picks into archive partitions')
+    parser.add_argument('files', nargs='*', help='Tracking files (default: ARCHIVED_TRACKING_FILES)')
+    parser.add_argument('--roll', action='store_true', help='Move cold picks into the archive')
+    parser.add_argument('--days', type=float, default=HOT_WINDOW_DAYS, help=f'Hot window in days (default: {HOT_WINDOW_DAYS})')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would move without writing')
+    parser.add_argument('--stats', action='store_true', help='Show hot/archive sizes')
+    args = parser.parse_args()
+
+    files = [Path(f) for f in args.files] or find_tracking_files()
+    for f in files:
+        if args.roll:
+            moved = roll_tracking_file(f, hot_days=args.days, dry_run=args.dry_run)
+            verb = 'would archive' if args.dry_run else 'archived'
+            print(f"{f}: {verb} {moved} picks")
+        if args.stats or not args.roll:
+            s = archive_stats(f)
+            print(f"{f}: hot={s['hot_picks']} picks ({s['hot_bytes'] / 1024:.0f} KB), "
+                  f"archive={s['partitions']} partitions ({s['archived_bytes'] / 1024:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()
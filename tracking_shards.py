@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Pick History Shards
+-------------------
+The tracking dashboards show every settled pick in a "Pick History" table
+without carrying the history in the page. Settled picks are written as one
+small JSON file per ET month next to the dashboard, plus an index:
+
+    nba/nba_tracking_dashboard.html
+    nba/history/nba_tracking_dashboard/index.json     months, counts, W-L, shard hashes
+    nba/history/nba_tracking_dashboard/2025-12.json   that month's rows, newest first
+
+The page carries only an empty panel and the shared `history.js` bundle
+(site_assets.py). The browser fetches the index after the page has painted,
+loads the newest month, and pulls older months as the table is scrolled or
+filtered, so the page's first paint is the same for 200 picks or 20,000.
+Rows are drawn into a fixed-height scrolling window (only the visible rows
+exist in the DOM).
+
+Shards are rewritten only when their bytes change. The index lists each
+shard's hash, which the client appends to the shard URL, so a closed month
+stays cached in the browser and in git.
+
+Rows are compact arrays in `COLUMNS` order:
+
+    d  ET date           g  game              t  pick type
+    p  pick              l  line              e  edge
+    s  win/loss/push     u  profit (units)    r  final score
+
+    write_history(TRACKING_HTML_FILE, tracking_data['picks'])
+    panel = history_panel(TRACKING_HTML_FILE)        # HTML for the dashboard template
+
+Usage (shard a tracking file by hand and show the result):
+    python3 tracking_shards.py ncaa/ncaab_picks_tracking.json ncaa/ncaab_tracking_dashboard.html
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import pytz
+
+try:
+    from render_manifest import write_if_changed
+    from tracking_archive import is_settled, load_tracking, pick_datetime
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from render_manifest import write_if_changed
+    from tracking_archive import is_settled, load_tracking, pick_datetime
+
+HISTORY_DIRNAME = "history"
+INDEX_NAME = "index.json"
+COLUMNS = ['d', 'g', 't', 'p', 'l', 'e', 's', 'u', 'r']
+
+ET = pytz.timezone('US/Eastern')
+
+RESULT_STATUS = {'win': 'win', 'won': 'win', 'loss': 'loss', 'lost': 'loss', 'push': 'push'}
+
+
+def history_dir(page: str | Path) -> Path:
+    """`<sport>/history/<page stem>/` for a dashboard page."""
+    page = Path(page)
+    return page.parent / HISTORY_DIRNAME / page.stem
+
+
+def _number(value: Any, digits: int) -> Optional[float]:
+    try:
+        return round(float(value), digits)
+    except (TypeError, ValueError):
+        return None
+
+
+def history_row(pick: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Compact history row for a settled pick (None for pending/void picks or no game date)."""
+    status = RESULT_STATUS.get(str(pick.get('status') or '').lower())
+    dt = pick_datetime(pick)
+    if status is None or dt is None:
+        return None
+
+    game = pick.get('matchup')
+    if not game and pick.get('home_team') and pick.get('away_team'):
+        game = f"{pick['away_team']} @ {pick['home_team']}"
+    text = str(pick.get('pick') or pick.get('pick_text') or '')
+    if ':' in text and text.lstrip().startswith('✅'):
+        text = text.split(':', 1)[1].strip()
+
+    home, away = pick.get('actual_home_score'), pick.get('actual_away_score')
+    score = f"{away}-{home}" if home is not None and away is not None else pick.get('actual_score')
+
+    profit = pick.get('profit_loss')
+    if profit is None:
+        profit = pick.get('profit')
+    units = _number(profit, 4)
+
+    return {
+        'd': dt.astimezone(ET).strftime('%Y-%m-%d'),
+        'g': game or '',
+        't': str(pick.get('pick_type') or '').title(),
+        'p': text,
+        'l': _number(pick.get('market_line', pick.get('line')), 1),
+        'e': _number(pick.get('edge'), 1),
+        's': status,
+        'u': round(units / 100, 2) if units is not None else None,
+        'r': score or '',
+    }
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def build_shards(picks: Iterable[dict[str, Any]],
+                 row: Callable[[dict[str, Any]], Optional[dict[str, Any]]] = history_row
+                 ) -> OrderedDict[str, list[dict[str, Any]]]:
+    """{month: rows} for settled picks, newest month and newest row first."""
+    months: dict[str, list[dict[str, Any]]] = {}
+    for pick in picks:
+        if not is_settled(pick):
+            continue
+        entry = row(pick)
+        if entry:
+            months.setdefault(entry['d'][:7], []).append(entry)
+    shards = OrderedDict()
+    for month in sorted(months, reverse=True):
+        # Stable order: date descending, then the order the tracking file logged them
+        shards[month] = sorted(months[month], key=lambda r: r['d'], reverse=True)
+    return shards
+
+
+def write_history(page: str | Path, picks: Iterable[dict[str, Any]],
+                  row: Callable[[dict[str, Any]], Optional[dict[str, Any]]] = history_row
+                  ) -> dict[str, int]:
+    """
+    Write the month shards and index for a dashboard page. Unchanged shards are
+    left alone; shards for months that no longer have picks are removed.
+    Returns {'written', 'unchanged', 'removed', 'rows'}.
+    """
+    folder = history_dir(page)
+    shards = build_shards(picks, row)
+    summary = {'written': 0, 'unchanged': 0, 'removed': 0, 'rows': 0}
+    months, types = [], set()
+    for month, rows in shards.items():
+        data = _dumps({'month': month, 'rows': [[r[c] for c in COLUMNS] for r in rows]})
+        name = f"{month}.json"
+        summary['written' if write_if_changed(folder / name, data) else 'unchanged'] += 1
+        summary['rows'] += len(rows)
+        types.update(r['t'] for r in rows if r['t'])
+        months.append({
+            'month': month,
+            'file': name,
+            'hash': hashlib.sha256(data).hexdigest()[:10],
+            'count': len(rows),
+            'wins': sum(1 for r in rows if r['s'] == 'win'),
+            'losses': sum(1 for r in rows if r['s'] == 'loss'),
+            'pushes': sum(1 for r in rows if r['s'] == 'push'),
+            'units': round(sum(r['u'] or 0 for r in rows), 2),
+        })
+
+    if folder.exists():
+        for stale in folder.glob('????-??.json'):
+            if stale.stem not in shards:
+                stale.unlink()
+                summary['removed'] += 1
+
+    index = {'columns': COLUMNS, 'total': summary['rows'], 'types': sorted(types), 'months': months}
+    write_if_changed(folder / INDEX_NAME, _dumps(index))
+    return summary
+
+
+def history_index_url(page: str | Path) -> str:
+    """index.json URL relative to the page."""
+    page = Path(page).resolve()
+    return Path(os.path.relpath(history_dir(page) / INDEX_NAME, page.parent)).as_posix()
+
+
+def history_panel(page: str | Path) -> str:
+    """The "Pick History" card for a dashboard; rows are loaded by history.js."""
+    from html_templates import render
+    return render('history_panel.html', page=page, index=history_index_url(page))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Write pick-history shards for a tracking dashboard')
+    parser.add_argument('tracking_file', help='Tracking JSON ({"picks": [...]} or a list)')
+    parser.add_argument('page', help='Dashboard HTML the shards belong to')
+    args = parser.parse_args()
+
+    with open(args.tracking_file, 'r') as f:
+        raw = json.load(f)
+    # List-format files (NFL) aren't archive-aware; dict files may have archived months
+    picks = raw if isinstance(raw, list) else load_tracking(args.tracking_file, full_history=True)['picks']
+    summary = write_history(args.page, picks)
+    print(f"📜 {summary['rows']} settled picks -> {history_dir(args.page)}")
+    print(f"   {summary['written']} shards written, {summary['unchanged']} unchanged, "
+          f"{summary['removed']} removed")
+
+
+if __name__ == '__main__':
+    main()
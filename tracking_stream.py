@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Streaming Tracking Reader
+-------------------------
+Iterates picks out of large tracking / dashboard JSON files without loading
+the whole document. The file is read in chunks and only the pick currently
+being yielded is materialized, so memory stays flat no matter how big
+`best_plays_tracking.json` or `unified_dashboard_data.json` get.
+
+    from tracking_stream import iter_picks, count_picks
+
+    for p in iter_picks('best_plays_tracking.json', status='pending'):
+        ...
+    n = count_picks('ncaa/ncaab_picks_tracking.json', status={'win', 'loss'},
+                    since='2025-12-01', full_history=True)
+
+Works on `{"picks": [...]}`, `{"plays": [...]}` and bare `[...]` documents.
+Reading stops as soon as the pick array closes, so trailing keys such as
+`summary` or `record` are never parsed.
+
+Use it for filtered scans that keep a few picks, such as the grading
+scheduler's pending check. Readers that need every pick anyway (the pick table
+behind best plays and the dashboards, the model tracking pages, and the tools/
+reports) go through `tracking_archive.load_tracking`. On a full scan, json.load
+is faster than this parser and peaks at about the same memory.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+import pytz
+
+from tracking_archive import iter_archived_picks, list_partitions, pick_datetime
+
+ET = pytz.timezone('US/Eastern')
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+PICK_ARRAY_KEYS = ('picks', 'plays')
+
+_WHITESPACE = ' \t\n\r'
+_DECODER = json.JSONDecoder()
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_TAIL = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+
+
+class _ChunkReader:
+    """Minimal pull parser over a text stream, refilled one chunk at a time."""
+
+    def __init__(self, f, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        # Drop everything already consumed so the buffer never grows with the file
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, ch: str) -> None:
+        got = self.peek()
+        if got != ch:
+            raise ValueError(f"Expected '{ch}' but found '{got or 'EOF'}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value (one pick, one key, one scalar)."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number can be cut in half by the chunk boundary
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def skip_value(self) -> None:
+        """Step over the next value without building it (used for non-pick keys)."""
+        if self.peek() not in '{[':
+            self.value()
+            return
+        depth = 0
+        while True:
+            m = _STRUCTURAL.search(self.buf, self.pos)
+            if not m:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise ValueError('Unexpected end of JSON while skipping value')
+                continue
+            self.pos = m.end()
+            ch = m.group()
+            if ch == '"':
+                while True:
+                    s = _STRING_TAIL.match(self.buf, self.pos)
+                    if s:
+                        self.pos = s.end()
+                        break
+                    if not self._fill():
+                        raise ValueError('Unterminated string in JSON')
+            elif ch in '{[':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+
+def _iter_array(reader: _ChunkReader) -> Iterator[Any]:
+    reader.expect('[')
+    while True:
+        ch = reader.peek()
+        if ch == ']':
+            reader.pos += 1
+            return
+        if ch == ',':
+            reader.pos += 1
+            continue
+        if ch == '':
+            raise ValueError('Unexpected end of JSON inside pick array')
+        yield reader.value()
+
+
+def _iter_raw_picks(path: Path, keys: Iterable[str], chunk_size: int) -> Iterator[Any]:
+    keys = tuple(keys)
+    with path.open('r', encoding='utf-8') as f:
+        reader = _ChunkReader(f, chunk_size)
+        ch = reader.peek()
+        if ch == '[':
+            yield from _iter_array(reader)
+            return
+        reader.expect('{')
+        while True:
+            ch = reader.peek()
+            if ch in ('}', ''):
+                return
+            if ch == ',':
+                reader.pos += 1
+                continue
+            key = reader.value()
+            reader.expect(':')
+            if key in keys and reader.peek() == '[':
+                yield from _iter_array(reader)
+                return
+            reader.skip_value()
+
+
+def _as_date(value: Union[str, date, datetime, None]) -> Optional[date]:
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(str(value)[:10])
+
+
+def _pick_et_date(pick: dict[str, Any]) -> Optional[date]:
+    dt = pick_datetime(pick)
+    return dt.astimezone(ET).date() if dt else None
+
+
+def iter_picks(path: Union[str, Path], status: Union[str, Iterable[str], None] = None,
+               since: Union[str, date, None] = None, until: Union[str, date, None] = None,
+               full_history: bool = False, keys: Iterable[str] = PICK_ARRAY_KEYS,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    """
+    Yield picks one at a time, optionally filtered.
+
+    status: "pending" or a set like {"win", "loss"} (case-insensitive)
+    since / until: inclusive game dates in ET ("YYYY-MM-DD" or date)
+    full_history: also stream the archive partitions from `tracking_archive`
+    """
+    path = Path(path)
+    if isinstance(status, str):
+        statuses = {status.lower()}
+    else:
+        statuses = {s.lower() for s in status} if status else None
+    since_d, until_d = _as_date(since), _as_date(until)
+
+    sources = []
+    if full_history:
+        sources.extend(list_partitions(path))
+    if path.exists():
+        sources.append(path)
+
+    for source in sources:
+        for p in _iter_raw_picks(source, keys, chunk_size):
+            if not isinstance(p, dict):
+                continue
+            if statuses is not None and str(p.get('status') or 'pending').lower() not in statuses:
+                continue
+            if since_d or until_d:
+                d = _pick_et_date(p)
+                if d is None or (since_d and d < since_d) or (until_d and d > until_d):
+                    continue
+            yield p
+
+
+def count_picks(path: Union[str, Path], **filters) -> int:
+    """Count picks matching the same filters as `iter_picks` without keeping any."""
+    return sum(1 for _ in iter_picks(path, **filters))
+
+
+__all__ = ['iter_picks', 'count_picks', 'iter_archived_picks']
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """
 Unified Sports Betting Dashboard
-Aggregates picks from all models (NBA, NCAA, MLB, CFB, Props) into one interface
+Aggregates picks from all models (NBA, NCAAB, Props) into one interface
 Similar to DGFantasy optimizer
+
+Picks and rollups come from the shared pick table (pick_table.py)
 """
 
 import json
@@ -11,27 +13,17 @@ from datetime import datetime, timedelta
 import pytz
 from collections import defaultdict
 
+try:
+    from pick_table import DASHBOARD_MODELS, load_table
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from pick_table import DASHBOARD_MODELS, load_table
+
 # Configuration
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_HTML = os.path.join(SCRIPT_DIR, "unified_dashboard.html")
 
-# Model tracking files
-MODEL_FILES = {
-    'NBA': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'nba', 'nba_picks_tracking.json'),
-        '3pt_props': os.path.join(SCRIPT_DIR, 'nba', 'nba_3pt_props_tracking.json')
-    },
-    'NCAA': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'ncaa', 'ncaab_picks_tracking.json')
-    },
-    'MLB': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'mlb', 'mlb_picks_tracking.json') if os.path.exists(os.path.join(SCRIPT_DIR, 'mlb', 'mlb_picks_tracking.json')) else None
-    },
-    'CFB': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'cfb', 'cfb_picks_tracking.json') if os.path.exists(os.path.join(SCRIPT_DIR, 'cfb', 'cfb_picks_tracking.json')) else None
-    }
-}
-
 # ANSI colors
 class Colors:
     CYAN = '\033[96m'
@@ -41,68 +33,7 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
-def load_model_data(file_path):
-    """Load data from a model's tracking JSON file"""
-    if not file_path or not os.path.exists(file_path):
-        return None
-
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"{Colors.RED}✗ Error loading {file_path}: {e}{Colors.END}")
-        return None
-
-def normalize_pick_format(pick, sport, model_type):
-    """
-    Normalize different pick formats into a unified structure
-    """
-    normalized = {
-        'sport': sport,
-        'model_type': model_type,
-        'pick_id': pick.get('pick_id', ''),
-        'status': pick.get('status', 'pending'),
-        'game_date': None,
-        'matchup': '',
-        'pick_description': '',
-        'odds': None,
-        'edge': None,
-        'ai_score': None,
-        'result': pick.get('result'),
-        'profit_loss': pick.get('profit_loss', 0)
-    }
-
-    # Handle spread/total picks (NBA/NCAA/MLB/CFB)
-    if model_type == 'spreads_totals':
-        normalized.update({
-            'game_date': pick.get('game_date'),
-            'matchup': pick.get('matchup', f"{pick.get('away_team', '')} @ {pick.get('home_team', '')}"),
-            'pick_description': pick.get('pick', ''),
-            'odds': -110,  # Standard odds for spreads/totals
-            'edge': pick.get('edge'),
-            'pick_type': pick.get('pick_type', 'Unknown')
-        })
-
-    # Handle player props (3PT, etc.)
-    elif model_type == '3pt_props':
-        player = pick.get('player', 'Unknown')
-        prop_line = pick.get('prop_line', 0)
-        bet_type = pick.get('bet_type', 'over').upper()
-        team = pick.get('team', '')
-        opponent = pick.get('opponent', '')
-
-        normalized.update({
-            'game_date': pick.get('game_time'),
-            'matchup': f"{team} vs {opponent}",
-            'pick_description': f"{player} {bet_type} {prop_line} 3PT",
-            'odds': pick.get('odds', -110),
-            'ai_score': pick.get('ai_score'),
-            'pick_type': 'Player Prop'
-        })
-
-    return normalized
-
-def aggregate_all_picks():
+def aggregate_all_picks(table=None):
     """
     Aggregate picks from all models
     Returns: dict with picks organized by sport and overall stats
@@ -111,71 +42,23 @@ def aggregate_all_picks():
     print(f"{Colors.BOLD}{Colors.CYAN}UNIFIED DASHBOARD - Aggregating All Models{Colors.END}")
     print(f"{Colors.CYAN}{'='*80}{Colors.END}\n")
 
-    all_picks = []
-    sport_summaries = {}
+    table = table or load_table()
+    for name in DASHBOARD_MODELS:
+        rollup = table.models[name]
+        if rollup.error:
+            print(f"  {Colors.RED}✗ {name}: {rollup.error}{Colors.END}")
+        else:
+            print(f"  {Colors.GREEN}✓ {name}: {rollup.counts['total']} picks{Colors.END}")
 
-    # Process each sport
-    for sport, models in MODEL_FILES.items():
-        print(f"{Colors.CYAN}Loading {sport} models...{Colors.END}")
-        sport_picks = []
-
-        for model_type, file_path in models.items():
-            if not file_path:
-                continue
-
-            data = load_model_data(file_path)
-            if not data or 'picks' not in data:
-                continue
-
-            picks = data['picks']
-            print(f"  {Colors.GREEN}✓ {model_type}: {len(picks)} picks{Colors.END}")
-
-            # Normalize and add to collection
-            for pick in picks:
-                normalized = normalize_pick_format(pick, sport, model_type)
-                sport_picks.append(normalized)
-                all_picks.append(normalized)
-
-        # Calculate sport summary
-        if sport_picks:
-            completed = [p for p in sport_picks if p['status'] in ['win', 'loss']]
-            wins = [p for p in sport_picks if p['status'] == 'win']
-            losses = [p for p in sport_picks if p['status'] == 'loss']
-            pending = [p for p in sport_picks if p['status'] == 'pending']
-
-            win_rate = (len(wins) / len(completed) * 100) if completed else 0
-            total_profit = sum(p.get('profit_loss', 0) for p in sport_picks)
-
-            sport_summaries[sport] = {
-                'total': len(sport_picks),
-                'wins': len(wins),
-                'losses': len(losses),
-                'pending': len(pending),
-                'win_rate': win_rate,
-                'profit_loss': total_profit
-            }
-
-    # Calculate overall summary
-    all_completed = [p for p in all_picks if p['status'] in ['win', 'loss']]
-    all_wins = [p for p in all_picks if p['status'] == 'win']
-    all_losses = [p for p in all_picks if p['status'] == 'loss']
-    all_pending = [p for p in all_picks if p['status'] == 'pending']
-
-    overall_summary = {
-        'total': len(all_picks),
-        'wins': len(all_wins),
-        'losses': len(all_losses),
-        'pending': len(all_pending),
-        'win_rate': (len(all_wins) / len(all_completed) * 100) if all_completed else 0,
-        'profit_loss': sum(p.get('profit_loss', 0) for p in all_picks)
-    }
+    all_picks = table.rows_for(DASHBOARD_MODELS)
+    sport_summaries = table.sport_summaries(DASHBOARD_MODELS)
 
     print(f"\n{Colors.GREEN}✓ Aggregated {len(all_picks)} total picks across {len(sport_summaries)} sports{Colors.END}")
 
     return {
         'picks': all_picks,
         'sport_summaries': sport_summaries,
-        'overall_summary': overall_summary,
+        'overall_summary': table.summary(DASHBOARD_MODELS),
         'generated_at': datetime.now(pytz.timezone('US/Eastern')).isoformat()
     }
 
@@ -183,7 +66,7 @@ def filter_picks(picks, filters):
     """
     Filter picks based on criteria
     filters = {
-        'sport': 'NBA' | 'NCAA' | 'ALL',
+        'sport': 'NBA' | 'NCAAB' | 'ALL',
         'status': 'pending' | 'completed' | 'all',
         'model_type': 'spreads_totals' | '3pt_props' | 'all',
         'min_ai_score': float (for props),
@@ -631,7 +514,7 @@ def generate_unified_html(data):
 """
 
     # Add each sport section
-    for sport in ['NBA', 'NCAA', 'MLB', 'CFB']:
+    for sport in ['NBA', 'NCAAB']:
         if sport not in picks_by_sport or not picks_by_sport[sport]:
             continue
 
@@ -678,7 +561,7 @@ def generate_unified_html(data):
 
             # Format odds
             odds = pick.get('odds')
-            odds_str = f"{odds:+d}" if odds else "N/A"
+            odds_str = f"{odds:+.0f}" if odds else "N/A"
 
             # Score or edge
             score_display = ""
@@ -720,14 +603,14 @@ def save_html(html_content):
         print(f"\n{Colors.RED}✗ Error saving HTML: {e}{Colors.END}")
         return False
 
-def main():
+def main(table=None):
     """Main execution"""
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*80}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.CYAN}UNIFIED SPORTS DASHBOARD GENERATOR{Colors.END}")
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*80}{Colors.END}")
 
     # Aggregate all data
-    data = aggregate_all_picks()
+    data = aggregate_all_picks(table)
 
     # Display summary
     print(f"\n{Colors.BOLD}{Colors.GREEN}OVERALL SUMMARY{Colors.END}")
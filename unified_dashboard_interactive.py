@@ -10,28 +10,18 @@ from datetime import datetime, timedelta
 import pytz
 from collections import defaultdict
 
+try:
+    from pick_table import DASHBOARD_MODELS, load_table
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from pick_table import DASHBOARD_MODELS, load_table
+
 # Configuration
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_HTML = os.path.join(SCRIPT_DIR, "unified_dashboard_interactive.html")
 OUTPUT_JSON = os.path.join(SCRIPT_DIR, "unified_dashboard_data.json")
 
-# Model tracking files
-MODEL_FILES = {
-    'NBA': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'nba', 'nba_picks_tracking.json'),
-        '3pt_props': os.path.join(SCRIPT_DIR, 'nba', 'nba_3pt_props_tracking.json')
-    },
-    'NCAA': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'ncaa', 'ncaab_picks_tracking.json')
-    },
-    'MLB': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'mlb', 'mlb_picks_tracking.json') if os.path.exists(os.path.join(SCRIPT_DIR, 'mlb', 'mlb_picks_tracking.json')) else None
-    },
-    'CFB': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'cfb', 'cfb_picks_tracking.json') if os.path.exists(os.path.join(SCRIPT_DIR, 'cfb', 'cfb_picks_tracking.json')) else None
-    }
-}
-
 # ANSI colors
 class Colors:
     CYAN = '\033[96m'
@@ -41,148 +31,29 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
-def load_model_data(file_path):
-    """Load data from a model's tracking JSON file"""
-    if not file_path or not os.path.exists(file_path):
-        return None
-
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"{Colors.RED}✗ Error loading {file_path}: {e}{Colors.END}")
-        return None
-
-def normalize_pick_format(pick, sport, model_type):
-    """Normalize different pick formats into a unified structure"""
-    normalized = {
-        'sport': sport,
-        'model_type': model_type,
-        'pick_id': pick.get('pick_id', ''),
-        'status': pick.get('status', 'pending'),
-        'game_date': None,
-        'matchup': '',
-        'pick_description': '',
-        'odds': None,
-        'edge': None,
-        'ai_score': None,
-        'result': pick.get('result'),
-        'profit_loss': pick.get('profit_loss', 0)
-    }
-
-    # Handle spread/total picks
-    if model_type == 'spreads_totals':
-        # Clean up pick description - remove emoji and "BET:" prefix
-        # NCAA uses 'pick_text', NBA uses 'pick'
-        pick_text = pick.get('pick_text', pick.get('pick', ''))
-        # Remove checkmark emoji and "BET:" prefix
-        pick_text = pick_text.replace('✅', '').replace('❌', '')
-        pick_text = pick_text.replace('BET:', '').strip()
-
-        # Capitalize pick_type if it's lowercase (NCAA format)
-        pick_type = pick.get('pick_type', 'Unknown')
-        if pick_type and isinstance(pick_type, str):
-            pick_type = pick_type.capitalize()
-
-        normalized.update({
-            'game_date': pick.get('game_date'),
-            'matchup': pick.get('matchup', f"{pick.get('away_team', '')} @ {pick.get('home_team', '')}"),
-            'pick_description': pick_text,
-            'odds': -110,
-            'edge': pick.get('edge'),
-            'pick_type': pick_type,
-            'home_team': pick.get('home_team'),
-            'away_team': pick.get('away_team')
-        })
-
-    # Handle player props
-    elif model_type == '3pt_props':
-        player = pick.get('player', 'Unknown')
-        prop_line = pick.get('prop_line', 0)
-        bet_type = pick.get('bet_type', 'over').upper()
-        team = pick.get('team', '')
-        opponent = pick.get('opponent', '')
-
-        normalized.update({
-            'game_date': pick.get('game_time'),
-            'matchup': f"{team} vs {opponent}",
-            'pick_description': f"{player} {bet_type} {prop_line} 3PT",
-            'odds': pick.get('odds', -110),
-            'ai_score': pick.get('ai_score'),
-            'pick_type': 'Player Prop',
-            'player': player,
-            'team': team
-        })
-
-    return normalized
-
-def aggregate_all_picks():
-    """Aggregate picks from all models"""
+def aggregate_all_picks(table=None):
+    """Aggregate picks from all models (views of the shared pick table)"""
     print(f"\n{Colors.CYAN}{'='*80}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.CYAN}INTERACTIVE DASHBOARD - Aggregating All Models{Colors.END}")
     print(f"{Colors.CYAN}{'='*80}{Colors.END}\n")
 
-    all_picks = []
-    sport_summaries = {}
-
-    for sport, models in MODEL_FILES.items():
-        print(f"{Colors.CYAN}Loading {sport} models...{Colors.END}")
-        sport_picks = []
-
-        for model_type, file_path in models.items():
-            if not file_path:
-                continue
-
-            data = load_model_data(file_path)
-            if not data or 'picks' not in data:
-                continue
-
-            picks = data['picks']
-            print(f"  {Colors.GREEN}✓ {model_type}: {len(picks)} picks{Colors.END}")
-
-            for pick in picks:
-                normalized = normalize_pick_format(pick, sport, model_type)
-                sport_picks.append(normalized)
-                all_picks.append(normalized)
-
-        if sport_picks:
-            completed = [p for p in sport_picks if p['status'] in ['win', 'loss']]
-            wins = [p for p in sport_picks if p['status'] == 'win']
-            losses = [p for p in sport_picks if p['status'] == 'loss']
-            pending = [p for p in sport_picks if p['status'] == 'pending']
-
-            win_rate = (len(wins) / len(completed) * 100) if completed else 0
-            total_profit = sum(p.get('profit_loss', 0) for p in sport_picks)
-
-            sport_summaries[sport] = {
-                'total': len(sport_picks),
-                'wins': len(wins),
-                'losses': len(losses),
-                'pending': len(pending),
-                'win_rate': win_rate,
-                'profit_loss': total_profit
-            }
+    table = table or load_table()
+    for name in DASHBOARD_MODELS:
+        rollup = table.models[name]
+        if rollup.error:
+            print(f"  {Colors.RED}✗ {name}: {rollup.error}{Colors.END}")
+        else:
+            print(f"  {Colors.GREEN}✓ {name}: {rollup.counts['total']} picks{Colors.END}")
 
-    all_completed = [p for p in all_picks if p['status'] in ['win', 'loss']]
-    all_wins = [p for p in all_picks if p['status'] == 'win']
-    all_losses = [p for p in all_picks if p['status'] == 'loss']
-    all_pending = [p for p in all_picks if p['status'] == 'pending']
-
-    overall_summary = {
-        'total': len(all_picks),
-        'wins': len(all_wins),
-        'losses': len(all_losses),
-        'pending': len(all_pending),
-        'win_rate': (len(all_wins) / len(all_completed) * 100) if all_completed else 0,
-        'profit_loss': sum(p.get('profit_loss', 0) for p in all_picks)
-    }
+    all_picks = table.rows_for(DASHBOARD_MODELS)
+    sport_summaries = table.sport_summaries(DASHBOARD_MODELS)
 
     print(f"\n{Colors.GREEN}✓ Aggregated {len(all_picks)} total picks across {len(sport_summaries)} sports{Colors.END}")
 
     return {
         'picks': all_picks,
         'sport_summaries': sport_summaries,
-        'overall_summary': overall_summary,
+        'overall_summary': table.summary(DASHBOARD_MODELS),
         'generated_at': datetime.now(pytz.timezone('US/Eastern')).isoformat()
     }
 
@@ -198,104 +69,101 @@ def save_json_data(data):
         return False
 
 def generate_interactive_html(data):
-    """Generate interactive HTML with embedded data - no external JSON needed"""
-
-    # Embed data directly in JavaScript
-    embedded_data = json.dumps(data, indent=2)
+    """Generate interactive HTML; the page loads its picks from OUTPUT_JSON (save_json_data)"""
 
-    html = f"""<!DOCTYPE html>
+    html = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Premium Sports Dashboard</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
             background: #000000;
             color: #e2e8f0;
             min-height: 100vh;
             padding: 2rem;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1800px;
             margin: 0 auto;
-        }}
+        }
 
         /* Header */
-        .header {{
+        .header {
             text-align: center;
             margin-bottom: 2rem;
             padding: 2rem;
             background: #1a1a1a;
             border-radius: 1rem;
             border: 2px solid #fbbf24;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             font-size: 2.5rem;
             font-weight: 900;
             color: #fbbf24;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .header .subtitle {{
+        .header .subtitle {
             font-size: 1.1rem;
             color: #9ca3af;
-        }}
+        }
 
-        .header .timestamp {{
+        .header .timestamp {
             font-size: 0.875rem;
             color: #6b7280;
             margin-top: 0.5rem;
-        }}
+        }
 
         /* Stats Cards */
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
             gap: 1rem;
             margin-bottom: 2rem;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: #1a1a1a;
             padding: 1.5rem;
             border-radius: 0.75rem;
             text-align: center;
             border: 2px solid #2a2a2a;
             transition: all 0.3s ease;
-        }}
+        }
 
-        .stat-card:hover {{
+        .stat-card:hover {
             transform: translateY(-3px);
             border-color: #fbbf24;
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 2rem;
             font-weight: 900;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             font-size: 0.75rem;
             color: #9ca3af;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        .stat-card.profit .stat-value {{ color: #10b981; }}
-        .stat-card.loss .stat-value {{ color: #ef4444; }}
-        .stat-card.pending .stat-value {{ color: #fbbf24; }}
-        .stat-card.winrate .stat-value {{ color: #3b82f6; }}
+        .stat-card.profit .stat-value { color: #10b981; }
+        .stat-card.loss .stat-value { color: #ef4444; }
+        .stat-card.pending .stat-value { color: #fbbf24; }
+        .stat-card.winrate .stat-value { color: #3b82f6; }
 
         /* Filters */
         .filters {
@@ -422,7 +290,7 @@ def generate_interactive_html(data):
         }
 
         .sport-badge.nba { background: rgba(237, 100, 166, 0.2); color: #ec4899; }
-        .sport-badge.ncaa { background: rgba(59, 130, 246, 0.2); color: #3b82f6; }
+        .sport-badge.ncaab { background: rgba(59, 130, 246, 0.2); color: #3b82f6; }
         .sport-badge.mlb { background: rgba(16, 185, 129, 0.2); color: #10b981; }
         .sport-badge.cfb { background: rgba(245, 158, 11, 0.2); color: #f59e0b; }
 
@@ -537,7 +405,7 @@ def generate_interactive_html(data):
                     <select id="sportFilter">
                         <option value="all">All Sports</option>
                         <option value="NBA">NBA</option>
-                        <option value="NCAA">NCAA</option>
+                        <option value="NCAAB">NCAAB</option>
                         <option value="MLB">MLB</option>
                         <option value="CFB">CFB</option>
                     </select>
@@ -756,14 +624,14 @@ def save_html(html_content):
         print(f"{Colors.RED}✗ Error saving HTML: {e}{Colors.END}")
         return False
 
-def main():
+def main(table=None):
     """Main execution"""
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*80}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.CYAN}INTERACTIVE DASHBOARD GENERATOR{Colors.END}")
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*80}{Colors.END}")
 
     # Aggregate data
-    data = aggregate_all_picks()
+    data = aggregate_all_picks(table)
 
     # Save JSON for JavaScript
     save_json_data(data)
@@ -778,7 +646,7 @@ def main():
 
     # Generate HTML
     print(f"\n{Colors.CYAN}Generating interactive dashboard...{Colors.END}")
-    html = generate_interactive_html()
+    html = generate_interactive_html(data)
     save_html(html)
 
     print(f"\n{Colors.BOLD}{Colors.GREEN}{'='*80}{Colors.END}")
@@ -3,29 +3,25 @@
 Premium Unified Sports Betting Dashboard
 Rich cards with team performance history, filters, and all the info you need
 NO SERVER REQUIRED - all data embedded directly in HTML
+Picks and team records come from the shared pick table (pick_table.py)
 """
 
 import json
 import os
 from datetime import datetime
 import pytz
-from collections import defaultdict
+
+try:
+    from pick_table import DASHBOARD_MODELS, load_table
+except ImportError:
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from pick_table import DASHBOARD_MODELS, load_table
 
 # Configuration
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_HTML = os.path.join(SCRIPT_DIR, "unified_dashboard_premium.html")
 
-# Model tracking files
-MODEL_FILES = {
-    'NBA': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'nba', 'nba_picks_tracking.json'),
-        '3pt_props': os.path.join(SCRIPT_DIR, 'nba', 'nba_3pt_props_tracking.json')
-    },
-    'NCAA': {
-        'spreads_totals': os.path.join(SCRIPT_DIR, 'ncaa', 'ncaab_picks_tracking.json')
-    }
-}
-
 class Colors:
     CYAN = '\033[96m'
     GREEN = '\033[92m'
@@ -33,86 +29,18 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
-def load_tracking_data():
-    """Load all tracking data and calculate team performance history"""
+def load_tracking_data(table=None):
+    """Picks from the shared pick table, each with the W-L history of its teams"""
     print(f"{Colors.CYAN}Loading model data...{Colors.END}")
 
+    table = table or load_table()
+    team_stats = table.team_stats(DASHBOARD_MODELS)
+
+    # Attach team stats to copies of the picks (the table's rows are shared with other dashboards)
     all_picks = []
-    team_stats = defaultdict(lambda: {'wins': 0, 'losses': 0, 'profit': 0})
-
-    for sport, models in MODEL_FILES.items():
-        for model_type, file_path in models.items():
-            if not file_path or not os.path.exists(file_path):
-                continue
-
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-
-                for pick in data.get('picks', []):
-                    # Build matchup string if not provided
-                    matchup = pick.get('matchup', '')
-                    if not matchup and pick.get('away_team') and pick.get('home_team'):
-                        matchup = f"{pick['away_team']} @ {pick['home_team']}"
-
-                    # NCAA uses 'profit' field, NBA uses 'profit_loss'
-                    profit_loss = pick.get('profit_loss') if pick.get('profit_loss') is not None else pick.get('profit', 0)
-                    if profit_loss is None:
-                        profit_loss = 0
-
-                    # Normalize pick format
-                    normalized = {
-                        'sport': sport,
-                        'model_type': model_type,
-                        'status': pick.get('status', 'pending'),
-                        'game_date': pick.get('game_date') or pick.get('game_time'),
-                        'matchup': matchup,
-                        'pick_description': pick.get('pick_text', pick.get('pick', '')).replace('✅', '').replace('BET:', '').strip(),
-                        'pick_type': pick.get('pick_type', 'Unknown').capitalize(),
-                        'odds': pick.get('odds', -110),
-                        'edge': pick.get('edge'),
-                        'ai_score': pick.get('ai_score'),
-                        'result': pick.get('result'),
-                        'profit_loss': profit_loss,
-                        'home_team': pick.get('home_team', ''),
-                        'away_team': pick.get('away_team', ''),
-                        'player': pick.get('player', ''),
-                        'team': pick.get('team', '')
-                    }
-
-                    all_picks.append(normalized)
-
-                    # Track team performance - find which team we're betting on
-                    if normalized['status'] in ['win', 'loss']:
-                        # Determine the team being bet on from the pick description
-                        pick_desc = normalized['pick_description']
-                        bet_team = None
-
-                        # Check if home or away team is in the pick
-                        if normalized['home_team'] and normalized['home_team'] in pick_desc:
-                            bet_team = normalized['home_team']
-                        elif normalized['away_team'] and normalized['away_team'] in pick_desc:
-                            bet_team = normalized['away_team']
-                        elif normalized['team']:  # For player props
-                            bet_team = normalized['team']
-
-                        # Only track stats for the team we're actually betting on
-                        if bet_team:
-                            if normalized['status'] == 'win':
-                                team_stats[bet_team]['wins'] += 1
-                                team_stats[bet_team]['profit'] += normalized['profit_loss']
-                            else:
-                                team_stats[bet_team]['losses'] += 1
-                                team_stats[bet_team]['profit'] += normalized['profit_loss']
-
-            except Exception as e:
-                print(f"Error loading {file_path}: {e}")
-
-    # Attach team stats to picks
-    for pick in all_picks:
-        teams = [pick['home_team'], pick['away_team'], pick['team']]
-        pick['team_performance'] = {}
-        for team in teams:
+    for row in table.rows_for(DASHBOARD_MODELS):
+        pick = dict(row, team_performance={})
+        for team in (pick['home_team'], pick['away_team'], pick['team']):
             if team and team in team_stats:
                 stats = team_stats[team]
                 total = stats['wins'] + stats['losses']
@@ -122,27 +50,11 @@ def load_tracking_data():
                     'win_rate': win_rate,
                     'profit': stats['profit']
                 }
+        all_picks.append(pick)
 
     print(f"{Colors.GREEN}✓ Loaded {len(all_picks)} picks{Colors.END}")
     return all_picks
 
-def calculate_overall_stats(picks):
-    """Calculate overall statistics"""
-    completed = [p for p in picks if p['status'] in ['win', 'loss']]
-    wins = [p for p in picks if p['status'] == 'win']
-    losses = [p for p in picks if p['status'] == 'loss']
-    pending = [p for p in picks if p['status'] == 'pending']
-
-    return {
-        'total': len(picks),
-        'wins': len(wins),
-        'losses': len(losses),
-        'pending': len(pending),
-        'win_rate': (len(wins) / len(completed) * 100) if completed else 0,
-        'profit_loss': sum(p['profit_loss'] for p in picks),
-        'record': f"{len(wins)}-{len(losses)}"
-    }
-
 def generate_html(picks, stats):
     """Generate premium HTML dashboard with embedded data"""
 
@@ -323,7 +235,7 @@ def generate_html(picks, stats):
         }}
 
         .sport-badge.nba {{ background: #ec4899; color: #fff; }}
-        .sport-badge.ncaa {{ background: #3b82f6; color: #fff; }}
+        .sport-badge.ncaab {{ background: #3b82f6; color: #fff; }}
 
         .status-badge {{
             padding: 0.35rem 0.75rem;
@@ -466,7 +378,7 @@ def generate_html(picks, stats):
                     <select id="sportFilter">
                         <option value="all">All Sports</option>
                         <option value="NBA">NBA</option>
-                        <option value="NCAA">NCAA Basketball</option>
+                        <option value="NCAAB">NCAA Basketball</option>
                     </select>
                 </div>
                 <div class="filter-group">
@@ -701,14 +613,15 @@ def generate_html(picks, stats):
 
     return html
 
-def main():
+def main(table=None):
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*80}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.CYAN}PREMIUM DASHBOARD GENERATOR{Colors.END}")
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*80}{Colors.END}\n")
 
     # Load data
-    picks = load_tracking_data()
-    stats = calculate_overall_stats(picks)
+    table = table or load_table()
+    picks = load_tracking_data(table)
+    stats = table.summary(DASHBOARD_MODELS)
 
     print(f"\n{Colors.BOLD}{Colors.GREEN}OVERALL STATS{Colors.END}")
     print(f"Total Picks: {stats['total']}")
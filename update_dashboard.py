@@ -1,31 +1,36 @@
 #!/usr/bin/env python3
 """
-Simple script to update the unified dashboard
+Simple script to update the unified dashboards
 Call this from any of your models after they finish running
+
+All three dashboards (unified, interactive, premium) are generated in this
+process from one load of the shared pick table (pick_table.py).
 """
 
-import subprocess
 import os
+import time
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 def update_dashboard():
-    """Run the unified dashboard generator"""
+    """Regenerate every unified dashboard from a single pick table load"""
     try:
-        result = subprocess.run(
-            ['python3', 'unified_dashboard_interactive.py'],
-            cwd=SCRIPT_DIR,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode == 0:
-            print("✓ Dashboard updated successfully")
-            return True
-        else:
-            print(f"✗ Dashboard update failed: {result.stderr}")
-            return False
+        import pick_table
+        import unified_dashboard
+        import unified_dashboard_interactive
+        import unified_dashboard_premium
+
+        start = time.perf_counter()
+        table = pick_table.load_table()
+        load_ms = (time.perf_counter() - start) * 1000
+
+        for dashboard in (unified_dashboard, unified_dashboard_interactive, unified_dashboard_premium):
+            dashboard.main(table)
+
+        total_ms = (time.perf_counter() - start) * 1000
+        print(f"✓ Dashboards updated successfully ({len(table.models)} tracking files loaded once "
+              f"in {load_ms:.0f} ms, {total_ms:.0f} ms total)")
+        return True
     except Exception as e:
         print(f"✗ Error updating dashboard: {e}")
         return False
@@ -17,7 +17,7 @@ def verify_nfl(mod_name, filename):
         
         # Load data, calc stats, gen html
         if hasattr(mod, 'load_tracking_data') and hasattr(mod, 'calculate_tracking_stats'):
-            t_data = mod.load_tracking_data()
+            t_data = mod.load_tracking_data(full_history=True)
             stats = mod.calculate_tracking_stats(t_data)
             mod.generate_html_output([], stats, t_data)
             print("  ✅ HTML Regenerated")
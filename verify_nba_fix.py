@@ -17,7 +17,7 @@ def verify_nba(mod_name, filename):
         
         # Load data, calc stats, gen html
         if hasattr(mod, 'load_tracking_data') and hasattr(mod, 'calculate_tracking_stats') and hasattr(mod, 'generate_html_output'):
-            t_data = mod.load_tracking_data()
+            t_data = mod.load_tracking_data(full_history=True)
             stats = mod.calculate_tracking_stats(t_data)
             # Pass empty lists for plays to avoid API calls or data logic needs
             # generate_html_output(over_plays, under_plays, stats=None, tracking_data=None, factors=None, player_stats=None)
@@ -4,150 +4,65 @@ Model Tracking Health Check
 ---------------------------
 Verifies all sports models are tracking correctly.
 Run this to get a complete status report.
-"""
-
-import json
-import os
-from datetime import datetime, timedelta
-from collections import Counter
-import pytz
 
-# Get Eastern timezone
-ET = pytz.timezone('US/Eastern')
-NOW = datetime.now(ET)
-TODAY = NOW.strftime('%Y-%m-%d')
-YESTERDAY = (NOW - timedelta(days=1)).strftime('%Y-%m-%d')
+The tracking files and their counts come from the shared pick table
+(pick_table.py), so this reports exactly what the dashboards see.
 
-# All tracking files to check
-TRACKING_FILES = [
-    # NBA Props
-    ('NBA Points Props', 'nba/nba_points_props_tracking.json'),
-    ('NBA Assists Props', 'nba/nba_assists_props_tracking.json'),
-    ('NBA Rebounds Props', 'nba/nba_rebounds_props_tracking.json'),
-    ('NBA 3PT Props', 'nba/nba_3pt_props_tracking.json'),
-    # NFL Props
-    ('NFL Passing Yards', 'nfl/nfl_passing_yards_props_tracking.json'),
-    ('NFL Rushing Yards', 'nfl/nfl_rushing_yards_props_tracking.json'),
-    ('NFL Receiving Yards', 'nfl/nfl_receiving_yards_props_tracking.json'),
-    ('NFL Receptions', 'nfl/nfl_receptions_props_tracking.json'),
-    # Main Models
-    ('NBA Main', 'nba/nba_picks_tracking.json'),
-    ('NFL Main', 'nfl/nfl_picks_tracking.json'),
-    ('NCAAB Main', 'ncaa/ncaab_picks_tracking.json'),
-    ('Soccer', 'soccer/soccer_picks_tracking.json'),
-]
+Usage:
+    python3 verify_tracking.py
+"""
 
-def parse_game_date(game_time):
-    """Parse game_time string to date string YYYY-MM-DD in ET"""
-    if not game_time:
-        return None
-    try:
-        if 'Z' in game_time:
-            dt = datetime.fromisoformat(game_time.replace('Z', '+00:00'))
-        else:
-            dt = datetime.fromisoformat(game_time)
-        return dt.astimezone(ET).strftime('%Y-%m-%d')
-    except:
-        return None
+from pick_table import PickTable, SOURCES
 
-def check_tracking_file(name, filepath):
-    """Check a single tracking file for issues"""
+def check_tracking_file(rollup):
+    """Check a single tracking file's rollup (from the shared pick table) for issues"""
     result = {
-        'name': name,
-        'exists': False,
-        'total': 0,
-        'pending': 0,
-        'wins': 0,
-        'losses': 0,
-        'today': {'wins': 0, 'losses': 0},
-        'yesterday': {'wins': 0, 'losses': 0},
-        'has_game_time': True,
-        'duplicate_players': 0,
+        'name': rollup.source.name,
+        'category': rollup.source.category,
+        'exists': rollup.exists,
+        'total': rollup.counts['total'],
+        'pending': rollup.counts['pending'],
+        'wins': rollup.counts['wins'],
+        'losses': rollup.counts['losses'],
+        'today': rollup.days['today'],
+        'yesterday': rollup.days['yesterday'],
+        'has_game_time': rollup.missing_game_time == 0,
+        'duplicate_players': sum(1 for c in rollup.pending_players.values() if c > 1),
         'issues': []
     }
-    
-    if not os.path.exists(filepath):
+
+    if not rollup.exists:
         result['issues'].append('❌ File not found')
         return result
-    
-    result['exists'] = True
-    
-    try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-    except Exception as e:
-        result['issues'].append(f'❌ JSON parse error: {e}')
+    if rollup.error:
+        result['issues'].append(f'❌ JSON parse error: {rollup.error}')
         return result
-    
-    # Handle both dict and array formats
-    if isinstance(data, dict):
-        picks = data.get('picks', [])
-    else:
-        picks = data
-    
-    result['total'] = len(picks)
-    
-    # Count by status
-    pending_players = []
-    for p in picks:
-        status = p.get('status', 'pending').lower()
-        
-        if status == 'pending':
-            result['pending'] += 1
-            pending_players.append(p.get('player', 'unknown'))
-        elif status in ['win', 'won']:
-            result['wins'] += 1
-        elif status in ['loss', 'lost']:
-            result['losses'] += 1
-        
-        # Check game_time
-        game_time = p.get('game_time') or p.get('game_date')
-        if not game_time:
-            result['has_game_time'] = False
-        else:
-            game_date = parse_game_date(game_time)
-            if game_date == TODAY:
-                if status in ['win', 'won']:
-                    result['today']['wins'] += 1
-                elif status in ['loss', 'lost']:
-                    result['today']['losses'] += 1
-            elif game_date == YESTERDAY:
-                if status in ['win', 'won']:
-                    result['yesterday']['wins'] += 1
-                elif status in ['loss', 'lost']:
-                    result['yesterday']['losses'] += 1
-    
-    # Check for duplicate players in pending
-    player_counts = Counter(pending_players)
-    dupes = [(p, c) for p, c in player_counts.items() if c > 1]
-    result['duplicate_players'] = len(dupes)
-    
+
     # Identify issues
     if not result['has_game_time']:
         result['issues'].append('⚠️ Some picks missing game_time')
     if result['duplicate_players'] > 0:
         result['issues'].append(f'⚠️ {result["duplicate_players"]} duplicate players in pending')
-    
+
     return result
 
 def main():
+    # Every file loaded and rolled up in one pass (archive partitions included)
+    table = PickTable(SOURCES)
+
     print("=" * 70)
     print("🏀 COURTSIDE ANALYTICS - TRACKING HEALTH CHECK")
-    print(f"📅 Today: {TODAY} | Yesterday: {YESTERDAY}")
+    print(f"📅 Today: {table.today} | Yesterday: {table.yesterday}")
     print("=" * 70)
     print()
     
-    all_results = []
-    
-    for name, filepath in TRACKING_FILES:
-        result = check_tracking_file(name, filepath)
-        all_results.append(result)
+    all_results = [check_tracking_file(rollup) for rollup in table.models.values()]
     
     # Print results by category
     categories = {
         'NBA Props': [r for r in all_results if 'NBA' in r['name'] and 'Props' in r['name']],
-        'NFL Props': [r for r in all_results if 'NFL' in r['name'] and 'Main' not in r['name']],
-        'Main Models': [r for r in all_results if 'Main' in r['name'] or 'Soccer' in r['name'] or 'NCAAB' in r['name']],
+        'NFL Props': [r for r in all_results if 'NFL' in r['name'] and r['category'] == 'Props'],
+        'Main Models': [r for r in all_results if r['category'] != 'Props'],
     }
     
     total_issues = 0
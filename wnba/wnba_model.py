@@ -10,7 +10,14 @@ from datetime import datetime
 import os
 import json
 import random
-from jinja2 import Template
+import sys
+
+# Shared HTML template environment (repo root)
+try:
+    from html_templates import compile_template
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import compile_template
 
 # --- CONFIGURATION ---
 SEASON = 2025
@@ -486,7 +493,7 @@ def generate_html(results, stats_tuple):
 </html>
     """
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         results=results,
         timestamp=timestamp,
@@ -9,7 +9,14 @@ from datetime import datetime
 import os
 import json
 import random
-from jinja2 import Template
+import sys
+
+# Shared HTML template environment (repo root)
+try:
+    from html_templates import compile_template
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from html_templates import compile_template
 
 # --- CONFIGURATION ---
 SEASON = 2025
@@ -360,7 +367,7 @@ def generate_html(picks, season_stats, last10_stats, today_stats, yesterday_stat
 </html>
     """
     
-    template = Template(template_str)
+    template = compile_template(template_str)
     html_output = template.render(
         picks=picks,
         timestamp=timestamp,